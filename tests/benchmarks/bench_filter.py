@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark for client-side filtering of resources.
+
+Measures the time for matching the properties of 10000 resources against
+several sets of filter arguments, with the compiled filters used by the
+resource managers, and with the previous matching that interpreted the
+filter arguments for each resource (as a baseline for the speedup). It also
+measures listing 10000 partitions of a faked HMC with filter arguments.
+
+Usage:
+
+    python -m tests.benchmarks.bench_filter
+"""
+
+from __future__ import absolute_import, print_function
+
+import re
+import sys
+import timeit
+
+import six
+
+from zhmcclient import Client
+from zhmcclient._filter import compile_filter
+from zhmcclient_mock import FakedSession
+
+NUM_RESOURCES = 10000
+
+# Sets of filter arguments to benchmark, with a title
+FILTERS = [
+    ('one string', {'status': 'active'}),
+    ('one regexp', {'name': 'PART0.*9'}),
+    ('string list', {'status': ['stopped', 'paused', 'degraded', 'active']}),
+    ('mixed', {'name': 'PART.*', 'type': 'ssc', 'ifl-processors': 4,
+               'status': ['active', 'degraded']}),
+]
+
+
+def resource_properties(num_resources):
+    """Return a list of synthetic resource properties of partitions."""
+    props_list = []
+    for p in range(num_resources):
+        props_list.append({
+            'object-id': 'part{}'.format(p),
+            'object-uri': '/api/partitions/part{}'.format(p),
+            'name': 'PART{:05d}'.format(p),
+            'status': 'active' if p % 3 else 'stopped',
+            'type': 'linux' if p % 10 else 'ssc',
+            'ifl-processors': p % 8,
+            'description': 'Partition {}'.format(p),
+        })
+    return props_list
+
+
+def baseline_matches_filters(properties, filter_args):
+    """
+    The previous matching of resource properties against filter arguments,
+    which interprets the filter arguments for each resource.
+    """
+    for prop_name in filter_args:
+        if not baseline_matches_prop(properties, prop_name,
+                                     filter_args[prop_name]):
+            return False
+    return True
+
+
+def baseline_matches_prop(properties, prop_name, prop_match):
+    # pylint: disable=missing-docstring
+    if isinstance(prop_match, (list, tuple)):
+        for pm in prop_match:
+            if baseline_matches_prop(properties, prop_name, pm):
+                return True
+    else:
+        try:
+            prop_value = properties[prop_name]
+        except KeyError:
+            return False
+        if isinstance(prop_value, six.string_types):
+            if re.match(prop_match + '$', prop_value):
+                return True
+        else:
+            if prop_value == prop_match:
+                return True
+    return False
+
+
+def bench(func, repeat):
+    """Return the best time in seconds of calling func()."""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def bench_matching(props_list, repeat):
+    """
+    Benchmark matching resource properties against the filter arguments,
+    and print the results.
+    """
+    print("Matching {} resources:".format(len(props_list)))
+    print("  {:<12} {:>8} {:>14} {:>14} {:>8}".format(
+        'filter', 'matches', 'baseline [ms]', 'compiled [ms]', 'speedup'))
+    for title, filter_args in FILTERS:
+
+        def baseline():
+            # pylint: disable=cell-var-from-loop
+            return [p for p in props_list
+                    if baseline_matches_filters(p, filter_args)]
+
+        def compiled():
+            # pylint: disable=cell-var-from-loop
+            compiled_filter = compile_filter(filter_args)
+            return [p for p in props_list if compiled_filter.matches(p)]
+
+        assert baseline() == compiled()
+        baseline_time = bench(baseline, repeat)
+        compiled_time = bench(compiled, repeat)
+        print("  {:<12} {:>8} {:>14.1f} {:>14.1f} {:>7.1f}x".format(
+            title, len(compiled()), baseline_time * 1000,
+            compiled_time * 1000, baseline_time / compiled_time))
+    print("")
+
+
+def bench_faked_list(props_list, repeat):
+    """
+    Benchmark listing partitions of a faked HMC with the filter arguments,
+    and print the results.
+    """
+    session = FakedSession('fake-host', 'fake-hmc', '2.13.1', '1.8')
+    faked_cpc = session.hmc.cpcs.add({
+        'object-id': 'cpc1',
+        'name': 'CPC1',
+        'dpm-enabled': True,
+    })
+    for props in props_list:
+        faked_cpc.partitions.add(props)
+    cpc = Client(session).cpcs.find(name='CPC1')
+
+    print("Listing {} partitions of a faked HMC:".format(len(props_list)))
+    print("  {:<12} {:>8} {:>10}".format('filter', 'matches', 'time [ms]'))
+    for title, filter_args in FILTERS:
+
+        def list_partitions():
+            # pylint: disable=cell-var-from-loop
+            return cpc.partitions.list(filter_args=filter_args)
+
+        list_time = bench(list_partitions, repeat)
+        print("  {:<12} {:>8} {:>10.1f}".format(
+            title, len(list_partitions()), list_time * 1000))
+    print("")
+
+
+def main(argv):
+    # pylint: disable=unused-argument
+    """Run the benchmark."""
+    repeat = 5
+    props_list = resource_properties(NUM_RESOURCES)
+    bench_matching(props_list, repeat)
+    bench_faked_list(props_list, repeat)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
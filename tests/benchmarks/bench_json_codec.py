@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark for the JSON codecs of zhmcclient.JsonCodec.
+
+Measures the time for decoding large HMC responses, and for encoding them,
+with each installed JSON backend. By default, synthetic responses of the
+'Get Inventory' and 'List Storage Volumes of a Storage Group' operations
+are used. Recorded HMC responses can be benchmarked by specifying their
+files.
+
+Usage:
+
+    python -m tests.benchmarks.bench_json_codec [FILE ...]
+"""
+
+from __future__ import absolute_import, print_function
+
+import sys
+import json
+import timeit
+from collections import OrderedDict
+
+from zhmcclient import JsonCodec
+
+# Codec arguments (backend, ordered) to benchmark. The first one is the
+# default codec of a session and is the baseline for the speedup.
+CODEC_ARGS = [
+    ('json', True),
+    ('json', False),
+    ('orjson', False),
+    ('ujson', False),
+]
+
+
+def inventory_response(num_partitions=2000):
+    """
+    Return a synthetic 'Get Inventory' response with CPCs, partitions with
+    NICs and HBAs, and adapters.
+    """
+    resources = []
+    for c in range(4):
+        cpc_uri = '/api/cpcs/cpc{}'.format(c)
+        resources.append(OrderedDict([
+            ('class', 'cpc'),
+            ('object-uri', cpc_uri),
+            ('name', 'CPC{}'.format(c)),
+            ('dpm-enabled', True),
+            ('status', 'active'),
+            ('description', u'CPC number {} \u2013 production'.format(c)),
+            ('processor-count-ifl', 64),
+            ('storage-customer', 4194304),
+        ]))
+        for a in range(100):
+            resources.append(OrderedDict([
+                ('class', 'adapter'),
+                ('object-uri', '/api/adapters/c{}a{}'.format(c, a)),
+                ('parent', cpc_uri),
+                ('name', 'Adapter {}'.format(a)),
+                ('adapter-id', '{:03X}'.format(a)),
+                ('type', 'osd' if a % 2 else 'fcp'),
+                ('status', 'active'),
+                ('port-count', 2),
+                ('network-port-uris', [
+                    '/api/adapters/c{}a{}/network-ports/{}'.format(c, a, p)
+                    for p in range(2)]),
+            ]))
+    for p in range(num_partitions):
+        part_uri = '/api/partitions/part{}'.format(p)
+        resources.append(OrderedDict([
+            ('class', 'partition'),
+            ('object-uri', part_uri),
+            ('parent', '/api/cpcs/cpc{}'.format(p % 4)),
+            ('name', 'PART{:05d}'.format(p)),
+            ('status', 'active' if p % 3 else 'stopped'),
+            ('type', 'linux'),
+            ('description', 'Partition {}'.format(p)),
+            ('ifl-processors', 4),
+            ('initial-memory', 8192),
+            ('maximum-memory', 16384),
+            ('processor-mode', 'shared'),
+            ('boot-device', 'storage-adapter'),
+            ('boot-storage-device', None),
+            ('auto-start', False),
+            ('nic-uris', ['{}/nics/nic{}'.format(part_uri, n)
+                          for n in range(4)]),
+            ('hba-uris', ['{}/hbas/hba{}'.format(part_uri, n)
+                          for n in range(2)]),
+            ('crypto-configuration', None),
+            ('acceptable-status', ['active', 'stopped']),
+        ]))
+    return OrderedDict([('inventory', resources)])
+
+
+def storage_volumes_response(num_volumes=20000):
+    """
+    Return a synthetic 'List Storage Volumes of a Storage Group' response.
+    """
+    volumes = []
+    for v in range(num_volumes):
+        volumes.append(OrderedDict([
+            ('element-uri',
+             '/api/storage-groups/sg1/storage-volumes/vol{}'.format(v)),
+            ('name', 'Volume {}'.format(v)),
+            ('fulfillment-state', 'complete'),
+            ('size', 128.5),
+            ('usage', 'data' if v % 10 else 'boot'),
+        ]))
+    return OrderedDict([('storage-volumes', volumes)])
+
+
+def bench(func, repeat):
+    """Return the best time in seconds of calling func()."""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def bench_payload(title, data, repeat):
+    """
+    Benchmark decoding and encoding of a JSON payload (byte string) with
+    all installed codecs, and print the results.
+    """
+    print("{}: {:.1f} MB".format(title, len(data) / 1e6))
+    print("  {:<8} {:<8} {:>11} {:>11} {:>8}".format(
+        'backend', 'ordered', 'loads [ms]', 'dumps [ms]', 'speedup'))
+    baseline = None
+    for backend, ordered in CODEC_ARGS:
+        try:
+            codec = JsonCodec(backend=backend, ordered=ordered)
+        except ImportError:
+            print("  {:<8} (not installed)".format(backend))
+            continue
+        obj = codec.loads(data)
+        loads_time = bench(lambda: codec.loads(data), repeat)
+        dumps_time = bench(lambda: codec.dumps(obj), repeat)
+        if baseline is None:
+            baseline = loads_time
+        print("  {:<8} {:<8} {:>11.1f} {:>11.1f} {:>7.1f}x".format(
+            backend, str(ordered), loads_time * 1000, dumps_time * 1000,
+            baseline / loads_time))
+    print("")
+
+
+def main(argv):
+    """Run the benchmark."""
+    repeat = 5
+    if len(argv) > 1:
+        for filename in argv[1:]:
+            with open(filename, 'rb') as fp:
+                data = fp.read()
+            bench_payload(filename, data, repeat)
+    else:
+        for title, response in (
+                ('Get Inventory (synthetic)', inventory_response()),
+                ('List Storage Volumes (synthetic)',
+                 storage_volumes_response())):
+            data = json.dumps(response).encode('utf-8')
+            bench_payload(title, data, repeat)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,218 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A local HTTP server that stands in for an HMC, for tests that need real HTTP
+interactions (e.g. with concurrent requests).
+
+The server serves the state of a :class:`~zhmcclient_mock.FakedHmc` object
+using the URI handlers of the zhmcclient_mock package, and in addition
+implements the Logon and Logoff operations including the expiration of
+sessions. Tests can register handlers for additional URIs (e.g. for jobs).
+"""
+
+from __future__ import absolute_import
+
+import json
+import re
+import threading
+import time
+from six.moves import BaseHTTPServer, socketserver
+
+from zhmcclient_mock import FakedHmc
+from zhmcclient_mock._urihandler import UriHandler, HTTPError, URIS
+
+
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn,
+                           BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        # Suppress the logging to stderr.
+        pass
+
+    def do_GET(self):
+        self.server.faked_server.handle(self, 'GET')
+
+    def do_POST(self):
+        self.server.faked_server.handle(self, 'POST')
+
+    def do_DELETE(self):
+        self.server.faked_server.handle(self, 'DELETE')
+
+    def send_json(self, status, body):
+        if body is None:
+            content = b''
+        else:
+            content = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        if content:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class FakedHttpServer(object):
+    """
+    A local HTTP server in a background thread, that serves a faked HMC.
+
+    Usage::
+
+        server = FakedHttpServer()
+        server.hmc.add_resources({...})
+        server.start()
+        try:
+            session = zhmcclient.Session(server.host, 'user', 'pw',
+                                         port=server.port)
+            ...
+        finally:
+            server.stop()
+
+    The server uses HTTP, so the client under test needs to use HTTP instead
+    of HTTPS (e.g. by patching its ``_HMC_SCHEME`` module variable).
+    """
+
+    def __init__(self, hmc_name='fake-hmc', hmc_version='2.13.1',
+                 api_version='1.8'):
+        self.hmc = FakedHmc(hmc_name, hmc_version, api_version)
+        self.host = '127.0.0.1'
+        self.port = None
+
+        #: Delay in seconds for each response, to simulate HMC latency.
+        self.delay = 0
+
+        #: List of tuple(method, uri) for all requests that were received.
+        self.requests = []
+
+        #: Number of Logon operations that were performed.
+        self.logon_count = 0
+
+        self._urihandler = UriHandler(URIS)
+        self._handlers = []  # list of tuple(method, uri-pattern, func)
+        self._sessions = set()
+        self._next_session = 1
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        """Start the server on a free port."""
+        self._server = _ThreadingHTTPServer((self.host, 0), _RequestHandler)
+        self._server.faked_server = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def add_handler(self, method, uri, func):
+        """
+        Add a handler for a URI, that takes precedence over the URI handlers
+        of the zhmcclient_mock package.
+
+        Parameters:
+
+          method (string): HTTP method (e.g. 'GET').
+
+          uri (string): Regular expression for the URI (including any query
+            parameters).
+
+          func (callable): Handler function, that is called with the request
+            body (a JSON object or `None`) and returns a tuple
+            (http_status, response_body).
+        """
+        self._handlers.append((method, re.compile('^' + uri + '$'), func))
+
+    def expire_sessions(self):
+        """Expire all currently valid sessions."""
+        with self._lock:
+            self._sessions.clear()
+
+    def count(self, method, uri):
+        """Return the number of requests received for a method and URI."""
+        return self.requests.count((method, uri))
+
+    def handle(self, request, method):
+        uri = request.path
+        length = int(request.headers.get('Content-Length', 0) or 0)
+        content = request.rfile.read(length) if length else b''
+        body = json.loads(content.decode('utf-8')) if content else None
+        with self._lock:
+            self.requests.append((method, uri))
+        if self.delay:
+            time.sleep(self.delay)
+
+        if method == 'POST' and uri == '/api/sessions':
+            with self._lock:
+                session_id = 'session-{}'.format(self._next_session)
+                self._next_session += 1
+                self._sessions.add(session_id)
+                self.logon_count += 1
+            request.send_json(200, {'api-session': session_id})
+            return
+
+        if not (method == 'GET' and uri == '/api/version'):
+            session_id = request.headers.get('X-API-Session', None)
+            with self._lock:
+                valid = session_id in self._sessions
+            if not valid:
+                request.send_json(403, {
+                    'http-status': 403,
+                    'reason': 5,
+                    'message': "Session is not valid: {}".format(session_id),
+                    'request-method': method,
+                    'request-uri': uri,
+                })
+                return
+
+        if method == 'DELETE' and uri == '/api/sessions/this-session':
+            with self._lock:
+                self._sessions.discard(session_id)
+            request.send_json(204, None)
+            return
+
+        for h_method, h_pattern, func in self._handlers:
+            if h_method == method and h_pattern.match(uri):
+                status, result = func(body)
+                request.send_json(status, result)
+                return
+
+        try:
+            if method == 'GET':
+                result = self._urihandler.get(self.hmc, uri, True)
+            elif method == 'POST':
+                result = self._urihandler.post(self.hmc, uri, body, True, True)
+            else:
+                result = self._urihandler.delete(self.hmc, uri, True)
+        except HTTPError as exc:
+            request.send_json(exc.http_status, exc.response())
+            return
+        if result is None:
+            request.send_json(204, None)
+        else:
+            request.send_json(200, result)
@@ -0,0 +1,190 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _async_client module.
+
+The tests run against a local HTTP server that stands in for the HMC.
+"""
+
+from __future__ import absolute_import, print_function
+
+import pytest
+import mock
+
+from zhmcclient import Cpc, Partition, NotFound, NoUniqueMatch
+from tests.common.http_server import FakedHttpServer
+
+# The asyncio support requires Python 3.5 and the aiohttp package
+pytest.importorskip('aiohttp')
+
+import asyncio  # noqa: E402
+from zhmcclient import AsyncSession, AsyncClient, AsyncManager  # noqa: E402
+
+
+class TestAsyncClient(object):
+    """All tests for the AsyncClient and AsyncManager classes."""
+
+    def setup_method(self):
+        self.server = FakedHttpServer()
+        faked_cpc = self.server.hmc.cpcs.add({
+            'object-id': 'cpc1',
+            'name': 'CPC1',
+            'dpm-enabled': True,
+        })
+        for i in range(1, 6):
+            faked_cpc.partitions.add({
+                'object-id': 'part{}'.format(i),
+                'name': 'PART{}'.format(i),
+                'description': 'Partition #{}'.format(i),
+                'status': 'active' if i % 2 else 'stopped',
+                'type': 'linux',
+            })
+        faked_cpc.adapters.add({
+            'object-id': 'osa1',
+            'name': 'OSA1',
+            'adapter-family': 'osa',
+            'type': 'osd',
+        })
+        self.server.start()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        with mock.patch('zhmcclient._async_session._HMC_SCHEME', 'http'):
+            self.session = AsyncSession(
+                self.server.host, 'fake-user', 'fake-pw',
+                port=self.server.port)
+        self.client = AsyncClient(self.session)
+
+    def teardown_method(self):
+        self.loop.run_until_complete(self.session.close())
+        self.loop.close()
+        asyncio.set_event_loop(None)
+        self.server.stop()
+
+    def run(self, coro):
+        """Run a coroutine in the event loop of the test."""
+        return self.loop.run_until_complete(coro)
+
+    def test_query_api_version(self):
+        """Test query_api_version() and version_info()."""
+        result = self.run(self.client.query_api_version())
+
+        assert result['hmc-version'] == '2.13.1'
+        assert self.run(self.client.version_info()) == (1, 8)
+        assert self.server.logon_count == 0
+
+    def test_cpcs_list(self):
+        """Test list() for CPCs."""
+        cpcs = self.run(self.client.cpcs.list())
+
+        assert len(cpcs) == 1
+        cpc = cpcs[0]
+        assert isinstance(cpc, Cpc)
+        assert cpc.uri == '/api/cpcs/cpc1'
+        assert cpc.name == 'CPC1'
+        assert not cpc.full_properties
+
+    def test_cpcs_find(self):
+        """Test find() for CPCs, using the Name-URI cache."""
+        cpc = self.run(self.client.cpcs.find(name='CPC1'))
+
+        assert cpc.uri == '/api/cpcs/cpc1'
+        assert self.server.count('GET', '/api/cpcs') == 1
+
+        self.run(self.client.cpcs.find(name='CPC1'))
+
+        assert self.server.count('GET', '/api/cpcs') == 1
+
+        with pytest.raises(NotFound):
+            self.run(self.client.cpcs.find(name='CPC2'))
+
+    def test_cpcs_list_oid(self):
+        """Test list() for CPCs with the optimized lookup by object-id."""
+        cpcs = self.run(self.client.cpcs.list(
+            filter_args={'object-id': 'cpc1'}))
+
+        assert [cpc.uri for cpc in cpcs] == ['/api/cpcs/cpc1']
+        assert cpcs[0].full_properties
+
+        cpcs = self.run(self.client.cpcs.list(
+            filter_args={'object-id': 'foo'}))
+
+        assert cpcs == []
+
+    def test_partitions_list_full(self):
+        """Test list() for partitions with full properties."""
+        cpc = self.run(self.client.cpcs.find(name='CPC1'))
+        partitions = self.client.manager(cpc.partitions)
+
+        assert isinstance(partitions, AsyncManager)
+
+        part_list = self.run(partitions.list(full_properties=True))
+
+        assert len(part_list) == 5
+        for part in part_list:
+            assert isinstance(part, Partition)
+            assert part.full_properties
+            assert part.properties['type'] == 'linux'
+        assert sorted(p.name for p in part_list) == \
+            ['PART1', 'PART2', 'PART3', 'PART4', 'PART5']
+
+    def test_partitions_list_filter(self):
+        """Test list() for partitions with server-side and client-side
+        filtering."""
+        cpc = self.run(self.client.cpcs.find(name='CPC1'))
+        partitions = self.client.manager(cpc.partitions)
+
+        part_list = self.run(partitions.list(
+            filter_args={'status': 'active', 'description': '.*#[13]'}))
+
+        assert sorted(p.name for p in part_list) == ['PART1', 'PART3']
+
+    def test_partitions_find(self):
+        """Test find() and findall() for partitions."""
+        cpc = self.run(self.client.cpcs.find(name='CPC1'))
+        partitions = self.client.manager(cpc.partitions)
+
+        part = self.run(partitions.find(name='PART2'))
+
+        assert part.uri == '/api/partitions/part2'
+
+        with pytest.raises(NoUniqueMatch):
+            self.run(partitions.find(status='active'))
+
+        part_list = self.run(partitions.findall(name='PART9'))
+
+        assert part_list == []
+
+    def test_pull_full_properties(self):
+        """Test pull_full_properties()."""
+        cpc = self.run(self.client.cpcs.find(name='CPC1'))
+        adapters = self.client.manager(cpc.adapters)
+        adapter = self.run(adapters.find(name='OSA1'))
+
+        assert not adapter.full_properties
+
+        self.run(adapters.pull_full_properties(adapter))
+
+        assert adapter.full_properties
+        assert adapter.properties['adapter-family'] == 'osa'
+
+    def test_list_unsupported(self):
+        """Test that list() for an element resource is not supported."""
+        cpc = self.run(self.client.cpcs.find(name='CPC1'))
+        partitions = self.client.manager(cpc.partitions)
+        part = self.run(partitions.find(name='PART1'))
+        nics = self.client.manager(part.nics)
+
+        with pytest.raises(NotImplementedError):
+            self.run(nics.list())
@@ -0,0 +1,233 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _async_session module.
+
+The tests run against a local HTTP server that stands in for the HMC.
+"""
+
+from __future__ import absolute_import, print_function
+
+import pytest
+import mock
+
+from zhmcclient import HTTPError, ConnectionError, OperationTimeout, \
+    RetryTimeoutConfig
+from tests.common.http_server import FakedHttpServer
+
+# The asyncio support requires Python 3.5 and the aiohttp package
+pytest.importorskip('aiohttp')
+
+import asyncio  # noqa: E402
+from zhmcclient import AsyncSession, AsyncJob  # noqa: E402
+
+
+class TestAsyncSession(object):
+    """All tests for the AsyncSession and AsyncJob classes."""
+
+    def setup_method(self):
+        self.server = FakedHttpServer()
+        self.server.hmc.cpcs.add({
+            'object-id': 'cpc1',
+            'name': 'CPC1',
+            'dpm-enabled': True,
+        })
+        self.server.start()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        with mock.patch('zhmcclient._async_session._HMC_SCHEME', 'http'):
+            self.session = AsyncSession(
+                self.server.host, 'fake-user', 'fake-pw',
+                port=self.server.port)
+
+    def teardown_method(self):
+        self.loop.run_until_complete(self.session.close())
+        self.loop.close()
+        asyncio.set_event_loop(None)
+        self.server.stop()
+
+    def run(self, coro):
+        """Run a coroutine in the event loop of the test."""
+        return self.loop.run_until_complete(coro)
+
+    def test_init(self):
+        """Test initialization of AsyncSession."""
+        session = self.session
+
+        assert session.host == self.server.host
+        assert session.port == self.server.port
+        assert session.userid == 'fake-user'
+        assert session.session_id is None
+        assert session.session is None
+        assert session.base_url == 'http://{}:{}'.format(
+            self.server.host, self.server.port)
+        assert 'X-API-Session' not in session.headers
+        assert session.retry_timeout_config.pool_maxsize == \
+            AsyncSession.default_rt_config.pool_maxsize
+
+    def test_logon_logoff(self):
+        """Test logon(), is_logon() and logoff()."""
+        session = self.session
+
+        assert not self.run(session.is_logon())
+
+        self.run(session.logon())
+
+        assert self.run(session.is_logon())
+        assert self.run(session.is_logon(verify=False))
+        assert session.session_id == 'session-1'
+        assert session.headers['X-API-Session'] == 'session-1'
+        assert self.server.logon_count == 1
+
+        self.run(session.logoff())
+
+        assert not self.run(session.is_logon())
+        assert session.session_id is None
+        assert 'X-API-Session' not in session.headers
+        assert self.server.count('DELETE', '/api/sessions/this-session') == 1
+
+    def test_get(self):
+        """Test get() with deferred logon."""
+        result = self.run(self.session.get('/api/cpcs/cpc1'))
+
+        assert result['name'] == 'CPC1'
+        assert self.server.logon_count == 1
+
+    def test_get_no_logon(self):
+        """Test get() with an operation that does not require logon."""
+        result = self.run(self.session.get('/api/version',
+                                           logon_required=False))
+
+        assert result['hmc-version'] == '2.13.1'
+        assert self.server.logon_count == 0
+
+    def test_get_error(self):
+        """Test get() for a resource that does not exist."""
+        with pytest.raises(HTTPError) as exc_info:
+            self.run(self.session.get('/api/cpcs/foo'))
+        exc = exc_info.value
+
+        assert exc.http_status == 404
+        assert exc.reason == 1
+
+    def test_concurrent_get(self):
+        """Test that concurrent get() coroutines cause a single logon."""
+        self.server.delay = 0.1
+        coros = [self.session.get('/api/cpcs/cpc1') for _ in range(10)]
+
+        results = self.run(asyncio.gather(*coros))
+
+        assert [r['name'] for r in results] == ['CPC1'] * 10
+        assert self.server.logon_count == 1
+        assert self.server.count('GET', '/api/cpcs/cpc1') == 10
+
+    def test_concurrent_relogon(self):
+        """Test that an expired session causes a single re-logon for
+        concurrent get() coroutines."""
+        self.run(self.session.logon())
+        self.server.expire_sessions()
+        coros = [self.session.get('/api/cpcs/cpc1') for _ in range(10)]
+
+        results = self.run(asyncio.gather(*coros))
+
+        assert [r['name'] for r in results] == ['CPC1'] * 10
+        assert self.server.logon_count == 2
+        assert self.session.session_id == 'session-2'
+
+    def test_time_stats(self):
+        """Test that the time statistics are updated."""
+        self.session.time_stats_keeper.enable()
+
+        self.run(self.session.get('/api/cpcs/cpc1'))
+
+        stats = self.session.time_stats_keeper.snapshot()
+        assert stats['get /api/cpcs/cpc1'].count == 1
+        assert stats['post /api/sessions'].count == 1
+
+    def test_post_job(self):
+        """Test post() for an asynchronous operation, with
+        wait_for_completion."""
+        job_states = ['running', 'complete']
+
+        def start(body):
+            return 202, {'job-uri': '/api/jobs/job1'}
+
+        def query_job(body):
+            status = job_states.pop(0)
+            result = {'status': status}
+            if status == 'complete':
+                result['job-status-code'] = 200
+                result['job-results'] = {'foo': 'bar'}
+            return 200, result
+
+        def delete_job(body):
+            return 204, None
+
+        self.server.add_handler('POST', '/api/cpcs/cpc1/operations/start',
+                                start)
+        self.server.add_handler('GET', '/api/jobs/job1', query_job)
+        self.server.add_handler('DELETE', '/api/jobs/job1', delete_job)
+
+        job = self.run(self.session.post('/api/cpcs/cpc1/operations/start'))
+
+        assert isinstance(job, AsyncJob)
+        assert job.uri == '/api/jobs/job1'
+        assert job.op_method == 'POST'
+        assert job.op_uri == '/api/cpcs/cpc1/operations/start'
+
+        result = self.run(job.wait_for_completion())
+
+        assert result == {'foo': 'bar'}
+        assert self.server.count('GET', '/api/jobs/job1') == 2
+        assert self.server.count('DELETE', '/api/jobs/job1') == 1
+
+    def test_post_job_timeout(self):
+        """Test post() with wait_for_completion for an asynchronous operation
+        that does not complete in time."""
+
+        self.server.add_handler(
+            'POST', '/api/cpcs/cpc1/operations/start',
+            lambda body: (202, {'job-uri': '/api/jobs/job1'}))
+        self.server.add_handler(
+            'GET', '/api/jobs/job1',
+            lambda body: (200, {'status': 'running'}))
+
+        with pytest.raises(OperationTimeout) as exc_info:
+            self.run(self.session.post('/api/cpcs/cpc1/operations/start',
+                                       wait_for_completion=True,
+                                       operation_timeout=1))
+        assert exc_info.value.operation_timeout == 1
+
+    def test_post_sync(self):
+        """Test post() for a synchronous operation."""
+        self.run(self.session.post('/api/cpcs/cpc1',
+                                   body={'description': 'new'}))
+
+        result = self.run(self.session.get('/api/cpcs/cpc1'))
+        assert result['description'] == 'new'
+
+    def test_connection_error(self):
+        """Test that a connection failure raises ConnectionError."""
+        self.server.stop()
+        rt_config = RetryTimeoutConfig(connect_retries=0)
+        with mock.patch('zhmcclient._async_session._HMC_SCHEME', 'http'):
+            session = AsyncSession(self.server.host, 'fake-user', 'fake-pw',
+                                   port=self.server.port,
+                                   retry_timeout_config=rt_config)
+        try:
+            with pytest.raises(ConnectionError):
+                self.run(session.get('/api/version', logon_required=False))
+        finally:
+            self.run(session.close())
@@ -0,0 +1,217 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _cache_coherence module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import json
+import time
+import pytest
+from mock import patch
+import requests_mock
+
+from zhmcclient import Client, Session, CacheCoherenceService
+from zhmcclient_mock import FakedSession
+
+from tests.unit.zhmcclient.test_notification import StompStandIn
+
+
+def object_headers(noti_type, uri, resource_class, **headers):
+    """Return the headers of an object notification for a resource."""
+    headers.update({
+        'notification-type': noti_type,
+        'object-uri': uri,
+        'class': resource_class,
+    })
+    return headers
+
+
+class TestCacheCoherenceService(object):
+    """All tests for the CacheCoherenceService class."""
+
+    def setup_method(self):
+        """
+        Set up a faked session with a CPC in DPM mode that has two
+        partitions, and a client with an identity map whose partition manager
+        has all partitions loaded.
+        """
+        self.session = FakedSession('fake-host', 'fake-hmc', '2.13.1', '1.8')
+        self.faked_cpc = self.session.hmc.cpcs.add({
+            'object-id': 'cpc1-oid',
+            'parent': None,
+            'class': 'cpc',
+            'name': 'cpc1',
+            'dpm-enabled': True,
+        })
+        for name in ('part1', 'part2'):
+            self.faked_cpc.partitions.add({
+                'object-id': name + '-oid',
+                'parent': self.faked_cpc.uri,
+                'class': 'partition',
+                'name': name,
+                'status': 'stopped',
+                'description': name + ' description',
+            })
+        self.client = Client(self.session, identity_map=True)
+        self.cpc = self.client.cpcs.find(name='cpc1')
+        partitions = self.cpc.partitions.list(full_properties=True)
+        # pylint: disable=protected-access
+        self.cpc.partitions._name_uri_cache.set_resources(partitions)
+        self.service = CacheCoherenceService(self.client, start=False)
+
+    def test_init_no_identity_map(self):
+        """Test that a client without identity map is rejected."""
+        with pytest.raises(ValueError):
+            CacheCoherenceService(Client(self.session), start=False)
+
+    def test_property_change(self):
+        """Test that property changes are applied to the resource object and
+        to the Name-URI cache."""
+        part1 = self.cpc.partitions.find_by_name('part1')
+        headers = object_headers('property-change', part1.uri, 'partition')
+        message = {'change-reports': [
+            {'property-name': 'description', 'old-value': 'part1 description',
+             'new-value': 'new description'},
+            {'property-name': 'name', 'old-value': 'part1',
+             'new-value': 'part1-new'},
+        ]}
+
+        # Execute the code to be tested
+        self.service.apply_notification(headers, message)
+
+        # pylint: disable=protected-access
+        cache = self.cpc.partitions._name_uri_cache
+        assert part1.properties['description'] == 'new description'
+        assert part1.name == 'part1-new'
+        assert cache.get_cached('part1') is None
+        assert cache.get_cached('part1-new') == part1.uri
+        assert self.cpc.partitions.find_by_name('part1-new') is part1
+        assert self.service.num_applied == 1
+
+    def test_status_change(self):
+        """Test that status changes are applied to the resource object."""
+        part1 = self.cpc.partitions.find_by_name('part1')
+        headers = object_headers('status-change', part1.uri, 'partition')
+        message = {'change-reports': [
+            {'old-status': 'stopped', 'new-status': 'active',
+             'has-unacceptable-status': False},
+        ]}
+
+        # Execute the code to be tested
+        self.service.apply_notification(headers, message)
+
+        assert part1.properties['status'] == 'active'
+        assert part1.properties['has-unacceptable-status'] is False
+        partitions = self.cpc.partitions.list(
+            filter_args={'status': 'active'})
+        assert partitions == [part1]
+
+    def test_inventory_add(self):
+        """Test that an added resource is added to the resource manager of
+        its parent."""
+        faked_part3 = self.faked_cpc.partitions.add({
+            'object-id': 'part3-oid',
+            'parent': self.faked_cpc.uri,
+            'class': 'partition',
+            'name': 'part3',
+            'status': 'stopped',
+        })
+        headers = object_headers('inventory-change', faked_part3.uri,
+                                 'partition', action='add')
+
+        # Execute the code to be tested
+        self.service.apply_notification(headers, None)
+
+        partitions = self.cpc.partitions.list()
+        assert sorted(p.name for p in partitions) == \
+            ['part1', 'part2', 'part3']
+        part3 = self.client.identity_map.get(faked_part3.uri)
+        assert part3 in partitions
+        assert part3.full_properties
+
+    def test_inventory_remove(self):
+        """Test that a removed resource is removed from its resource manager
+        and from the identity map."""
+        part2 = self.cpc.partitions.find_by_name('part2')
+        headers = object_headers('inventory-change', part2.uri, 'partition',
+                                 action='remove')
+
+        # Execute the code to be tested
+        self.service.apply_notification(headers, None)
+
+        # pylint: disable=protected-access
+        cache = self.cpc.partitions._name_uri_cache
+        assert [p.name for p in self.cpc.partitions.list()] == ['part1']
+        assert cache.get_cached('part2') is None
+        assert part2.uri not in self.client.identity_map
+
+    def test_other_notification(self):
+        """Test that notifications of other types are ignored."""
+        headers = {'notification-type': 'job-completion',
+                   'job-uri': '/api/jobs/fake-job-1'}
+
+        # Execute the code to be tested
+        self.service.apply_notification(headers, None)
+
+        assert self.service.num_applied == 0
+
+    @patch(target='stomp.Connection', new=StompStandIn)
+    def test_service(self):
+        """Test that the service receives and applies the notifications of
+        the object notification topic."""
+        StompStandIn.connections = []
+        session = Session('fake-hmc', 'fake-userid', 'fake-password')
+        client = Client(session, identity_map=True)
+        cpc_uri = '/api/cpcs/cpc1'
+
+        with requests_mock.mock() as m:
+            m.post('/api/sessions', json={'api-session': 'fake-session-id'})
+            m.get('/api/sessions/operations/get-notification-topics', json={
+                'topics': [
+                    {'topic-type': 'job-notification',
+                     'topic-name': 'fake-job-topic'},
+                    {'topic-type': 'object-notification',
+                     'topic-name': 'fake-object-topic'},
+                ]})
+            m.get('/api/cpcs', json={'cpcs': [
+                {'object-uri': cpc_uri, 'name': 'cpc1'},
+            ]})
+            cpc = client.cpcs.find_by_name('cpc1')
+
+            # Execute the code to be tested
+            service = CacheCoherenceService(client)
+
+        conn = StompStandIn.connections[0]
+        assert conn.destination == '/topic/fake-object-topic'
+        assert service.running
+
+        headers = object_headers('property-change', cpc_uri, 'cpc')
+        message = {'change-reports': [
+            {'property-name': 'description', 'old-value': '',
+             'new-value': 'new description'},
+        ]}
+        conn.send_notification(headers, json.dumps(message))
+        for _ in range(100):
+            if service.num_applied:
+                break
+            time.sleep(0.01)
+
+        assert cpc.properties['description'] == 'new description'
+
+        service.close()
+
+        assert not service.running
@@ -0,0 +1,295 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _circuit_breaker module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import time
+import requests
+import requests_mock
+import mock
+import pytest
+
+from zhmcclient import CircuitBreaker, CircuitBreakerOpen, ConnectionError, \
+    HTTPError, OperationTimeout, Session, Client, RetryPolicy
+
+VERSION_RESP = {'api-major-version': 2, 'api-minor-version': 20}
+
+
+def connection_error():
+    """Return a requests_mock response that fails to connect."""
+    return {'exc': requests.exceptions.ConnectionError('refused')}
+
+
+class TestCircuitBreaker(object):
+    """All tests for the CircuitBreaker class."""
+
+    def test_init(self):
+        """Test initialization of CircuitBreaker."""
+        breaker = CircuitBreaker()
+
+        assert breaker.failure_threshold == 5
+        assert breaker.reset_timeout == 30
+        assert breaker.state == 'closed'
+        assert breaker.available
+        assert breaker.failures == 0
+        assert breaker.last_error is None
+        assert breaker.retry_in() is None
+
+    def test_init_error(self):
+        """Test initialization of CircuitBreaker with an invalid failure
+        threshold."""
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_threshold=0)
+
+    def test_open(self):
+        """Test that the circuit breaker opens after the failure threshold
+        is reached, and fails fast while open."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+        error = ConnectionError('refused', None)
+
+        assert not breaker.before_request()
+        breaker.failure(error)
+        assert breaker.state == 'closed'
+        breaker.failure(error)
+
+        assert breaker.state == 'open'
+        assert not breaker.available
+        assert breaker.failures == 2
+        assert breaker.last_error is error
+        assert 29 < breaker.retry_in() <= 30
+        with pytest.raises(CircuitBreakerOpen) as exc_info:
+            breaker.before_request()
+        assert isinstance(exc_info.value, ConnectionError)
+
+    def test_success_resets(self):
+        """Test that a success resets the consecutive failures."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        error = ConnectionError('refused', None)
+
+        breaker.failure(error)
+        breaker.success()
+        breaker.failure(error)
+
+        assert breaker.state == 'closed'
+        assert breaker.failures == 1
+
+    def test_half_open(self):
+        """Test that exactly one probe is allowed after the reset timeout,
+        and that its outcome determines the next state."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        error = ConnectionError('refused', None)
+        breaker.failure(error)
+        opened_at = breaker._opened_at
+
+        with mock.patch('time.time', return_value=opened_at + 31):
+            assert breaker.retry_in() == 0
+            assert breaker.before_request()
+            assert breaker.state == 'half-open'
+            with pytest.raises(CircuitBreakerOpen):
+                breaker.before_request()
+
+            breaker.failure(error)
+            assert breaker.state == 'open'
+            with pytest.raises(CircuitBreakerOpen):
+                breaker.before_request()
+
+        with mock.patch('time.time', return_value=opened_at + 62):
+            assert breaker.before_request()
+            breaker.success()
+
+        assert breaker.state == 'closed'
+        assert breaker.failures == 0
+
+    def test_abort_probe(self):
+        """Test that an aborted probe allows the next probe right away."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.failure(ConnectionError('refused', None))
+
+        assert breaker.before_request()
+        breaker.abort_probe()
+
+        assert breaker.state == 'open'
+        assert breaker.before_request()
+
+    def test_wait(self):
+        """Test that wait() returns after the timeout if the state does not
+        change."""
+        breaker = CircuitBreaker()
+
+        start_time = time.time()
+        state = breaker.wait(0.1)
+        duration = time.time() - start_time
+
+        assert state == 'closed'
+        assert 0.1 <= duration < 1
+
+
+class TestSessionCircuitBreaker(object):
+    """All tests for the circuit breaker of a session."""
+
+    def session(self, breaker, **kwargs):
+        """Return a session that is logged on."""
+        return Session('fake-host', 'fake-user', 'fake-pw',
+                       session_id='fake-session-id', circuit_breaker=breaker,
+                       **kwargs)
+
+    def test_fail_fast(self):
+        """Test that requests fail fast while the circuit breaker is open."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+        session = self.session(breaker)
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', **connection_error())
+
+            for _ in range(2):
+                with pytest.raises(ConnectionError):
+                    session.get('/api/cpcs')
+            with pytest.raises(CircuitBreakerOpen):
+                session.get('/api/cpcs')
+
+            num_requests = m.call_count
+
+        assert session.circuit_breaker is breaker
+        assert num_requests == 2
+        assert breaker.state == 'open'
+
+    def test_http_error_is_success(self):
+        """Test that an HTTP error response does not count as a connection
+        failure."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        session = self.session(breaker)
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', [
+                connection_error(),
+                {'status_code': 500,
+                 'json': {'http-status': 500, 'reason': 1,
+                          'message': 'fake message'}},
+                connection_error(),
+            ])
+
+            with pytest.raises(ConnectionError):
+                session.get('/api/cpcs')
+            with pytest.raises(HTTPError):
+                session.get('/api/cpcs')
+            with pytest.raises(ConnectionError):
+                session.get('/api/cpcs')
+
+        assert breaker.state == 'closed'
+        assert breaker.failures == 1
+
+    def test_probe(self):
+        """Test that the HMC is probed with 'Query API Version' before the
+        next request after the reset timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        session = self.session(breaker)
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', [connection_error(), {'json': {'cpcs': []}}])
+            m.get('/api/version', json=VERSION_RESP)
+
+            with pytest.raises(ConnectionError):
+                session.get('/api/cpcs')
+            assert breaker.state == 'open'
+
+            result = session.get('/api/cpcs')
+
+            uris = [r.path for r in m.request_history]
+
+        assert result == {'cpcs': []}
+        assert uris == ['/api/cpcs', '/api/version', '/api/cpcs']
+        assert breaker.state == 'closed'
+
+    def test_probe_failed(self):
+        """Test that a failed probe opens the circuit breaker again, and
+        that the request is not sent."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        session = self.session(breaker)
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', **connection_error())
+            m.get('/api/version', **connection_error())
+
+            with pytest.raises(ConnectionError):
+                session.get('/api/cpcs')
+            with pytest.raises(ConnectionError):
+                session.get('/api/cpcs')
+
+            uris = [r.path for r in m.request_history]
+
+        assert uris == ['/api/cpcs', '/api/version']
+        assert breaker.state == 'open'
+
+    def test_not_retried(self):
+        """Test that a request that fails fast is not retried by the retry
+        policy."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        session = self.session(breaker,
+                               retry_policy=RetryPolicy(backoff_initial=0.001))
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', **connection_error())
+
+            with pytest.raises(CircuitBreakerOpen):
+                session.get('/api/cpcs')
+
+            num_requests = m.call_count
+
+        assert num_requests == 1
+
+
+class TestWaitForAvailable(object):
+    """All tests for Client.wait_for_available() with a circuit breaker."""
+
+    def test_wait_for_probe(self):
+        """Test that wait_for_available() waits until the circuit breaker
+        allows the next probe."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.5)
+        session = Session('fake-host', circuit_breaker=breaker)
+        client = Client(session)
+
+        with requests_mock.mock() as m:
+            m.get('/api/version', [connection_error(),
+                                   {'json': VERSION_RESP}])
+
+            start_time = time.time()
+            client.wait_for_available(operation_timeout=10)
+            duration = time.time() - start_time
+
+            num_requests = m.call_count
+
+        assert num_requests == 2
+        assert 0.5 <= duration < 2
+        assert breaker.state == 'closed'
+
+    def test_timeout(self):
+        """Test that wait_for_available() checks once more when the timeout
+        expires."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        session = Session('fake-host', circuit_breaker=breaker)
+        client = Client(session)
+
+        with requests_mock.mock() as m:
+            m.get('/api/version', **connection_error())
+
+            start_time = time.time()
+            with pytest.raises(OperationTimeout):
+                client.wait_for_available(operation_timeout=0.5)
+            duration = time.time() - start_time
+
+        assert duration < 2
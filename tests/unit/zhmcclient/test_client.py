@@ -19,8 +19,9 @@ Unit tests for _client module.
 from __future__ import absolute_import, print_function
 
 import pytest
+import requests_mock
 
-from zhmcclient import Client, CpcManager, MetricsContextManager
+from zhmcclient import Client, CpcManager, MetricsContextManager, Session
 from zhmcclient_mock import FakedSession
 
 
@@ -139,3 +140,114 @@ class TestClient(object):
             inventory = client.get_inventory(resources)
 
             assert inventory == exp_inventory
+
+    def test_iter_inventory(self):
+        """Test Client.iter_inventory()."""
+
+        inventory = [
+            {'class': 'cpc', 'object-uri': '/api/cpcs/cpc1', 'name': 'CPC1'},
+            {'class': 'partition', 'object-uri': '/api/partitions/part1',
+             'name': 'PART1'},
+        ]
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          session_id='fake-session-id')
+        client = Client(session)
+
+        with requests_mock.mock() as m:
+            m.post('/api/services/inventory', json=inventory)
+
+            # Execute the code to be tested
+            resources = client.iter_inventory(['cpc', 'partition'])
+
+            assert m.call_count == 0
+            assert list(resources) == inventory
+            assert m.request_history[0].json() == \
+                {'resources': ['cpc', 'partition']}
+
+    def test_load_inventory(self):
+        """Test Client.load_inventory()."""
+
+        inventory = [
+            {'class': 'cpc', 'object-uri': '/api/cpcs/cpc1', 'name': 'CPC1',
+             'dpm-enabled': True},
+            {'class': 'partition', 'object-uri': '/api/partitions/part1',
+             'name': 'PART1', 'parent': '/api/cpcs/cpc1', 'status': 'active'},
+            {'class': 'partition', 'object-uri': '/api/partitions/part2',
+             'name': 'PART2', 'parent': '/api/cpcs/cpc1', 'status': 'stopped'},
+            {'class': 'nic',
+             'element-uri': '/api/partitions/part1/nics/nic1',
+             'name': 'NIC1', 'parent': '/api/partitions/part1'},
+            {'class': 'user', 'object-uri': '/api/users/user1',
+             'name': 'USER1', 'parent': '/api/console'},
+        ]
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          session_id='fake-session-id')
+        client = Client(session)
+
+        with requests_mock.mock() as m:
+            m.post('/api/services/inventory', json=inventory)
+
+            # Execute the code to be tested
+            obj_list = client.load_inventory(['partition', 'user'])
+
+            assert m.call_count == 1
+            assert m.request_history[0].json() == \
+                {'resources': ['cpc', 'user', 'partition']}
+            assert [obj.uri for obj in obj_list] == [
+                '/api/cpcs/cpc1', '/api/users/user1',
+                '/api/partitions/part1', '/api/partitions/part2',
+                '/api/partitions/part1/nics/nic1']
+
+            cpc = client.cpcs.find(name='CPC1')
+            partitions = cpc.partitions.list(
+                filter_args={'status': 'stopped'})
+            partition = cpc.partitions.find_by_name('PART1')
+            nics = partition.nics.list()
+            hbas = partition.hbas.list()
+            user = client.consoles.console.users.find(name='USER1')
+
+            assert m.call_count == 1
+            assert [p.name for p in partitions] == ['PART2']
+            assert partition.full_properties
+            assert partition.get_property('status') == 'active'
+            assert [n.uri for n in nics] == ['/api/partitions/part1/nics/nic1']
+            assert hbas == []
+            assert user.uri == '/api/users/user1'
+
+    def test_load_inventory_invalidate(self):
+        """Test that invalidating the Name-URI cache of a manager after
+        Client.load_inventory() causes its resources to be listed on the HMC
+        again."""
+
+        inventory = [
+            {'class': 'cpc', 'object-uri': '/api/cpcs/cpc1', 'name': 'CPC1'},
+        ]
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          session_id='fake-session-id')
+        client = Client(session)
+
+        with requests_mock.mock() as m:
+            m.post('/api/services/inventory', json=inventory)
+            m.get('/api/cpcs', json={'cpcs': [
+                {'object-uri': '/api/cpcs/cpc1', 'name': 'CPC1'},
+                {'object-uri': '/api/cpcs/cpc2', 'name': 'CPC2'},
+            ]})
+            client.load_inventory(['cpc'])
+
+            assert len(client.cpcs.list()) == 1
+
+            # Execute the code to be tested
+            client.cpcs.invalidate_cache()
+
+            assert len(client.cpcs.list()) == 2
+            assert m.call_count == 2
+
+    def test_load_inventory_invalid(self):
+        """Test Client.load_inventory() with an invalid resource class."""
+
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          session_id='fake-session-id')
+        client = Client(session)
+
+        with pytest.raises(ValueError):
+            client.load_inventory(['cpc', 'foo'])
@@ -0,0 +1,245 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _deadline module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import time
+import threading
+import requests
+import requests_mock
+import pytest
+
+from zhmcclient import Deadline, DeadlineExceeded, OperationTimeout, \
+    Session, Job, Client, RetryPolicy, HTTPError
+from zhmcclient_mock import FakedSession
+
+
+class TestDeadline(object):
+    """All tests for the Deadline class."""
+
+    def test_init(self):
+        """Test initialization of Deadline."""
+        before = time.time()
+        deadline = Deadline(10)
+        after = time.time()
+
+        assert deadline.timeout == 10
+        assert before + 10 <= deadline.expires_at <= after + 10
+        assert not deadline.expired
+        assert 9 < deadline.remaining() <= 10
+
+    def test_expired(self):
+        """Test an expired deadline."""
+        deadline = Deadline(0)
+
+        assert deadline.expired
+        assert deadline.remaining() <= 0
+        with pytest.raises(DeadlineExceeded) as exc_info:
+            deadline.check("doing something")
+
+        exc = exc_info.value
+        assert isinstance(exc, OperationTimeout)
+        assert exc.operation_timeout == 0
+        assert exc.args[0] == \
+            "Deadline of 0 s expired before or during doing something"
+
+    def test_check_not_expired(self):
+        """Test that check() does not raise for a deadline that has not
+        expired."""
+        Deadline(10).check("doing something")
+
+    def test_nesting(self):
+        """Test that the deadline that expires first is current when
+        deadlines are nested."""
+        outer = Deadline(10)
+        longer = Deadline(20)
+        shorter = Deadline(5)
+
+        assert Deadline.current() is None
+        with outer:
+            assert Deadline.current() is outer
+            with longer:
+                assert Deadline.current() is outer
+                with shorter:
+                    assert Deadline.current() is shorter
+                assert Deadline.current() is outer
+            assert Deadline.current() is outer
+        assert Deadline.current() is None
+
+    def test_effective(self):
+        """Test Deadline.effective()."""
+        outer = Deadline(10)
+        longer = Deadline(20)
+        shorter = Deadline(5)
+
+        assert Deadline.effective() is None
+        assert Deadline.effective(longer) is longer
+        with outer:
+            assert Deadline.effective() is outer
+            assert Deadline.effective(longer) is outer
+            assert Deadline.effective(shorter) is shorter
+
+    def test_thread(self):
+        """Test that an active deadline does not apply to other threads."""
+        current = []
+
+        def target():
+            current.append(Deadline.current())
+
+        with Deadline(10):
+            thread = threading.Thread(target=target)
+            thread.start()
+            thread.join()
+
+        assert current == [None]
+
+
+class TestSessionDeadline(object):
+    """All tests for the deadlines of session requests."""
+
+    def session(self, **kwargs):
+        """Return a session that is logged on."""
+        return Session('fake-host', 'fake-user', 'fake-pw',
+                       session_id='fake-session-id', **kwargs)
+
+    def test_expired(self):
+        """Test that no request is sent after the deadline expired."""
+        session = self.session()
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', json={'cpcs': []})
+
+            with Deadline(0):
+                with pytest.raises(DeadlineExceeded) as exc_info:
+                    session.get('/api/cpcs')
+
+            num_requests = m.call_count
+
+        assert num_requests == 0
+        assert exc_info.value.args[0].endswith("HTTP request GET /api/cpcs")
+
+    def test_request_timeout(self):
+        """Test that the timeouts of a request are limited to the remaining
+        time of the deadline."""
+        session = self.session()
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', json={'cpcs': []})
+
+            with Deadline(5):
+                session.get('/api/cpcs')
+            session.get('/api/cpcs')
+
+            timeouts = [r.timeout for r in m.request_history]
+
+        assert 4 < timeouts[0][0] <= 5
+        assert 4 < timeouts[0][1] <= 5
+        assert timeouts[1] == (session.retry_timeout_config.connect_timeout,
+                               session.retry_timeout_config.read_timeout)
+
+    def test_timeout_during_request(self):
+        """Test that a timeout of a request whose timeouts were limited by
+        the deadline raises DeadlineExceeded."""
+        session = self.session()
+
+        def timeout_callback(request, context):
+            time.sleep(0.2)
+            raise requests.exceptions.ReadTimeout('timed out')
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', text=timeout_callback)
+
+            with Deadline(0.1):
+                with pytest.raises(DeadlineExceeded):
+                    session.get('/api/cpcs')
+
+    def test_retries(self):
+        """Test that a request is not retried when the backoff time would
+        exceed the deadline."""
+        session = self.session(retry_policy=RetryPolicy(backoff_initial=0.5,
+                                                        jitter=0))
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', status_code=503,
+                  json={'http-status': 503, 'reason': 1,
+                        'message': 'fake message'})
+
+            start_time = time.time()
+            with Deadline(0.3):
+                with pytest.raises(HTTPError):
+                    session.get('/api/cpcs')
+            duration = time.time() - start_time
+
+            num_requests = m.call_count
+
+        assert num_requests == 1
+        assert duration < 0.3
+
+
+class TestWaitDeadline(object):
+    """All tests for the deadlines of waiting methods."""
+
+    def test_job(self):
+        """Test that Job.wait_for_completion() stops waiting when the
+        deadline expires."""
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          session_id='fake-session-id')
+        job_uri = '/api/jobs/fake-job-1'
+        job = Job(session, job_uri, 'POST', '/api/foo')
+
+        with requests_mock.mock() as m:
+            m.get(job_uri, json={'status': 'running'})
+
+            start_time = time.time()
+            with pytest.raises(DeadlineExceeded):
+                job.wait_for_completion(operation_timeout=10,
+                                        deadline=Deadline(0.5))
+            duration = time.time() - start_time
+
+        assert duration < 1
+
+    def test_partition(self):
+        """Test that Partition.wait_for_status() stops waiting when the
+        active deadline expires."""
+        session = FakedSession('fake-host', 'fake-hmc', '2.13.1', '1.8')
+        faked_cpc = session.hmc.cpcs.add({
+            'object-id': 'fake-cpc1-oid',
+            'parent': None,
+            'class': 'cpc',
+            'name': 'fake-cpc1-name',
+            'dpm-enabled': True,
+        })
+        faked_cpc.partitions.add({
+            'object-id': 'fake-part1-oid',
+            'parent': faked_cpc.uri,
+            'class': 'partition',
+            'name': 'fake-part1-name',
+            'status': 'stopped',
+        })
+        client = Client(session)
+        cpc = client.cpcs.find(name='fake-cpc1-name')
+        partition = cpc.partitions.find(name='fake-part1-name')
+
+        start_time = time.time()
+        with Deadline(0.5):
+            with pytest.raises(DeadlineExceeded) as exc_info:
+                partition.wait_for_status('active', status_timeout=10)
+        duration = time.time() - start_time
+
+        assert "fake-part1-name" in exc_info.value.args[0]
+        assert duration < 1
@@ -0,0 +1,129 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _federated_client module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import time
+from collections import OrderedDict
+
+from zhmcclient import FederatedClient, Client, HTTPError, OperationTimeout, \
+    Deadline
+from zhmcclient_mock import FakedSession
+
+
+def faked_client(hmc, cpc_names):
+    """Return a client for a faked HMC that manages CPCs."""
+    session = FakedSession(hmc, 'fake-hmc', '2.13.1', '1.8')
+    for cpc_name in cpc_names:
+        session.hmc.cpcs.add({
+            'object-id': cpc_name + '-oid',
+            'parent': None,
+            'class': 'cpc',
+            'name': cpc_name,
+            'dpm-enabled': True,
+        })
+    return Client(session)
+
+
+class TestFederatedClient(object):
+    """All tests for the FederatedClient class."""
+
+    def setup_method(self):
+        """
+        Set up clients for two faked HMCs.
+        """
+        self.client1 = faked_client('hmc1', ['cpc1a', 'cpc1b'])
+        self.client2 = faked_client('hmc2', ['cpc2a'])
+
+    def test_init(self):
+        """Test initialization of FederatedClient."""
+        fed1 = FederatedClient([self.client1, self.client2])
+        fed2 = FederatedClient(OrderedDict([('a', self.client1)]), timeout=5)
+
+        assert list(fed1.clients.items()) == \
+            [('hmc1', self.client1), ('hmc2', self.client2)]
+        assert fed1.timeout is None
+        assert list(fed2.clients.items()) == [('a', self.client1)]
+        assert fed2.timeout == 5
+
+    def test_list_cpcs(self):
+        """Test list_cpcs() and merge()."""
+        fed = FederatedClient([self.client1, self.client2])
+
+        results = fed.list_cpcs()
+        merged = FederatedClient.merge(results)
+
+        assert [r.hmc for r in results] == ['hmc1', 'hmc2']
+        assert all(r.error is None for r in results)
+        assert all(r.duration >= 0 for r in results)
+        assert results[0].client is self.client1
+        assert sorted((hmc, cpc.name) for hmc, cpc in merged) == \
+            [('hmc1', 'cpc1a'), ('hmc1', 'cpc1b'), ('hmc2', 'cpc2a')]
+
+    def test_concurrent(self):
+        """Test that the work on the HMCs runs concurrently."""
+        fed = FederatedClient([self.client1, self.client2])
+
+        start_time = time.time()
+        results = fed.run(lambda client: time.sleep(0.3))
+        duration = time.time() - start_time
+
+        assert len(results) == 2
+        assert duration < 0.55
+
+    def test_isolation(self):
+        """Test that an error on one HMC does not affect the other HMCs."""
+        fed = FederatedClient([self.client1, self.client2])
+
+        def func(client):
+            if client is self.client1:
+                raise HTTPError({'http-status': 500, 'reason': 1,
+                                 'message': 'fake message'})
+            return client.cpcs.list()
+
+        results = fed.run(func)
+        merged = FederatedClient.merge(results)
+
+        assert isinstance(results[0].error, HTTPError)
+        assert results[0].value is None
+        assert results[1].error is None
+        assert [(hmc, cpc.name) for hmc, cpc in merged] == \
+            [('hmc2', 'cpc2a')]
+
+    def test_timeout(self):
+        """Test that the work on an HMC that does not complete within the
+        timeout is abandoned, and that a deadline is active for it."""
+        fed = FederatedClient([self.client1, self.client2], timeout=0.3)
+        deadlines = []
+
+        def func(client):
+            deadlines.append(Deadline.current())
+            if client is self.client1:
+                time.sleep(2)
+            return []
+
+        start_time = time.time()
+        results = fed.run(func)
+        duration = time.time() - start_time
+
+        assert isinstance(results[0].error, OperationTimeout)
+        assert results[0].value is None
+        assert results[1].error is None
+        assert results[1].value == []
+        assert all(d is not None and d.timeout == 0.3 for d in deadlines)
+        assert duration < 1
@@ -0,0 +1,109 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _filter module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import pytest
+
+from zhmcclient._filter import CompiledFilter, compile_filter
+
+PROPS = {
+    'name': 'PART1',
+    'status': 'active',
+    'ifl-processors': 4,
+    'auto-start': False,
+}
+
+
+class TestCompiledFilter(object):
+    """All tests for the CompiledFilter class and compile_filter()."""
+
+    @pytest.mark.parametrize(
+        "filter_args, exp_match", [
+            (None, True),
+            ({}, True),
+            ({'name': 'PART1'}, True),
+            ({'name': 'PART'}, False),
+            ({'name': 'PART.*'}, True),
+            ({'name': 'ART1'}, False),
+            ({'name': ['PART2', 'PART1']}, True),
+            ({'name': ('PART2', ['PART3', 'PART1'])}, True),
+            ({'name': ['PART2', 'PART3']}, False),
+            ({'ifl-processors': 4}, True),
+            ({'ifl-processors': '4'}, False),
+            ({'ifl-processors': [2, 4]}, True),
+            ({'auto-start': False}, True),
+            ({'name': 'PART1', 'status': 'stopped'}, False),
+            ({'name': 'PART1', 'status': 'act.*'}, True),
+            ({'foo': 'bar'}, False),
+        ]
+    )
+    def test_matches(self, filter_args, exp_match):
+        """Test matches() without retrieving missing properties."""
+        compiled = CompiledFilter(filter_args)
+
+        assert compiled.matches(PROPS) == exp_match
+
+    def test_pull(self):
+        """Test that missing properties are retrieved only if the present
+        properties match."""
+        compiled = CompiledFilter({'name': 'PART1', 'foo': 'bar'})
+        pulled = []
+
+        def pull(prop_names):
+            pulled.append(prop_names)
+            props = dict(PROPS)
+            props['foo'] = 'bar'
+            return props
+
+        assert compiled.matches(PROPS, pull)
+        assert pulled == [['foo']]
+
+        compiled = CompiledFilter({'name': 'PART2', 'foo': 'bar'})
+        del pulled[:]
+
+        assert not compiled.matches(PROPS, pull)
+        assert pulled == []
+
+    def test_order(self):
+        """Test that cheap checks are performed before regexp checks."""
+        compiled = CompiledFilter({'name': ['P.*', 'Q.*'], 'status': 'active',
+                                   'ifl-processors': 4})
+
+        assert compiled.prop_names == ['ifl-processors', 'status', 'name']
+
+    def test_mapping(self):
+        """Test that a compiled filter is a mapping of the filter
+        arguments."""
+        filter_args = {'name': 'PART1', 'ifl-processors': [2, 4]}
+        compiled = CompiledFilter(filter_args)
+
+        assert compiled == filter_args
+        assert dict(compiled) == filter_args
+        assert len(compiled) == 2
+        assert compiled['name'] == 'PART1'
+
+    def test_compile_filter(self):
+        """Test that compile_filter() reuses compiled filters."""
+        compiled1 = compile_filter({'name': 'PART1', 'status': ['active']})
+        compiled2 = compile_filter({'name': 'PART1', 'status': ['active']})
+        compiled3 = compile_filter({'name': 'PART1', 'status': 'active'})
+
+        assert compiled2 is compiled1
+        assert compiled3 is not compiled1
+        assert compile_filter(compiled1) is compiled1
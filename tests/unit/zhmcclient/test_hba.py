@@ -253,7 +253,7 @@ class TestHba(object):
 
         assert len(hbas) == len(exp_oids)
         if exp_oids:
-            oids = [hba.properties['element-id'] for hba in hbas]
+            oids = [hba.get_property('element-id') for hba in hbas]
             assert set(oids) == set(exp_oids)
 
     @pytest.mark.parametrize(
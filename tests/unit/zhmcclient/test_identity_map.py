@@ -0,0 +1,104 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _identity_map module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import gc
+
+from zhmcclient import Client, IdentityMap
+from zhmcclient_mock import FakedSession
+
+
+class TestIdentityMap(object):
+    """All tests for the IdentityMap class and its use by the managers."""
+
+    def setup_method(self):
+        """
+        Set up a faked session with a CPC in DPM mode that has two
+        partitions, and a client with an identity map.
+        """
+        self.session = FakedSession('fake-host', 'fake-hmc', '2.13.1', '1.8')
+        faked_cpc = self.session.hmc.cpcs.add({
+            'object-id': 'cpc1-oid',
+            'parent': None,
+            'class': 'cpc',
+            'name': 'cpc1',
+            'dpm-enabled': True,
+        })
+        for name in ('part1', 'part2'):
+            faked_cpc.partitions.add({
+                'object-id': name + '-oid',
+                'parent': faked_cpc.uri,
+                'class': 'partition',
+                'name': name,
+                'status': 'stopped',
+                'description': name + ' description',
+            })
+        self.client = Client(self.session, identity_map=True)
+
+    def test_init(self):
+        """Test that the identity map is opt-in."""
+        client = Client(self.session)
+
+        assert client.identity_map is None
+        assert isinstance(self.client.identity_map, IdentityMap)
+        assert len(self.client.identity_map) == 0
+
+    def test_same_object(self):
+        """Test that the managers return the same Python resource object for
+        a resource."""
+        cpc = self.client.cpcs.find(name='cpc1')
+
+        part1 = cpc.partitions.find(name='part1')
+        part_list = cpc.partitions.list()
+        part1_by_oid = cpc.partitions.resource_object('part1-oid')
+        cpc_again = self.client.cpcs.list()[0]
+
+        assert part1 in part_list
+        assert part1_by_oid is part1
+        assert cpc_again is cpc
+        assert self.client.identity_map.get(part1.uri) is part1
+        assert part1.uri in self.client.identity_map
+
+    def test_merge(self):
+        """Test that newly retrieved properties are merged into the existing
+        Python resource object."""
+        cpc = self.client.cpcs.find(name='cpc1')
+        part1 = cpc.partitions.find(name='part1')
+        part1.pull_properties(['description'])
+        self.session.hmc.lookup_by_uri(part1.uri).update(
+            {'status': 'active'})
+
+        cpc.partitions.list()
+
+        assert part1.properties['status'] == 'active'
+        assert part1.properties['description'] == 'part1 description'
+
+    def test_weak_references(self):
+        """Test that Python resource objects that are no longer used are
+        removed from the identity map."""
+        cpc = self.client.cpcs.find(name='cpc1')
+        cpc.partitions.list()
+        gc.collect()
+
+        assert len(self.client.identity_map) == 1
+
+        self.client.identity_map.clear()
+
+        assert len(self.client.identity_map) == 0
+        assert self.client.cpcs.find(name='cpc1') is not cpc
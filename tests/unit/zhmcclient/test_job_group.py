@@ -0,0 +1,200 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _job_group module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import time
+import threading
+import requests_mock
+import pytest
+
+from zhmcclient import Session, Job, JobGroup, HTTPError, OperationTimeout, \
+    RetryTimeoutConfig, DEFAULT_JOB_GROUP_CONCURRENCY
+
+# Retry / timeout configuration with short, fixed job poll intervals
+RT_CONFIG = RetryTimeoutConfig(
+    job_poll_initial=0.05, job_poll_factor=1, job_poll_jitter=0)
+
+
+class FakedJob(Job):
+    """
+    A job whose status checks return the results from a list, and that
+    records the number of its concurrent status checks.
+    """
+
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def __init__(self, session, uri, statuses, check_time=0):
+        super(FakedJob, self).__init__(session, uri, 'POST', '/api/foo')
+        self.statuses = list(statuses)
+        self.check_time = check_time
+
+    def check_for_completion(self):
+        with self.lock:
+            FakedJob.in_flight += 1
+            FakedJob.max_in_flight = max(FakedJob.max_in_flight,
+                                         FakedJob.in_flight)
+        time.sleep(self.check_time)
+        with self.lock:
+            FakedJob.in_flight -= 1
+        status = self.statuses.pop(0)
+        if isinstance(status, Exception):
+            raise status
+        if status == 'complete':
+            return status, {'job': self.uri}
+        return status, None
+
+
+class TestJobGroup(object):
+    """All tests for the JobGroup class."""
+
+    def setup_method(self):
+        """Create a session and reset the concurrency counters."""
+        self.session = Session('fake-host', 'fake-user', 'fake-pw',
+                               session_id='fake-session-id',
+                               retry_timeout_config=RT_CONFIG)
+        FakedJob.in_flight = 0
+        FakedJob.max_in_flight = 0
+
+    def test_init(self):
+        """Test initialization of JobGroup."""
+        jobs = [FakedJob(self.session, '/api/jobs/1', ['complete'])]
+
+        job_group = JobGroup(iter(jobs))
+
+        assert job_group.jobs == jobs
+        assert job_group.max_concurrent == DEFAULT_JOB_GROUP_CONCURRENCY
+
+        with pytest.raises(ValueError):
+            JobGroup(jobs, max_concurrent=0)
+
+    def test_wait_empty(self):
+        """Test wait() for a job group without jobs."""
+        job_group = JobGroup([])
+
+        assert list(job_group.wait()) == []
+
+    def test_wait_as_completed(self):
+        """Test that wait() yields the job results in completion order."""
+        job1 = FakedJob(self.session, '/api/jobs/1',
+                        ['running', 'running', 'running', 'complete'])
+        job2 = FakedJob(self.session, '/api/jobs/2',
+                        ['complete'])
+        job3 = FakedJob(self.session, '/api/jobs/3',
+                        ['running', 'complete'])
+        job_group = JobGroup([job1, job2, job3])
+
+        results = list(job_group.wait())
+
+        assert results == [
+            (job2, {'job': '/api/jobs/2'}, None),
+            (job3, {'job': '/api/jobs/3'}, None),
+            (job1, {'job': '/api/jobs/1'}, None),
+        ]
+
+    def test_wait_error(self):
+        """Test that wait() yields job errors and continues with the other
+        jobs."""
+        error = HTTPError({'http-status': 500, 'reason': 263,
+                           'message': 'job failed'})
+        job1 = FakedJob(self.session, '/api/jobs/1',
+                        ['running', 'running', 'complete'])
+        job2 = FakedJob(self.session, '/api/jobs/2',
+                        ['running', error])
+        job_group = JobGroup([job1, job2])
+
+        results = list(job_group.wait())
+
+        assert results == [
+            (job2, None, error),
+            (job1, {'job': '/api/jobs/1'}, None),
+        ]
+
+    def test_wait_unexpected_error(self):
+        """Test that wait() raises exceptions that are not zhmcclient
+        errors."""
+        job1 = FakedJob(self.session, '/api/jobs/1', [KeyError('foo')])
+        job_group = JobGroup([job1])
+
+        with pytest.raises(KeyError):
+            list(job_group.wait())
+
+    @pytest.mark.parametrize(
+        "max_concurrent", [1, 3]
+    )
+    def test_wait_max_concurrent(self, max_concurrent):
+        """Test that wait() limits the number of concurrent status checks."""
+        jobs = [FakedJob(self.session, '/api/jobs/{}'.format(i),
+                         ['running', 'complete'], check_time=0.05)
+                for i in range(8)]
+        job_group = JobGroup(jobs, max_concurrent=max_concurrent)
+
+        results = list(job_group.wait())
+
+        assert len(results) == len(jobs)
+        assert FakedJob.max_in_flight == max_concurrent
+
+    def test_wait_timeout(self):
+        """Test that wait() yields the completed jobs and then raises
+        OperationTimeout."""
+        job1 = FakedJob(self.session, '/api/jobs/1',
+                        ['running', 'complete'])
+        job2 = FakedJob(self.session, '/api/jobs/2',
+                        ['running'] * 100)
+        job_group = JobGroup([job1, job2])
+        results = []
+
+        start_time = time.time()
+        with pytest.raises(OperationTimeout) as exc_info:
+            for result in job_group.wait(operation_timeout=0.3):
+                results.append(result)
+        duration = time.time() - start_time
+
+        assert results == [(job1, {'job': '/api/jobs/1'}, None)]
+        assert exc_info.value.operation_timeout == 0.3
+        assert str(exc_info.value).startswith(
+            "Waiting for completion of 1 of 2 jobs timed out")
+        assert 0.3 <= duration < 1
+
+    def test_session_wait_for_jobs(self):
+        """Test Session.wait_for_jobs() with jobs on a mocked HMC."""
+        with requests_mock.mock() as m:
+            m.get('/api/jobs/1', [
+                {'json': {'status': 'running'}},
+                {'json': {'status': 'complete', 'job-status-code': 200,
+                          'job-results': {'foo': 'bar'}}},
+            ])
+            m.delete('/api/jobs/1', status_code=204)
+            m.get('/api/jobs/2', json={'status': 'complete',
+                                       'job-status-code': 204})
+            m.delete('/api/jobs/2', status_code=204)
+            job1 = Job(self.session, '/api/jobs/1', 'POST', '/api/foo')
+            job2 = Job(self.session, '/api/jobs/2', 'POST', '/api/foo')
+
+            results = list(self.session.wait_for_jobs([job1, job2]))
+
+            delete_uris = [r.path for r in m.request_history
+                           if r.method == 'DELETE']
+
+        assert results == [
+            (job2, None, None),
+            (job1, {'foo': 'bar'}, None),
+        ]
+        assert sorted(delete_uris) == ['/api/jobs/1', '/api/jobs/2']
@@ -0,0 +1,281 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _json_codec module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import json
+from collections import OrderedDict
+import requests_mock
+import pytest
+
+from zhmcclient import JsonCodec, Session, ParseError
+
+
+def _installed(backend):
+    """Return a bool indicating whether a JSON backend is installed."""
+    try:
+        __import__(backend)
+    except ImportError:
+        return False
+    return True
+
+
+# Backends that are installed, with the ordered values they support
+CODEC_ARGS = [('json', True), ('json', False)] + \
+    [(b, False) for b in ('orjson', 'ujson') if _installed(b)]
+
+# A JSON response with nested objects and non-ASCII characters
+RESPONSE = OrderedDict([
+    ('name', u'CPC1 ä'),
+    ('object-uri', '/api/cpcs/cpc1'),
+    ('dpm-enabled', True),
+    ('processor-count-ifl', 12),
+    ('storage-customer', None),
+    ('ec-mcl-description', OrderedDict([
+        ('ec', [OrderedDict([('number', 'P08449'), ('mcl', [])])]),
+    ])),
+])
+
+
+class TestJsonCodec(object):
+    """All tests for the JsonCodec class."""
+
+    def test_init_default(self):
+        """Test the default initialization of JsonCodec."""
+        codec = JsonCodec()
+
+        assert codec.backend == 'json'
+        assert codec.ordered is True
+        assert repr(codec) == "JsonCodec(backend='json', ordered=True)"
+
+    def test_init_auto(self):
+        """Test initialization of JsonCodec with the 'auto' backend."""
+        codec = JsonCodec(backend='auto', ordered=True)
+        assert codec.backend == 'json'
+
+        codec = JsonCodec(backend='auto', ordered=False)
+        exp_backend = [b for b in ('orjson', 'ujson', 'json')
+                       if _installed(b)][0]
+        assert codec.backend == exp_backend
+        assert codec.ordered is False
+
+    @pytest.mark.parametrize(
+        "backend, ordered, exp_exc_type", [
+            ('foo', False, ValueError),
+            ('orjson', True, ValueError),
+            ('ujson', True, ValueError),
+        ]
+    )
+    def test_init_error(self, backend, ordered, exp_exc_type):
+        """Test initialization of JsonCodec with invalid arguments."""
+        with pytest.raises(exp_exc_type):
+            JsonCodec(backend=backend, ordered=ordered)
+
+    @pytest.mark.parametrize(
+        "backend, ordered", CODEC_ARGS
+    )
+    def test_loads(self, backend, ordered):
+        """Test loads() from byte strings and unicode strings."""
+        codec = JsonCodec(backend=backend, ordered=ordered)
+        data = json.dumps(RESPONSE)
+
+        for d in (data, data.encode('utf-8')):
+            result = codec.loads(d)
+
+            assert result == RESPONSE
+            if ordered:
+                assert isinstance(result, OrderedDict)
+                assert list(result.keys()) == list(RESPONSE.keys())
+            else:
+                assert not isinstance(result, OrderedDict)
+
+    @pytest.mark.parametrize(
+        "backend, ordered", CODEC_ARGS
+    )
+    @pytest.mark.parametrize(
+        "data", [b'', b'{"name": "CPC1"', b'{"name"; "CPC1"}']
+    )
+    def test_loads_error(self, backend, ordered, data):
+        """Test that loads() raises ValueError for invalid JSON."""
+        codec = JsonCodec(backend=backend, ordered=ordered)
+
+        with pytest.raises(ValueError):
+            codec.loads(data)
+
+    @pytest.mark.parametrize(
+        "backend, ordered", CODEC_ARGS
+    )
+    def test_dumps(self, backend, ordered):
+        """Test that dumps() produces JSON that decodes to the object."""
+        codec = JsonCodec(backend=backend, ordered=ordered)
+
+        data = codec.dumps(RESPONSE)
+
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        assert json.loads(data) == RESPONSE
+
+
+class TestSessionJsonCodec(object):
+    """All tests for the use of a JsonCodec by a Session."""
+
+    def test_default(self):
+        """Test that a session uses OrderedDict results by default."""
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          session_id='fake-session-id')
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs/cpc1', text=json.dumps(RESPONSE))
+
+            result = session.get('/api/cpcs/cpc1')
+
+        assert session.json_codec.backend == 'json'
+        assert session.json_codec.ordered is True
+        assert isinstance(result, OrderedDict)
+        assert list(result.keys()) == list(RESPONSE.keys())
+
+    @pytest.mark.parametrize(
+        "backend, ordered", CODEC_ARGS
+    )
+    def test_get_post(self, backend, ordered):
+        """Test that get() and post() use the JSON codec of the session."""
+        codec = JsonCodec(backend=backend, ordered=ordered)
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          session_id='fake-session-id', json_codec=codec)
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs/cpc1', text=json.dumps(RESPONSE))
+            m.post('/api/cpcs/cpc1', status_code=204)
+
+            result = session.get('/api/cpcs/cpc1')
+            session.post('/api/cpcs/cpc1', body=RESPONSE)
+
+            body = m.request_history[1].body
+            content_type = m.request_history[1].headers['Content-type']
+
+        assert session.json_codec is codec
+        assert result == RESPONSE
+        assert isinstance(result, OrderedDict) == ordered
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+        assert json.loads(body) == RESPONSE
+        assert content_type == 'application/json'
+
+    @pytest.mark.parametrize(
+        "backend, ordered", CODEC_ARGS
+    )
+    def test_get_parse_error(self, backend, ordered):
+        """Test that get() raises ParseError for invalid JSON."""
+        codec = JsonCodec(backend=backend, ordered=ordered)
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          session_id='fake-session-id', json_codec=codec)
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs/cpc1', text='{"name"; "CPC1"}')
+
+            with pytest.raises(ParseError) as exc_info:
+                session.get('/api/cpcs/cpc1')
+
+        assert str(exc_info.value).startswith(
+            "JSON parse error in HTTP response: ")
+
+
+def _chunks(data, size):
+    """Return a list with the data split into chunks of a size."""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestJsonCodecIterItems(object):
+    """All tests for JsonCodec.iter_items()."""
+
+    @pytest.mark.parametrize(
+        "backend, ordered", CODEC_ARGS
+    )
+    @pytest.mark.parametrize(
+        "chunk_size", [1, 2, 7, 100000]
+    )
+    def test_member(self, backend, ordered, chunk_size):
+        """Test iter_items() for an array in a member of an object."""
+        codec = JsonCodec(backend=backend, ordered=ordered)
+        items = [RESPONSE, 42, -1.5e3, u'a "quoted" ]}, string\\', None,
+                 True, [[], {}]]
+        obj = OrderedDict([
+            ('before', {'nested': [1, {'cpcs': []}], 's': ']}"'}),
+            ('cpcs', items),
+            ('after', 'not read'),
+        ])
+        data = json.dumps(obj).encode('utf-8')
+
+        result = list(codec.iter_items(_chunks(data, chunk_size), 'cpcs'))
+
+        assert result == items
+        if ordered:
+            assert list(result[0].keys()) == list(RESPONSE.keys())
+
+    @pytest.mark.parametrize(
+        "data, exp_items", [
+            (b'[]', []),
+            (b' [ ] ', []),
+            (b'', []),
+            (b'[1,2 , 3]', [1, 2, 3]),
+            (b'\n[\n{"a": "b"}\n]\n', [{'a': 'b'}]),
+        ]
+    )
+    def test_array(self, data, exp_items):
+        """Test iter_items() for JSON text that is an array."""
+        codec = JsonCodec()
+
+        result = list(codec.iter_items(_chunks(data, 3) if data else []))
+
+        assert result == exp_items
+
+    @pytest.mark.parametrize(
+        "data, member", [
+            (b'[1, 2', None),
+            (b'[1 2]', None),
+            (b'[,]', None),
+            (b'{"cpcs": []}', None),
+            (b'[1]', 'cpcs'),
+            (b'{"foo": []}', 'cpcs'),
+            (b'{}', 'cpcs'),
+            (b'{"foo": [1, 2}, "cpcs": []}', 'cpcs'),
+            (b'{"cpcs": [{"name": "a"]}', 'cpcs'),
+            (b'{"cpcs": [{"name": "a}]}', 'cpcs'),
+        ]
+    )
+    def test_error(self, data, member):
+        """Test that iter_items() raises ValueError for invalid JSON."""
+        codec = JsonCodec()
+
+        with pytest.raises(ValueError):
+            list(codec.iter_items(_chunks(data, 4), member))
+
+    def test_incremental(self):
+        """Test that iter_items() yields items before reading all data."""
+        codec = JsonCodec()
+        read = []
+
+        def chunks():
+            for chunk in _chunks(b'[{"n": 1}, {"n": 2}, {"n": 3}]', 10):
+                read.append(chunk)
+                yield chunk
+
+        items = codec.iter_items(chunks())
+
+        assert next(items) == {'n': 1}
+        assert len(read) == 1
@@ -23,9 +23,10 @@ import time
 import re
 import warnings
 import pytest
+import mock
 
 from zhmcclient import BaseResource, BaseManager, Session, NotFound, \
-    NoUniqueMatch
+    NoUniqueMatch, RetryTimeoutConfig, HTTPError
 from zhmcclient._manager import _NameUriCache
 
 
@@ -63,6 +64,7 @@ class MyManager(BaseManager):
             query_props=[])
         self._list_resources = []  # resources to return in list()
         self._list_called = 0  # number of calls to list()
+        self._list_filter_args = None  # filter args of last call to list()
 
     def list(self, full_properties=False, filter_args=None):
         # This mocked implementation does its work based upon the
@@ -73,6 +75,7 @@ class MyManager(BaseManager):
             if not filter_args or self._matches_filters(res, filter_args):
                 result_list.append(res)
         self._list_called += 1
+        self._list_filter_args = filter_args
         return result_list
 
 
@@ -795,3 +798,138 @@ class TestNameUriCache(object):
         act_resource2_uri = self.cache.get(self.resource2_name)
         assert self.manager._list_called == 1
         assert act_resource2_uri == resource2_new_uri
+
+    def test_maxsize(self):
+        """Test that the least recently used entries are evicted when the
+        maximum size is exceeded."""
+        cache = _NameUriCache(self.manager, self.timetolive, maxsize=2)
+        cache.update('a', '/api/a')
+        cache.update('b', '/api/b')
+
+        # Access 'a' so that 'b' becomes the least recently used entry
+        cache.get('a')
+        cache.update('c', '/api/c')
+
+        assert list(cache._uris.keys()) == ['a', 'c']
+
+    def test_negative(self):
+        """Test that a name that was not found is remembered for the negative
+        time to live."""
+        cache = _NameUriCache(self.manager, self.timetolive,
+                              negative_timetolive=5)
+
+        with pytest.raises(NotFound):
+            cache.get('non-existing')
+        with pytest.raises(NotFound):
+            cache.get('non-existing')
+
+        assert self.manager._list_called == 1
+        assert cache.statistics() == {'hits': 1, 'misses': 1, 'refreshes': 1}
+
+        # After the negative time to live, the name is looked up again
+        later = time.time() + 6
+        with mock.patch('time.time', return_value=later):
+            with pytest.raises(NotFound):
+                cache.get('non-existing')
+
+        assert self.manager._list_called == 2
+
+        # Adding the name ends remembering it as not found
+        cache.update('non-existing', '/api/fake-uri-3')
+
+        assert cache.get('non-existing') == '/api/fake-uri-3'
+
+    def test_targeted(self):
+        """Test that a lookup of a name that is not cached lists only the
+        resources with that name, if the manager supports filtering by name
+        on the HMC."""
+        self.manager._query_props = [self.manager._name_prop]
+        name = self.resource1_name
+
+        uri = self.cache.get(name)
+
+        assert uri == self.resource1_uri
+        assert self.manager._list_called == 1
+        assert self.manager._list_filter_args == \
+            {self.manager._name_prop: re.escape(name)}
+        assert set(self.cache._uris.keys()) == {name}
+        assert self.cache.statistics() == \
+            {'hits': 0, 'misses': 1, 'refreshes': 0}
+
+    def test_manager_statistics(self):
+        """Test BaseManager.name_uri_cache_statistics()."""
+        self.manager.find_by_name(self.resource1_name)
+        self.manager.find_by_name(self.resource2_name)
+
+        assert self.manager.name_uri_cache_statistics() == \
+            {'hits': 1, 'misses': 1, 'refreshes': 1}
+
+
+class TestManagerPullFullProperties(object):
+    """All tests for BaseManager._pull_full_properties()."""
+
+    @staticmethod
+    def resources(manager, count, fail_indexes=(), delay=0.1):
+        """
+        Return resource objects whose pull_full_properties() takes some time,
+        records its start, and fails for the specified indexes.
+        """
+        calls = []
+
+        def make_pull(index):
+            def pull_full_properties():
+                calls.append(index)
+                time.sleep(delay)
+                if index in fail_indexes:
+                    raise HTTPError({'http-status': 500, 'reason': 1,
+                                     'message': 'fake error {}'.format(index)})
+            return pull_full_properties
+
+        resources = []
+        for index in range(count):
+            res = MyResource(manager, '/api/fake-uri-{}'.format(index))
+            res.pull_full_properties = make_pull(index)
+            resources.append(res)
+        return resources, calls
+
+    @staticmethod
+    def manager(list_concurrency):
+        """Return a manager whose session has the list concurrency."""
+        rt_config = RetryTimeoutConfig(list_concurrency=list_concurrency)
+        session = Session(host='fake-host', retry_timeout_config=rt_config)
+        return MyManager(session)
+
+    def test_concurrent(self):
+        """Test that the properties are retrieved concurrently, limited by
+        the list concurrency."""
+        manager = self.manager(4)
+        resources, calls = self.resources(manager, 8)
+
+        start_time = time.time()
+        manager._pull_full_properties(resources)
+        duration = time.time() - start_time
+
+        assert sorted(calls) == list(range(8))
+        assert 0.2 <= duration < 0.6
+
+    def test_serial(self):
+        """Test that a list concurrency of 1 retrieves the properties one
+        after the other, in list order."""
+        manager = self.manager(1)
+        resources, calls = self.resources(manager, 3, delay=0)
+
+        manager._pull_full_properties(resources)
+
+        assert calls == [0, 1, 2]
+
+    def test_error(self):
+        """Test that the error of the first failed resource in the list is
+        raised, and that no further retrievals are started."""
+        manager = self.manager(2)
+        resources, calls = self.resources(manager, 10, fail_indexes=(1, 2))
+
+        with pytest.raises(HTTPError) as exc_info:
+            manager._pull_full_properties(resources)
+
+        assert exc_info.value.message == "fake error 1"
+        assert len(calls) < 10
@@ -0,0 +1,157 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _max_age_policy module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import time
+import requests_mock
+import mock
+
+from zhmcclient import MaxAgePolicy, Session, Client
+
+CPC_URI = '/api/cpcs/fake-cpc-oid'
+
+
+class TestMaxAgePolicy(object):
+    """All tests for the MaxAgePolicy class."""
+
+    def test_init(self):
+        """Test initialization of MaxAgePolicy."""
+        policy = MaxAgePolicy()
+
+        assert policy.default_max_age == 300
+        assert policy.max_age('status') == 10
+        assert policy.max_age('name') == 3600
+        assert policy.max_age('object-id') is None
+        assert policy.max_age('description') == 3600
+        assert policy.max_age('foo') == 300
+        assert policy.statistics() == {'hits': 0, 'refreshes': 0,
+                                       'misses': 0}
+
+    def test_init_max_ages(self):
+        """Test initialization of MaxAgePolicy with specific max ages."""
+        policy = MaxAgePolicy(default_max_age=None,
+                              max_ages={'status': 1, 'foo': 2})
+
+        assert policy.max_age('status') == 1
+        assert policy.max_age('foo') == 2
+        assert policy.max_age('name') == 3600
+        assert policy.max_age('bar') is None
+        assert policy.max_ages['foo'] == 2
+
+    def test_is_stale(self):
+        """Test is_stale()."""
+        policy = MaxAgePolicy(default_max_age=None)
+
+        assert not policy.is_stale('status', 100, 110)
+        assert policy.is_stale('status', 100, 111)
+        assert not policy.is_stale('object-id', 0, 100000)
+        assert not policy.is_stale('foo', 0, 100000)
+
+
+class TestResourceMaxAge(object):
+    """All tests for resource properties with a max age policy."""
+
+    def setup_method(self):
+        """
+        Set up a session with a max age policy, and a CPC resource object.
+        """
+        self.policy = MaxAgePolicy()
+        self.session = Session('fake-host', 'fake-user', 'fake-pw',
+                               session_id='fake-session-id',
+                               max_age_policy=self.policy)
+        client = Client(self.session)
+        self.cpc = client.cpcs.resource_object(
+            CPC_URI, {'name': 'cpc1', 'status': 'active', 'foo': 'bar'})
+
+    def test_property_timestamp(self):
+        """Test property_timestamp()."""
+        now = time.time()
+
+        assert now - 1 <= self.cpc.property_timestamp('status') <= now
+        assert self.cpc.property_timestamp('baz') is None
+
+    def test_hit(self):
+        """Test that a fresh property is returned without a request."""
+        with requests_mock.mock() as m:
+            status = self.cpc.get_property('status')
+            name = self.cpc.prop('name')
+
+            num_requests = m.call_count
+
+        assert status == 'active'
+        assert name == 'cpc1'
+        assert num_requests == 0
+        assert self.policy.statistics() == {'hits': 2, 'refreshes': 0,
+                                            'misses': 0}
+
+    def test_refresh(self):
+        """Test that only the stale properties are retrieved when a stale
+        property is accessed."""
+        later = self.cpc.property_timestamp('status') + 60
+
+        with requests_mock.mock() as m:
+            m.get(CPC_URI, json={'status': 'degraded'})
+
+            with mock.patch('time.time', return_value=later):
+                status = self.cpc.get_property('status')
+                name = self.cpc.get_property('name')
+
+            query = m.last_request.query
+            num_requests = m.call_count
+
+        assert status == 'degraded'
+        assert name == 'cpc1'
+        assert num_requests == 1
+        assert query == 'properties=status'
+        assert self.cpc.property_timestamp('status') == later
+        assert self.policy.statistics() == {'hits': 1, 'refreshes': 1,
+                                            'misses': 0}
+
+    def test_miss(self):
+        """Test that a missing property causes the full set of properties to
+        be retrieved."""
+        full_props = {'object-uri': CPC_URI, 'name': 'cpc1',
+                      'status': 'active', 'foo': 'bar', 'baz': 42}
+
+        with requests_mock.mock() as m:
+            m.get(CPC_URI, json=full_props)
+
+            baz = self.cpc.get_property('baz')
+
+        assert baz == 42
+        assert self.cpc.full_properties
+        assert self.policy.misses == 1
+
+    def test_no_policy(self):
+        """Test that without a max age policy, cached properties are used
+        regardless of their age."""
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          session_id='fake-session-id')
+        cpc = Client(session).cpcs.resource_object(
+            CPC_URI, {'name': 'cpc1', 'status': 'active'})
+        later = cpc.property_timestamp('status') + 100000
+
+        with requests_mock.mock() as m:
+            with mock.patch('time.time', return_value=later):
+                status = cpc.get_property('status')
+
+            num_requests = m.call_count
+
+        assert status == 'active'
+        assert num_requests == 0
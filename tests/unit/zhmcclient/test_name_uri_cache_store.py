@@ -0,0 +1,140 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _name_uri_cache_store module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import time
+import requests_mock
+
+from zhmcclient import MemoryNameUriCacheStore, FileNameUriCacheStore, \
+    Session, Client
+
+CPC_URI = '/api/cpcs/fake-cpc-oid'
+CPC_KEY = ('fake-host', None, 'cpc')
+
+
+def new_client(store):
+    """Return a client for a session that uses a Name-URI cache store."""
+    session = Session('fake-host', 'fake-user', 'fake-pw',
+                      session_id='fake-session-id',
+                      name_uri_cache_store=store)
+    return Client(session)
+
+
+def find_cpc(client):
+    """
+    Find the CPC by name, and return the number of HMC requests that were
+    needed for that.
+    """
+    with requests_mock.mock() as m:
+        m.get('/api/cpcs', json={'cpcs': [
+            {'object-uri': CPC_URI, 'name': 'cpc1'},
+        ]})
+
+        cpc = client.cpcs.find_by_name('cpc1')
+
+        num_requests = m.call_count
+
+    assert cpc.uri == CPC_URI
+    return num_requests
+
+
+class TestMemoryNameUriCacheStore(object):
+    """All tests for the MemoryNameUriCacheStore class."""
+
+    def test_get_put(self):
+        """Test get() and put()."""
+        store = MemoryNameUriCacheStore()
+
+        assert store.get(CPC_KEY) is None
+
+        store.put(CPC_KEY, {'cpc1': CPC_URI}, 42.0)
+
+        assert store.get(CPC_KEY) == ({'cpc1': CPC_URI}, 42.0)
+        assert store.get(('fake-host', CPC_URI, 'cpc')) is None
+
+    def test_shared(self):
+        """Test that the Name-URI cache is shared by the managers of
+        different sessions."""
+        store = MemoryNameUriCacheStore()
+
+        num_requests1 = find_cpc(new_client(store))
+        num_requests2 = find_cpc(new_client(store))
+
+        assert num_requests1 == 1
+        assert num_requests2 == 0
+        assert store.get(CPC_KEY)[0] == {'cpc1': CPC_URI}
+
+    def test_invalidate(self):
+        """Test that invalidating the Name-URI cache through one manager
+        invalidates it for all managers."""
+        store = MemoryNameUriCacheStore()
+        client1 = new_client(store)
+        client2 = new_client(store)
+        find_cpc(client1)
+
+        client1.cpcs.invalidate_cache()
+        num_requests = find_cpc(client2)
+
+        assert num_requests == 1
+
+    def test_timetolive(self):
+        """Test that a stored Name-URI cache that is older than its time to
+        live is not used."""
+        store = MemoryNameUriCacheStore()
+        store.put(CPC_KEY, {'cpc1': '/api/cpcs/old-oid'}, time.time() - 100000)
+
+        num_requests = find_cpc(new_client(store))
+
+        assert num_requests == 1
+
+
+class TestFileNameUriCacheStore(object):
+    """All tests for the FileNameUriCacheStore class."""
+
+    def test_init(self):
+        """Test initialization of FileNameUriCacheStore."""
+        store = FileNameUriCacheStore()
+
+        assert store.directory == os.path.join(
+            os.path.expanduser('~'), '.zhmcclient', 'name-uri-cache')
+
+    def test_get_put(self, tmpdir):
+        """Test get() and put()."""
+        directory = str(tmpdir.join('cache'))
+        store = FileNameUriCacheStore(directory)
+
+        assert store.get(CPC_KEY) is None
+
+        store.put(CPC_KEY, {'cpc1': CPC_URI}, 42.0)
+
+        assert store.get(CPC_KEY) == ({'cpc1': CPC_URI}, 42.0)
+        assert store.get(('fake-host', CPC_URI, 'cpc')) is None
+        assert len(os.listdir(directory)) == 1
+
+    def test_warm_start(self, tmpdir):
+        """Test that a new store object for the same directory starts with
+        the Name-URI caches of an earlier one."""
+        directory = str(tmpdir)
+
+        num_requests1 = find_cpc(new_client(FileNameUriCacheStore(directory)))
+        num_requests2 = find_cpc(new_client(FileNameUriCacheStore(directory)))
+
+        assert num_requests1 == 1
+        assert num_requests2 == 0
@@ -301,9 +301,29 @@ class TestNic(object):
 
         assert len(nics) == len(exp_oids)
         if exp_oids:
-            oids = [nic.properties['element-id'] for nic in nics]
+            oids = [nic.get_property('element-id') for nic in nics]
             assert set(oids) == set(exp_oids)
 
+    def test_nicmanager_iter_list(self):
+        """Test NicManager.iter_list(), for resources that are not listed
+        with an HMC list operation."""
+
+        # Add two faked NICs
+        faked_nic1 = self.add_nic1()
+        faked_nic2 = self.add_nic2()
+
+        nic_mgr = self.partition.nics
+
+        # Execute the code to be tested
+        nic_iter = nic_mgr.iter_list(full_properties=True, prefetch=2)
+
+        assert not isinstance(nic_iter, list)
+        nics = list(nic_iter)
+        assert_resources(nics, [faked_nic1, faked_nic2], None)
+
+        nics = list(nic_mgr.iter_list(filter_args={'element-id': NIC2_OID}))
+        assert [nic.get_property('element-id') for nic in nics] == [NIC2_OID]
+
     @pytest.mark.parametrize(
         "initial_partition_status, exp_status_exc", [
             ('stopped', None),
@@ -22,10 +22,13 @@ requests_mock package.
 from __future__ import absolute_import, print_function
 
 import json
+import time
 import threading
 from mock import patch
+import requests_mock
 
-from zhmcclient._notification import NotificationReceiver
+from zhmcclient import Session, Job, RetryTimeoutConfig
+from zhmcclient._notification import NotificationReceiver, _JobNotifier
 
 
 class MockedStompConnection(object):
@@ -166,3 +169,166 @@ class TestNotification(object):
         msg0 = msg_items[0]
         assert msg0[0] == self.std_headers
         assert msg0[1] == message_obj
+
+
+class StompStandIn(object):
+    """
+    A class that replaces stomp.Connection and that stands in for the STOMP
+    server of the HMC, by delivering notifications to the listener on
+    request.
+    """
+
+    # The connections created so far
+    connections = []
+
+    def __init__(self, *args, **kwargs):
+        self.listener = None
+        self.destination = None
+        self.connected = False
+        self.connections.append(self)
+
+    def set_listener(self, name, listener):
+        """Stands in for the same-named method of stomp.Connection."""
+        self.listener = listener
+
+    def start(self):
+        """Stands in for the same-named method of stomp.Connection."""
+        pass
+
+    def connect(self, userid, password, wait):
+        """Stands in for the same-named method of stomp.Connection."""
+        self.connected = True
+
+    def subscribe(self, destination, id, ack):
+        """Stands in for the same-named method of stomp.Connection."""
+        self.destination = destination
+
+    def disconnect(self):
+        """Stands in for the same-named method of stomp.Connection."""
+        if self.connected:
+            self.connected = False
+            self.listener.on_disconnected()
+
+    def send_notification(self, headers, message=''):
+        """Delivers a notification to the listener, like the HMC would."""
+        self.listener.on_message(headers, message)
+
+
+def job_completion_headers(job_uri):
+    """Return the headers of a job completion notification for a job."""
+    return {
+        'notification-type': 'job-completion',
+        'job-uri': job_uri,
+    }
+
+
+class TestJobNotifier(object):
+    """All tests for the _JobNotifier class and its use by Session."""
+
+    job_uri = '/api/jobs/fake-job-1'
+
+    def setup_method(self):
+        StompStandIn.connections = []
+
+    @patch(target='stomp.Connection', new=StompStandIn)
+    def test_notifier(self):
+        """Test that the notifier wakes up registered jobs."""
+        notifier = _JobNotifier('fake-job-topic', 'fake-hmc', 'fake-userid',
+                                'fake-password')
+        conn = StompStandIn.connections[0]
+        event1 = notifier.register(self.job_uri)
+        event2 = notifier.register('/api/jobs/fake-job-2')
+
+        assert conn.destination == '/topic/fake-job-topic'
+        assert notifier.running
+
+        conn.send_notification({'notification-type': 'property-change',
+                                'job-uri': self.job_uri}, '{}')
+        conn.send_notification(job_completion_headers(self.job_uri))
+
+        assert event1.wait(1)
+        assert not event2.is_set()
+
+        notifier.unregister(self.job_uri)
+        notifier.close()
+
+        assert event2.wait(1)
+        assert not notifier.running
+        assert notifier.register('/api/jobs/fake-job-3').is_set()
+
+    @staticmethod
+    def mock_hmc(m, job_uri):
+        """Set up the mocked responses of an HMC with a running job."""
+        m.post('/api/sessions', json={'api-session': 'fake-session-id'})
+        m.delete('/api/sessions/this-session', status_code=204)
+        m.get('/api/sessions/operations/get-notification-topics', json={
+            'topics': [
+                {'topic-type': 'object-notification',
+                 'topic-name': 'fake-object-topic'},
+                {'topic-type': 'job-notification',
+                 'topic-name': 'fake-job-topic'},
+            ]})
+        m.get(job_uri, [
+            {'json': {'status': 'running'}},
+            {'json': {'status': 'complete', 'job-status-code': 200,
+                      'job-results': {'foo': 'bar'}}},
+        ])
+        m.delete(job_uri, status_code=204)
+
+    @patch(target='stomp.Connection', new=StompStandIn)
+    def test_wait_for_completion(self):
+        """Test that a job waiting for completion is woken up by its
+        completion notification instead of polling."""
+        rt_config = RetryTimeoutConfig(job_poll_initial=30, job_poll_max=30)
+        session = Session('fake-hmc', 'fake-userid', 'fake-password',
+                          retry_timeout_config=rt_config,
+                          job_notifications=True)
+        job = Job(session, self.job_uri, 'POST', '/api/foo')
+
+        def notify():
+            # Wait until the job waits for its completion notification
+            while session._job_notifier is None or \
+                    self.job_uri not in session._job_notifier._waiters:
+                time.sleep(0.01)
+            conn = StompStandIn.connections[0]
+            conn.send_notification(job_completion_headers(self.job_uri))
+
+        with requests_mock.mock() as m:
+            self.mock_hmc(m, self.job_uri)
+            notify_thread = threading.Thread(target=notify)
+            notify_thread.start()
+
+            start_time = time.time()
+            result = job.wait_for_completion()
+            duration = time.time() - start_time
+
+            notify_thread.join()
+            session.logoff()
+
+        assert result == {'foo': 'bar'}
+        assert duration < 10
+        assert len(StompStandIn.connections) == 1
+        conn = StompStandIn.connections[0]
+        assert conn.destination == '/topic/fake-job-topic'
+        assert not conn.connected
+
+    @patch(target='stomp.Connection', new=StompStandIn)
+    def test_wait_for_completion_fallback(self):
+        """Test that waiting for job completion falls back to polling when
+        job notifications cannot be received."""
+        rt_config = RetryTimeoutConfig(
+            job_poll_initial=0.01, job_poll_jitter=0)
+        # No password is known, so no notification receiver can be started
+        session = Session('fake-hmc', session_id='fake-session-id',
+                          retry_timeout_config=rt_config,
+                          job_notifications=True)
+        job = Job(session, self.job_uri, 'POST', '/api/foo')
+
+        with requests_mock.mock() as m:
+            self.mock_hmc(m, self.job_uri)
+
+            result = job.wait_for_completion()
+
+        assert result == {'foo': 'bar'}
+        assert session.job_notifications is True
+        assert StompStandIn.connections == []
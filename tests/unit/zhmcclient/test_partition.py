@@ -21,6 +21,7 @@ from __future__ import absolute_import, print_function
 import pytest
 import re
 import copy
+import mock
 
 from zhmcclient import Client, Partition, HTTPError, NotFound
 from zhmcclient_mock import FakedSession
@@ -164,6 +165,50 @@ class TestPartition(object):
 
         assert_resources(partitions, exp_faked_partitions, prop_names)
 
+    @pytest.mark.parametrize(
+        "properties, prop_names", [
+            (['status'],
+             ['object-uri', 'name', 'status']),
+            (['type', 'initial-memory'],
+             ['object-uri', 'name', 'status', 'type', 'initial-memory']),
+        ]
+    )
+    def test_partitionmanager_list_properties(self, properties, prop_names):
+        """Test PartitionManager.list() with properties."""
+
+        # Add two faked partitions
+        faked_partition1 = self.add_partition1()
+        faked_partition2 = self.add_partition2()
+
+        exp_faked_partitions = [faked_partition1, faked_partition2]
+        partition_mgr = self.cpc.partitions
+
+        # Execute the code to be tested
+        partitions = partition_mgr.list(properties=properties)
+
+        assert_resources(partitions, exp_faked_partitions, prop_names)
+        for partition in partitions:
+            assert set(partition.properties.keys()) == set(prop_names)
+            assert partition.full_properties is False
+
+    def test_partitionmanager_find_properties(self):
+        """Test PartitionManager.find() with properties."""
+
+        # Add two faked partitions
+        self.add_partition1()
+        self.add_partition2()
+
+        partition_mgr = self.cpc.partitions
+
+        # Execute the code to be tested
+        partition = partition_mgr.find(name=PART2_NAME,
+                                       properties=['type', 'maximum-memory'])
+
+        assert partition.full_properties is False
+        assert partition.properties['type'] == 'ssc'
+        assert partition.properties['maximum-memory'] == 2048
+        assert 'initial-memory' not in partition.properties
+
     @pytest.mark.parametrize(
         "filter_args, exp_names", [
             ({'object-id': PART1_OID},
@@ -239,6 +284,102 @@ class TestPartition(object):
             names = [p.properties['name'] for p in partitions]
             assert set(names) == set(exp_names)
 
+    @pytest.mark.parametrize(
+        "full_properties, filter_args, exp_names, prop_names", [
+            (False, None,
+             [PART1_NAME, PART2_NAME], ['object-uri', 'name', 'status']),
+            (True, None,
+             [PART1_NAME, PART2_NAME], None),
+            (False, {'name': 'part 1.*'},
+             [PART1_NAME], ['object-uri', 'name', 'status']),
+            (False, {'object-id': PART2_OID},
+             [PART2_NAME], None),
+            (False, {'name': PART1_NAME + 'foo'},
+             [], None),
+        ]
+    )
+    def test_partitionmanager_iter_list(
+            self, full_properties, filter_args, exp_names, prop_names):
+        """Test PartitionManager.iter_list()."""
+
+        # Add two faked partitions
+        faked_partitions = [self.add_partition1(), self.add_partition2()]
+        exp_faked_partitions = [p for p in faked_partitions
+                                if p.name in exp_names]
+        partition_mgr = self.cpc.partitions
+
+        # Execute the code to be tested
+        partition_iter = partition_mgr.iter_list(
+            full_properties=full_properties, filter_args=filter_args)
+
+        assert not isinstance(partition_iter, list)
+        partitions = list(partition_iter)
+        assert_resources(partitions, exp_faked_partitions, prop_names)
+        for name in exp_names:
+            assert partition_mgr._name_uri_cache.get_cached(name) is not None
+
+    @pytest.mark.parametrize(
+        "prefetch", [0, 1, 5]
+    )
+    def test_partitionmanager_iter_list_prefetch(self, prefetch):
+        """Test PartitionManager.iter_list() with prefetch of the full
+        properties."""
+
+        # Add two faked partitions
+        faked_partitions = [self.add_partition1(), self.add_partition2()]
+        partition_mgr = self.cpc.partitions
+
+        # Execute the code to be tested
+        partitions = list(partition_mgr.iter_list(
+            full_properties=True, prefetch=prefetch))
+
+        assert_resources(partitions, faked_partitions, None)
+        assert all(p.full_properties for p in partitions)
+
+    def test_partitionmanager_iter_list_lazy(self):
+        """Test that PartitionManager.iter_list() retrieves the full
+        properties only for the resource objects that are requested."""
+
+        # Add two faked partitions
+        self.add_partition1()
+        self.add_partition2()
+        partition_mgr = self.cpc.partitions
+
+        # Execute the code to be tested
+        with mock.patch.object(self.session, 'get',
+                               wraps=self.session.get) as get_mock:
+            partition_iter = partition_mgr.iter_list(full_properties=True)
+            partition = next(partition_iter)
+            partition_iter.close()
+
+        assert partition.full_properties
+        # The list operation and the retrieval of the first partition
+        assert get_mock.call_count == 2
+
+    @pytest.mark.parametrize(
+        "filter_args, exp_names", [
+            ({}, [PART1_NAME, PART2_NAME]),
+            ({'name': PART1_NAME}, [PART1_NAME]),
+            ({'name': PART1_NAME + 'foo'}, []),
+            ({'type': 'ssc'}, [PART2_NAME]),
+            ({'status': 'active', 'type': 'linux'}, [PART1_NAME]),
+        ]
+    )
+    def test_partitionmanager_iter_findall(self, filter_args, exp_names):
+        """Test PartitionManager.iter_findall()."""
+
+        # Add two faked partitions
+        self.add_partition1()
+        self.add_partition2()
+        partition_mgr = self.cpc.partitions
+
+        # Execute the code to be tested
+        partition_iter = partition_mgr.iter_findall(**filter_args)
+
+        assert not isinstance(partition_iter, list)
+        names = [p.properties['name'] for p in partition_iter]
+        assert set(names) == set(exp_names)
+
     @pytest.mark.parametrize(
         "input_props, exp_prop_names, exp_exc", [
             ({},
@@ -0,0 +1,181 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _rate_limiter module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import time
+import threading
+import requests_mock
+import pytest
+
+from zhmcclient import RateLimiter, RateLimit, Session
+
+
+class TestRateLimit(object):
+    """All tests for the RateLimit class."""
+
+    @pytest.mark.parametrize(
+        "kwargs, exp_rate, exp_burst, exp_max_inflight", [
+            (dict(), None, None, None),
+            (dict(rate=10), 10, 10, None),
+            (dict(rate=2.5), 2.5, 3, None),
+            (dict(rate=0.1), 0.1, 1, None),
+            (dict(rate=10, burst=20, max_inflight=5), 10, 20, 5),
+        ]
+    )
+    def test_init(self, kwargs, exp_rate, exp_burst, exp_max_inflight):
+        """Test initialization of RateLimit."""
+        limit = RateLimit(**kwargs)
+
+        assert limit.rate == exp_rate
+        assert limit.burst == exp_burst
+        assert limit.max_inflight == exp_max_inflight
+        assert limit.name is None
+        assert limit.inflight == 0
+
+    @pytest.mark.parametrize(
+        "kwargs", [
+            dict(rate=0),
+            dict(rate=-1),
+            dict(rate=1, burst=0),
+            dict(max_inflight=0),
+        ]
+    )
+    def test_init_error(self, kwargs):
+        """Test initialization of RateLimit with invalid arguments."""
+        with pytest.raises(ValueError):
+            RateLimit(**kwargs)
+
+    def test_unlimited(self):
+        """Test that an unlimited rate limit does not delay requests."""
+        limit = RateLimit()
+
+        delays = [limit.acquire() for _ in range(100)]
+
+        assert delays == [0] * 100
+        assert limit.inflight == 100
+
+    def test_rate(self):
+        """Test that the rate is limited after a burst."""
+        limit = RateLimit(rate=20, burst=2)
+
+        start_time = time.time()
+        delays = []
+        for _ in range(6):
+            delays.append(limit.acquire())
+            limit.release()
+        duration = time.time() - start_time
+
+        # The first 2 requests use the burst, and the next 4 requests need
+        # to wait for a token each (1/20 s)
+        assert delays[0:2] == [0, 0]
+        assert all(delay > 0 for delay in delays[2:])
+        assert 0.18 <= duration < 1
+
+    def test_max_inflight(self):
+        """Test that the number of requests in flight is limited."""
+        limit = RateLimit(max_inflight=2)
+        lock = threading.Lock()
+        inflight = [0]
+        max_inflight = [0]
+
+        def request():
+            limit.acquire()
+            with lock:
+                inflight[0] += 1
+                max_inflight[0] = max(max_inflight[0], inflight[0])
+            time.sleep(0.05)
+            with lock:
+                inflight[0] -= 1
+            limit.release()
+
+        threads = [threading.Thread(target=request) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max_inflight[0] == 2
+        assert limit.inflight == 0
+
+
+class TestRateLimiter(object):
+    """All tests for the RateLimiter class."""
+
+    def test_limit(self):
+        """Test the selection of the limit for a request."""
+        op_limit = RateLimit(rate=1, name='operations')
+        post_limit = RateLimit(rate=2)
+        default_limit = RateLimit(rate=10)
+        limiter = RateLimiter(
+            limits=[
+                (r'POST /api/.*/operations/.*', op_limit),
+                (r'POST .*', post_limit),
+            ],
+            default_limit=default_limit)
+
+        assert limiter.limit('POST', '/api/partitions/p1/operations/start') \
+            is op_limit
+        assert limiter.limit('POST', '/api/partitions/p1') is post_limit
+        assert limiter.limit('GET', '/api/partitions/p1/operations/x') \
+            is default_limit
+        assert limiter.default_limit is default_limit
+        assert op_limit.name == 'operations'
+        assert post_limit.name == 'POST .*'
+        assert default_limit.name == 'default'
+
+    def test_no_default(self):
+        """Test that requests without a matching limit are not limited
+        without a default limit."""
+        limiter = RateLimiter(limits=[(r'GET .*', RateLimit(rate=1))])
+
+        assert limiter.limit('POST', '/api/foo') is None
+        assert limiter.default_limit is None
+
+    def test_session(self):
+        """Test the rate limiting of the requests of a session."""
+        op_limit = RateLimit(rate=20, burst=1, name='operations')
+        limiter = RateLimiter(
+            limits=[(r'POST /api/.*/operations/.*', op_limit)],
+            default_limit=RateLimit(max_inflight=1))
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          session_id='fake-session-id', rate_limiter=limiter)
+        session.time_stats_keeper.enable()
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', json={'cpcs': []})
+            m.post('/api/cpcs/c1/operations/start', status_code=204)
+
+            for _ in range(3):
+                session.get('/api/cpcs')
+            for _ in range(3):
+                session.post('/api/cpcs/c1/operations/start')
+
+        keeper = session.time_stats_keeper
+        snapshot = keeper.snapshot()
+        counters = keeper.counters()
+
+        assert session.rate_limiter is limiter
+        assert snapshot['rate limit default'].count == 3
+        assert snapshot['rate limit default'].max_time == 0
+        assert snapshot['rate limit operations'].count == 3
+        assert snapshot['rate limit operations'].max_time > 0
+        assert 'rate limit default (delayed)' not in counters
+        assert counters['rate limit operations (delayed)'] == 2
+        assert limiter.default_limit.inflight == 0
+        assert op_limit.inflight == 0
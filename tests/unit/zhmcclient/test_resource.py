@@ -21,6 +21,7 @@ from __future__ import absolute_import, print_function
 import time
 import re
 from collections import OrderedDict
+import requests_mock
 
 from zhmcclient import BaseResource, BaseManager, Session
 
@@ -509,3 +510,60 @@ class TestManagerDivideFilter(ResourceTestCase):
 
         assert parm_str == '?qp1=bar&qp2=42&qp2={}'.format(escape_str)
         assert cf_args == {}
+
+
+class TestPullProperties(ResourceTestCase):
+    """Test BaseResource.pull_properties()."""
+
+    def setup_method(self):
+        super(TestPullProperties, self).setup_method()
+        self.session = Session('fake-host', 'fake-user', 'fake-pw',
+                               session_id='fake-session-id')
+        self.mgr = MyManager(self.session)
+
+    def test_subset(self):
+        """Test that only the specified properties are retrieved."""
+        res = MyResource(self.mgr, self.uri, self.name, None)
+
+        with requests_mock.mock() as m:
+            m.get(self.uri, json={'prop-a': 1, 'prop-b': 'b'})
+
+            res.pull_properties(['prop-a', 'prop-b'])
+
+            query = m.last_request.query
+
+        assert query == 'properties=prop-a,prop-b'
+        self.assert_properties(res, {
+            self.uri_prop: self.uri,
+            self.name_prop: self.name,
+            'prop-a': 1,
+            'prop-b': 'b',
+        })
+        assert res.full_properties is False
+
+    def test_fallback(self):
+        """Test that the full set of properties is retrieved if the HMC
+        rejects the 'properties' query parameter, and that the query parameter
+        is then no longer used for the resource type."""
+        res = MyResource(self.mgr, self.uri, self.name, None)
+        full_props = {self.uri_prop: self.uri, self.name_prop: self.name,
+                      'prop-a': 1, 'prop-b': 'b'}
+
+        def callback(request, context):
+            if request.query:
+                context.status_code = 400
+                return {'http-status': 400, 'reason': 1,
+                        'message': 'invalid query parameter'}
+            return full_props
+
+        with requests_mock.mock() as m:
+            m.get(self.uri, json=callback)
+
+            res.pull_properties(['prop-a'])
+            res.pull_properties(['prop-b'])
+
+            queries = [r.query for r in m.request_history]
+
+        assert queries == ['properties=prop-a', '', '']
+        self.assert_properties(res, full_props)
+        assert res.full_properties is True
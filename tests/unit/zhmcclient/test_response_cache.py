@@ -0,0 +1,225 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _response_cache module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import time
+import requests_mock
+import pytest
+
+from zhmcclient import ResponseCache, Session, Client, HTTPError, \
+    DEFAULT_RESPONSE_CACHE_MAXSIZE
+
+
+class TestResponseCache(object):
+    """All tests for the ResponseCache class."""
+
+    def test_init(self):
+        """Test initialization of ResponseCache."""
+        cache = ResponseCache()
+
+        assert cache.maxsize == DEFAULT_RESPONSE_CACHE_MAXSIZE
+        assert cache.default_ttl == 0
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize(
+        "uri, exp_ttl", [
+            ('/api/version', 100),
+            ('/api/cpcs', 10),
+            ('/api/cpcs?name=foo', 10),
+            ('/api/cpcs/cpc1', 5),
+            ('/api/cpcs/cpc1/partitions', 1),
+            ('/api/jobs/job1', 0),
+            ('/api/sessions/operations/get-notification-topics', 0),
+            ('/api/services/metrics/context/1', 0),
+        ]
+    )
+    def test_ttl(self, uri, exp_ttl):
+        """Test the time to live of URIs."""
+        cache = ResponseCache(
+            ttls=[
+                (r'/api/version', 100),
+                (r'/api/cpcs(\?.*)?', 10),
+                (r'/api/cpcs/[^/]+', 5),
+            ],
+            default_ttl=1)
+
+        assert cache.ttl(uri) == exp_ttl
+
+    def test_get_put(self):
+        """Test get() and put(), including the expiration."""
+        cache = ResponseCache(ttls=[(r'/api/cpcs', 0.2)])
+        result = {'cpcs': []}
+
+        assert cache.get('/api/cpcs') is None
+
+        cache.put('/api/cpcs', result, cache.generation())
+
+        cached = cache.get('/api/cpcs')
+        assert cached == result
+        cached['cpcs'].append('foo')
+        assert cache.get('/api/cpcs') == result
+
+        time.sleep(0.3)
+
+        assert cache.get('/api/cpcs') is None
+
+    def test_put_uncached(self):
+        """Test that put() does not store results of uncached URIs."""
+        cache = ResponseCache(ttls=[(r'/api/cpcs', 10)])
+
+        cache.put('/api/console', {}, cache.generation())
+
+        assert len(cache) == 0
+
+    def test_put_outdated(self):
+        """Test that put() does not store results that were retrieved while
+        the cache was invalidated."""
+        cache = ResponseCache(default_ttl=10)
+
+        generation = cache.generation()
+        cache.invalidate('/api/cpcs/cpc1/operations/start')
+        cache.put('/api/cpcs', {'cpcs': []}, generation)
+
+        assert cache.get('/api/cpcs') is None
+
+    def test_lru(self):
+        """Test the LRU eviction."""
+        cache = ResponseCache(default_ttl=10, maxsize=3)
+        for i in range(3):
+            cache.put('/api/cpcs/cpc{}'.format(i), {'i': i},
+                      cache.generation())
+        cache.get('/api/cpcs/cpc0')  # cpc1 is now least recently used
+
+        cache.put('/api/cpcs/cpc3', {'i': 3}, cache.generation())
+
+        assert len(cache) == 3
+        assert cache.get('/api/cpcs/cpc1') is None
+        assert cache.get('/api/cpcs/cpc0') == {'i': 0}
+        assert cache.get('/api/cpcs/cpc3') == {'i': 3}
+
+    @pytest.mark.parametrize(
+        "uri, exp_remaining", [
+            ('/api/partitions/part1',
+             ['/api/cpcs?name=cpc1', '/api/partitions/part2']),
+            ('/api/partitions/part1/operations/start',
+             ['/api/cpcs?name=cpc1', '/api/partitions/part1/nics/nic1',
+              '/api/partitions/part2']),
+            ('/api/partitions/part1/nics',
+             ['/api/cpcs?name=cpc1', '/api/partitions/part2']),
+            ('/api/cpcs/cpc1',
+             ['/api/partitions/part1', '/api/partitions/part1/nics/nic1',
+              '/api/partitions/part2']),
+        ]
+    )
+    def test_invalidate(self, uri, exp_remaining):
+        """Test invalidate() for related URIs."""
+        cache = ResponseCache(default_ttl=10)
+        uris = ['/api/cpcs?name=cpc1', '/api/partitions/part1',
+                '/api/partitions/part1/nics/nic1', '/api/partitions/part2']
+        for u in uris:
+            cache.put(u, {}, cache.generation())
+
+        cache.invalidate(uri)
+
+        remaining = [u for u in uris if cache.get(u) is not None]
+        assert remaining == exp_remaining
+
+    def test_clear(self):
+        """Test clear()."""
+        cache = ResponseCache(default_ttl=10)
+        cache.put('/api/cpcs', {}, cache.generation())
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+
+class TestSessionResponseCache(object):
+    """All tests for the use of a ResponseCache by a Session."""
+
+    def setup_method(self):
+        self.cache = ResponseCache(ttls=[(r'/api/cpcs.*', 10)])
+        self.session = Session('fake-host', 'fake-user', 'fake-pw',
+                               session_id='fake-session-id',
+                               response_cache=self.cache)
+        self.session.time_stats_keeper.enable()
+
+    def test_get(self):
+        """Test that get() uses the response cache."""
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', json={'cpcs': []})
+            m.get('/api/console', json={'name': 'hmc'})
+
+            assert self.session.response_cache is self.cache
+
+            for _ in range(3):
+                assert self.session.get('/api/cpcs') == {'cpcs': []}
+                assert self.session.get('/api/console') == {'name': 'hmc'}
+
+            assert m.call_count == 4
+            assert self.session.time_stats_keeper.counters() == {
+                'get /api/cpcs (cache hit)': 2,
+                'get /api/cpcs (cache miss)': 1,
+            }
+
+    def test_get_error(self):
+        """Test that errors are not cached."""
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs/foo', status_code=404,
+                  json={'http-status': 404, 'reason': 1, 'message': 'x'})
+
+            for _ in range(2):
+                with pytest.raises(HTTPError):
+                    self.session.get('/api/cpcs/foo')
+
+            assert m.call_count == 2
+
+    def test_invalidate(self):
+        """Test that post() and delete() invalidate the response cache."""
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs/cpc1', json={'name': 'cpc1'})
+            m.post('/api/cpcs/cpc1', status_code=204)
+            m.delete('/api/cpcs/cpc1', status_code=204)
+
+            self.session.get('/api/cpcs/cpc1')
+            self.session.get('/api/cpcs/cpc1')
+            assert m.call_count == 1
+
+            self.session.post('/api/cpcs/cpc1', body={'description': 'x'})
+            self.session.get('/api/cpcs/cpc1')
+            assert m.call_count == 3
+
+            self.session.delete('/api/cpcs/cpc1')
+            self.session.get('/api/cpcs/cpc1')
+            assert m.call_count == 5
+
+    def test_client(self):
+        """Test that resource listing via a client uses the response
+        cache."""
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', json={'cpcs': [
+                {'object-uri': '/api/cpcs/cpc1', 'name': 'CPC1'},
+            ]})
+            client = Client(self.session)
+
+            cpcs1 = client.cpcs.list()
+            cpcs2 = client.cpcs.list()
+
+            assert [c.name for c in cpcs1] == [c.name for c in cpcs2]
+            assert m.call_count == 1
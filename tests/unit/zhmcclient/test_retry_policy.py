@@ -0,0 +1,225 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _retry_policy module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import requests
+import requests_mock
+import mock
+import pytest
+
+from zhmcclient import RetryPolicy, Session, HTTPError, ConnectionError, \
+    ConnectTimeout, ReadTimeout
+from zhmcclient._retry_policy import _RetryBudget
+
+
+def http_error(http_status, reason):
+    """Return an HTTPError with an HTTP status and reason code."""
+    return HTTPError({'http-status': http_status, 'reason': reason,
+                      'message': 'fake message'})
+
+
+def error_response(http_status, reason):
+    """Return a requests_mock response for an HMC error."""
+    return {'status_code': http_status,
+            'json': {'http-status': http_status, 'reason': reason,
+                     'message': 'fake message'}}
+
+
+class TestRetryPolicy(object):
+    """All tests for the RetryPolicy class."""
+
+    @pytest.mark.parametrize(
+        "kwargs, exc, exp_transient", [
+            (dict(), http_error(503, 1), True),
+            (dict(), http_error(503, 2), True),
+            (dict(), http_error(409, 1), True),
+            (dict(), http_error(409, 2), False),
+            (dict(), http_error(404, 1), False),
+            (dict(), ConnectionError('reset', None), True),
+            (dict(), ConnectTimeout('timeout', None, 30, 3), True),
+            (dict(), ReadTimeout('timeout', None, 300, 3), False),
+            (dict(), ValueError('foo'), False),
+            (dict(transient_errors=[(500, 263)]), http_error(500, 263), True),
+            (dict(transient_errors=[(500, 263)]), http_error(503, 1), False),
+        ]
+    )
+    def test_is_transient(self, kwargs, exc, exp_transient):
+        """Test is_transient()."""
+        policy = RetryPolicy(**kwargs)
+
+        assert policy.is_transient(exc) == exp_transient
+
+    def test_backoff_intervals(self):
+        """Test backoff_intervals() without jitter."""
+        policy = RetryPolicy(backoff_initial=0.5, backoff_factor=2,
+                             backoff_max=3, jitter=0)
+
+        intervals = policy.backoff_intervals()
+
+        assert [next(intervals) for _ in range(5)] == [0.5, 1, 2, 3, 3]
+
+    def test_backoff_intervals_jitter(self):
+        """Test that backoff_intervals() randomizes the intervals."""
+        policy = RetryPolicy(backoff_initial=1, backoff_max=1, jitter=0.2)
+
+        intervals = policy.backoff_intervals()
+        values = [next(intervals) for _ in range(100)]
+
+        assert all(0.8 <= value <= 1.2 for value in values)
+        assert len(set(values)) > 1
+
+    def test_budget(self):
+        """Test that the retry budget is limited and refilled."""
+        budget = _RetryBudget(budget=2, budget_period=60)
+
+        assert budget.spend()
+        assert budget.spend()
+        assert not budget.spend()
+
+        with mock.patch('time.time', return_value=budget._last_refill + 30):
+            assert budget.spend()
+            assert not budget.spend()
+
+
+class TestSessionRetries(object):
+    """All tests for the retries of a session with a retry policy."""
+
+    def session(self, **kwargs):
+        """Return a session with a retry policy without backoff times."""
+        policy = RetryPolicy(backoff_initial=0.001, **kwargs)
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          session_id='fake-session-id', retry_policy=policy)
+        session.time_stats_keeper.enable()
+        return session
+
+    def test_get_retried(self):
+        """Test that a GET is retried after transient errors."""
+        session = self.session()
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', [
+                error_response(503, 1),
+                {'exc': requests.exceptions.ConnectionError('reset')},
+                error_response(409, 1),
+                {'json': {'cpcs': []}},
+            ])
+
+            result = session.get('/api/cpcs')
+
+            num_requests = m.call_count
+
+        counters = session.time_stats_keeper.counters()
+        assert result == {'cpcs': []}
+        assert num_requests == 4
+        assert counters['get /api/cpcs (retried)'] == 3
+        assert 'get /api/cpcs (retry failed)' not in counters
+
+    def test_delete_retried(self):
+        """Test that a DELETE is retried after a transient error."""
+        session = self.session()
+
+        with requests_mock.mock() as m:
+            m.delete('/api/jobs/j1', [
+                error_response(503, 1),
+                {'status_code': 204},
+            ])
+
+            session.delete('/api/jobs/j1')
+
+            num_requests = m.call_count
+
+        assert num_requests == 2
+
+    def test_post_not_retried(self):
+        """Test that a POST is not retried, because it is not idempotent."""
+        session = self.session()
+
+        with requests_mock.mock() as m:
+            m.post('/api/cpcs/c1/operations/start', [
+                error_response(503, 1),
+                {'status_code': 204},
+            ])
+
+            with pytest.raises(HTTPError):
+                session.post('/api/cpcs/c1/operations/start')
+
+            num_requests = m.call_count
+
+        assert num_requests == 1
+
+    def test_not_transient(self):
+        """Test that a GET is not retried after a non-transient error."""
+        session = self.session()
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', [
+                error_response(404, 1),
+                {'json': {'cpcs': []}},
+            ])
+
+            with pytest.raises(HTTPError):
+                session.get('/api/cpcs')
+
+            num_requests = m.call_count
+
+        assert num_requests == 1
+        assert session.time_stats_keeper.counters() == {}
+
+    @pytest.mark.parametrize(
+        "kwargs, exp_requests", [
+            (dict(max_retries=2), 3),
+            (dict(max_retries=5, budget=1), 2),
+            (dict(max_retries=5, deadline=0.0001), 1),
+        ]
+    )
+    def test_retry_failed(self, kwargs, exp_requests):
+        """Test that the retries of a GET are limited by the maximum number
+        of retries, the retry budget and the deadline."""
+        session = self.session(**kwargs)
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', **error_response(503, 1))
+
+            with pytest.raises(HTTPError) as exc_info:
+                session.get('/api/cpcs')
+
+            num_requests = m.call_count
+
+        counters = session.time_stats_keeper.counters()
+        assert exc_info.value.http_status == 503
+        assert num_requests == exp_requests
+        assert counters.get('get /api/cpcs (retried)', 0) == exp_requests - 1
+        assert counters['get /api/cpcs (retry failed)'] == 1
+
+    def test_budget_per_session(self):
+        """Test that the retry budget is shared by the requests of a
+        session."""
+        session = self.session(budget=2)
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', **error_response(503, 1))
+
+            for _ in range(2):
+                with pytest.raises(HTTPError):
+                    session.get('/api/cpcs')
+
+            num_requests = m.call_count
+
+        # The first GET uses up the budget with 2 retries
+        assert num_requests == 4
@@ -21,13 +21,14 @@ from __future__ import absolute_import, print_function
 import time
 import json
 import re
+import threading
 import requests
 import requests_mock
 import mock
 import pytest
 
 from zhmcclient import Session, ParseError, Job, HTTPError, OperationTimeout, \
-    ClientAuthError, DEFAULT_HMC_PORT
+    ClientAuthError, DEFAULT_HMC_PORT, RetryTimeoutConfig
 
 
 class TestSession(object):
@@ -373,6 +374,390 @@ class TestSession(object):
             assert exc.request_uri.endswith(get_uri)
             assert exc.request_method == 'GET'
 
+    @pytest.mark.parametrize(
+        "pool_maxsize, pool_block", [
+            (None, None),
+            (50, False),
+            (50, True),
+        ]
+    )
+    def test_pool_config(self, pool_maxsize, pool_block):
+        """Test that the connection pool of the session is configured."""
+
+        rt_config = RetryTimeoutConfig(pool_maxsize=pool_maxsize,
+                                       pool_block=pool_block)
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          session_id='fake-session-id',
+                          retry_timeout_config=rt_config)
+
+        exp_maxsize = pool_maxsize or \
+            Session.default_rt_config.pool_maxsize
+        exp_block = pool_block or Session.default_rt_config.pool_block
+
+        assert session.retry_timeout_config.pool_maxsize == exp_maxsize
+        assert session.retry_timeout_config.pool_block == exp_block
+        for prefix in ('https://', 'http://'):
+            adapter = session.session.get_adapter(prefix + 'fake-host')
+            assert adapter._pool_maxsize == exp_maxsize
+            assert adapter._pool_block == exp_block
+
+    def test_concurrent_logon(self):
+        """
+        Test that concurrent requests on a logged-off session cause only a
+        single logon.
+        """
+        num_threads = 20
+        logons = []
+
+        def logon_callback(request, context):
+            logons.append(request)
+            time.sleep(0.1)  # Give the other threads a chance to wait
+            return json.dumps({'api-session': 'fake-session-id'})
+
+        with requests_mock.mock() as m:
+            m.post('/api/sessions', text=logon_callback)
+            m.get('/api/cpcs', json={'cpcs': []})
+
+            session = Session('fake-host', 'fake-user', 'fake-pw')
+            results, errors = run_in_threads(
+                num_threads, lambda: session.get('/api/cpcs'))
+
+            assert errors == []
+            assert results == [{'cpcs': []}] * num_threads
+            assert len(logons) == 1
+            assert session.session_id == 'fake-session-id'
+
+    def test_concurrent_relogon(self):
+        """
+        Test that an expired session-id that is detected by many threads at
+        the same time causes only a single re-logon.
+        """
+        num_threads = 20
+        logons = []
+        expired = WaitGroup(num_threads)
+
+        def logon_callback(request, context):
+            logons.append(request)
+            return json.dumps({'api-session': 'new-session-id'})
+
+        def get_callback(request, context):
+            if request.headers['X-API-Session'] == 'old-session-id':
+                context.status_code = 403
+                return json.dumps({'http-status': 403, 'reason': 5,
+                                   'message': 'session expired'})
+            return json.dumps({'cpcs': []})
+
+        with requests_mock.mock() as m:
+            m.post('/api/sessions', text=logon_callback)
+            m.get('/api/cpcs', text=get_callback)
+
+            session = Session('fake-host', 'fake-user', 'fake-pw',
+                              session_id='old-session-id')
+
+            # Let all threads see the expired session-id before the first
+            # one re-logs on.
+            org_do_relogon = session._do_relogon
+
+            def do_relogon(expired_session_id):
+                expired.done_and_wait(timeout=5)
+                org_do_relogon(expired_session_id)
+
+            session._do_relogon = do_relogon
+
+            results, errors = run_in_threads(
+                num_threads, lambda: session.get('/api/cpcs'))
+
+            assert errors == []
+            assert results == [{'cpcs': []}] * num_threads
+            assert len(logons) == 1
+            assert session.session_id == 'new-session-id'
+            assert session.headers['X-API-Session'] == 'new-session-id'
+
+    def test_concurrent_time_stats(self):
+        """
+        Test that the time statistics are correct for concurrent requests.
+        """
+        num_threads = 20
+
+        def get_callback(request, context):
+            time.sleep(0.05)  # Make the requests overlap
+            return json.dumps({'cpcs': []})
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', text=get_callback)
+
+            session = Session('fake-host', 'fake-user', 'fake-pw',
+                              session_id='fake-session-id')
+            session.time_stats_keeper.enable()
+            results, errors = run_in_threads(
+                num_threads, lambda: session.get('/api/cpcs'))
+
+            assert errors == []
+            stats = session.time_stats_keeper.snapshot()['get /api/cpcs']
+            assert stats.count == num_threads
+
+    @pytest.mark.parametrize(
+        "coalesce_gets, exp_requests", [
+            (False, 20),
+            (True, 1),
+        ]
+    )
+    def test_coalesce_gets(self, coalesce_gets, exp_requests):
+        """
+        Test that identical concurrent GET requests are coalesced if enabled.
+        """
+        num_threads = 20
+        gets = []
+
+        def get_callback(request, context):
+            gets.append(request)
+            time.sleep(0.3)  # Give the other threads a chance to join
+            return json.dumps({'cpcs': []})
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', text=get_callback)
+
+            session = Session('fake-host', 'fake-user', 'fake-pw',
+                              session_id='fake-session-id',
+                              coalesce_gets=coalesce_gets)
+            session.time_stats_keeper.enable()
+
+            assert session.coalesce_gets == coalesce_gets
+
+            results, errors = run_in_threads(
+                num_threads, lambda: session.get('/api/cpcs'))
+
+            assert errors == []
+            assert results == [{'cpcs': []}] * num_threads
+            assert len(gets) == exp_requests
+            counters = session.time_stats_keeper.counters()
+            saved = counters.get('get /api/cpcs (coalesced)', 0)
+            assert saved == num_threads - exp_requests
+
+            # Each caller has its own copy of the result
+            results[0]['cpcs'].append('foo')
+            assert results[1] == {'cpcs': []}
+
+            # Subsequent requests are not coalesced with completed requests
+            session.get('/api/cpcs')
+            assert len(gets) == exp_requests + 1
+
+    def test_coalesce_gets_error(self):
+        """
+        Test that an error of a coalesced GET request is raised to all
+        callers.
+        """
+        num_threads = 20
+        gets = []
+
+        def get_callback(request, context):
+            gets.append(request)
+            time.sleep(0.3)  # Give the other threads a chance to join
+            context.status_code = 404
+            return json.dumps({'http-status': 404, 'reason': 1,
+                               'message': 'not found'})
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs/foo', text=get_callback)
+
+            session = Session('fake-host', 'fake-user', 'fake-pw',
+                              session_id='fake-session-id',
+                              coalesce_gets=True)
+            results, errors = run_in_threads(
+                num_threads, lambda: session.get('/api/cpcs/foo'))
+
+            assert results == []
+            assert len(errors) == num_threads
+            for exc in errors:
+                assert isinstance(exc, HTTPError)
+                assert exc.http_status == 404
+            assert len(gets) == 1
+            assert session._inflight_gets == {}
+
+    def test_iter_get(self):
+        """
+        Test that iter_get() yields the items of the array in the response,
+        without reading the entire response first.
+        """
+        volumes = [{'element-uri': '/api/storage-groups/sg1/'
+                                   'storage-volumes/vol{}'.format(i),
+                    'name': 'vol{}'.format(i)} for i in range(1000)]
+        content = json.dumps({'storage-volumes': volumes}).encode('utf-8')
+
+        with requests_mock.mock() as m:
+            m.get('/api/storage-groups/sg1/storage-volumes',
+                  body=ChunkedStream(content, 100))
+
+            session = Session('fake-host', 'fake-user', 'fake-pw',
+                              session_id='fake-session-id')
+            session.time_stats_keeper.enable()
+
+            items = session.iter_get(
+                '/api/storage-groups/sg1/storage-volumes', 'storage-volumes')
+
+            assert m.call_count == 0  # Lazy
+            first = next(items)
+            assert first == volumes[0]
+            assert [first] + list(items) == volumes
+            stats = session.time_stats_keeper.snapshot()
+            assert stats['get /api/storage-groups/sg1/storage-volumes'].\
+                count == 1
+
+    def test_iter_get_chunks(self):
+        """
+        Test that iter_get() reads the response body incrementally.
+        """
+        items_json = [json.dumps({'n': i}).encode('utf-8')
+                      for i in range(10)]
+        content = b'[' + b','.join(items_json) + b']'
+        body = ChunkedStream(content, 8)
+
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', body=body)
+
+            session = Session('fake-host', 'fake-user', 'fake-pw',
+                              session_id='fake-session-id')
+            items = session.iter_get('/api/cpcs')
+
+            assert next(items) == {'n': 0}
+            assert body.pos < len(content)
+            assert list(items) == [{'n': i} for i in range(1, 10)]
+
+    def test_iter_get_relogon(self):
+        """
+        Test that iter_get() re-logs on and retries if the session-id is
+        expired.
+        """
+        def logon_callback(request, context):
+            return json.dumps({'api-session': 'new-session-id'})
+
+        def get_callback(request, context):
+            if request.headers['X-API-Session'] == 'old-session-id':
+                context.status_code = 403
+                return json.dumps({'http-status': 403, 'reason': 5,
+                                   'message': 'session expired'})
+            return json.dumps({'cpcs': [{'name': 'CPC1'}]})
+
+        with requests_mock.mock() as m:
+            m.post('/api/sessions', text=logon_callback)
+            m.get('/api/cpcs', text=get_callback)
+
+            session = Session('fake-host', 'fake-user', 'fake-pw',
+                              session_id='old-session-id')
+
+            items = list(session.iter_get('/api/cpcs', 'cpcs'))
+
+            assert items == [{'name': 'CPC1'}]
+            assert session.session_id == 'new-session-id'
+
+    @pytest.mark.parametrize(
+        "status, content, exp_exc_type", [
+            (404, b'{"http-status": 404, "reason": 1, "message": "x"}',
+             HTTPError),
+            (200, b'{"cpcs": [{"name": "CPC1"}, {"name": ', ParseError),
+            (200, b'{"foo": []}', ParseError),
+        ]
+    )
+    def test_iter_get_error(self, status, content, exp_exc_type):
+        """
+        Test that iter_get() raises errors when iterating.
+        """
+        with requests_mock.mock() as m:
+            m.get('/api/cpcs', status_code=status, content=content)
+
+            session = Session('fake-host', 'fake-user', 'fake-pw',
+                              session_id='fake-session-id')
+
+            with pytest.raises(exp_exc_type):
+                list(session.iter_get('/api/cpcs', 'cpcs'))
+
+    def test_iter_post(self):
+        """
+        Test iter_post() with a response that is a JSON array.
+        """
+        inventory = [{'class': 'cpc', 'name': 'CPC1'},
+                     {'class': 'partition', 'name': 'PART1'}]
+
+        with requests_mock.mock() as m:
+            m.post('/api/services/inventory', json=inventory)
+
+            session = Session('fake-host', 'fake-user', 'fake-pw',
+                              session_id='fake-session-id')
+            items = list(session.iter_post('/api/services/inventory',
+                                           body={'resources': ['cpc']}))
+
+            assert items == inventory
+            assert m.request_history[0].json() == {'resources': ['cpc']}
+
+
+class ChunkedStream(object):
+    """
+    A file-like object that returns its content in chunks of a maximum size,
+    and records how much of it has been read.
+    """
+
+    def __init__(self, content, chunk_size):
+        self.content = content
+        self.chunk_size = chunk_size
+        self.pos = 0
+        self.closed = False
+
+    def read(self, size=-1, **kwargs):
+        """Read at most one chunk."""
+        if size is None or size < 0:
+            size = self.chunk_size
+        size = min(size, self.chunk_size)
+        data = self.content[self.pos:self.pos + size]
+        self.pos += len(data)
+        return data
+
+    def close(self):
+        """Close the stream."""
+        self.closed = True
+
+
+class WaitGroup(object):
+    """
+    Lets a number of threads wait until all of them have arrived.
+    """
+
+    def __init__(self, num):
+        self._num = num
+        self._cond = threading.Condition()
+
+    def done_and_wait(self, timeout):
+        with self._cond:
+            self._num -= 1
+            self._cond.notify_all()
+            end_time = time.time() + timeout
+            while self._num > 0 and time.time() < end_time:
+                self._cond.wait(end_time - time.time())
+
+
+def run_in_threads(num_threads, func):
+    """
+    Call a function in a number of threads at the same time, and return a
+    tuple (results, errors) with the lists of return values and exceptions.
+    """
+    results = []
+    errors = []
+    start = threading.Event()
+
+    def run():
+        start.wait()
+        try:
+            results.append(func())
+        except Exception as exc:  # pylint: disable=broad-except
+            errors.append(exc)
+
+    threads = [threading.Thread(target=run) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    start.set()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
 
 class TestJob(object):
     """
@@ -649,7 +1034,11 @@ class TestJob(object):
         """Test wait_for_completion() with timeout."""
         with requests_mock.mock() as m:
             self.mock_server_1(m)
-            session = Session('fake-host', 'fake-user', 'fake-pw')
+            # Poll with a fixed interval of 1 s
+            rt_config = RetryTimeoutConfig(
+                job_poll_initial=1, job_poll_factor=1, job_poll_jitter=0)
+            session = Session('fake-host', 'fake-user', 'fake-pw',
+                              retry_timeout_config=rt_config)
             op_method = 'POST'
             op_uri = '/api/foo'
             job = Job(session, self.job_uri, op_method, op_uri)
@@ -684,6 +1073,88 @@ class TestJob(object):
                 msg = exc.args[0]
                 assert msg.startswith("Waiting for completion of job")
 
+    @pytest.mark.parametrize(
+        "initial, maximum, factor, exp_intervals", [
+            (0.2, 10, 1.5, [0.2, 0.3, 0.45, 0.675]),
+            (1, 10, 1, [1, 1, 1, 1]),
+            (1, 3, 2, [1, 2, 3, 3]),
+            (20, 10, 2, [10, 10, 10, 10]),
+        ]
+    )
+    def test_poll_intervals(self, initial, maximum, factor, exp_intervals):
+        """Test the poll intervals of a job without jitter."""
+        rt_config = RetryTimeoutConfig(
+            job_poll_initial=initial, job_poll_max=maximum,
+            job_poll_factor=factor, job_poll_jitter=0)
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          retry_timeout_config=rt_config)
+        job = Job(session, self.job_uri, 'POST', '/api/foo')
+
+        poll_intervals = job._poll_intervals()
+        intervals = [next(poll_intervals) for _ in exp_intervals]
+
+        assert intervals == pytest.approx(exp_intervals)
+
+    def test_poll_intervals_jitter(self):
+        """Test that the poll intervals of a job are randomized by jitter."""
+        rt_config = RetryTimeoutConfig(
+            job_poll_initial=1, job_poll_max=1, job_poll_jitter=0.1)
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          retry_timeout_config=rt_config)
+        job = Job(session, self.job_uri, 'POST', '/api/foo')
+
+        poll_intervals = job._poll_intervals()
+        intervals = [next(poll_intervals) for _ in range(100)]
+
+        for interval in intervals:
+            assert 0.9 <= interval <= 1.1
+        assert len(set(intervals)) > 1
+
+    @pytest.mark.parametrize(
+        "op_method, op_uri, exp_initial", [
+            ('POST', '/api/partitions/p1/operations/start', 2),
+            ('POST', '/api/partitions/p1/operations/stop', 2),
+            ('POST', '/api/partitions/p1/operations/scsi-dump', 5),
+            ('POST', '/api/logical-partitions/l1/operations/load', 5),
+            ('POST', '/api/cpcs/c1/operations/activate', 10),
+            ('POST', '/api/cpcs/c1/operations/export-profiles', 5),
+            ('POST', '/api/partitions/p1/operations/mount-iso-image', 0.2),
+            ('POST', '/api/foo', 0.2),
+        ]
+    )
+    def test_poll_intervals_hints(self, op_method, op_uri, exp_initial):
+        """Test the initial poll interval for known slow operations."""
+        rt_config = RetryTimeoutConfig(job_poll_jitter=0)
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          retry_timeout_config=rt_config)
+        job = Job(session, self.job_uri, op_method, op_uri)
+
+        initial = next(job._poll_intervals())
+
+        assert initial == exp_initial
+
+    def test_wait_complete_poll_intervals(self):
+        """Test that wait_for_completion() sleeps for the poll intervals."""
+        with requests_mock.mock() as m:
+            self.mock_server_1(m)
+            rt_config = RetryTimeoutConfig(
+                job_poll_initial=0.01, job_poll_max=0.03, job_poll_factor=2,
+                job_poll_jitter=0)
+            session = Session('fake-host', 'fake-user', 'fake-pw',
+                              retry_timeout_config=rt_config)
+            job = Job(session, self.job_uri, 'POST', '/api/foo')
+            responses = [{'json': {'status': 'running'}}] * 4
+            responses.append(
+                {'json': {'status': 'complete', 'job-status-code': 204}})
+            m.get(self.job_uri, responses)
+            m.delete(self.job_uri, status_code=204)
+
+            with mock.patch('time.sleep') as sleep:
+                job.wait_for_completion(operation_timeout=0)
+
+        intervals = [c[0][0] for c in sleep.call_args_list]
+        assert intervals == pytest.approx([0.01, 0.02, 0.03, 0.03])
+
 
 def result_running_callback(request, context):
     job_result_running = {
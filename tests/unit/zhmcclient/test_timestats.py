@@ -309,6 +309,41 @@ class TestTimeStats(object):
         assert num_lines == 3, \
             "Unexpected str(keeper): %r" % s
 
+    def test_counters(self):
+        """Test counting with enabled and disabled keeper."""
+
+        keeper = TimeStatsKeeper()
+
+        keeper.count('foo')
+        assert keeper.counters() == {}
+
+        keeper.enable()
+        keeper.count('foo')
+        keeper.count('foo', 2)
+        keeper.count('bar')
+        counters = keeper.counters()
+        assert counters == {'foo': 3, 'bar': 1}
+
+        # The returned dict is a snapshot
+        keeper.count('foo')
+        assert counters['foo'] == 3
+        assert keeper.counters()['foo'] == 4
+
+        keeper.reset_counters()
+        assert keeper.counters() == {}
+
+    def test_str_counters(self):
+        """Test TimestatsKeeper.__str__() for an enabled keeper with
+        counters."""
+
+        keeper = TimeStatsKeeper()
+        keeper.enable()
+        keeper.count('foo', 5)
+
+        s = str(keeper)
+        assert s == PRINT_HEADER + "\nCounters:\n  Value  Counter name\n" \
+            "      5  foo"
+
     def test_ts_str(self):
         """Test Timestats.__str__()."""
 
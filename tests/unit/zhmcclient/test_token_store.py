@@ -0,0 +1,180 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _token_store module.
+"""
+
+from __future__ import absolute_import, print_function
+
+import os
+import stat
+import time
+import threading
+import requests_mock
+import pytest
+
+from zhmcclient import FileTokenStore, Session, ClientAuthError
+
+
+class TestFileTokenStore(object):
+    """All tests for the FileTokenStore class."""
+
+    def test_get_put_remove(self, tmpdir):
+        """Test get(), put() and remove()."""
+        directory = str(tmpdir.join('tokens'))
+        store = FileTokenStore(directory)
+
+        assert store.directory == directory
+        assert store.get('hmc1', 'user1') is None
+
+        store.put('hmc1', 'user1', 'session-1')
+        store.put('hmc1', 'user2', 'session-2')
+
+        assert store.get('hmc1', 'user1') == 'session-1'
+        assert store.get('hmc1', 'user2') == 'session-2'
+        assert store.get('hmc2', 'user1') is None
+
+        store.remove('hmc1', 'user1', 'session-other')
+        assert store.get('hmc1', 'user1') == 'session-1'
+
+        store.remove('hmc1', 'user1', 'session-1')
+        assert store.get('hmc1', 'user1') is None
+        assert store.get('hmc1', 'user2') == 'session-2'
+
+    @pytest.mark.skipif(os.name == 'nt',
+                        reason="File permissions differ on Windows")
+    def test_permissions(self, tmpdir):
+        """Test that the token files can only be accessed by their owner."""
+        store = FileTokenStore(str(tmpdir.join('tokens')))
+
+        store.put('hmc1', 'user1', 'session-1')
+
+        for name in os.listdir(store.directory):
+            mode = os.stat(os.path.join(store.directory, name)).st_mode
+            assert stat.S_IMODE(mode) & 0o077 == 0
+
+    def test_lock(self, tmpdir):
+        """Test that the lock excludes other users of the token store
+        directory."""
+        directory = str(tmpdir)
+        events = []
+
+        def target(store):
+            with store.lock('hmc1', 'user1'):
+                events.append('begin')
+                time.sleep(0.1)
+                events.append('end')
+
+        threads = [threading.Thread(target=target,
+                                    args=(FileTokenStore(directory),))
+                   for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert events == ['begin', 'end'] * 3
+
+
+class TestSessionTokenStore(object):
+    """All tests for sessions with a session token store."""
+
+    @staticmethod
+    def mock_logon(m, session_ids):
+        """Mock the 'Logon' operation, returning the session-ids in turn."""
+        m.post('/api/sessions',
+               [{'json': {'api-session': session_id}}
+                for session_id in session_ids])
+
+    def test_reuse(self, tmpdir):
+        """Test that sessions for the same host and userid reuse the
+        session-id in the token store."""
+        store = FileTokenStore(str(tmpdir))
+        session1 = Session('fake-host', 'fake-user', 'fake-pw',
+                           token_store=store)
+        session2 = Session('fake-host', 'fake-user', token_store=store)
+
+        with requests_mock.mock() as m:
+            self.mock_logon(m, ['session-1'])
+            m.get('/api/cpcs', json={'cpcs': []})
+
+            session1.get('/api/cpcs')
+            session2.get('/api/cpcs')
+
+            logons = [r for r in m.request_history if r.method == 'POST']
+            session_headers = [r.headers['X-API-Session']
+                               for r in m.request_history if r.method == 'GET']
+
+        assert session2.token_store is store
+        assert len(logons) == 1
+        assert session_headers == ['session-1', 'session-1']
+        assert store.get('fake-host', 'fake-user') == 'session-1'
+
+    def test_no_password(self, tmpdir):
+        """Test that a password is required when no session-id is in the
+        token store."""
+        store = FileTokenStore(str(tmpdir))
+        session = Session('fake-host', 'fake-user', token_store=store)
+
+        with pytest.raises(ClientAuthError):
+            session.logon()
+
+    def test_relogon(self, tmpdir):
+        """Test that an expired session-id causes only one logon, and that
+        other sessions reuse the new session-id."""
+        store = FileTokenStore(str(tmpdir))
+        store.put('fake-host', 'fake-user', 'session-1')
+        session1 = Session('fake-host', 'fake-user', 'fake-pw',
+                           token_store=store)
+        session2 = Session('fake-host', 'fake-user', 'fake-pw',
+                           token_store=store)
+        session1.logon()
+        session2.logon()
+
+        def cpcs_callback(request, context):
+            if request.headers['X-API-Session'] == 'session-1':
+                context.status_code = 403
+                return {'http-status': 403, 'reason': 5,
+                        'message': 'session expired'}
+            return {'cpcs': []}
+
+        with requests_mock.mock() as m:
+            self.mock_logon(m, ['session-2', 'session-3'])
+            m.get('/api/cpcs', json=cpcs_callback)
+
+            session1.get('/api/cpcs')
+            session2.get('/api/cpcs')
+
+            logons = [r for r in m.request_history if r.method == 'POST']
+
+        assert len(logons) == 1
+        assert session1.session_id == 'session-2'
+        assert session2.session_id == 'session-2'
+        assert store.get('fake-host', 'fake-user') == 'session-2'
+
+    def test_logoff(self, tmpdir):
+        """Test that logoff removes the session-id from the token store."""
+        store = FileTokenStore(str(tmpdir))
+        store.put('fake-host', 'fake-user', 'session-1')
+        session = Session('fake-host', 'fake-user', 'fake-pw',
+                          token_store=store)
+        session.logon()
+
+        with requests_mock.mock() as m:
+            m.delete('/api/sessions/this-session', status_code=204)
+
+            session.logoff()
+
+        assert store.get('fake-host', 'fake-user') is None
@@ -21,6 +21,8 @@ For documentation, see TODO: Add link to RTD once available.
 
 from __future__ import absolute_import
 
+import sys
+
 from ._version import *       # noqa: F401
 from ._constants import *     # noqa: F401
 from ._exceptions import *    # noqa: F401
@@ -28,7 +30,19 @@ from ._manager import *       # noqa: F401
 from ._resource import *      # noqa: F401
 from ._logging import *       # noqa: F401
 from ._session import *       # noqa: F401
+from ._job_group import *     # noqa: F401
 from ._timestats import *     # noqa: F401
+from ._response_cache import *         # noqa: F401
+from ._rate_limiter import *  # noqa: F401
+from ._retry_policy import *  # noqa: F401
+from ._max_age_policy import *  # noqa: F401
+from ._deadline import *  # noqa: F401
+from ._circuit_breaker import *  # noqa: F401
+from ._token_store import *  # noqa: F401
+from ._federated_client import *  # noqa: F401
+from ._identity_map import *  # noqa: F401
+from ._name_uri_cache_store import *  # noqa: F401
+from ._json_codec import *    # noqa: F401
 from ._client import *        # noqa: F401
 from ._cpc import *           # noqa: F401
 from ._lpar import *          # noqa: F401
@@ -41,6 +55,7 @@ from ._virtual_function import *       # noqa: F401
 from ._virtual_switch import *         # noqa: F401
 from ._port import *          # noqa: F401
 from ._notification import *  # noqa: F401
+from ._cache_coherence import *       # noqa: F401
 from ._metrics import *       # noqa: F401
 from ._utils import *         # noqa: F401
 from ._console import *       # noqa: F401
@@ -54,3 +69,7 @@ from ._unmanaged_cpc import *          # noqa: F401
 from ._storage_group import *          # noqa: F401
 from ._storage_volume import *         # noqa: F401
 from ._virtual_storage_resource import *        # noqa: F401
+
+if sys.version_info >= (3, 5):
+    from ._async_session import *     # noqa: F401
+    from ._async_client import *      # noqa: F401
@@ -0,0 +1,358 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+AsyncClient class: A client to an HMC for use with :mod:`py:asyncio`.
+
+The :class:`~zhmcclient.AsyncClient` class provides coroutines for the
+read-only operations that are most commonly issued in large numbers (listing
+and finding resources and retrieving their properties), on top of an
+:class:`~zhmcclient.AsyncSession` object.
+
+The resource objects returned by these coroutines are the normal resource
+objects of this package (e.g. :class:`~zhmcclient.Cpc`), and their
+`properties` attribute can be used as usual. Because their session is an
+:class:`~zhmcclient.AsyncSession` object, their methods that interact with
+the HMC cannot be used directly; instead, their managers are wrapped into
+:class:`~zhmcclient.AsyncManager` objects using
+:meth:`~zhmcclient.AsyncClient.manager`.
+
+This module requires Python 3.5 or higher, and the `aiohttp` package.
+"""
+
+import asyncio
+
+from ._cpc import CpcManager
+from ._exceptions import HTTPError, NotFound, NoUniqueMatch
+
+__all__ = ['AsyncClient', 'AsyncManager']
+
+
+class AsyncClient(object):
+    """
+    A client to an HMC, for use with :mod:`py:asyncio`.
+    """
+
+    def __init__(self, session):
+        """
+        Parameters:
+
+          session (:class:`~zhmcclient.AsyncSession`):
+            Session with the HMC.
+        """
+        self._session = session
+        self._cpcs = AsyncManager(CpcManager(self))
+        self._api_version = None
+
+    @property
+    def session(self):
+        """
+        :class:`~zhmcclient.AsyncSession`:
+          Session with the HMC.
+        """
+        return self._session
+
+    @property
+    def cpcs(self):
+        """
+        :class:`~zhmcclient.AsyncManager`:
+          Manager object for the CPCs in scope of this client. This includes
+          managed and unmanaged CPCs.
+        """
+        return self._cpcs
+
+    def manager(self, manager):
+        """
+        Return an :class:`~zhmcclient.AsyncManager` object for a manager
+        object of a resource that was returned by this client.
+
+        Example::
+
+            cpc = await client.cpcs.find(name='CPC1')
+            partitions = await client.manager(cpc.partitions).list()
+
+        Parameters:
+
+          manager (:class:`~zhmcclient.BaseManager`):
+            The manager object to be wrapped (e.g. the `partitions` attribute
+            of a :class:`~zhmcclient.Cpc` object).
+
+        Returns:
+
+          :class:`~zhmcclient.AsyncManager`: The wrapping manager object.
+        """
+        assert manager.session is self._session, \
+            "AsyncClient.manager: The manager does not use the session of " \
+            "this client"
+        return AsyncManager(manager)
+
+    async def version_info(self):
+        """
+        Returns API version information for the HMC.
+
+        For details, see :meth:`zhmcclient.Client.version_info`.
+        """
+        if self._api_version is None:
+            await self.query_api_version()
+        return self._api_version['api-major-version'],\
+            self._api_version['api-minor-version']
+
+    async def query_api_version(self):
+        """
+        The Query API Version operation returns information about
+        the level of Web Services API supported by the HMC.
+
+        For details, see :meth:`zhmcclient.Client.query_api_version`.
+        """
+        version_resp = await self._session.get('/api/version',
+                                               logon_required=False)
+        self._api_version = version_resp
+        return self._api_version
+
+    async def get_inventory(self, resources):
+        """
+        Returns a JSON object with the requested resources and their
+        properties, that are managed by the HMC.
+
+        For details, see :meth:`zhmcclient.Client.get_inventory`.
+        """
+        uri = '/api/services/inventory'
+        body = {'resources': resources}
+        result = await self._session.post(uri, body=body)
+        return result
+
+
+class AsyncManager(object):
+    """
+    A wrapper around a manager object (e.g. :class:`~zhmcclient.CpcManager`)
+    that provides its listing and finding methods as coroutines, for use with
+    :mod:`py:asyncio`.
+
+    Objects of this class are created by :class:`~zhmcclient.AsyncClient`.
+
+    Listing is supported for the resources that are listed with an HMC list
+    operation. This excludes element resources (e.g. NICs or ports) and the
+    Console.
+
+    When full properties are retrieved, the 'Get Properties' operations for
+    the resources are performed concurrently.
+    """
+
+    def __init__(self, manager):
+        # This function should not go into the docs.
+        # Parameters:
+        #   manager (:class:`~zhmcclient.BaseManager`):
+        #     Manager object to be wrapped. Its session must be an
+        #     :class:`~zhmcclient.AsyncSession` object.
+        self._manager = manager
+
+    @property
+    def manager(self):
+        """
+        :class:`~zhmcclient.BaseManager`: The wrapped manager object.
+        """
+        return self._manager
+
+    @property
+    def session(self):
+        """
+        :class:`~zhmcclient.AsyncSession`: Session with the HMC.
+        """
+        return self._manager.session
+
+    async def pull_full_properties(self, resource):
+        """
+        Retrieve the full set of resource properties of a resource object
+        and cache them in the resource object.
+
+        For details, see :meth:`zhmcclient.BaseResource.pull_full_properties`.
+
+        Parameters:
+
+          resource (:class:`~zhmcclient.BaseResource`): The resource object.
+            It must have been returned by this manager.
+        """
+        full_properties = await self.session.get(resource.uri)
+        resource._set_full_properties(full_properties)
+
+    async def list(self, full_properties=False, filter_args=None):
+        """
+        List the resources in scope of this manager, by matching resource
+        properties against the specified filter arguments, and return a list
+        of their Python resource objects.
+
+        For details, see the `list()` method of the wrapped manager object.
+
+        Parameters:
+
+          full_properties (bool):
+            Controls whether the full set of resource properties should be
+            retrieved, vs. only the short set as returned by the list
+            operation.
+
+          filter_args (dict):
+            Filter arguments that narrow the list of returned resources to
+            those that match the specified filter arguments. For details, see
+            :ref:`Filtering`.
+
+            `None` causes no filtering to happen, i.e. all resources are
+            returned.
+
+        Returns:
+
+          : A list of resource objects.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+          :exc:`~py:exceptions.NotImplementedError`: The resources of the
+            wrapped manager are not listed with an HMC list operation.
+        """
+        manager = self._manager
+        resource_obj_list = []
+
+        uri = manager._optimized_lookup_uri(filter_args)
+        if uri is not None:
+            resource_obj = await self._get_resource(uri)
+            if resource_obj:
+                resource_obj_list.append(resource_obj)
+                # It already has full properties
+        else:
+            query_parms, client_filters = \
+                manager._divide_filter_args(filter_args)
+
+            uri, resources_name = manager._list_operation(query_parms)
+
+            result = await self.session.get(uri)
+            if result:
+                candidates = []
+                for props in result[resources_name]:
+                    candidates.append(manager.resource_class(
+                        manager=manager,
+                        uri=props[manager._uri_prop],
+                        name=props.get(manager._name_prop, None),
+                        properties=props))
+
+                if client_filters:
+                    # Client-side filtering must not drive synchronous
+                    # property retrieval, so we retrieve the full properties
+                    # of the resources that lack a filter property upfront.
+                    await self._pull_all(
+                        [obj for obj in candidates
+                         if any(name not in obj.properties
+                                for name in client_filters)])
+
+                for resource_obj in candidates:
+                    if manager._matches_filters(resource_obj, client_filters):
+                        resource_obj_list.append(resource_obj)
+
+                if full_properties:
+                    await self._pull_all(
+                        [obj for obj in resource_obj_list
+                         if not obj.full_properties])
+
+        manager._name_uri_cache.update_from(resource_obj_list)
+        return resource_obj_list
+
+    async def _pull_all(self, resource_obj_list):
+        """
+        Retrieve the full properties of the specified resource objects
+        concurrently.
+        """
+        await asyncio.gather(
+            *[self.pull_full_properties(obj) for obj in resource_obj_list])
+
+    async def _get_resource(self, uri):
+        """
+        Return a resource object with full properties for the specified
+        resource URI, or `None` if the resource does not exist.
+        """
+        manager = self._manager
+        try:
+            props = await self.session.get(uri)
+        except HTTPError as exc:
+            if exc.http_status == 404 and exc.reason == 1:
+                # No such resource
+                return None
+            raise
+        resource_obj = manager.resource_class(
+            manager=manager,
+            uri=props[manager._uri_prop],
+            name=props.get(manager._name_prop, None),
+            properties=props)
+        resource_obj._full_properties = True
+        return resource_obj
+
+    async def findall(self, **filter_args):
+        """
+        Find zero or more resources in scope of this manager, by matching
+        resource properties against the specified filter arguments, and return
+        a list of their Python resource objects.
+
+        For details, see :meth:`zhmcclient.BaseManager.findall`.
+        """
+        manager = self._manager
+        if len(filter_args) == 1 and manager._name_prop in filter_args:
+            try:
+                obj = await self.find_by_name(filter_args[manager._name_prop])
+            except NotFound:
+                return []
+            return [obj]
+        else:
+            obj_list = await self.list(filter_args=filter_args)
+            return obj_list
+
+    async def find(self, **filter_args):
+        """
+        Find exactly one resource in scope of this manager, by matching
+        resource properties against the specified filter arguments, and return
+        its Python resource object.
+
+        For details, see :meth:`zhmcclient.BaseManager.find`.
+        """
+        obj_list = await self.findall(**filter_args)
+        num_objs = len(obj_list)
+        if num_objs == 0:
+            raise NotFound(filter_args, self._manager)
+        elif num_objs > 1:
+            raise NoUniqueMatch(filter_args, self._manager, obj_list)
+        else:
+            return obj_list[0]
+
+    async def find_by_name(self, name):
+        """
+        Find a resource by name (i.e. value of its 'name' resource property)
+        and return its Python resource object.
+
+        This method uses the Name-URI cache of the wrapped manager object.
+        For details, see :meth:`zhmcclient.BaseManager.find_by_name`.
+        """
+        manager = self._manager
+        cache = manager._name_uri_cache
+        uri = cache.get_cached(name)
+        if uri is None:
+            cache.invalidate()
+            await self.list(full_properties=not manager._list_has_name)
+            uri = cache.get_cached(name)
+            if uri is None:
+                raise NotFound({manager._name_prop: name}, manager)
+        obj = manager.resource_class(
+            manager=manager,
+            uri=uri,
+            name=name,
+            properties=None)
+        return obj
@@ -0,0 +1,907 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+AsyncSession class: A session to the HMC for use with :mod:`py:asyncio`.
+
+The :class:`~zhmcclient.AsyncSession` class provides the same functionality
+as the :class:`~zhmcclient.Session` class, but its methods that interact with
+the HMC are coroutines. This allows a single event loop to keep many HMC
+requests in flight at the same time, without using a thread per request.
+
+This module requires Python 3.5 or higher, and the `aiohttp` package.
+
+Example::
+
+    import asyncio
+    import zhmcclient
+
+    async def main():
+        async with zhmcclient.AsyncSession(hmc, userid, password) as session:
+            client = zhmcclient.AsyncClient(session)
+            cpcs = await client.cpcs.list()
+            partition_lists = await asyncio.gather(
+                *[client.manager(cpc.partitions).list() for cpc in cpcs])
+
+    asyncio.get_event_loop().run_until_complete(main())
+"""
+
+import asyncio
+import time
+from copy import copy
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from ._exceptions import HTTPError, ServerAuthError, ClientAuthError, \
+    ConnectionError, ConnectTimeout, ReadTimeout, OperationTimeout
+from ._timestats import TimeStatsKeeper
+from ._logging import get_logger
+from ._constants import DEFAULT_HMC_PORT
+from ._session import Session, Job, _HMC_SCHEME, _STD_HEADERS, \
+    _DEFAULT_JSON_CODEC, _body_data, _result_object
+
+__all__ = ['AsyncSession', 'AsyncJob']
+
+LOG = get_logger(__name__)
+
+
+def _handle_async_request_exc(exc, retry_timeout_config):
+    """
+    Handle an exception raised by the `aiohttp` package, or an
+    :exc:`asyncio.TimeoutError` exception.
+    """
+    connect_timeout_error = getattr(aiohttp, 'ConnectionTimeoutError', None)
+    if connect_timeout_error and isinstance(exc, connect_timeout_error):
+        raise ConnectTimeout(_async_request_exc_message(exc), exc,
+                             retry_timeout_config.connect_timeout,
+                             retry_timeout_config.connect_retries)
+    elif isinstance(exc, (aiohttp.ServerTimeoutError, asyncio.TimeoutError)):
+        raise ReadTimeout(_async_request_exc_message(exc), exc,
+                          retry_timeout_config.read_timeout,
+                          retry_timeout_config.read_retries)
+    else:
+        raise ConnectionError(_async_request_exc_message(exc), exc)
+
+
+def _async_request_exc_message(exc):
+    """
+    Return a reasonable exception message from an exception raised by the
+    `aiohttp` package.
+    """
+    message = str(exc)
+    if not message:
+        message = exc.__class__.__name__
+    return message
+
+
+class _AsyncRequest(object):
+    """
+    The HTTP request of an :class:`_AsyncResult` object, with the attributes
+    of :class:`requests.PreparedRequest` that are used by the zhmcclient.
+    """
+
+    def __init__(self, method, url):
+        self.method = method
+        self.url = url
+
+
+class _AsyncResult(object):
+    """
+    An HTTP response received with the `aiohttp` package, with its body
+    already read.
+
+    This class provides the attributes and methods of
+    :class:`requests.Response` that are used by the zhmcclient, so that the
+    response can be processed by the same functions as a response received
+    with the `requests` package (e.g. ``_result_object()``).
+    """
+
+    def __init__(self, method, url, response, content):
+        self.request = _AsyncRequest(method, url)
+        self.status_code = response.status
+        self.headers = response.headers
+        self.content = content
+        self.encoding = response.charset or 'utf-8'
+
+    @property
+    def text(self):
+        """
+        The response body as a unicode string.
+        """
+        return self.content.decode(self.encoding, errors='replace')
+
+
+class AsyncSession(object):
+    """
+    A session to the HMC, optionally in context of an HMC user, for use with
+    :mod:`py:asyncio`.
+
+    The methods of this class that interact with the HMC are coroutines. Apart
+    from that, this class has the same behavior as
+    :class:`~zhmcclient.Session`. This includes the deferred logon, the
+    re-logon and retry when the HMC session token is expired, the mapping of
+    errors to zhmcclient exceptions, and the time statistics.
+
+    Like :class:`~zhmcclient.Session`, this class supports multiple requests
+    being in flight at the same time, in this case as concurrent coroutines
+    in the same event loop. An expired session-id that is detected by
+    multiple coroutines at the same time causes only a single re-logon.
+
+    The HTTP connection pool of the session is limited to the
+    `pool_maxsize` attribute of the retry/timeout configuration if its
+    `pool_block` attribute is `True`, and is unlimited otherwise.
+
+    An object of this class must be used within a single event loop. The
+    :meth:`~zhmcclient.AsyncSession.close` coroutine should be awaited when
+    the session is no longer needed, in order to release its HTTP
+    connections. Alternatively, the session object can be used as an
+    asynchronous context manager (``async with``).
+
+    This class requires the `aiohttp` package to be installed.
+    """
+
+    default_rt_config = Session.default_rt_config
+
+    def __init__(self, host, userid=None, password=None, session_id=None,
+                 get_password=None, retry_timeout_config=None,
+                 port=DEFAULT_HMC_PORT, json_codec=None):
+        """
+        Creating a session object will not immediately cause a logon to be
+        attempted; the logon is deferred until needed.
+
+        For the alternatives for specifying the authentication related
+        parameters, see :class:`~zhmcclient.Session`.
+
+        Parameters:
+
+          host (:term:`string`):
+            HMC host. For valid formats, see the
+            :attr:`~zhmcclient.Session.host` property.
+            Must not be `None`.
+
+          userid (:term:`string`):
+            Userid of the HMC user to be used, or `None`.
+
+          password (:term:`string`):
+            Password of the HMC user to be used, if `userid` was specified.
+
+          session_id (:term:`string`):
+            Session-id to be used for this session, or `None`.
+
+          get_password (:term:`callable`):
+            A password retrieval function, or `None`. It is called as a
+            normal function (not as a coroutine) and must follow the
+            interface defined in :func:`~zhmcclient.get_password_interface`.
+
+          retry_timeout_config (:class:`~zhmcclient.RetryTimeoutConfig`):
+            The retry/timeout configuration for this session for use by any of
+            its HMC operations, overriding any defaults.
+            For details, see :class:`~zhmcclient.Session`.
+
+          port (:term:`integer`):
+            HMC TCP port. Defaults to
+            :attr:`~zhmcclient._constants.DEFAULT_HMC_PORT`.
+
+          json_codec (:class:`~zhmcclient.JsonCodec`):
+            JSON codec for encoding the request bodies and decoding the
+            response bodies of this session. For details, see
+            :class:`~zhmcclient.Session`.
+
+        Raises:
+
+          ImportError: The `aiohttp` package is not installed.
+        """
+        if aiohttp is None:
+            raise ImportError("The AsyncSession class requires the 'aiohttp' "
+                              "package to be installed")
+        self._host = host
+        self._port = port
+        self._userid = userid
+        self._password = password
+        self._get_password = get_password
+        self._retry_timeout_config = self.default_rt_config.override_with(
+            retry_timeout_config)
+        self._base_url = "{scheme}://{host}:{port}".format(
+            scheme=_HMC_SCHEME,
+            host=self._host,
+            port=self._port)
+        self._headers = copy(_STD_HEADERS)  # dict with standard HTTP headers
+        if session_id is not None:
+            self._headers['X-API-Session'] = session_id
+        self._session_id = session_id
+        # The aiohttp.ClientSession object and the lock for serializing logon
+        # and logoff are created when first needed, because they must be
+        # created within the event loop that uses them.
+        self._session = None
+        self._logon_lock = None
+        self._time_stats_keeper = TimeStatsKeeper()
+        self._json_codec = json_codec if json_codec is not None \
+            else _DEFAULT_JSON_CODEC
+
+    def __repr__(self):
+        """
+        Return a string with the state of this session, for debug purposes.
+        """
+        ret = (
+            "{classname} at 0x{id:08x} (\n"
+            "  _host = {s._host!r}\n"
+            "  _userid = {s._userid!r}\n"
+            "  _password = '...'\n"
+            "  _get_password = {s._get_password!r}\n"
+            "  _retry_timeout_config = {s._retry_timeout_config!r}\n"
+            "  _base_url = {s._base_url!r}\n"
+            "  _headers = {s._headers!r}\n"
+            "  _session_id = {s._session_id!r}\n"
+            "  _session = {s._session!r}\n"
+            "  _json_codec = {s._json_codec!r}\n"
+            ")".format(classname=self.__class__.__name__, id=id(self), s=self))
+        return ret
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @property
+    def host(self):
+        """
+        :term:`string`: HMC host. For details, see
+        :attr:`zhmcclient.Session.host`.
+        """
+        return self._host
+
+    @property
+    def port(self):
+        """
+        :term:`integer`: HMC TCP port to be used.
+        """
+        return self._port
+
+    @property
+    def userid(self):
+        """
+        :term:`string`: Userid of the HMC user to be used.
+
+        If `None`, only operations that do not require authentication, can be
+        performed.
+        """
+        return self._userid
+
+    @property
+    def get_password(self):
+        """
+        The password retrieval function, or `None`.
+        """
+        return self._get_password
+
+    @property
+    def retry_timeout_config(self):
+        """
+        :class:`~zhmcclient.RetryTimeoutConfig`: The effective retry/timeout
+        configuration for this session for use by any of its HMC operations,
+        taking into account the defaults and the session-specific overrides.
+        """
+        return self._retry_timeout_config
+
+    @property
+    def base_url(self):
+        """
+        :term:`string`: Base URL of the HMC in this session.
+        """
+        return self._base_url
+
+    @property
+    def headers(self):
+        """
+        :term:`header dict`: HTTP headers to be used in each request.
+        For details, see :attr:`zhmcclient.Session.headers`.
+        """
+        return self._headers
+
+    @property
+    def time_stats_keeper(self):
+        """
+        The time statistics keeper (for a usage example, see section
+        :ref:`Time Statistics`).
+        """
+        return self._time_stats_keeper
+
+    @property
+    def json_codec(self):
+        """
+        :class:`~zhmcclient.JsonCodec`: JSON codec for encoding the request
+        bodies and decoding the response bodies of this session.
+        """
+        return self._json_codec
+
+    @property
+    def session_id(self):
+        """
+        :term:`string`: Session ID for this session, returned by the HMC.
+        """
+        return self._session_id
+
+    @property
+    def session(self):
+        """
+        :class:`aiohttp.ClientSession` object for this session, or `None` if
+        it has not been created yet.
+        """
+        return self._session
+
+    def _get_session(self):
+        """
+        Return the :class:`aiohttp.ClientSession` object for this session,
+        creating it if needed.
+        """
+        if self._session is None:
+            rt_config = self.retry_timeout_config
+            limit = rt_config.pool_maxsize if rt_config.pool_block else 0
+            connector = aiohttp.TCPConnector(limit=limit)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def _get_logon_lock(self):
+        """
+        Return the lock for serializing logon and logoff, creating it if
+        needed.
+        """
+        if self._logon_lock is None:
+            self._logon_lock = asyncio.Lock()
+        return self._logon_lock
+
+    async def close(self):
+        """
+        Close the HTTP connections of this session.
+
+        This does not log off from the HMC. The session object can continue to
+        be used after this method has been called; new HTTP connections will be
+        created as needed.
+        """
+        if self._session is not None:
+            session = self._session
+            self._session = None
+            await session.close()
+
+    async def logon(self, verify=False):
+        """
+        Make sure the session is logged on to the HMC.
+
+        For details, see :meth:`zhmcclient.Session.logon`.
+
+        Parameters:
+
+          verify (bool): If a session-id is already set, verify its validity.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.ClientAuthError`
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        if not await self.is_logon(verify):
+            session_id = self._session_id
+            async with self._get_logon_lock():
+                # Another coroutine may have logged on while we were waiting
+                if self._session_id == session_id:
+                    await self._do_logon()
+
+    async def logoff(self, verify=False):
+        """
+        Make sure the session is logged off from the HMC.
+
+        For details, see :meth:`zhmcclient.Session.logoff`.
+
+        Parameters:
+
+          verify (bool): If a session-id is already set, verify its validity.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        if await self.is_logon(verify):
+            async with self._get_logon_lock():
+                if self._session_id is not None:
+                    await self._do_logoff()
+
+    async def is_logon(self, verify=False):
+        """
+        Return a boolean indicating whether the session is currently logged on
+        to the HMC.
+
+        For details, see :meth:`zhmcclient.Session.is_logon`.
+
+        Parameters:
+
+          verify (bool): If a session-id is already set, verify its validity.
+        """
+        if self._session_id is None:
+            return False
+        if verify:
+            try:
+                await self.get('/api/console', logon_required=True)
+            except ServerAuthError:
+                return False
+        return True
+
+    async def _do_logon(self):
+        """
+        Log on, unconditionally. This can be used to re-logon.
+        This requires credentials to be provided.
+
+        The caller must hold the logon lock.
+
+        Raises:
+
+          :exc:`~zhmcclient.ClientAuthError`
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.HTTPError`
+        """
+        if self._userid is None:
+            raise ClientAuthError("Userid is not provided.")
+        if self._password is None:
+            if self._get_password:
+                self._password = self._get_password(self._host, self._userid)
+            else:
+                raise ClientAuthError("Password is not provided.")
+        logon_uri = '/api/sessions'
+        logon_body = {
+            'userid': self._userid,
+            'password': self._password
+        }
+        self._set_session_header(None)  # Just in case
+        logon_res = await self.post(logon_uri, logon_body,
+                                    logon_required=False)
+        self._session_id = logon_res['api-session']
+        self._set_session_header(self._session_id)
+
+    async def _do_relogon(self, expired_session_id):
+        """
+        Log on again, because the HMC has rejected the specified session-id
+        as expired. If another coroutine has already logged on again, this
+        method does nothing.
+
+        Parameters:
+
+          expired_session_id (:term:`string`): The session-id that was used
+            in the rejected request, or `None`.
+        """
+        async with self._get_logon_lock():
+            if self._session_id is None or \
+                    self._session_id == expired_session_id:
+                await self._do_logon()
+
+    def _set_session_header(self, session_id):
+        """
+        Set or remove the session-id in the standard HTTP headers.
+
+        The headers dict is replaced instead of being modified in place, so
+        that requests of other coroutines that are in progress are not
+        affected.
+        """
+        headers = copy(self._headers)
+        if session_id is None:
+            headers.pop('X-API-Session', None)
+        else:
+            headers['X-API-Session'] = session_id
+        self._headers = headers
+
+    async def _do_logoff(self):
+        """
+        Log off, unconditionally.
+
+        The caller must hold the logon lock.
+
+        Raises:
+
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.HTTPError`
+        """
+        session_uri = '/api/sessions/this-session'
+        await self.delete(session_uri, logon_required=False)
+        self._session_id = None
+        self._set_session_header(None)
+
+    async def _request(self, method, uri, headers, data=None):
+        """
+        Send an HTTP request to the HMC and return its response with the
+        response body already read, as an :class:`_AsyncResult` object.
+
+        Connection-related issues are retried up to the `connect_retries`
+        attribute of the retry/timeout configuration. Read-related issues are
+        retried up to its `read_retries` attribute, for the HTTP methods in its
+        `method_whitelist` attribute.
+
+        The elapsed time is measured in the time statistics of the session.
+
+        Raises:
+
+          :exc:`~zhmcclient.ConnectionError` and derived exceptions
+        """
+        rt_config = self.retry_timeout_config
+        url = self.base_url + uri
+        Session._log_http_request(method, url, headers=headers, content=data)
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=rt_config.connect_timeout or None,
+            sock_read=rt_config.read_timeout or None)
+        connect_retries = rt_config.connect_retries or 0
+        if method in rt_config.method_whitelist:
+            read_retries = rt_config.read_retries or 0
+        else:
+            read_retries = 0
+        session = self._get_session()
+        stats = self.time_stats_keeper.get_stats(method.lower() + ' ' + uri)
+        begin_time = time.time()
+        try:
+            while True:
+                try:
+                    async with session.request(
+                            method, url, data=data, headers=headers,
+                            ssl=False, timeout=timeout,
+                            max_redirects=rt_config.max_redirects) as resp:
+                        content = await resp.read()
+                        result = _AsyncResult(method, url, resp, content)
+                    break
+                except aiohttp.ClientConnectorError as exc:
+                    if connect_retries > 0:
+                        connect_retries -= 1
+                        continue
+                    _handle_async_request_exc(exc, rt_config)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                    if read_retries > 0:
+                        read_retries -= 1
+                        continue
+                    _handle_async_request_exc(exc, rt_config)
+        finally:
+            stats._add_time(time.time() - begin_time)
+        Session._log_http_response(method, url,
+                                   status=result.status_code,
+                                   headers=result.headers,
+                                   content=result.content)
+        return result
+
+    async def get(self, uri, logon_required=True):
+        """
+        Perform the HTTP GET method against the resource identified by a URI.
+
+        For details, see :meth:`zhmcclient.Session.get`.
+
+        Parameters:
+
+          uri (:term:`string`):
+            Relative URI path of the resource, e.g. "/api/session".
+            Must not be `None`.
+
+          logon_required (bool):
+            Boolean indicating whether the operation requires that the session
+            is logged on to the HMC.
+
+        Returns:
+
+          :term:`json object` with the operation result.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.ClientAuthError`
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        if logon_required:
+            await self.logon()
+        headers = self.headers  # Standard headers, never modified in place
+        result = await self._request('GET', uri, headers)
+
+        if result.status_code == 200:
+            return _result_object(result, self._json_codec)
+        elif result.status_code == 403:
+            result_object = _result_object(result, self._json_codec)
+            reason = result_object.get('reason', None)
+            if reason == 5:
+                # API session token expired: re-logon and retry
+                await self._do_relogon(headers.get('X-API-Session', None))
+                return await self.get(uri, logon_required)
+            else:
+                msg = result_object.get('message', None)
+                raise ServerAuthError("HTTP authentication failed: {}".
+                                      format(msg), HTTPError(result_object))
+        else:
+            result_object = _result_object(result, self._json_codec)
+            raise HTTPError(result_object)
+
+    async def post(self, uri, body=None, logon_required=True,
+                   wait_for_completion=False, operation_timeout=None):
+        """
+        Perform the HTTP POST method against the resource identified by a URI,
+        using a provided request body.
+
+        For details, see :meth:`zhmcclient.Session.post`.
+
+        Parameters:
+
+          uri (:term:`string`):
+            Relative URI path of the resource, e.g. "/api/session".
+            Must not be `None`.
+
+          body (:term:`json object`):
+            JSON object to be used as the HTTP request body (payload).
+            `None` means the same as an empty dictionary, namely that no HTTP
+            body is included in the request.
+
+          logon_required (bool):
+            Boolean indicating whether the operation requires that the session
+            is logged on to the HMC.
+
+          wait_for_completion (bool):
+            Boolean controlling whether this method should wait for completion
+            of the requested asynchronous HMC operation.
+
+          operation_timeout (:term:`number`):
+            Timeout in seconds, when waiting for completion of an asynchronous
+            operation. The special value 0 means that no timeout is set. `None`
+            means that the default async operation timeout of the session is
+            used.
+
+        Returns:
+
+          : A :term:`json object` or `None` or a :class:`~zhmcclient.AsyncJob`
+          object, as described for :meth:`zhmcclient.Session.post`.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.ClientAuthError`
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError`
+          :exc:`~zhmcclient.OperationTimeout`: The timeout expired while
+            waiting for completion of the asynchronous operation.
+          :exc:`TypeError`: Body has invalid type.
+        """
+        if logon_required:
+            await self.logon()
+        headers = self.headers.copy()  # Standard headers
+        data = _body_data(body, headers, self._json_codec)
+
+        if wait_for_completion:
+            stats_total = self.time_stats_keeper.get_stats(
+                'post ' + uri + '+completion')
+            begin_time = time.time()
+        try:
+            result = await self._request('POST', uri, headers, data)
+
+            if result.status_code in (200, 201):
+                return _result_object(result, self._json_codec)
+            elif result.status_code == 204:
+                # No content
+                return None
+            elif result.status_code == 202:
+                if not result.content:
+                    # Some operations (e.g. "Restart Console",
+                    # "Shutdown Console" or "Cancel Job") return 202
+                    # with no response content.
+                    return None
+                else:
+                    # This is the most common case to return 202: An
+                    # asynchronous job has been started.
+                    result_object = _result_object(result, self._json_codec)
+                    job_uri = result_object['job-uri']
+                    job = AsyncJob(self, job_uri, 'POST', uri)
+                    if wait_for_completion:
+                        return await job.wait_for_completion(
+                            operation_timeout)
+                    else:
+                        return job
+            elif result.status_code == 403:
+                result_object = _result_object(result, self._json_codec)
+                reason = result_object.get('reason', None)
+                if reason == 5:
+                    # API session token expired: re-logon and retry
+                    await self._do_relogon(
+                        headers.get('X-API-Session', None))
+                    return await self.post(uri, body, logon_required)
+                else:
+                    msg = result_object.get('message', None)
+                    raise ServerAuthError("HTTP authentication failed: {}".
+                                          format(msg),
+                                          HTTPError(result_object))
+            else:
+                result_object = _result_object(result, self._json_codec)
+                raise HTTPError(result_object)
+        finally:
+            if wait_for_completion:
+                stats_total._add_time(time.time() - begin_time)
+
+    async def delete(self, uri, logon_required=True):
+        """
+        Perform the HTTP DELETE method against the resource identified by a
+        URI.
+
+        For details, see :meth:`zhmcclient.Session.delete`.
+
+        Parameters:
+
+          uri (:term:`string`):
+            Relative URI path of the resource, e.g.
+            "/api/session/{session-id}".
+            Must not be `None`.
+
+          logon_required (bool):
+            Boolean indicating whether the operation requires that the session
+            is logged on to the HMC.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.ClientAuthError`
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        if logon_required:
+            await self.logon()
+        headers = self.headers  # Standard headers, never modified in place
+        result = await self._request('DELETE', uri, headers)
+
+        if result.status_code in (200, 204):
+            return
+        elif result.status_code == 403:
+            result_object = _result_object(result, self._json_codec)
+            reason = result_object.get('reason', None)
+            if reason == 5:
+                # API session token expired: re-logon and retry
+                await self._do_relogon(headers.get('X-API-Session', None))
+                await self.delete(uri, logon_required)
+                return
+            else:
+                msg = result_object.get('message', None)
+                raise ServerAuthError("HTTP authentication failed: {}".
+                                      format(msg), HTTPError(result_object))
+        else:
+            result_object = _result_object(result, self._json_codec)
+            raise HTTPError(result_object)
+
+    async def get_notification_topics(self):
+        """
+        The 'Get Notification Topics' operation returns a structure that
+        describes the JMS notification topics associated with the
+        API session.
+
+        For details, see :meth:`zhmcclient.Session.get_notification_topics`.
+        """
+        topics_uri = '/api/sessions/operations/get-notification-topics'
+        response = await self.get(topics_uri)
+        return response['topics']
+
+
+class AsyncJob(Job):
+    """
+    A job on the HMC that performs an asynchronous HMC operation, for use
+    with :class:`~zhmcclient.AsyncSession`.
+
+    This class has the same properties as :class:`~zhmcclient.Job`, but its
+    methods for checking and waiting for job completion are coroutines.
+    """
+
+    async def check_for_completion(self):
+        """
+        Check once for completion of the job and return completion status and
+        result if it has completed.
+
+        For details, see :meth:`zhmcclient.Job.check_for_completion`.
+
+        Returns:
+
+          : A tuple (status, result), as described for
+          :meth:`zhmcclient.Job.check_for_completion`.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`: The job completed in error, or the job
+            status cannot be retrieved, or the job cannot be deleted.
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.ClientAuthError`
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        job_result_obj = await self.session.get(self.uri)
+        job_status = job_result_obj['status']
+        if job_status == 'complete':
+            await self.session.delete(self.uri)
+            op_result_obj = self._op_result(job_result_obj)
+        else:
+            op_result_obj = None
+        return job_status, op_result_obj
+
+    async def wait_for_completion(self, operation_timeout=None):
+        """
+        Wait for completion of the job, then delete the job on the HMC and
+        return the result of the original asynchronous HMC operation, if it
+        completed successfully.
+
+        While waiting, other coroutines in the event loop continue to run.
+
+        For details, see :meth:`zhmcclient.Job.wait_for_completion`.
+
+        Parameters:
+
+          operation_timeout (:term:`number`):
+            Timeout in seconds, when waiting for completion of the job. The
+            special value 0 means that no timeout is set. `None` means that the
+            default async operation timeout of the session is used.
+
+        Returns:
+
+          :term:`json object` or `None`:
+            The result of the original asynchronous operation that was
+            performed by the job.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`: The job completed in error, or the job
+            status cannot be retrieved, or the job cannot be deleted.
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.ClientAuthError`
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError`
+          :exc:`~zhmcclient.OperationTimeout`: The timeout expired while
+            waiting for job completion.
+        """
+
+        if operation_timeout is None:
+            operation_timeout = \
+                self.session.retry_timeout_config.operation_timeout
+        if operation_timeout > 0:
+            start_time = time.time()
+        poll_intervals = self._poll_intervals()
+
+        while True:
+            job_status, op_result_obj = await self.check_for_completion()
+
+            # We give completion of status priority over strictly achieving
+            # the timeout, so we check status first. This may cause a longer
+            # duration of the method than prescribed by the timeout.
+            if job_status == 'complete':
+                return op_result_obj
+
+            if operation_timeout > 0:
+                current_time = time.time()
+                if current_time > start_time + operation_timeout:
+                    raise OperationTimeout(
+                        "Waiting for completion of job {} timed out "
+                        "(operation timeout: {} s)".
+                        format(self.uri, operation_timeout),
+                        operation_timeout)
+
+            interval = next(poll_intervals)
+            if operation_timeout > 0:
+                # Check once more when the timeout expires
+                remaining = start_time + operation_timeout - current_time
+                interval = min(interval, max(remaining, 0))
+            await asyncio.sleep(interval)
@@ -0,0 +1,402 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A cache coherence service keeps the data cached by a
+:class:`~zhmcclient.Client` object coherent with the HMC, by applying the
+object notifications of the HMC to it.
+
+Without a cache coherence service, the resource properties cached in Python
+resource objects are not updated when the resources are changed by other
+clients or by the HMC itself, and the Name-URI caches of the resource managers
+remain stale until their time to live expires. With a cache coherence
+service, long-running programs can rely on the cached data instead of
+retrieving it again from the HMC.
+
+The service subscribes for the object notification topic of the session of
+the client, and applies the following notifications:
+
+* 'property-change': The changed properties are set in the Python resource
+  object for the resource. A change of the resource name is also applied to
+  the Name-URI cache of its resource manager.
+
+* 'status-change': The 'status' property (and 'additional-status' and
+  'has-unacceptable-status' properties, if reported) are set in the Python
+  resource object for the resource.
+
+* 'inventory-change': A resource that was added is retrieved from the HMC and
+  added to the resource manager of its parent resource object (to its
+  Name-URI cache, and to its loaded resources, see
+  :meth:`~zhmcclient.Client.load_inventory`). A resource that was removed is
+  removed from the Name-URI cache and loaded resources of its resource
+  manager, and from the identity map.
+
+The Python resource objects are found using the identity map of the client
+(see :ref:`Identity map`), so the client must have been created with an
+identity map.
+
+Example::
+
+    import zhmcclient
+
+    session = zhmcclient.Session(hmc, userid, password)
+    client = zhmcclient.Client(session, identity_map=True)
+    client.load_inventory(['partition'])
+
+    service = zhmcclient.CacheCoherenceService(client)
+    try:
+        ...  # cpc.partitions.list() etc. reflect changes made by others
+    finally:
+        service.close()
+"""
+
+from __future__ import absolute_import
+
+import threading
+import time
+
+from ._client import _INVENTORY_CLASSES, _PORT_CLASSES
+from ._notification import NotificationReceiver
+from ._logging import get_logger, logged_api_call
+
+__all__ = ['CacheCoherenceService']
+
+LOG = get_logger(__name__)
+
+# Properties of a resource that are reported in status change notifications,
+# with the name of the item in the change report that has the new value
+_STATUS_PROPERTIES = [
+    ('status', 'new-status'),
+    ('additional-status', 'new-additional-status'),
+    ('has-unacceptable-status', 'has-unacceptable-status'),
+]
+
+
+class CacheCoherenceService(object):
+    """
+    A service that keeps the resource properties cached in the Python
+    resource objects of a client and the Name-URI caches of its resource
+    managers coherent with the HMC, by applying the HMC object notifications
+    (property changes, status changes and inventory changes) to them.
+
+    **Experimental:** This class is considered experimental at this point, and
+    its API may change incompatibly as long as it is experimental.
+
+    Creating an object of this class subscribes for the object notification
+    topic of the session of the client, and starts a thread that applies the
+    notifications. The service stops when it is closed, or when the
+    notification receiver is disconnected (e.g. because the session has been
+    logged off). After that, the cached data is no longer kept coherent.
+
+    Notifications can also be applied by the user with
+    :meth:`~zhmcclient.CacheCoherenceService.apply_notification`, e.g. when
+    the user receives the notifications of the object notification topic with
+    an own :class:`~zhmcclient.NotificationReceiver`.
+    """
+
+    def __init__(self, client, userid=None, password=None, start=True):
+        """
+        Parameters:
+
+          client (:class:`~zhmcclient.Client`):
+            The client whose cached data is to be kept coherent. It must have
+            an identity map.
+
+          userid (:term:`string`):
+            Userid of the HMC user to be used for receiving the notifications.
+            `None` means to use the userid of the session of the client.
+
+          password (:term:`string`):
+            Password of the HMC user to be used for receiving the
+            notifications. `None` means to use the password of the session of
+            the client.
+
+          start (bool):
+            Controls whether the notifications of the object notification
+            topic are received and applied. `False` means that notifications
+            are applied only by calling
+            :meth:`~zhmcclient.CacheCoherenceService.apply_notification`.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+          ValueError: The client has no identity map, the HMC has no object
+            notification topic for the session, or no password is known.
+        """
+        if client.identity_map is None:
+            raise ValueError("The client for a cache coherence service must "
+                             "have an identity map")
+        self._client = client
+        self._receiver = None
+        self._thread = None
+        self._running = False
+        self._lock = threading.Lock()
+        self._num_applied = 0
+        if start:
+            self._start(userid, password)
+
+    def __repr__(self):
+        """
+        Return a string with the state of this cache coherence service, for
+        debug purposes.
+        """
+        return "{}(running={!r}, applied={!r})".format(
+            self.__class__.__name__, self._running, self._num_applied)
+
+    def _start(self, userid, password):
+        """
+        Subscribe for the object notification topic of the session and start
+        the thread that applies the notifications.
+        """
+        session = self._client.session
+        topics = session.get_notification_topics()
+        object_topics = [t['topic-name'] for t in topics
+                         if t['topic-type'] == 'object-notification']
+        if not object_topics:
+            raise ValueError("The HMC has no object notification topic for "
+                             "the session")
+        if userid is None:
+            userid = session.userid
+        if password is None:
+            password = session._password  # pylint: disable=protected-access
+        if password is None:
+            raise ValueError("No password is known for the session")
+        self._receiver = NotificationReceiver(
+            object_topics[0], session.host, userid, password)
+        self._running = True
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def client(self):
+        """
+        :class:`~zhmcclient.Client`: The client whose cached data is kept
+        coherent.
+        """
+        return self._client
+
+    @property
+    def running(self):
+        """
+        bool: Indicates whether notifications are still being received and
+        applied.
+        """
+        return self._running
+
+    @property
+    def num_applied(self):
+        """
+        :term:`integer`: The number of notifications that have been applied
+        so far.
+        """
+        return self._num_applied
+
+    @logged_api_call
+    def close(self):
+        """
+        Stop receiving notifications, by closing the notification receiver
+        of this service.
+        """
+        if self._receiver is not None:
+            self._receiver.close()
+        if self._thread is not None:
+            self._thread.join(10)
+
+    def _run(self):
+        """
+        Thread function that applies the notifications.
+        """
+        try:
+            for headers, message in self._receiver.notifications():
+                try:
+                    self.apply_notification(headers, message)
+                except Exception as exc:  # pylint: disable=broad-except
+                    LOG.warning("Cannot apply %s notification for %s: %s",
+                                headers.get('notification-type'),
+                                _resource_uri(headers), exc)
+        finally:
+            self._running = False
+
+    @logged_api_call
+    def apply_notification(self, headers, message):
+        """
+        Apply an HMC notification of the object notification topic to the
+        cached data of the client.
+
+        Notifications of other types than 'property-change', 'status-change'
+        and 'inventory-change' are ignored.
+
+        Parameters:
+
+          headers (dict): The notification header fields, as yielded by
+            :meth:`~zhmcclient.NotificationReceiver.notifications`.
+
+          message (:term:`JSON object`): Body of the notification, as yielded
+            by :meth:`~zhmcclient.NotificationReceiver.notifications`.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        noti_type = headers.get('notification-type')
+        uri = _resource_uri(headers)
+        if uri is None:
+            return
+        with self._lock:
+            if noti_type == 'property-change':
+                reports = (message or {}).get('change-reports', [])
+                self._apply_property_changes(
+                    headers, uri,
+                    [(r['property-name'], r.get('new-value'))
+                     for r in reports])
+            elif noti_type == 'status-change':
+                reports = (message or {}).get('change-reports', [])
+                changes = []
+                for report in reports:
+                    for prop_name, item_name in _STATUS_PROPERTIES:
+                        if item_name in report:
+                            changes.append((prop_name, report[item_name]))
+                self._apply_property_changes(headers, uri, changes)
+            elif noti_type == 'inventory-change':
+                action = headers.get('action')
+                if action == 'add':
+                    self._apply_add(headers, uri)
+                elif action == 'remove':
+                    self._apply_remove(headers, uri)
+                else:
+                    return
+            else:
+                return
+            self._num_applied += 1
+
+    def _apply_property_changes(self, headers, uri, changes):
+        """
+        Apply changed properties to the Python resource object for a
+        resource, and a changed name to the Name-URI caches.
+        """
+        # pylint: disable=protected-access
+        obj = self._client.identity_map.get(uri)
+        if obj is None:
+            # There is no resource object to update, but the Name-URI caches
+            # may have an entry for the resource.
+            for prop_name, value in changes:
+                if prop_name == 'name':
+                    for manager in self._managers(headers.get('class')):
+                        manager._name_uri_cache.resource_renamed(uri, value)
+            return
+        now = time.time()
+        name_prop = obj.manager._name_prop
+        for prop_name, value in changes:
+            if prop_name == name_prop:
+                obj.manager._name_uri_cache.resource_renamed(uri, value)
+            obj._properties[prop_name] = value
+            obj._property_timestamps[prop_name] = now
+        LOG.debug("Applied property changes to %s: %s", uri,
+                  [prop_name for prop_name, _ in changes])
+
+    def _apply_add(self, headers, uri):
+        """
+        Add a resource that was added on the HMC to the resource manager of
+        its parent resource object.
+        """
+        # pylint: disable=protected-access
+        resource_class = headers.get('class')
+        if resource_class not in _INVENTORY_CLASSES:
+            return
+        managers = list(self._managers(resource_class))
+        if not managers:
+            # No resource manager has cached data for the resource class
+            return
+        props = self._client.session.get(uri)
+        parent_class = _INVENTORY_CLASSES[resource_class][0]
+        if parent_class is None:
+            pass
+        elif parent_class == 'console':
+            managers = [m for m in managers
+                        if m.parent.uri == props.get('parent', m.parent.uri)]
+        else:
+            managers = [m for m in managers
+                        if m.parent.uri == props.get('parent')]
+        for manager in managers:
+            obj = manager._get_resource_obj(
+                uri=uri,
+                name=props.get(manager._name_prop),
+                properties=props)
+            obj._set_full_properties(props)
+            manager._name_uri_cache.resource_added(obj)
+            LOG.debug("Applied addition of %s to %r", uri, manager)
+
+    def _apply_remove(self, headers, uri):
+        """
+        Remove a resource that was removed on the HMC from the resource
+        manager holding it, and from the identity map.
+        """
+        # pylint: disable=protected-access
+        identity_map = self._client.identity_map
+        obj = identity_map.get(uri)
+        if obj is not None:
+            managers = [obj.manager]
+        else:
+            managers = self._managers(headers.get('class'))
+        for manager in managers:
+            manager._name_uri_cache.resource_removed(uri)
+        identity_map.remove(uri)
+        LOG.debug("Applied removal of %s", uri)
+
+    def _managers(self, resource_class):
+        """
+        Generate the existing resource managers of the client for a resource
+        class.
+        """
+        try:
+            parent_class, manager_attr, _ = _INVENTORY_CLASSES[resource_class]
+        except KeyError:
+            return
+        client = self._client
+        if parent_class is None:
+            parents = [client]
+        elif parent_class == 'console':
+            # pylint: disable=protected-access
+            console = client.consoles._console
+            if console is None:
+                console = client.identity_map.get('/api/console')
+            parents = [console] if console is not None else []
+        else:
+            # pylint: disable=protected-access
+            parents = [obj for obj in client.identity_map._objects_list()
+                       if obj.manager.class_name == parent_class]
+        for parent in parents:
+            # The resource managers are created on first access, so a
+            # resource manager that does not exist has no cached data.
+            manager = getattr(parent, '_' + manager_attr, None)
+            if manager is None:
+                continue
+            if resource_class in _PORT_CLASSES and \
+                    manager.class_name != resource_class:
+                continue
+            yield manager
+
+
+def _resource_uri(headers):
+    """
+    Return the canonical URI of the resource an object notification is about.
+    """
+    return headers.get('element-uri') or headers.get('object-uri')
@@ -0,0 +1,291 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The :class:`~zhmcclient.CircuitBreaker` class tracks the health of the
+connections to an HMC host, and lets the HTTP requests of a
+:class:`~zhmcclient.Session` object fail fast while the HMC is unreachable.
+
+Without a circuit breaker, each HTTP request to an unreachable HMC waits for
+the connect timeout and connect retries of the session (see
+:class:`~zhmcclient.RetryTimeoutConfig`), in every thread that uses the
+session. A circuit breaker is enabled for a session by passing it to the
+:class:`~zhmcclient.Session` object via its `circuit_breaker` init parameter,
+and has one of these states:
+
+* ``"closed"`` - The HMC is considered reachable, and HTTP requests are sent
+  as usual. The circuit breaker counts the consecutive HTTP requests that
+  failed with a :exc:`~zhmcclient.ConnectionError`, and changes to the
+  ``"open"`` state when their number reaches the failure threshold. Any HTTP
+  response from the HMC, including HTTP errors, resets that number.
+
+* ``"open"`` - The HMC is considered unreachable, and HTTP requests fail fast
+  with :exc:`~zhmcclient.CircuitBreakerOpen`, without being sent. When the
+  reset timeout has passed since the circuit breaker was opened, the next
+  HTTP request changes it to the ``"half-open"`` state.
+
+* ``"half-open"`` - The HMC is probed once with the 'Query API Version'
+  operation (see :meth:`zhmcclient.Client.query_api_version`), which does not
+  require a logon. Other HTTP requests fail fast during the probe. If the
+  probe succeeds, the circuit breaker changes to the ``"closed"`` state and
+  the HTTP request that caused the probe is sent. Otherwise, it changes back
+  to the ``"open"`` state and the HTTP request fails.
+
+A circuit breaker object can be shared by multiple sessions with the same HMC
+host, in which case its state reflects the requests of all of these sessions
+together.
+
+:meth:`zhmcclient.Client.wait_for_available` uses the circuit breaker of the
+session, if any, to wait until the next probe is allowed or until the state
+of the circuit breaker changes.
+
+Example::
+
+    import zhmcclient
+
+    breaker = zhmcclient.CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    session = zhmcclient.Session(hmc, userid, password,
+                                 circuit_breaker=breaker)
+
+    . . .
+
+    if breaker.state != 'closed':
+        print("HMC {} is unreachable".format(hmc))
+"""
+
+from __future__ import absolute_import
+
+import time
+import threading
+
+from ._logging import get_logger
+from ._exceptions import CircuitBreakerOpen
+
+__all__ = ['CircuitBreaker']
+
+LOG = get_logger(__name__)
+
+
+class CircuitBreaker(object):
+    """
+    A circuit breaker for the HTTP requests to one HMC host.
+
+    For a description of its states, see :mod:`zhmcclient._circuit_breaker`.
+
+    A circuit breaker object is thread-safe.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        """
+        Parameters:
+
+          failure_threshold (:term:`integer`):
+            Number of consecutive HTTP requests that failed with a
+            :exc:`~zhmcclient.ConnectionError`, after which the circuit breaker
+            opens.
+
+          reset_timeout (:term:`number`):
+            Time in seconds after opening, after which the circuit breaker
+            probes the HMC.
+        """
+        if failure_threshold < 1:
+            raise ValueError("Invalid failure_threshold value: {!r}".
+                             format(failure_threshold))
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._state = 'closed'
+        self._failures = 0
+        self._opened_at = None
+        self._last_error = None
+        self._cond = threading.Condition()
+
+    def __repr__(self):
+        """
+        Return a string with the state of this circuit breaker, for debug
+        purposes.
+        """
+        ret = (
+            "{classname}(failure_threshold={s._failure_threshold!r}, "
+            "reset_timeout={s._reset_timeout!r}, state={s._state!r}, "
+            "failures={s._failures!r})".
+            format(classname=self.__class__.__name__, s=self))
+        return ret
+
+    @property
+    def failure_threshold(self):
+        """
+        :term:`integer`: Number of consecutive failed HTTP requests after
+        which the circuit breaker opens.
+        """
+        return self._failure_threshold
+
+    @property
+    def reset_timeout(self):
+        """
+        :term:`number`: Time in seconds after opening, after which the circuit
+        breaker probes the HMC.
+        """
+        return self._reset_timeout
+
+    @property
+    def state(self):
+        """
+        :term:`string`: State of the circuit breaker: ``"closed"``,
+        ``"open"`` or ``"half-open"``.
+        """
+        return self._state
+
+    @property
+    def available(self):
+        """
+        bool: Indicates whether the HMC is considered reachable, i.e. whether
+        the circuit breaker is closed.
+        """
+        return self._state == 'closed'
+
+    @property
+    def failures(self):
+        """
+        :term:`integer`: Number of consecutive HTTP requests that failed with
+        a :exc:`~zhmcclient.ConnectionError`.
+        """
+        return self._failures
+
+    @property
+    def last_error(self):
+        """
+        :exc:`~zhmcclient.ConnectionError`: The error of the last failed HTTP
+        request or probe, or `None`.
+        """
+        return self._last_error
+
+    def retry_in(self):
+        """
+        Return the time until the circuit breaker allows the next probe of
+        the HMC.
+
+        Returns:
+
+          :term:`number`: Time in seconds until the next probe is allowed
+          (0 if it is allowed now), or `None` if the circuit breaker is not
+          open.
+        """
+        with self._cond:
+            if self._state != 'open':
+                return None
+            return max(self._opened_at + self._reset_timeout - time.time(), 0)
+
+    def wait(self, timeout):
+        """
+        Wait until the state of the circuit breaker changes, or until a
+        timeout expires.
+
+        Parameters:
+
+          timeout (:term:`number`): Timeout in seconds.
+
+        Returns:
+
+          :term:`string`: The state of the circuit breaker.
+        """
+        with self._cond:
+            state = self._state
+            end_time = time.time() + timeout
+            while self._state == state:
+                remaining = end_time - time.time()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            return self._state
+
+    def _set_state(self, state):
+        """Change the state. Must be called with the condition held."""
+        if state != self._state:
+            LOG.debug("Circuit breaker changes from state %s to %s",
+                      self._state, state)
+            self._state = state
+            self._cond.notify_all()
+
+    def before_request(self):
+        """
+        Check whether an HTTP request may be sent.
+
+        Returns:
+
+          bool: Indicates whether the caller has to probe the HMC before
+          sending the HTTP request, and to report the result of the probe via
+          :meth:`~zhmcclient.CircuitBreaker.success` or
+          :meth:`~zhmcclient.CircuitBreaker.failure`.
+
+        Raises:
+
+          :exc:`~zhmcclient.CircuitBreakerOpen`: The circuit breaker is open,
+            or another caller is probing the HMC.
+        """
+        with self._cond:
+            if self._state == 'closed':
+                return False
+            if self._state == 'open' and \
+                    time.time() >= self._opened_at + self._reset_timeout:
+                self._set_state('half-open')
+                return True
+            details = self._last_error.details \
+                if self._last_error is not None else None
+            raise CircuitBreakerOpen(
+                "Circuit breaker is {} after {} consecutive connection "
+                "failures; last error: {}".
+                format(self._state, self._failures, self._last_error),
+                details)
+
+    def success(self):
+        """
+        Report that an HTTP request or probe received a response from the HMC.
+        """
+        with self._cond:
+            if self._state != 'closed':
+                LOG.info("HMC is reachable again, closing circuit breaker")
+            self._failures = 0
+            self._set_state('closed')
+
+    def failure(self, error):
+        """
+        Report that an HTTP request or probe failed with a
+        :exc:`~zhmcclient.ConnectionError`.
+
+        Parameters:
+
+          error (:exc:`~zhmcclient.ConnectionError`): The error.
+        """
+        with self._cond:
+            self._failures += 1
+            self._last_error = error
+            if self._state == 'half-open' or \
+                    self._failures >= self._failure_threshold:
+                if self._state == 'closed':
+                    LOG.warning("Opening circuit breaker after %s consecutive "
+                                "connection failures; last error: %s",
+                                self._failures, error)
+                self._opened_at = time.time()
+                self._set_state('open')
+
+    def abort_probe(self):
+        """
+        Report that a probe was not completed (e.g. because of an error that
+        is not related to the connection to the HMC). The circuit breaker
+        changes back to the ``"open"`` state and allows the next probe right
+        away.
+        """
+        with self._cond:
+            if self._state == 'half-open':
+                self._set_state('open')
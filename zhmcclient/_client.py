@@ -23,6 +23,7 @@ import time
 from ._cpc import CpcManager
 from ._console import ConsoleManager
 from ._metrics import MetricsContextManager
+from ._identity_map import IdentityMap
 from ._logging import get_logger, logged_api_call
 from ._exceptions import Error, OperationTimeout
 
@@ -30,6 +31,55 @@ __all__ = ['Client']
 
 LOG = get_logger(__name__)
 
+# Resource classes that can be loaded with Client.load_inventory(), with
+# tuple items:
+# - resource class of the parent resource ('console' for the Console, `None`
+#   for top level resources),
+# - name of the manager attribute of the parent resource object,
+# - boolean indicating whether the resources are element resources, that are
+#   returned by the 'Get Inventory' operation as children of their parent.
+_INVENTORY_CLASSES = {
+    'cpc': (None, 'cpcs', False),
+    'partition': ('cpc', 'partitions', False),
+    'logical-partition': ('cpc', 'lpars', False),
+    'adapter': ('cpc', 'adapters', False),
+    'virtual-switch': ('cpc', 'virtual_switches', False),
+    'reset-activation-profile': ('cpc', 'reset_activation_profiles', False),
+    'image-activation-profile': ('cpc', 'image_activation_profiles', False),
+    'load-activation-profile': ('cpc', 'load_activation_profiles', False),
+    'nic': ('partition', 'nics', True),
+    'hba': ('partition', 'hbas', True),
+    'virtual-function': ('partition', 'virtual_functions', True),
+    'network-port': ('adapter', 'ports', True),
+    'storage-port': ('adapter', 'ports', True),
+    'storage-group': ('console', 'storage_groups', False),
+    'storage-volume': ('storage-group', 'storage_volumes', True),
+    'virtual-storage-resource':
+        ('storage-group', 'virtual_storage_resources', True),
+    'user': ('console', 'users', False),
+    'user-role': ('console', 'user_roles', False),
+    'user-pattern': ('console', 'user_patterns', False),
+    'password-rule': ('console', 'password_rules', False),
+    'task': ('console', 'tasks', False),
+    'ldap-server-definition': ('console', 'ldap_server_definitions', False),
+}
+
+# Resource classes whose managers are shared by more than one resource class
+_PORT_CLASSES = ('network-port', 'storage-port')
+
+
+def _inventory_depth(resource_class):
+    """
+    Return the number of ancestors of a resource class that can be loaded
+    with Client.load_inventory().
+    """
+    depth = 0
+    parent_class = _INVENTORY_CLASSES[resource_class][0]
+    while parent_class not in (None, 'console'):
+        depth += 1
+        parent_class = _INVENTORY_CLASSES[parent_class][0]
+    return depth
+
 
 class Client(object):
     """
@@ -38,14 +88,21 @@ class Client(object):
     This is the main class for users of this package.
     """
 
-    def __init__(self, session):
+    def __init__(self, session, identity_map=False):
         """
         Parameters:
 
           session (:class:`~zhmcclient.Session`):
             Session with the HMC.
+
+          identity_map (bool):
+            Controls whether the Python resource objects of this client are
+            kept in an identity map, so that each resource is represented by
+            at most one Python resource object at a time. For details, see
+            :class:`~zhmcclient.IdentityMap`.
         """
         self._session = session
+        self._identity_map = IdentityMap() if identity_map else None
         self._cpcs = CpcManager(self)
         self._consoles = ConsoleManager(self)
         self._metrics_contexts = MetricsContextManager(self)
@@ -59,6 +116,15 @@ class Client(object):
         """
         return self._session
 
+    @property
+    def identity_map(self):
+        """
+        :class:`~zhmcclient.IdentityMap`:
+          Identity map of the Python resource objects of this client, or
+          `None` if this client has no identity map.
+        """
+        return self._identity_map
+
     @property
     def cpcs(self):
         """
@@ -180,6 +246,200 @@ class Client(object):
         result = self.session.post(uri, body=body)
         return result
 
+    @logged_api_call
+    def iter_inventory(self, resources):
+        """
+        Generator that yields the requested resources that are managed by the
+        HMC, as the response of the 'Get Inventory' HMC operation is being
+        received.
+
+        This method performs the 'Get Inventory' HMC operation, like
+        :meth:`~zhmcclient.Client.get_inventory`, but parses its response
+        incrementally (see :meth:`~zhmcclient.Session.iter_post`), so the
+        memory needed does not depend on the number of resources in the
+        inventory.
+
+        The operation is performed when the first resource is requested from
+        the returned generator.
+
+        Parameters:
+
+          resources (:term:`iterable` of :term:`string`):
+            Resource classes and/or resource classifiers specifying the types
+            of resources that should be included in the result. For details,
+            see :meth:`~zhmcclient.Client.get_inventory`.
+
+            Must not be `None`.
+
+        Returns:
+
+          :term:`iterable` of :term:`json object`:
+            A generator that yields one JSON object with the properties of
+            each resource, in the order of the response.
+
+        Example:
+
+            resource_classes = ['partition', 'adapter']
+            for res in client.iter_inventory(resource_classes):
+                print(res['class'], res['name'])
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        uri = '/api/services/inventory'
+        body = {'resources': resources}
+        return self.session.iter_post(uri, body=body)
+
+    @logged_api_call
+    def load_inventory(self, resources):
+        """
+        Populate the resource managers of this client with the requested
+        resources that are managed by the HMC, using a single 'Get Inventory'
+        HMC operation.
+
+        For each resource in the inventory, a Python resource object with the
+        full set of resource properties is created in the resource manager of
+        its parent resource object, starting with the CPCs of this client and
+        the Console. The Name-URI caches of these resource managers are
+        updated with the names and URIs of the resources.
+
+        The resource managers for the requested resource classes are marked as
+        loaded. Subsequent :meth:`~zhmcclient.BaseManager.list`,
+        :meth:`~zhmcclient.BaseManager.findall`,
+        :meth:`~zhmcclient.BaseManager.find` and
+        :meth:`~zhmcclient.BaseManager.find_by_name` calls on a loaded
+        resource manager are served from the loaded resource objects without
+        any HMC interactions, until its Name-URI cache is invalidated (see
+        :meth:`~zhmcclient.BaseManager.invalidate_cache`), or expires after
+        the time to live set by the
+        :attr:`~zhmcclient.RetryTimeoutConfig.name_uri_cache_timetolive`
+        attribute of the session.
+
+        The ancestor resource classes of the requested resource classes are
+        loaded as well (for example, requesting 'partition' loads the CPCs),
+        and so are the element resources of the requested resource classes
+        (for example, requesting 'partition' loads its NICs, HBAs and
+        virtual functions).
+
+        Parameters:
+
+          resources (:term:`iterable` of :term:`string`):
+            Resource classes of the resources to be loaded. Valid resource
+            classes are: 'cpc', 'partition', 'logical-partition', 'adapter',
+            'virtual-switch', 'reset-activation-profile',
+            'image-activation-profile', 'load-activation-profile', 'nic',
+            'hba', 'virtual-function', 'network-port', 'storage-port',
+            'storage-group', 'storage-volume', 'virtual-storage-resource',
+            'user', 'user-role', 'user-pattern', 'password-rule', 'task',
+            'ldap-server-definition'. Resource classifiers are not supported.
+
+        Returns:
+
+          list of resource objects:
+            The Python resource objects for the loaded resources, with
+            parent resources before their child resources.
+
+        Example:
+
+            client.load_inventory(['partition', 'adapter'])
+            for cpc in client.cpcs.list():  # no HMC interaction
+                for partition in cpc.partitions.list():  # no HMC interaction
+                    print(cpc.name, partition.name, partition.get_property(
+                        'status'))  # no HMC interaction
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+          ValueError: Invalid resource class.
+        """
+        loaded_classes = set()
+        for resource_class in resources:
+            if resource_class not in _INVENTORY_CLASSES:
+                raise ValueError(
+                    "Invalid resource class for loading the inventory: {!r}".
+                    format(resource_class))
+            while resource_class not in (None, 'console'):
+                loaded_classes.add(resource_class)
+                resource_class = _INVENTORY_CLASSES[resource_class][0]
+        for resource_class, (parent_class, _, element) in \
+                _INVENTORY_CLASSES.items():
+            if element and parent_class in loaded_classes:
+                loaded_classes.add(resource_class)
+        loaded_classes = sorted(
+            loaded_classes, key=lambda c: (_inventory_depth(c), c))
+
+        inventory_classes = [c for c in loaded_classes
+                             if not _INVENTORY_CLASSES[c][2]]
+        items_by_class = {}
+        for item in self.iter_inventory(inventory_classes):
+            items_by_class.setdefault(item.get('class'), []).append(item)
+
+        objs_by_class = {}
+        objs_by_uri = {}
+        for resource_class in loaded_classes:
+            parent_class, manager_attr, _ = _INVENTORY_CLASSES[resource_class]
+            if parent_class is None:
+                parents = [self]
+            elif parent_class == 'console':
+                parents = [self._loaded_console()]
+            else:
+                parents = objs_by_class.get(parent_class, [])
+
+            objs_by_manager = {}
+            for item in items_by_class.get(resource_class, []):
+                if parent_class is None:
+                    parent = self
+                elif parent_class == 'console':
+                    parent = parents[0]
+                else:
+                    parent = objs_by_uri.get(item.get('parent'))
+                    if parent is None:
+                        # The parent resource is not in the inventory
+                        continue
+                manager = getattr(parent, manager_attr)
+                # pylint: disable=protected-access
+                obj = manager._get_resource_obj(
+                    uri=item[manager._uri_prop],
+                    name=item.get(manager._name_prop),
+                    properties=item)
+                obj._set_full_properties(item)
+                objs_by_manager.setdefault(id(manager), []).append(obj)
+                objs_by_class.setdefault(resource_class, []).append(obj)
+                objs_by_uri[obj.uri] = obj
+
+            for parent in parents:
+                manager = getattr(parent, manager_attr)
+                if resource_class in _PORT_CLASSES and \
+                        manager.class_name != resource_class:
+                    continue
+                # pylint: disable=protected-access
+                manager._name_uri_cache.set_resources(
+                    objs_by_manager.get(id(manager), []))
+
+        obj_list = []
+        for resource_class in loaded_classes:
+            obj_list.extend(objs_by_class.get(resource_class, []))
+        return obj_list
+
+    def _loaded_console(self):
+        """
+        Return the Console object of this client for loading the inventory,
+        without retrieving it from the HMC.
+        """
+        consoles = self.consoles
+        # pylint: disable=protected-access
+        if consoles._console is None:
+            consoles._console = consoles._get_resource_obj(
+                uri='/api/console',
+                properties={consoles._uri_prop: '/api/console'})
+        return consoles._console
+
     @logged_api_call
     def wait_for_available(self, operation_timeout=None):
         """
@@ -190,6 +450,12 @@ class Client(object):
         If the Console does not become available within the operation timeout,
         an :exc:`~zhmcclient.OperationTimeout` exception is raised.
 
+        If the session has a circuit breaker (see
+        :class:`~zhmcclient.CircuitBreaker`) that is open, this method waits
+        until the circuit breaker allows the next probe of the Console, or
+        until its state changes (e.g. because the probe of another thread
+        succeeded). Otherwise, it checks the Console every 10 seconds.
+
         Parameters:
 
           operation_timeout (:term:`number`):
@@ -220,6 +486,12 @@ class Client(object):
                 raise
             else:
                 break
+            interval = 10  # Avoid hot spin loop
+            breaker = self.session.circuit_breaker
+            if breaker is not None:
+                retry_in = breaker.retry_in()
+                if retry_in is not None:
+                    interval = retry_in
             if operation_timeout > 0:
                 current_time = time.time()
                 if current_time > start_time + operation_timeout:
@@ -228,4 +500,10 @@ class Client(object):
                         "out (operation timeout: {} s)".
                         format(self.session.host, operation_timeout),
                         operation_timeout)
-            time.sleep(10)  # Avoid hot spin loop
+                # Check once more when the timeout expires
+                remaining = start_time + operation_timeout - current_time
+                interval = min(interval, remaining)
+            if breaker is not None:
+                breaker.wait(interval)
+            else:
+                time.sleep(interval)
@@ -111,7 +111,8 @@ class ConsoleManager(BaseManager):
         return self._console
 
     @logged_api_call
-    def list(self, full_properties=True, filter_args=None):
+    def list(self, full_properties=True, filter_args=None,
+             properties=None):
         """
         List the (one) :term:`Console` representing the HMC this client is
         connected to.
@@ -130,6 +131,10 @@ class ConsoleManager(BaseManager):
             This parameter exists for consistency with other list() methods
             and will be ignored.
 
+          properties (:term:`iterable` of :term:`string`):
+            This parameter exists for consistency with other list() methods
+            and will be ignored.
+
         Returns:
 
           : A list of :class:`~zhmcclient.Console` objects, containing the one
@@ -150,8 +155,7 @@ class ConsoleManager(BaseManager):
             props = {
                 self._uri_prop: uri,
             }
-        resource_obj = self.resource_class(
-            manager=self,
+        resource_obj = self._get_resource_obj(
             uri=props[self._uri_prop],
             name=props.get(self._name_prop, None),
             properties=props)
@@ -32,7 +32,19 @@ __all__ = ['DEFAULT_CONNECT_TIMEOUT',
            'DEFAULT_MAX_REDIRECTS',
            'DEFAULT_OPERATION_TIMEOUT',
            'DEFAULT_STATUS_TIMEOUT',
+           'DEFAULT_JOB_POLL_INITIAL',
+           'DEFAULT_JOB_POLL_MAX',
+           'DEFAULT_JOB_POLL_FACTOR',
+           'DEFAULT_JOB_POLL_JITTER',
+           'DEFAULT_JOB_GROUP_CONCURRENCY',
+           'DEFAULT_LIST_CONCURRENCY',
            'DEFAULT_NAME_URI_CACHE_TIMETOLIVE',
+           'DEFAULT_NAME_URI_CACHE_MAXSIZE',
+           'DEFAULT_NAME_URI_CACHE_NEGATIVE_TIMETOLIVE',
+           'DEFAULT_POOL_MAXSIZE',
+           'DEFAULT_POOL_BLOCK',
+           'DEFAULT_RESPONSE_CACHE_MAXSIZE',
+           'DEFAULT_STREAM_CHUNK_SIZE',
            'HMC_LOGGER_NAME',
            'API_LOGGER_NAME',
            'HTML_REASON_WEB_SERVICES_DISABLED',
@@ -103,6 +115,53 @@ DEFAULT_OPERATION_TIMEOUT = 3600
 #: :meth:`zhmcclient.Lpar.activate`)).
 DEFAULT_STATUS_TIMEOUT = 900
 
+#: Default interval in seconds before the first repeated status check when
+#: polling for completion of a job in
+#: :meth:`zhmcclient.Job.wait_for_completion`,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+#:
+#: Asynchronous HMC operations that are known to take long use a longer
+#: initial interval.
+DEFAULT_JOB_POLL_INITIAL = 0.2
+
+#: Default maximum interval in seconds between status checks when polling for
+#: completion of a job,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+DEFAULT_JOB_POLL_MAX = 10
+
+#: Default factor by which the interval between status checks grows when
+#: polling for completion of a job,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+DEFAULT_JOB_POLL_FACTOR = 1.5
+
+#: Default jitter of the interval between status checks when polling for
+#: completion of a job, as a fraction of the interval (e.g. 0.1 randomizes the
+#: interval by up to +/-10%),
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+DEFAULT_JOB_POLL_JITTER = 0.1
+
+#: Default maximum number of concurrent job status checks when waiting for
+#: the jobs of a :class:`~zhmcclient.JobGroup`,
+#: if not specified in the ``max_concurrent`` init argument to
+#: :class:`~zhmcclient.JobGroup`.
+#:
+#: This should not be larger than the maximum size of the connection pool of
+#: the sessions of the jobs (see :data:`DEFAULT_POOL_MAXSIZE`).
+DEFAULT_JOB_GROUP_CONCURRENCY = 10
+
+#: Default maximum number of concurrent retrievals of the full set of
+#: resource properties, when listing resources with full properties,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+#:
+#: This should not be larger than the maximum size of the connection pool of
+#: the session (see :data:`DEFAULT_POOL_MAXSIZE`).
+DEFAULT_LIST_CONCURRENCY = 10
+
 #: Default time to the next automatic invalidation of the Name-URI cache of
 #: manager objects, in seconds since the last invalidation,
 #: if not specified in the ``retry_timeout_config`` init argument to
@@ -112,6 +171,50 @@ DEFAULT_STATUS_TIMEOUT = 900
 #: caching is disabled).
 DEFAULT_NAME_URI_CACHE_TIMETOLIVE = 300
 
+#: Default maximum number of entries in the Name-URI cache of manager objects,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+#:
+#: The least recently used entries are evicted when the maximum is exceeded.
+#: The special value `None` means that the number of entries is not limited.
+DEFAULT_NAME_URI_CACHE_MAXSIZE = 10000
+
+#: Default time in seconds for which the Name-URI cache of manager objects
+#: remembers resource names that were not found,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+#:
+#: The special value 0 means that resource names that were not found are not
+#: remembered.
+DEFAULT_NAME_URI_CACHE_NEGATIVE_TIMETOLIVE = 5
+
+#: Default maximum number of HTTP connections that are kept in the connection
+#: pool of a session,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+#:
+#: This should be at least the number of threads that concurrently use the
+#: same session.
+DEFAULT_POOL_MAXSIZE = 10
+
+#: Default for whether requests block when all HTTP connections in the
+#: connection pool of a session are in use,
+#: if not specified in the ``retry_timeout_config`` init argument to
+#: :class:`~zhmcclient.Session`.
+#:
+#: If `False`, additional connections are created when the pool is exhausted,
+#: and they are discarded after use.
+DEFAULT_POOL_BLOCK = False
+
+#: Default maximum number of cached results in a
+#: :class:`~zhmcclient.ResponseCache`.
+DEFAULT_RESPONSE_CACHE_MAXSIZE = 1000
+
+#: Size in bytes of the chunks in which the response body is read by the
+#: streaming methods of :class:`~zhmcclient.Session` (e.g.
+#: :meth:`~zhmcclient.Session.iter_get`).
+DEFAULT_STREAM_CHUNK_SIZE = 65536
+
 #: Name of the Python logger that logs HMC operations.
 HMC_LOGGER_NAME = 'zhmcclient.hmc'
 
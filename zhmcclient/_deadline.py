@@ -0,0 +1,235 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The :class:`~zhmcclient.Deadline` class limits the total time of a call,
+including all of the HTTP requests, re-logons and waits it involves.
+
+A single call such as :meth:`zhmcclient.Partition.start` may involve a
+logon, a re-logon after the session-id expired, the HTTP request of the
+operation, and many status checks of the job that performs the operation.
+The timeouts of the :class:`~zhmcclient.RetryTimeoutConfig` of the session
+apply to each of these steps separately. A deadline applies to all of these
+steps together:
+
+* A deadline is activated for the code in a ``with`` statement, and applies
+  to all calls that are performed by that code in the same thread (and, on
+  Python 3.7 and higher, in the same :mod:`py:contextvars` context, e.g. in
+  the same :mod:`py:asyncio` task). When deadlines are nested, the one that
+  expires first applies.
+
+* The methods that wait for completion or for a status (such as
+  :meth:`zhmcclient.Job.wait_for_completion` and
+  :meth:`zhmcclient.Partition.wait_for_status`) also accept a deadline via
+  their `deadline` parameter.
+
+A :class:`~zhmcclient.Session` object does not start an HTTP request after
+the deadline has expired, and limits the connect and read timeouts of each
+HTTP request to the remaining time of the deadline. Waiting methods stop
+waiting when the deadline expires. In all of these cases, a
+:exc:`~zhmcclient.DeadlineExceeded` exception is raised.
+
+Example::
+
+    import zhmcclient
+
+    with zhmcclient.Deadline(120):
+        partition.start()
+        partition.wait_for_status('active')
+"""
+
+from __future__ import absolute_import
+
+import time
+import threading
+from contextlib import contextmanager
+
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
+from ._exceptions import DeadlineExceeded
+
+__all__ = ['Deadline']
+
+# The stack of the active deadlines, as a tuple of Deadline objects, where
+# each item is the deadline that expires first among itself and the items
+# before it.
+if contextvars is not None:
+    _ACTIVE_DEADLINES = contextvars.ContextVar('zhmcclient_deadlines',
+                                               default=())
+else:
+    _THREAD_LOCAL = threading.local()
+
+
+def _get_active():
+    """Return the stack of active deadlines."""
+    if contextvars is not None:
+        return _ACTIVE_DEADLINES.get()
+    return getattr(_THREAD_LOCAL, 'deadlines', ())
+
+
+def _set_active(deadlines):
+    """Set the stack of active deadlines."""
+    if contextvars is not None:
+        _ACTIVE_DEADLINES.set(deadlines)
+    else:
+        _THREAD_LOCAL.deadlines = deadlines
+
+
+class Deadline(object):
+    """
+    A deadline for a call, i.e. a point in time after which the call is
+    aborted.
+
+    A deadline object can be activated for the code in a ``with`` statement
+    (see :mod:`zhmcclient._deadline` for details). The same deadline object
+    can be activated multiple times, including in nested ``with`` statements
+    and in multiple threads. Its point in time is set when the deadline object
+    is created.
+    """
+
+    def __init__(self, timeout):
+        """
+        Parameters:
+
+          timeout (:term:`number`):
+            Time in seconds from now until the deadline expires.
+        """
+        self._timeout = timeout
+        self._expires_at = time.time() + timeout
+
+    def __repr__(self):
+        """
+        Return a string with the state of this deadline, for debug purposes.
+        """
+        return "{}(timeout={!r}, remaining={:.3f})". \
+            format(self.__class__.__name__, self._timeout, self.remaining())
+
+    def __enter__(self):
+        active = _get_active()
+        if active and active[-1].expires_at <= self._expires_at:
+            effective = active[-1]
+        else:
+            effective = self
+        _set_active(active + (effective,))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # The with statements are nested, so the last item is from the
+        # corresponding __enter__()
+        _set_active(_get_active()[:-1])
+
+    @property
+    def timeout(self):
+        """
+        :term:`number`: Time in seconds from the creation of this deadline
+        until it expires.
+        """
+        return self._timeout
+
+    @property
+    def expires_at(self):
+        """
+        :term:`number`: Point in time when this deadline expires, as seconds
+        since the epoch (see :func:`py:time.time`).
+        """
+        return self._expires_at
+
+    @property
+    def expired(self):
+        """
+        bool: Indicates whether this deadline has expired.
+        """
+        return time.time() >= self._expires_at
+
+    def remaining(self):
+        """
+        Return the remaining time until this deadline expires.
+
+        Returns:
+
+          :term:`number`: Remaining time in seconds. 0 or a negative value
+          means that the deadline has expired.
+        """
+        return self._expires_at - time.time()
+
+    def check(self, activity):
+        """
+        Raise :exc:`~zhmcclient.DeadlineExceeded` if this deadline has
+        expired.
+
+        Parameters:
+
+          activity (:term:`string`): Description of the activity that cannot
+            be performed anymore, for the exception message (e.g.
+            "HTTP request GET /api/cpcs").
+        """
+        if self.expired:
+            raise DeadlineExceeded(
+                "Deadline of {} s expired before or during {}".
+                format(self._timeout, activity),
+                self._timeout)
+
+    @staticmethod
+    def current():
+        """
+        Return the active deadline that expires first, or `None` if no
+        deadline is active.
+
+        Returns:
+
+          :class:`~zhmcclient.Deadline`: The deadline, or `None`.
+        """
+        active = _get_active()
+        if active:
+            return active[-1]
+        return None
+
+    @staticmethod
+    def effective(deadline=None):
+        """
+        Return the deadline that applies to a call, given an optional deadline
+        that was passed to the call.
+
+        Parameters:
+
+          deadline (:class:`~zhmcclient.Deadline`): Deadline passed to the
+            call, or `None`.
+
+        Returns:
+
+          :class:`~zhmcclient.Deadline`: The deadline that expires first among
+          the specified deadline and the active deadlines, or `None` if there
+          is no deadline.
+        """
+        current = Deadline.current()
+        if deadline is None:
+            return current
+        if current is None or deadline.expires_at < current.expires_at:
+            return deadline
+        return current
+
+
+@contextmanager
+def _activated(deadline):
+    """
+    Context manager that activates a deadline, if not `None`.
+    """
+    if deadline is None:
+        yield
+    else:
+        with deadline:
+            yield
@@ -20,9 +20,10 @@ import re
 
 
 __all__ = ['Error', 'ConnectionError', 'ConnectTimeout', 'ReadTimeout',
-           'RetriesExceeded', 'AuthError', 'ClientAuthError',
-           'ServerAuthError', 'ParseError', 'VersionError', 'HTTPError',
-           'OperationTimeout', 'StatusTimeout', 'NoUniqueMatch', 'NotFound']
+           'RetriesExceeded', 'CircuitBreakerOpen', 'AuthError',
+           'ClientAuthError', 'ServerAuthError', 'ParseError', 'VersionError',
+           'HTTPError', 'OperationTimeout', 'DeadlineExceeded',
+           'StatusTimeout', 'NoUniqueMatch', 'NotFound']
 
 
 class Error(Exception):
@@ -332,6 +333,20 @@ class RetriesExceeded(ConnectionError):
             format(self.__class__.__name__, self.connect_retries, self.args[0])
 
 
+class CircuitBreakerOpen(ConnectionError):
+    """
+    This exception indicates that an HTTP request was not sent to the HMC,
+    because the circuit breaker of the session (see
+    :class:`~zhmcclient.CircuitBreaker`) considers the HMC to be unreachable.
+
+    The :attr:`~zhmcclient.ConnectionError.details` attribute is the original
+    exception of the last connection failure, or `None`.
+
+    Derived from :exc:`~zhmcclient.ConnectionError`.
+    """
+    pass
+
+
 class AuthError(Error):
     """
     This exception indicates erors related to authentication.
@@ -858,6 +873,21 @@ class OperationTimeout(Error):
                    self.args[0])
 
 
+class DeadlineExceeded(OperationTimeout):
+    """
+    This exception indicates that the deadline of a call (see
+    :class:`~zhmcclient.Deadline`) has expired, either before or during an
+    HTTP request to the HMC, or while waiting for completion of an
+    asynchronous HMC operation or for a desired LPAR or Partition status.
+
+    The :attr:`~zhmcclient.OperationTimeout.operation_timeout` attribute is
+    the timeout of the deadline, in seconds.
+
+    Derived from :exc:`~zhmcclient.OperationTimeout`.
+    """
+    pass
+
+
 class StatusTimeout(Error):
     """
     This exception indicates that the waiting for reaching a desired LPAR
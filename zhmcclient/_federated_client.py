@@ -0,0 +1,333 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The :class:`~zhmcclient.FederatedClient` class performs the same work on
+several HMCs concurrently, each through its own :class:`~zhmcclient.Client`
+object.
+
+The work for each HMC runs in its own thread, so that the total duration is
+the duration of the slowest HMC instead of the sum of the durations of all
+HMCs. The HMCs are isolated from each other: An exception raised for one HMC
+is returned in the result for that HMC and does not affect the other HMCs,
+and a timeout applies to each HMC separately.
+
+The result for each HMC is a :class:`~zhmcclient.FederatedResult` object,
+and :meth:`~zhmcclient.FederatedClient.merge` combines the results of all
+HMCs into one list of items that are tagged with the name of their HMC.
+
+Example::
+
+    import zhmcclient
+
+    clients = {}
+    for hmc, userid, password in hmcs:
+        session = zhmcclient.Session(hmc, userid, password)
+        clients[hmc] = zhmcclient.Client(session)
+    federated_client = zhmcclient.FederatedClient(clients, timeout=300)
+
+    results = federated_client.list_cpcs()
+    for result in results:
+        if result.error:
+            print("HMC {} failed: {}".format(result.hmc, result.error))
+    for hmc, cpc in zhmcclient.FederatedClient.merge(results):
+        print("CPC {} managed by HMC {}".format(cpc.name, hmc))
+"""
+
+from __future__ import absolute_import
+
+import time
+import threading
+from collections import OrderedDict
+
+from ._logging import get_logger, logged_api_call
+from ._exceptions import OperationTimeout
+from ._deadline import Deadline, _activated
+
+__all__ = ['FederatedClient', 'FederatedResult']
+
+LOG = get_logger(__name__)
+
+
+class FederatedResult(object):
+    """
+    The result of the work that a :class:`~zhmcclient.FederatedClient` object
+    performed on one HMC.
+    """
+
+    def __init__(self, hmc, client):
+        self._hmc = hmc
+        self._client = client
+        self._value = None
+        self._error = None
+        self._duration = None
+
+    def __repr__(self):
+        """
+        Return a string with the state of this result, for debug purposes.
+        """
+        return "{}(hmc={!r}, value={!r}, error={!r}, duration={!r})". \
+            format(self.__class__.__name__, self._hmc, self._value,
+                   self._error, self._duration)
+
+    @property
+    def hmc(self):
+        """
+        :term:`string`: Name of the HMC, as specified in the `clients` init
+        parameter of the federated client.
+        """
+        return self._hmc
+
+    @property
+    def client(self):
+        """
+        :class:`~zhmcclient.Client`: Client for the HMC.
+        """
+        return self._client
+
+    @property
+    def value(self):
+        """
+        The return value of the work for the HMC, or `None` if it failed.
+        """
+        return self._value
+
+    @property
+    def error(self):
+        """
+        :exc:`~py:exceptions.Exception`: The exception raised by the work for
+        the HMC, or `None` if it succeeded. If the work did not complete
+        within the timeout, this is an :exc:`~zhmcclient.OperationTimeout`
+        exception.
+        """
+        return self._error
+
+    @property
+    def duration(self):
+        """
+        :term:`number`: Time in seconds the work for the HMC took. If the work
+        did not complete within the timeout, this is the time until the
+        timeout expired.
+        """
+        return self._duration
+
+
+class FederatedClient(object):
+    """
+    A client for several HMCs, that performs the same work on all of them
+    concurrently.
+
+    For details, see :mod:`zhmcclient._federated_client`.
+    """
+
+    def __init__(self, clients, timeout=None):
+        """
+        Parameters:
+
+          clients (dict or :term:`iterable` of :class:`~zhmcclient.Client`):
+            The clients for the HMCs. If specified as a dict, the keys are the
+            names of the HMCs, and the values are the clients. Otherwise, the
+            names of the HMCs are the hosts of the sessions of the clients.
+
+          timeout (:term:`number`):
+            Default timeout in seconds for the work on each HMC. `None` means
+            that there is no timeout.
+        """
+        if isinstance(clients, dict):
+            self._clients = OrderedDict(clients)
+        else:
+            self._clients = OrderedDict(
+                (client.session.host, client) for client in clients)
+        self._timeout = timeout
+
+    def __repr__(self):
+        """
+        Return a string with the state of this federated client, for debug
+        purposes.
+        """
+        return "{}(hmcs={!r}, timeout={!r})". \
+            format(self.__class__.__name__, list(self._clients),
+                   self._timeout)
+
+    @property
+    def clients(self):
+        """
+        :class:`py:collections.OrderedDict`: The clients for the HMCs, with
+        the names of the HMCs as keys.
+        """
+        return self._clients
+
+    @property
+    def timeout(self):
+        """
+        :term:`number`: Default timeout in seconds for the work on each HMC,
+        or `None`.
+        """
+        return self._timeout
+
+    @logged_api_call
+    def run(self, func, timeout=None):
+        """
+        Call a function for each HMC concurrently, and return its results.
+
+        Each call runs in its own thread. If a timeout applies, a
+        :class:`~zhmcclient.Deadline` with that timeout is active for the
+        call, so that the HTTP requests and waits of the call stop when the
+        timeout expires. Calls that still do not return within the timeout
+        are abandoned: Their threads continue in the background, and their
+        results are ignored.
+
+        Parameters:
+
+          func (:term:`callable`):
+            The function to be called for each HMC, with the
+            :class:`~zhmcclient.Client` object for the HMC as its only
+            argument.
+
+          timeout (:term:`number`):
+            Timeout in seconds for the call for each HMC. `None` means that the
+            default timeout of this federated client is used.
+
+        Returns:
+
+          list of :class:`~zhmcclient.FederatedResult`: The results for the
+          HMCs, in the order of the HMCs in this federated client.
+        """
+        if timeout is None:
+            timeout = self._timeout
+        results = []
+        threads = []
+        start_time = time.time()
+        for hmc, client in self._clients.items():
+            result = FederatedResult(hmc, client)
+            thread = threading.Thread(
+                target=self._call, args=(func, result, timeout),
+                name='FederatedClient-{}'.format(hmc))
+            thread.daemon = True
+            thread.start()
+            results.append(result)
+            threads.append(thread)
+        for i, thread in enumerate(threads):
+            result = results[i]
+            if timeout is None:
+                thread.join()
+            else:
+                thread.join(max(start_time + timeout - time.time(), 0))
+            if thread.is_alive():
+                LOG.warning("Abandoning work for HMC %s after timeout of "
+                            "%s s", result.hmc, timeout)
+                # The thread may still store its outcome in the original
+                # result object, so it is replaced.
+                # pylint: disable=protected-access
+                timed_out = FederatedResult(result.hmc, result.client)
+                timed_out._error = OperationTimeout(
+                    "Work for HMC {} timed out after {} s".
+                    format(result.hmc, timeout), timeout)
+                timed_out._duration = time.time() - start_time
+                results[i] = timed_out
+        return results
+
+    @staticmethod
+    def _call(func, result, timeout):
+        """
+        Call a function for one HMC and store its outcome in its result.
+        This is the target of the thread for the HMC.
+        """
+        # pylint: disable=protected-access
+        start_time = time.time()
+        deadline = Deadline(timeout) if timeout is not None else None
+        try:
+            with _activated(deadline):
+                result._value = func(result.client)
+        except Exception as exc:  # pylint: disable=broad-except
+            LOG.debug("Work for HMC %s failed: %s", result.hmc, exc)
+            result._error = exc
+        result._duration = time.time() - start_time
+
+    def list_cpcs(self, full_properties=False, filter_args=None,
+                  timeout=None):
+        """
+        List the CPCs managed by each HMC concurrently.
+
+        Parameters:
+
+          full_properties (bool):
+            Controls whether the full set of resource properties should be
+            retrieved, vs. only the short set as returned by the list
+            operation.
+
+          filter_args (dict):
+            Filter arguments that narrow the list of returned CPCs. For
+            details, see :meth:`zhmcclient.CpcManager.list`.
+
+          timeout (:term:`number`):
+            Timeout in seconds for each HMC. `None` means that the default
+            timeout of this federated client is used.
+
+        Returns:
+
+          list of :class:`~zhmcclient.FederatedResult`: The results for the
+          HMCs, where the value of each result is the list of
+          :class:`~zhmcclient.Cpc` objects of its HMC.
+        """
+        return self.run(
+            lambda client: client.cpcs.list(full_properties, filter_args),
+            timeout)
+
+    def get_inventory(self, resources, timeout=None):
+        """
+        Perform the 'Get Inventory' operation on each HMC concurrently.
+
+        Parameters:
+
+          resources (:term:`iterable` of :term:`string`):
+            Resource classes and/or resource classifiers specifying the types
+            of resources that should be included in the result. For details,
+            see :meth:`zhmcclient.Client.get_inventory`.
+
+          timeout (:term:`number`):
+            Timeout in seconds for each HMC. `None` means that the default
+            timeout of this federated client is used.
+
+        Returns:
+
+          list of :class:`~zhmcclient.FederatedResult`: The results for the
+          HMCs, where the value of each result is the list of resources
+          returned by the 'Get Inventory' operation of its HMC.
+        """
+        return self.run(
+            lambda client: client.get_inventory(resources), timeout)
+
+    @staticmethod
+    def merge(results):
+        """
+        Merge the items of the successful results of several HMCs into one
+        list, tagged with the name of their HMC.
+
+        Parameters:
+
+          results (:term:`iterable` of :class:`~zhmcclient.FederatedResult`):
+            The results, whose values must be iterables of items.
+
+        Returns:
+
+          list of tuple(hmc, item): The items of all successful results, in
+          the order of the results, where `hmc` is the name of the HMC of the
+          item.
+        """
+        merged = []
+        for result in results:
+            if result.error is None and result.value is not None:
+                merged.extend((result.hmc, item) for item in result.value)
+        return merged
@@ -0,0 +1,259 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compiled filters for matching resource properties against filter arguments
+(see :ref:`Filtering`).
+
+This module is used for client-side filtering by the resource managers of
+the zhmcclient package, and for filtering by the faked resource managers of
+the zhmcclient_mock package. It is not part of the external API.
+"""
+
+from __future__ import absolute_import
+
+import re
+import threading
+from collections import OrderedDict
+
+import six
+try:
+    from collections.abc import Mapping
+except ImportError:
+    # pylint: disable=deprecated-class
+    from collections import Mapping
+
+__all__ = []
+
+# Maximum number of compiled filters remembered by compile_filter()
+_MAX_COMPILED_FILTERS = 100
+
+_compiled_filters = OrderedDict()
+_compiled_filters_lock = threading.Lock()
+
+
+class _PropertyCheck(object):
+    """
+    The check of a single resource property against the match values of a
+    filter argument.
+    """
+
+    def __init__(self, prop_name, prop_match):
+        self.prop_name = prop_name
+        if not isinstance(prop_match, (list, tuple)):
+            prop_match = [prop_match]
+        # Tuples (match value, compiled regexp or None). The regexp matching
+        # implemented in the HMC requires begin and end of the string value to
+        # match, even if the '^' for begin and '$' for end are not specified
+        # in the pattern. We add end matching to the pattern, and begin
+        # matching is done by match() automatically.
+        self._matches = []
+        for pm in _flatten(prop_match):
+            if isinstance(pm, six.string_types):
+                self._matches.append((pm, re.compile(pm + '$')))
+            else:
+                self._matches.append((pm, None))
+        # Relative cost of the check, for ordering the checks
+        num_regexps = sum(1 for _, regexp in self._matches if regexp)
+        self.cost = (num_regexps, len(self._matches))
+
+    def matches(self, prop_value):
+        """
+        Return a boolean indicating whether a property value matches one of
+        the match values.
+
+        String property values are matched by interpreting the match values as
+        regular expressions. Other property values are matched by exact value
+        comparison with the match values.
+        """
+        if isinstance(prop_value, six.string_types):
+            # HMC resource property is Enum String or (non-enum) String, and
+            # is both matched by regexp matching. Ideally, regexp matching
+            # should only be done for non-enum strings, but distinguishing
+            # them is not possible given that the client has no knowledge
+            # about the properties.
+            for _, regexp in self._matches:
+                if regexp is not None and regexp.match(prop_value):
+                    return True
+        else:
+            for pm, _ in self._matches:
+                if prop_value == pm:
+                    return True
+        return False
+
+
+def _flatten(prop_match):
+    """
+    Generate the match values of a possibly nested list of match values.
+    """
+    for pm in prop_match:
+        if isinstance(pm, (list, tuple)):
+            for item in _flatten(pm):
+                yield item
+        else:
+            yield pm
+
+
+class CompiledFilter(Mapping):
+    """
+    A set of filter arguments (see :ref:`Filtering`) with their regular
+    expressions compiled, for matching the properties of many resources.
+
+    A compiled filter is a read-only mapping of the filter arguments.
+
+    Resource properties are matched as follows:
+
+    - All filter arguments must match (logical AND).
+
+    - If the match value of a filter argument is a list or tuple, one of its
+      items must match (logical OR).
+
+    - String properties are matched by interpreting the match value as a
+      regular expression that must match the entire property value. Other
+      properties are matched by exact value comparison.
+
+    - A resource that does not have a property specified in the filter
+      arguments does not match.
+
+    The checks are performed in the order of their cost, so that cheap checks
+    can rule out a resource before more expensive checks are performed.
+    Properties that are not yet present in the resource properties are checked
+    last, so that they are retrieved only for resources that match on the
+    other properties.
+    """
+
+    def __init__(self, filter_args):
+        """
+        Parameters:
+
+          filter_args (dict): Filter arguments. `None` causes all resources
+            to match.
+        """
+        self._filter_args = dict(filter_args or {})
+        checks = [_PropertyCheck(name, prop_match)
+                  for name, prop_match in self._filter_args.items()]
+        self._checks = sorted(checks, key=lambda c: c.cost)
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self._filter_args)
+
+    def __getitem__(self, prop_name):
+        return self._filter_args[prop_name]
+
+    def __iter__(self):
+        return iter(self._filter_args)
+
+    def __len__(self):
+        return len(self._filter_args)
+
+    @property
+    def prop_names(self):
+        """
+        list of string: Names of the properties in the filter arguments.
+        """
+        return [c.prop_name for c in self._checks]
+
+    def matches(self, properties, pull=None):
+        """
+        Return a boolean indicating whether a set of resource properties
+        matches the filter arguments.
+
+        Parameters:
+
+          properties (dict): Resource properties.
+
+          pull (callable): Function that is called with a list of the names of
+            the properties in the filter arguments that are not in
+            `properties`, to retrieve them. It must return the resource
+            properties including the retrieved properties. `None` means that
+            missing properties are not retrieved, so that the resource does not
+            match.
+
+        Returns:
+
+          bool: Boolean indicating whether the resource properties match the
+            filter arguments.
+        """
+        missing = None
+        for check in self._checks:
+            try:
+                prop_value = properties[check.prop_name]
+            except KeyError:
+                if pull is None:
+                    return False
+                if missing is None:
+                    missing = []
+                missing.append(check)
+                continue
+            if not check.matches(prop_value):
+                return False
+        if missing:
+            properties = pull([c.prop_name for c in missing])
+            for check in missing:
+                # Some lists of resources do not have all properties, for
+                # example Hipersocket adapters do not have a "card-location"
+                # property. If a filter property does not exist on a
+                # resource, the resource does not match.
+                try:
+                    prop_value = properties[check.prop_name]
+                except KeyError:
+                    return False
+                if not check.matches(prop_value):
+                    return False
+        return True
+
+
+def compile_filter(filter_args):
+    """
+    Return a compiled filter for a set of filter arguments.
+
+    The compiled filters for recently used filter arguments are remembered
+    and reused.
+
+    Parameters:
+
+      filter_args (dict or CompiledFilter): Filter arguments, or a compiled
+        filter which is returned unchanged. `None` causes all resources to
+        match.
+
+    Returns:
+
+      CompiledFilter: The compiled filter.
+    """
+    if isinstance(filter_args, CompiledFilter):
+        return filter_args
+    if not filter_args:
+        return CompiledFilter(filter_args)
+    try:
+        key = tuple((name, _freeze(pm)) for name, pm in filter_args.items())
+        hash(key)
+    except TypeError:
+        return CompiledFilter(filter_args)
+    with _compiled_filters_lock:
+        compiled = _compiled_filters.pop(key, None)
+        if compiled is None:
+            compiled = CompiledFilter(filter_args)
+        _compiled_filters[key] = compiled
+        if len(_compiled_filters) > _MAX_COMPILED_FILTERS:
+            _compiled_filters.popitem(last=False)
+    return compiled
+
+
+def _freeze(prop_match):
+    """
+    Return a hashable representation of a match value.
+    """
+    if isinstance(prop_match, (list, tuple)):
+        return (type(prop_match),) + tuple(_freeze(pm) for pm in prop_match)
+    return (type(prop_match), prop_match)
@@ -0,0 +1,150 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+An identity map of a :class:`~zhmcclient.Client` object ensures that each
+resource on the HMC is represented by at most one Python resource object
+at a time.
+
+Without an identity map, each call of methods such as
+:meth:`~zhmcclient.BaseManager.list`, :meth:`~zhmcclient.BaseManager.find`
+or :meth:`~zhmcclient.BaseManager.resource_object` returns new Python
+resource objects, each with its own cache of resource properties. With an
+identity map, these methods return the existing Python resource object for a
+resource if there is one, and merge the resource properties they have
+retrieved into it. This saves memory and avoids retrieving the same resource
+properties for several Python resource objects.
+
+The identity map holds weak references to the Python resource objects, so a
+Python resource object is removed from the identity map when it is no longer
+used.
+
+An identity map is enabled by specifying ``identity_map=True`` when creating
+the :class:`~zhmcclient.Client` object.
+
+Example::
+
+    import zhmcclient
+
+    session = zhmcclient.Session(hmc, userid, password)
+    client = zhmcclient.Client(session, identity_map=True)
+
+    cpc = client.cpcs.find(name='CPC1')
+    partition1 = cpc.partitions.find(name='PART1')
+    partition2 = cpc.partitions.list(filter_args={'name': 'PART1'})[0]
+    assert partition1 is partition2
+"""
+
+from __future__ import absolute_import
+
+import threading
+import weakref
+
+__all__ = ['IdentityMap']
+
+
+class IdentityMap(object):
+    """
+    A map of the Python resource objects of a client, with their canonical
+    URIs as keys, that holds weak references to the resource objects.
+
+    Objects of this class are not directly created by the user; they are
+    accessible via :attr:`zhmcclient.Client.identity_map`.
+    """
+
+    def __init__(self):
+        self._objects = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        """
+        Return a string with the state of this identity map, for debug
+        purposes.
+        """
+        return "{}(size={!r})".format(self.__class__.__name__, len(self))
+
+    def __len__(self):
+        """
+        Return the number of Python resource objects in this identity map.
+        """
+        return len(self._objects)
+
+    def __contains__(self, uri):
+        """
+        Return a boolean indicating whether this identity map has a Python
+        resource object for a canonical URI.
+        """
+        return self._objects.get(uri) is not None
+
+    def get(self, uri):
+        """
+        Return the Python resource object for a canonical URI.
+
+        Parameters:
+
+          uri (:term:`string`): Canonical URI path of the resource.
+
+        Returns:
+
+          Subclass of :class:`~zhmcclient.BaseResource`: The resource
+          object, or `None` if this identity map has no resource object for
+          the URI.
+        """
+        return self._objects.get(uri)
+
+    def remove(self, uri):
+        """
+        Remove the Python resource object for a canonical URI from this
+        identity map, if there is one.
+
+        The Python resource object itself is not changed, but subsequent
+        lookups return a new resource object for the URI.
+
+        Parameters:
+
+          uri (:term:`string`): Canonical URI path of the resource.
+        """
+        with self._lock:
+            self._objects.pop(uri, None)
+
+    def clear(self):
+        """
+        Remove all Python resource objects from this identity map.
+        """
+        with self._lock:
+            self._objects.clear()
+
+    def _objects_list(self):
+        """
+        Return a list of the Python resource objects in this identity map.
+        """
+        with self._lock:
+            return list(self._objects.values())
+
+    def _get_or_add(self, uri, create, properties):
+        """
+        Return the Python resource object for a canonical URI, with the
+        specified resource properties merged into it. If there is none, create
+        it by calling `create()` and add it.
+        """
+        with self._lock:
+            obj = self._objects.get(uri)
+            if obj is None:
+                obj = create()
+                self._objects[uri] = obj
+                return obj
+        if properties:
+            # pylint: disable=protected-access
+            obj._merge_properties(properties)
+        return obj
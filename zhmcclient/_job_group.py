@@ -0,0 +1,272 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The :class:`~zhmcclient.JobGroup` class waits for the completion of many
+:term:`jobs <job>` concurrently.
+
+Asynchronous HMC operations that are invoked with
+``wait_for_completion=False`` return a :class:`~zhmcclient.Job` object.
+Instead of waiting for these jobs one after the other, a job group checks the
+status of all of its jobs with one scheduler, with a bounded number of
+concurrent status checks, and returns the results of the jobs in the order in
+which they complete.
+
+Example::
+
+    jobs = [partition.start(wait_for_completion=False)
+            for partition in cpc.partitions.list()]
+
+    for job, result, error in zhmcclient.JobGroup(jobs).wait():
+        if error:
+            print("Job {} failed: {}".format(job.uri, error))
+        else:
+            print("Job {} succeeded".format(job.uri))
+"""
+
+from __future__ import absolute_import
+
+import time
+import heapq
+import threading
+from six.moves import queue
+
+from ._logging import get_logger, logged_api_call
+from ._exceptions import Error, OperationTimeout
+from ._constants import DEFAULT_JOB_GROUP_CONCURRENCY
+
+__all__ = ['JobGroup']
+
+LOG = get_logger(__name__)
+
+
+class JobGroup(object):
+    """
+    A group of :term:`jobs <job>` on one or more HMCs that are waited for
+    concurrently.
+
+    The job status checks are performed by a bounded number of worker threads.
+    The interval between the status checks of each job is determined in the
+    same way as for :meth:`zhmcclient.Job.wait_for_completion`, i.e. by the
+    `job_poll_*` attributes of the :class:`~zhmcclient.RetryTimeoutConfig` of
+    the session of the job.
+
+    A job group object is not thread-safe, i.e. its
+    :meth:`~zhmcclient.JobGroup.wait` method must not be used by multiple
+    threads at the same time.
+    """
+
+    def __init__(self, jobs, max_concurrent=None):
+        """
+        Parameters:
+
+          jobs (:term:`iterable` of :class:`~zhmcclient.Job`):
+            The jobs to wait for.
+            Must not be `None`.
+
+          max_concurrent (:term:`integer`):
+            Maximum number of concurrent job status checks. `None` means
+            :data:`~zhmcclient._constants.DEFAULT_JOB_GROUP_CONCURRENCY`.
+        """
+        if max_concurrent is None:
+            max_concurrent = DEFAULT_JOB_GROUP_CONCURRENCY
+        if max_concurrent < 1:
+            raise ValueError("Invalid max_concurrent value: {!r}".
+                             format(max_concurrent))
+        self._jobs = list(jobs)
+        self._max_concurrent = max_concurrent
+
+    def __repr__(self):
+        """
+        Return a string with the state of this job group, for debug purposes.
+        """
+        ret = (
+            "{classname} at 0x{id:08x} (\n"
+            "  _jobs = {_jobs!r}\n"
+            "  _max_concurrent = {_max_concurrent!r}\n"
+            ")".format(
+                classname=self.__class__.__name__,
+                id=id(self),
+                _jobs=self._jobs,
+                _max_concurrent=self._max_concurrent,
+            ))
+        return ret
+
+    @property
+    def jobs(self):
+        """
+        :class:`py:list` of :class:`~zhmcclient.Job`: The jobs of this job
+        group.
+        """
+        return self._jobs
+
+    @property
+    def max_concurrent(self):
+        """
+        :term:`integer`: Maximum number of concurrent job status checks.
+        """
+        return self._max_concurrent
+
+    @logged_api_call
+    def wait(self, operation_timeout=None):
+        """
+        Generator that waits for completion of the jobs of this job group and
+        yields the result of each job as the job completes.
+
+        The job status checks start when the first result is requested from
+        the returned generator. Completed jobs are deleted on the HMC, as with
+        :meth:`zhmcclient.Job.wait_for_completion`.
+
+        Parameters:
+
+          operation_timeout (:term:`number`):
+            Timeout in seconds, when waiting for completion of all jobs. The
+            special value 0 means that no timeout is set. `None` means that the
+            default async operation timeout of the session of the first job is
+            used.
+
+            If the timeout expires before all jobs have completed, a
+            :exc:`~zhmcclient.OperationTimeout` is raised from the generator,
+            after the results of the jobs that have completed have been
+            yielded.
+
+            This method gives completion of the jobs priority over strictly
+            achieving the timeout, as described for
+            :meth:`zhmcclient.Job.wait_for_completion`.
+
+        Returns:
+
+          :term:`iterable` of tuple(:class:`~zhmcclient.Job`, :term:`json object`, :exc:`~zhmcclient.Error`):
+            A generator that yields a tuple (job, result, error) for each job,
+            in the order in which the jobs complete. For a job that completed
+            successfully, result is the result of its asynchronous operation
+            (see :meth:`zhmcclient.Job.wait_for_completion`) and error is
+            `None`. For a job that completed in error or whose status could
+            not be retrieved, result is `None` and error is the exception
+            (e.g. :exc:`~zhmcclient.HTTPError`). Further status checks of the
+            other jobs are not affected by such errors.
+
+        Raises:
+
+          :exc:`~zhmcclient.OperationTimeout`: The timeout expired while
+            waiting for job completion.
+        """  # noqa: E501
+        if not self._jobs:
+            return
+
+        if operation_timeout is None:
+            operation_timeout = \
+                self._jobs[0].session.retry_timeout_config.operation_timeout
+        if operation_timeout > 0:
+            deadline = time.time() + operation_timeout
+        else:
+            deadline = None
+
+        # Schedule of the next status checks, as a heap of tuple(due time,
+        # sequence number, job, poll intervals of the job). The sequence
+        # number keeps the heap from comparing jobs.
+        now = time.time()
+        # pylint: disable=protected-access
+        schedule = [(now, i, job, job._poll_intervals())
+                    for i, job in enumerate(self._jobs)]
+        heapq.heapify(schedule)
+
+        task_queue = queue.Queue()
+        result_queue = queue.Queue()
+        num_workers = min(self._max_concurrent, len(self._jobs))
+        workers = [threading.Thread(target=_check_worker,
+                                    args=(task_queue, result_queue))
+                   for _ in range(num_workers)]
+        for worker in workers:
+            worker.daemon = True
+            worker.start()
+
+        try:
+            in_flight = {}
+            num_timed_out = 0
+            while schedule or in_flight:
+
+                # Start the status checks that are due
+                now = time.time()
+                while schedule and len(in_flight) < num_workers and \
+                        schedule[0][0] <= now:
+                    _, seq, job, poll_intervals = heapq.heappop(schedule)
+                    in_flight[seq] = (job, poll_intervals)
+                    task_queue.put((seq, job))
+
+                # Wait for a status check to finish, or for the next status
+                # check to become due
+                if len(in_flight) < num_workers and schedule:
+                    wait_time = max(schedule[0][0] - now, 0)
+                else:
+                    wait_time = None
+                try:
+                    seq, job_status, result, error = \
+                        result_queue.get(timeout=wait_time)
+                except queue.Empty:
+                    continue
+
+                job, poll_intervals = in_flight.pop(seq)
+                if error is not None and not isinstance(error, Error):
+                    raise error
+                if error is not None or job_status == 'complete':
+                    yield job, result, error
+                    continue
+
+                # We give completion of status priority over strictly
+                # achieving the timeout, so we check status first.
+                now = time.time()
+                if deadline is not None and now > deadline:
+                    num_timed_out += 1
+                    continue
+
+                # Schedule the next status check of the job, but check once
+                # more when the timeout expires
+                due_time = now + next(poll_intervals)
+                if deadline is not None:
+                    due_time = min(due_time, deadline)
+                heapq.heappush(schedule, (due_time, seq, job, poll_intervals))
+        finally:
+            for _ in workers:
+                task_queue.put(None)
+
+        if num_timed_out:
+            raise OperationTimeout(
+                "Waiting for completion of {} of {} jobs timed out "
+                "(operation timeout: {} s)".
+                format(num_timed_out, len(self._jobs), operation_timeout),
+                operation_timeout)
+
+
+def _check_worker(task_queue, result_queue):
+    """
+    Worker thread function of a job group that checks jobs for completion.
+
+    It gets tuple(sequence number, job) items from the task queue until it gets
+    `None`, and puts tuple(sequence number, job status, result, error) items
+    into the result queue.
+    """
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        seq, job = task
+        try:
+            job_status, result = job.check_for_completion()
+        except Exception as exc:  # pylint: disable=broad-except
+            LOG.debug("Checking job %s for completion failed: %s",
+                      job.uri, exc)
+            result_queue.put((seq, None, None, exc))
+        else:
+            result_queue.put((seq, job_status, result, None))
@@ -0,0 +1,419 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The :class:`~zhmcclient.JsonCodec` class encodes the JSON request bodies and
+decodes the JSON response bodies of the HTTP requests of a
+:class:`~zhmcclient.Session` object.
+
+By default, a session uses the :mod:`py:json` module of the Python standard
+library and returns JSON objects as :class:`py:collections.OrderedDict`
+objects. For large responses (e.g. of the 'Get Inventory' operation), the
+decoding can be made faster by using one of the following packages if it is
+installed, and by returning JSON objects as plain :class:`py:dict` objects:
+
+* `orjson <https://pypi.org/project/orjson/>`_
+* `ujson <https://pypi.org/project/ujson/>`_
+
+Example::
+
+    import zhmcclient
+
+    codec = zhmcclient.JsonCodec(backend='auto', ordered=False)
+    session = zhmcclient.Session(hmc, userid, password, json_codec=codec)
+
+A JSON codec can also decode the items of a JSON array incrementally from a
+stream of data (see :meth:`~zhmcclient.JsonCodec.iter_items`). This is used
+by the streaming methods of the session (e.g.
+:meth:`~zhmcclient.Session.iter_get`), so that the memory needed for
+processing very large responses does not grow with the size of the response.
+"""
+
+from __future__ import absolute_import
+
+import re
+import json
+from collections import OrderedDict
+import six
+
+from ._logging import get_logger
+
+__all__ = ['JsonCodec']
+
+LOG = get_logger(__name__)
+
+# Backends in the order of preference for the 'auto' backend
+_AUTO_BACKENDS = ('orjson', 'ujson', 'json')
+
+# Regular expressions for scanning JSON text in UTF-8. Scanning the bytes is
+# safe because the bytes of multi-byte UTF-8 characters are all >= 0x80.
+_WS_RE = re.compile(br'[ \t\n\r]*')
+_STRING_RE = re.compile(br'"[^"\\]*(?:\\.[^"\\]*)*"')
+_STRUCT_RE = re.compile(br'[\[\]{}"]')
+_SCALAR_RE = re.compile(br'[^ \t\n\r,\]}]+')
+
+
+def _import_backend(backend):
+    """
+    Import and return the module for a JSON backend, or return `None` if it
+    is not installed.
+    """
+    try:
+        if backend == 'orjson':
+            import orjson as module
+        elif backend == 'ujson':
+            import ujson as module
+        else:
+            module = json
+    except ImportError:
+        return None
+    return module
+
+
+class _JsonArrayReader(object):
+    """
+    A reader that splits the items of a JSON array from a stream of JSON text
+    in UTF-8, without decoding them.
+
+    The JSON array is either the JSON text itself, or a member of the JSON
+    object that is the JSON text.
+
+    Only the data of the current item is kept in memory, plus the data of the
+    chunk that is being processed.
+    """
+
+    def __init__(self, chunks, member):
+        """
+        Parameters:
+
+          chunks (:term:`iterable` of :term:`byte string`): The JSON text.
+
+          member (:term:`string`): Name of the member of the JSON object
+            that has the JSON array, or `None` if the JSON text is the array.
+        """
+        self._chunks = iter(chunks)
+        self._member = member
+        self._buf = b''
+        self._pos = 0  # Position of the unprocessed data in the buffer
+        self._eof = False
+
+    def _fill(self):
+        """
+        Append the next chunk to the buffer, discarding the processed data.
+
+        Returns:
+          bool: False if the end of the stream was reached.
+        """
+        while True:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self._eof = True
+                return False
+            if chunk:
+                break
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        """
+        Skip whitespace and return the next character, reading more data if
+        needed, or `None` at the end of the stream.
+        """
+        while True:
+            self._pos = _WS_RE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos:self._pos + 1]
+            if not self._fill():
+                return None
+
+    def _expect(self, chars):
+        """
+        Skip whitespace, and consume and return the next character, which
+        must be one of the specified characters.
+        """
+        c = self._peek()
+        if c is None:
+            raise ValueError("Unexpected end of JSON data")
+        if c not in chars:
+            raise ValueError("Expecting one of '{}' at position {} of the "
+                             "current JSON data chunk".
+                             format(b''.join(chars).decode('ascii'),
+                                    self._pos))
+        self._pos += 1
+        return c
+
+    def _value_end(self, pos):
+        """
+        Return the end position of the JSON value that starts at a position
+        in the buffer, or `None` if the buffer does not contain the entire
+        value.
+        """
+        buf = self._buf
+        c = buf[pos:pos + 1]
+        if c == b'"':
+            m = _STRING_RE.match(buf, pos)
+            return m.end() if m else None
+        if c not in (b'{', b'['):
+            m = _SCALAR_RE.match(buf, pos)
+            if m is None:
+                raise ValueError("Expecting value at position {} of the "
+                                 "current JSON data chunk".format(pos))
+            if m.end() == len(buf) and not self._eof:
+                return None  # The value may continue in the next chunk
+            return m.end()
+        depth = 0
+        while True:
+            m = _STRUCT_RE.search(buf, pos)
+            if m is None:
+                return None
+            pos = m.start()
+            c = buf[pos:pos + 1]
+            if c == b'"':
+                m = _STRING_RE.match(buf, pos)
+                if m is None:
+                    return None
+                pos = m.end()
+                continue
+            pos += 1
+            if c in (b'{', b'['):
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return pos
+
+    def _read_value(self):
+        """
+        Skip whitespace, and consume and return the JSON text of the next
+        value.
+        """
+        if self._peek() is None:
+            raise ValueError("Unexpected end of JSON data")
+        end = self._value_end(self._pos)
+        while end is None:
+            if self._eof:
+                raise ValueError("Unexpected end of JSON data")
+            self._fill()
+            end = self._value_end(self._pos)
+        data = self._buf[self._pos:end]
+        self._pos = end
+        return data
+
+    def _find_member(self):
+        """
+        Consume the JSON object up to and including the opening bracket of
+        the JSON array in the member, skipping any other members.
+        """
+        if self._peek() == b'}':
+            raise ValueError("JSON object has no member {!r}".
+                             format(self._member))
+        while True:
+            key = self._read_value()
+            if not key.startswith(b'"'):
+                raise ValueError("Expecting member name in JSON object")
+            self._expect((b':',))
+            if json.loads(key.decode('utf-8')) == self._member:
+                self._expect((b'[',))
+                return
+            json.loads(self._read_value().decode('utf-8'))  # Validate it
+            if self._expect((b',', b'}')) == b'}':
+                raise ValueError("JSON object has no member {!r}".
+                                 format(self._member))
+
+    def items(self):
+        """
+        Generator that yields the JSON text of each item of the JSON array,
+        as a :term:`byte string`.
+
+        The JSON data after the end of the JSON array is not read.
+
+        Empty JSON text is treated like an empty JSON array.
+        """
+        if self._peek() is None:
+            return
+        if self._member is None:
+            self._expect((b'[',))
+        else:
+            self._expect((b'{',))
+            self._find_member()
+        if self._peek() == b']':
+            return
+        while True:
+            yield self._read_value()
+            if self._expect((b',', b']')) == b']':
+                return
+
+
+class JsonCodec(object):
+    """
+    A JSON codec for the request and response bodies of a session.
+
+    A JSON codec object is stateless and can be shared by multiple sessions
+    and threads.
+    """
+
+    def __init__(self, backend='json', ordered=True):
+        """
+        Parameters:
+
+          backend (:term:`string`):
+            The package that is used for encoding and decoding JSON:
+
+            - ``'json'``: The :mod:`py:json` module of the Python standard
+              library.
+            - ``'orjson'``: The `orjson` package.
+            - ``'ujson'``: The `ujson` package.
+            - ``'auto'``: The first package of the above that is installed,
+              in the order `orjson`, `ujson`, `json`. If `ordered` is `True`,
+              ``'json'`` is used.
+
+          ordered (bool):
+            Controls whether JSON objects are decoded as
+            :class:`py:collections.OrderedDict` objects that preserve the order
+            of the members in the response, or as plain :class:`py:dict`
+            objects. Decoding as plain :class:`py:dict` objects is faster.
+            `True` is only supported for the ``'json'`` backend.
+
+        Raises:
+
+          ValueError: Invalid backend, or `ordered` is `True` for a backend
+            other than ``'json'``.
+          ImportError: The package for the backend is not installed.
+        """
+        if backend == 'auto':
+            if ordered:
+                backend = 'json'
+            else:
+                for backend in _AUTO_BACKENDS:
+                    if _import_backend(backend) is not None:
+                        break
+        if backend not in _AUTO_BACKENDS:
+            raise ValueError("Invalid JSON codec backend: {!r}".
+                             format(backend))
+        if ordered and backend != 'json':
+            raise ValueError("Decoding JSON objects as OrderedDict is not "
+                             "supported for JSON codec backend {!r}".
+                             format(backend))
+        module = _import_backend(backend)
+        if module is None:
+            raise ImportError("The package for JSON codec backend {!r} is not "
+                              "installed".format(backend))
+        self._backend = backend
+        self._ordered = ordered
+        self._module = module
+
+    def __repr__(self):
+        """
+        Return a string with the state of this JSON codec, for debug purposes.
+        """
+        return "{classname}(backend={s._backend!r}, ordered={s._ordered!r})".\
+            format(classname=self.__class__.__name__, s=self)
+
+    @property
+    def backend(self):
+        """
+        :term:`string`: The package that is used for encoding and decoding
+        JSON (``'json'``, ``'orjson'`` or ``'ujson'``).
+        """
+        return self._backend
+
+    @property
+    def ordered(self):
+        """
+        bool: Indicates whether JSON objects are decoded as
+        :class:`py:collections.OrderedDict` objects.
+        """
+        return self._ordered
+
+    def dumps(self, obj):
+        """
+        Encode a Python object as JSON.
+
+        Parameters:
+
+          obj: The Python object, e.g. a dict.
+
+        Returns:
+
+          :term:`unicode string` or :term:`byte string`: The JSON string,
+          using only ASCII characters if it is a unicode string, and using
+          UTF-8 if it is a byte string.
+
+        Raises:
+
+          TypeError: The object cannot be encoded as JSON.
+        """
+        return self._module.dumps(obj)
+
+    def loads(self, data):
+        """
+        Decode JSON into a Python object.
+
+        Parameters:
+
+          data (:term:`unicode string` or :term:`byte string`): The JSON
+            string. A byte string must use UTF-8.
+
+        Returns:
+
+          The Python object, e.g. a dict.
+
+        Raises:
+
+          ValueError: JSON parse error.
+        """
+        if self._backend == 'json':
+            if isinstance(data, six.binary_type):
+                data = data.decode('utf-8')
+            if self._ordered:
+                return json.loads(data, object_pairs_hook=OrderedDict)
+            return json.loads(data)
+        return self._module.loads(data)
+
+    def iter_items(self, chunks, member=None):
+        """
+        Generator that decodes the items of a JSON array incrementally from a
+        stream of JSON text, and yields each item as soon as its JSON text
+        has been read.
+
+        Only the JSON text of the current item is kept in memory (plus the
+        current chunk), so the memory needed does not depend on the number
+        of items in the array.
+
+        Parameters:
+
+          chunks (:term:`iterable` of :term:`byte string`): The JSON text in
+            UTF-8, in chunks of any size (e.g. as returned by
+            :meth:`requests.Response.iter_content`).
+
+          member (:term:`string`): Name of the member of the JSON object that
+            has the JSON array, if the JSON text is a JSON object. `None`
+            means that the JSON text is the JSON array. The JSON text after
+            the end of the JSON array is not read. Empty JSON text is treated
+            like an empty JSON array.
+
+        Returns:
+
+          :term:`iterable` of the Python objects for the array items, e.g.
+          dicts.
+
+        Raises:
+
+          ValueError: JSON parse error, or the JSON object does not have the
+            member.
+        """
+        for data in _JsonArrayReader(chunks, member).items():
+            yield self.loads(data)
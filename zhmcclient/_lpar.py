@@ -33,6 +33,7 @@ import copy
 from ._manager import BaseManager
 from ._resource import BaseResource
 from ._exceptions import StatusTimeout
+from ._deadline import Deadline, _activated
 from ._logging import get_logger, logged_api_call
 
 __all__ = ['LparManager', 'Lpar']
@@ -88,8 +89,14 @@ class LparManager(BaseManager):
         """
         return self._parent
 
+    def _list_operation(self, query_parms):
+        resources_name = 'logical-partitions'
+        uri = '{}/{}{}'.format(self.cpc.uri, resources_name, query_parms)
+        return uri, resources_name
+
     @logged_api_call
-    def list(self, full_properties=False, filter_args=None):
+    def list(self, full_properties=False, filter_args=None,
+             properties=None):
         """
         List the LPARs in this CPC.
 
@@ -113,6 +120,15 @@ class LparManager(BaseManager):
             `None` causes no filtering to happen, i.e. all resources are
             returned.
 
+          properties (:term:`iterable` of :term:`string`):
+            Names of resource properties that should be retrieved in addition
+            to the short set as returned by the list operation (see
+            :meth:`~zhmcclient.BaseResource.pull_properties`). Resource
+            properties that are already in the short set are not retrieved
+            again. Ignored if `full_properties` is `True`.
+
+            `None` causes only the short set to be retrieved.
+
         Returns:
 
           : A list of :class:`~zhmcclient.Lpar` objects.
@@ -124,6 +140,10 @@ class LparManager(BaseManager):
           :exc:`~zhmcclient.AuthError`
           :exc:`~zhmcclient.ConnectionError`
         """
+        resource_obj_list = self._list_loaded(filter_args)
+        if resource_obj_list is not None:
+            return resource_obj_list
+
         resource_obj_list = []
         resource_obj = self._try_optimized_lookup(filter_args)
         if resource_obj:
@@ -132,24 +152,25 @@ class LparManager(BaseManager):
         else:
             query_parms, client_filters = self._divide_filter_args(filter_args)
 
-            resources_name = 'logical-partitions'
-            uri = '{}/{}{}'.format(self.cpc.uri, resources_name, query_parms)
+            uri, resources_name = self._list_operation(query_parms)
 
             result = self.session.get(uri)
             if result:
                 props_list = result[resources_name]
                 for props in props_list:
 
-                    resource_obj = self.resource_class(
-                        manager=self,
+                    resource_obj = self._get_resource_obj(
                         uri=props[self._uri_prop],
                         name=props.get(self._name_prop, None),
                         properties=props)
 
                     if self._matches_filters(resource_obj, client_filters):
                         resource_obj_list.append(resource_obj)
-                        if full_properties:
-                            resource_obj.pull_full_properties()
+
+                if full_properties:
+                    self._pull_full_properties(resource_obj_list)
+                elif properties:
+                    self._pull_properties(resource_obj_list, properties)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
@@ -959,7 +980,7 @@ class Lpar(BaseResource):
             self.uri + '/operations/send-os-cmd', body)
 
     @logged_api_call
-    def wait_for_status(self, status, status_timeout=None):
+    def wait_for_status(self, status, status_timeout=None, deadline=None):
         """
         Wait until the status of this LPAR has a desired value.
 
@@ -989,6 +1010,13 @@ class Lpar(BaseResource):
             If the timeout expires , a :exc:`~zhmcclient.StatusTimeout` is
             raised.
 
+          deadline (:class:`~zhmcclient.Deadline`):
+            Deadline for waiting, including the HTTP requests for retrieving
+            the status. `None` means that only the active deadline applies, if
+            any (see :class:`~zhmcclient.Deadline`).
+            If the deadline expires, a :exc:`~zhmcclient.DeadlineExceeded` is
+            raised.
+
         Raises:
 
           :exc:`~zhmcclient.HTTPError`
@@ -997,6 +1025,8 @@ class Lpar(BaseResource):
           :exc:`~zhmcclient.ConnectionError`
           :exc:`~zhmcclient.StatusTimeout`: The timeout expired while
             waiting for the desired LPAR status.
+          :exc:`~zhmcclient.DeadlineExceeded`: The deadline expired while
+            waiting for the desired LPAR status.
         """
         if status_timeout is None:
             status_timeout = \
@@ -1007,23 +1037,31 @@ class Lpar(BaseResource):
             statuses = status
         else:
             statuses = [status]
-        while True:
-
-            # Fastest way to get actual status value:
-            lpars = self.manager.cpc.lpars.list(
-                filter_args={'name': self.name})
-            assert len(lpars) == 1
-            this_lpar = lpars[0]
-            actual_status = this_lpar.get_property('status')
-
-            if actual_status in statuses:
-                return
-
-            if status_timeout > 0 and time.time() > end_time:
-                raise StatusTimeout(
-                    "Waiting for LPAR {} to reach status(es) '{}' timed out "
-                    "after {} s - current status is '{}'".
-                    format(self.name, statuses, status_timeout, actual_status),
-                    actual_status, statuses, status_timeout)
-
-            time.sleep(1)  # Avoid hot spin loop
+        deadline = Deadline.effective(deadline)
+        with _activated(deadline):
+            while True:
+
+                # Fastest way to get actual status value:
+                lpars = self.manager.cpc.lpars.list(
+                    filter_args={'name': self.name})
+                assert len(lpars) == 1
+                this_lpar = lpars[0]
+                actual_status = this_lpar.get_property('status')
+
+                if actual_status in statuses:
+                    return
+
+                if status_timeout > 0 and time.time() > end_time:
+                    raise StatusTimeout(
+                        "Waiting for LPAR {} to reach status(es) '{}' "
+                        "timed out after {} s - current status is '{}'".
+                        format(self.name, statuses, status_timeout,
+                               actual_status),
+                        actual_status, statuses, status_timeout)
+
+                interval = 1  # Avoid hot spin loop
+                if deadline is not None:
+                    deadline.check("waiting for LPAR {} to reach status(es) "
+                                   "'{}'".format(self.name, statuses))
+                    interval = min(interval, max(deadline.remaining(), 0))
+                time.sleep(interval)
@@ -29,12 +29,17 @@ from __future__ import absolute_import
 
 import six
 import re
+import threading
+import time
 from datetime import datetime, timedelta
 import warnings
+from collections import OrderedDict, deque
 from requests.utils import quote
 
 from ._logging import get_logger, logged_api_call
 from ._exceptions import NotFound, NoUniqueMatch, HTTPError
+from ._deadline import Deadline, _activated
+from ._filter import compile_filter
 from ._utils import repr_list
 
 __all__ = ['BaseManager']
@@ -47,11 +52,17 @@ class _NameUriCache(object):
     A Name-URI cache, that caches the mapping between resource names and
     resource URIs. It supports looking up resource URIs by resource names.
 
+    The number of entries in the cache is limited, and the least recently
+    used entries are evicted when the limit is exceeded. In addition, the
+    cache remembers for a short time the resource names that were not found,
+    so that repeated lookups of such names do not cause HMC requests.
+
     This class is used by the implementation of manager classes, and is not
     part of the external API.
     """
 
-    def __init__(self, manager, timetolive):
+    def __init__(self, manager, timetolive, store=None, key=None,
+                 maxsize=None, negative_timetolive=0):
         """
         Parameters:
 
@@ -62,38 +73,196 @@ class _NameUriCache(object):
 
           timetolive (number): Time in seconds until the cache will invalidate
             itself automatically, since it was last invalidated.
+
+          store (NameUriCacheStore): Name-URI cache store that keeps the
+            cached data, so that it is shared with other Name-URI caches for
+            the same key. `None` means that the cached data is kept only in
+            this object.
+
+          key (tuple): Key of the cached data in the store.
+
+          maxsize (integer): Maximum number of entries in the cache, or `None`
+            for no limit.
+
+          negative_timetolive (number): Time in seconds for which a resource
+            name that was not found is remembered. 0 means that such names
+            are not remembered.
         """
         self._manager = manager
         self._timetolive = timetolive
+        self._store = store
+        self._key = key
+        self._maxsize = maxsize
+        self._negative_timetolive = negative_timetolive
 
-        # The cached data, as a dictionary with:
+        # The cached data, as an ordered dictionary with:
         # Key (string): Name of a resource (unique within its parent resource)
         # Value (string): URI of that resource
-        self._uris = {}
+        # The order is from least to most recently used. If a store is used,
+        # the dictionary is shared with the store and is therefore replaced
+        # instead of being modified, and the order is the order of insertion.
+        self._uris = OrderedDict()
 
         # Point in time when the cache was last invalidated
         self._invalidated = datetime.now()
 
+        # The resource names that were not found, as an ordered dictionary
+        # with:
+        # Key (string): Name of a resource
+        # Value (number): Point in time when the name expires, as Unix time
+        self._not_found = OrderedDict()
+
+        # All resource objects of the manager, if they were loaded at once
+        # (see set_resources()), or `None`
+        self._resources = None
+
+        # Statistics, see statistics()
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+
+        self._load()
+
+    def __repr__(self):
+        """
+        Return a string with the state of this Name-URI cache, for debug
+        purposes.
+        """
+        return "{}(size={!r}, maxsize={!r}, hits={!r}, misses={!r}, " \
+            "refreshes={!r})". \
+            format(self.__class__.__name__, len(self._uris), self._maxsize,
+                   self._hits, self._misses, self._refreshes)
+
+    def _load(self):
+        """
+        Load the cached data from the store, if a store is used and has
+        cached data for the key.
+        """
+        if self._store is not None:
+            cached = self._store.get(self._key)
+            if cached is not None:
+                self._uris, invalidated = cached
+                self._invalidated = datetime.fromtimestamp(invalidated)
+
+    def _save(self, uris):
+        """
+        Set the cached data to the specified dictionary after evicting the
+        least recently used entries that exceed the maximum size, and save it
+        in the store if a store is used.
+        """
+        if self._maxsize is not None:
+            while len(uris) > self._maxsize:
+                uris.popitem(last=False)
+        self._uris = uris
+        if self._store is not None:
+            invalidated = time.mktime(self._invalidated.timetuple()) + \
+                self._invalidated.microsecond / 1e6
+            self._store.put(self._key, uris, invalidated)
+
+    def _copy(self):
+        """
+        Return the cached data for being modified, which is a copy if a store
+        is used.
+        """
+        if self._store is not None:
+            return OrderedDict(self._uris)
+        return self._uris
+
+    def statistics(self):
+        """
+        Return the statistics of this Name-URI cache, as a dictionary with
+        items:
+
+        * 'hits': Number of lookups that were satisfied from the cache,
+          including lookups of names that were remembered as not found.
+        * 'misses': Number of lookups that needed to retrieve resources from
+          the HMC.
+        * 'refreshes': Number of times all resources of the manager were
+          retrieved from the HMC to refresh the cache.
+        """
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'refreshes': self._refreshes,
+        }
+
     def get(self, name):
         """
         Get the resource URI for a specified resource name.
 
         If an entry for the specified resource name does not exist in the
-        Name-URI cache, the cache is refreshed from the HMC with all resources
-        of the manager holding this cache.
+        Name-URI cache, the resource is looked up on the HMC. If the manager
+        supports filtering by resource name on the HMC, only resources with
+        that name are listed. Otherwise, the cache is refreshed from the HMC
+        with all resources of the manager holding this cache.
 
         If an entry for the specified resource name still does not exist after
-        that, ``NotFound`` is raised.
+        that, ``NotFound`` is raised, and the resource name is remembered as
+        not found for the negative time to live.
         """
-        self.auto_invalidate()
-        try:
-            return self._uris[name]
-        except KeyError:
+        uri = self.get_cached(name)
+        if uri is not None:
+            self._hits += 1
+            return uri
+        if self._is_not_found(name):
+            self._hits += 1
+            raise NotFound({self._manager._name_prop: name}, self._manager)
+        self._misses += 1
+        manager = self._manager
+        if manager._list_has_name and \
+                manager._name_prop in (manager._query_props or []):
+            # Resource names are matched as regular expressions on the HMC
+            res_list = manager.list(
+                filter_args={manager._name_prop: re.escape(name)})
+            self.update_from(res_list)
+        else:
             self.refresh()
-            try:
-                return self._uris[name]
-            except KeyError:
-                raise NotFound({self._manager._name_prop: name}, self._manager)
+        uri = self.get_cached(name)
+        if uri is None:
+            self._add_not_found(name)
+            raise NotFound({manager._name_prop: name}, manager)
+        return uri
+
+    def get_cached(self, name):
+        """
+        Get the resource URI for a specified resource name from the cache,
+        without refreshing the cache from the HMC.
+
+        If an entry for the specified resource name does not exist in the
+        Name-URI cache, `None` is returned.
+        """
+        self._load()
+        self.auto_invalidate()
+        uri = self._uris.get(name, None)
+        if uri is not None and self._store is None:
+            # Mark the entry as most recently used
+            del self._uris[name]
+            self._uris[name] = uri
+        return uri
+
+    def _is_not_found(self, name):
+        """
+        Return a boolean indicating whether the specified resource name is
+        remembered as not found.
+        """
+        expires = self._not_found.get(name, None)
+        if expires is None:
+            return False
+        if time.time() > expires:
+            self._not_found.pop(name, None)
+            return False
+        return True
+
+    def _add_not_found(self, name):
+        """
+        Remember the specified resource name as not found.
+        """
+        if self._negative_timetolive:
+            self._not_found.pop(name, None)
+            self._not_found[name] = time.time() + self._negative_timetolive
+            if self._maxsize is not None:
+                while len(self._not_found) > self._maxsize:
+                    self._not_found.popitem(last=False)
 
     def auto_invalidate(self):
         """
@@ -107,11 +276,14 @@ class _NameUriCache(object):
         """
         Invalidate the cache.
 
-        This empties the cache and sets the time of last invalidation to the
+        This empties the cache including the resource names that are
+        remembered as not found, and sets the time of last invalidation to the
         current time.
         """
-        self._uris = {}
         self._invalidated = datetime.now()
+        self._not_found = OrderedDict()
+        self._resources = None
+        self._save(OrderedDict())
 
     def refresh(self):
         """
@@ -120,6 +292,7 @@ class _NameUriCache(object):
         This is done by invalidating the cache, listing the resources of this
         manager from the HMC, and populating the cache with that information.
         """
+        self._refreshes += 1
         self.invalidate()
         full = not self._manager._list_has_name
         res_list = self._manager.list(full_properties=full)
@@ -133,12 +306,93 @@ class _NameUriCache(object):
         entries for non-empty resource names in that list. Other cache entries
         remain unchanged.
         """
+        uris = self._copy()
         for res in res_list:
             # We access the properties dictionary, in order to make sure
             # we don't drive additional HMC interactions.
             name = res.properties.get(self._manager._name_prop, None)
             uri = res.properties.get(self._manager._uri_prop, None)
-            self.update(name, uri)
+            if name:
+                uris.pop(name, None)
+                uris[name] = uri
+                self._not_found.pop(name, None)
+        self._save(uris)
+
+    def set_resources(self, res_list):
+        """
+        Set the resource objects of all resources of the manager holding this
+        cache, so that they are returned by :meth:`get_resources` until the
+        cache is invalidated, and replace the cache entries with their names
+        and URIs.
+
+        The resource objects are dropped when the cache is invalidated, and
+        when an entry is updated or deleted, because that indicates that a
+        resource was created, renamed or deleted.
+        """
+        self.invalidate()
+        self._resources = list(res_list)
+        self.update_from(res_list)
+
+    def get_resources(self):
+        """
+        Return the resource objects set with :meth:`set_resources`, or `None`
+        if they were not set or have been dropped since.
+        """
+        self.auto_invalidate()
+        return self._resources
+
+    def resource_added(self, res):
+        """
+        Apply the creation of the specified resource object to the Name-URI
+        cache, and to the resource objects set with :meth:`set_resources`.
+
+        Unlike :meth:`update`, this keeps the resource objects that have been
+        set.
+        """
+        if self._resources is not None and \
+                res.uri not in [r.uri for r in self._resources]:
+            self._resources.append(res)
+        name = res.properties.get(self._manager._name_prop, None)
+        if name:
+            uris = self._copy()
+            uris.pop(name, None)
+            uris[name] = res.uri
+            self._not_found.pop(name, None)
+            self._save(uris)
+
+    def resource_removed(self, uri):
+        """
+        Apply the deletion of the resource with the specified URI to the
+        Name-URI cache, and to the resource objects set with
+        :meth:`set_resources`.
+
+        Unlike :meth:`delete`, this keeps the resource objects that have been
+        set.
+        """
+        if self._resources is not None:
+            self._resources = [r for r in self._resources if r.uri != uri]
+        names = [n for n, u in self._uris.items() if u == uri]
+        if names:
+            uris = self._copy()
+            for name in names:
+                del uris[name]
+            self._save(uris)
+
+    def resource_renamed(self, uri, name):
+        """
+        Apply the renaming of the resource with the specified URI to the
+        specified name to the Name-URI cache.
+
+        Unlike :meth:`update`, this keeps the resource objects that have been
+        set with :meth:`set_resources`.
+        """
+        uris = self._copy()
+        for old_name in [n for n, u in uris.items() if u == uri]:
+            del uris[old_name]
+        if name:
+            uris[name] = uri
+            self._not_found.pop(name, None)
+        self._save(uris)
 
     def update(self, name, uri):
         """
@@ -147,8 +401,13 @@ class _NameUriCache(object):
 
         If the specified name is `None` or the empty string, do nothing.
         """
+        self._resources = None
         if name:
-            self._uris[name] = uri
+            uris = self._copy()
+            uris.pop(name, None)
+            uris[name] = uri
+            self._not_found.pop(name, None)
+            self._save(uris)
 
     def delete(self, name):
         """
@@ -158,11 +417,11 @@ class _NameUriCache(object):
         If the specified name is `None` or the empty string, or if an entry for
         the specified name does not exist, do nothing.
         """
-        if name:
-            try:
-                del self._uris[name]
-            except KeyError:
-                pass
+        self._resources = None
+        if name and name in self._uris:
+            uris = self._copy()
+            del uris[name]
+            self._save(uris)
 
 
 class BaseManager(object):
@@ -254,8 +513,13 @@ class BaseManager(object):
         self._query_props = query_props
         self._list_has_name = list_has_name
 
+        store = getattr(session, 'name_uri_cache_store', None)
+        store_key = (session.host, getattr(parent, 'uri', None), class_name)
+        rt_config = session.retry_timeout_config
         self._name_uri_cache = _NameUriCache(
-            self, session.retry_timeout_config.name_uri_cache_timetolive)
+            self, rt_config.name_uri_cache_timetolive, store, store_key,
+            rt_config.name_uri_cache_maxsize,
+            rt_config.name_uri_cache_negative_timetolive)
 
     def __repr__(self):
         """
@@ -312,11 +576,21 @@ class BaseManager(object):
         used), or changes performed in a different Python process, or changes
         performed via other means than the zhmcclient library (e.g. directly on
         the HMC) will not automatically update the Name-URI cache of this
-        manager.
+        manager. This also applies when the Name-URI cache is shared with
+        other manager objects via a Name-URI cache store (see
+        :class:`~zhmcclient.NameUriCacheStore`), except that invalidating the
+        Name-URI cache through any of them invalidates it for all of them.
 
         In cases where the resource name or resource URI are effected by such
         changes, the Name-URI cache can be manually invalidated by the user,
-        using this method.
+        using this method. Alternatively, a
+        :class:`~zhmcclient.CacheCoherenceService` can be used to apply such
+        changes to the Name-URI cache as they are notified by the HMC.
+
+        If the resources of this manager have been loaded from the inventory
+        of the HMC (see :meth:`~zhmcclient.Client.load_inventory`), this
+        method also drops the loaded resource objects, so that subsequent
+        list operations are performed on the HMC again.
 
         Note that the Name-URI cache automatically invalidates itself after a
         certain time since the last invalidation. That auto invalidation time
@@ -326,6 +600,56 @@ class BaseManager(object):
         """
         self._name_uri_cache.invalidate()
 
+    def name_uri_cache_statistics(self):
+        """
+        Return the statistics of the Name-URI cache of this manager.
+
+        The Name-URI cache is used by
+        :meth:`~zhmcclient.BaseManager.find_by_name` (and thus by
+        :meth:`~zhmcclient.BaseManager.find` and
+        :meth:`~zhmcclient.BaseManager.findall` when filtering only by name).
+
+        Returns:
+
+          dict: With items:
+
+          * 'hits': Number of lookups that were satisfied from the Name-URI
+            cache, including lookups of names that were recently not found.
+          * 'misses': Number of lookups that needed to retrieve resources from
+            the HMC.
+          * 'refreshes': Number of times all resources of this manager were
+            retrieved from the HMC to refresh the Name-URI cache.
+        """
+        return self._name_uri_cache.statistics()
+
+    def _list_loaded(self, filter_args):
+        """
+        Return the resource objects in scope of this manager that match the
+        filter arguments, if all resource objects of this manager have been
+        loaded (see :meth:`~zhmcclient.Client.load_inventory`) and the
+        Name-URI cache has not been invalidated since. Otherwise, return
+        `None`.
+
+        The loaded resource objects have the full set of resource properties,
+        so filtering them does not cause any HMC interactions.
+
+        Parameters:
+
+          filter_args (dict):
+            Filter arguments. For details, see :ref:`Filtering`.
+            `None` causes no filtering to happen.
+
+        Returns:
+
+          list of resource objects, or `None`.
+        """
+        resource_objs = self._name_uri_cache.get_resources()
+        if resource_objs is None:
+            return None
+        compiled_filter = compile_filter(filter_args)
+        return [obj for obj in resource_objs
+                if self._matches_filters(obj, compiled_filter)]
+
     def _try_optimized_lookup(self, filter_args):
         """
         Try to optimize the lookup by checking whether the filter arguments
@@ -346,21 +670,11 @@ class BaseManager(object):
 
           resource object, or `None` if the optimization was not possible.
         """
-        if filter_args is None or len(filter_args) != 1 or \
-                self._oid_prop not in filter_args:
+        uri = self._optimized_lookup_uri(filter_args)
+        if uri is None:
             return None
 
-        oid_match = filter_args[self._oid_prop]
-        if not isinstance(oid_match, six.string_types) or \
-                not re.match(r'^[a-zA-Z0-9_\-]+$', oid_match):
-            return None
-
-        # The match string is a plain string (not a reg.expression)
-
-        # Construct the resource URI from the filter property
-        # and issue a Get <Resource> Properties on that URI
-        uri = self._base_uri + '/' + oid_match
-
+        # Issue a Get <Resource> Properties on the resource URI
         try:
             props = self.session.get(uri)
         except HTTPError as exc:
@@ -369,16 +683,53 @@ class BaseManager(object):
                 return None
             raise
 
-        resource_obj = self.resource_class(
-            manager=self,
+        resource_obj = self._get_resource_obj(
             uri=props[self._uri_prop],
             name=props.get(self._name_prop, None),
             properties=props)
 
-        resource_obj._full_properties = True
+        resource_obj._set_full_properties(props)
 
         return resource_obj
 
+    def _optimized_lookup_uri(self, filter_args):
+        """
+        Return the resource URI for an optimized lookup (see
+        :meth:`_try_optimized_lookup`), or `None` if the optimization is not
+        possible for the filter arguments.
+        """
+        if filter_args is None or len(filter_args) != 1 or \
+                self._oid_prop not in filter_args:
+            return None
+
+        oid_match = filter_args[self._oid_prop]
+        if not isinstance(oid_match, six.string_types) or \
+                not re.match(r'^[a-zA-Z0-9_\-]+$', oid_match):
+            return None
+
+        # The match string is a plain string (not a reg.expression)
+
+        # Construct the resource URI from the filter property
+        return self._base_uri + '/' + oid_match
+
+    def _list_operation(self, query_parms):
+        """
+        Return a tuple (uri, resources_name) with the URI of the HMC list
+        operation for the resources of this manager, and the name of the
+        field in its response that has the list of resources.
+
+        This method is implemented by the derived manager classes whose
+        resources are listed with an HMC list operation (as opposed to
+        resources that are listed using a property of their parent resource,
+        such as NICs).
+
+        Parameters:
+
+          query_parms (:term:`string`): Query parameter string to be appended
+            to the URI, as returned by :meth:`_divide_filter_args`.
+        """
+        raise NotImplementedError
+
     def _divide_filter_args(self, filter_args):
         """
         Divide the filter arguments into filter query parameters for filtering
@@ -396,7 +747,9 @@ class BaseManager(object):
 
         Returns:
 
-          : tuple (query_parms_str, client_filter_args)
+          : tuple (query_parms_str, client_filter_args), where
+          client_filter_args is a CompiledFilter, so that the client-side
+          filters are compiled only once for all resources.
         """
         query_parms = []  # query parameter strings
         client_filter_args = {}
@@ -413,7 +766,7 @@ class BaseManager(object):
         if query_parms_str:
             query_parms_str = '?{}'.format(query_parms_str)
 
-        return query_parms_str, client_filter_args
+        return query_parms_str, compile_filter(client_filter_args)
 
     def _append_query_parms(self, query_parms, prop_name, prop_match):
         if isinstance(prop_match, (list, tuple)):
@@ -432,15 +785,17 @@ class BaseManager(object):
         of filter arguments.
         This is used for client-side filtering.
 
-        Depending on the properties specified in the filter arguments, this
-        method retrieves the resource properties from the HMC.
+        If the resource object does not yet have all of the properties
+        specified in the filter arguments, this method retrieves only the
+        missing properties from the HMC, and only if the resource object
+        matches on the properties it already has.
 
         Parameters:
 
           obj (BaseResource):
             Resource object.
 
-          filter_args (dict):
+          filter_args (dict or CompiledFilter):
             Filter arguments. For details, see :ref:`Filtering`.
             `None` causes the resource to always match.
 
@@ -449,12 +804,17 @@ class BaseManager(object):
           bool: Boolean indicating whether the resource object matches the
             filter arguments.
         """
-        if filter_args is not None:
-            for prop_name in filter_args:
-                prop_match = filter_args[prop_name]
-                if not self._matches_prop(obj, prop_name, prop_match):
-                    return False
-        return True
+        if not filter_args:
+            return True
+        compiled = compile_filter(filter_args)
+        if obj.full_properties:
+            return compiled.matches(obj.properties)
+
+        def pull(prop_names):
+            obj.pull_properties(prop_names)
+            return obj.properties
+
+        return compiled.matches(obj.properties, pull)
 
     def _matches_prop(self, obj, prop_name, prop_match):
         """
@@ -462,8 +822,8 @@ class BaseManager(object):
         a single property against a property match value.
         This is used for client-side filtering.
 
-        Depending on the specified property, this method retrieves the resource
-        properties from the HMC.
+        The property must already have been retrieved from the HMC, if it
+        exists for the resource (see :meth:`_matches_filters`).
 
         Parameters:
 
@@ -489,41 +849,103 @@ class BaseManager(object):
           bool: Boolean indicating whether the resource object matches w.r.t.
             the specified property and the match value.
         """
-        if isinstance(prop_match, (list, tuple)):
-            # List items are logically ORed, so one matching item suffices.
-            for pm in prop_match:
-                if self._matches_prop(obj, prop_name, pm):
-                    return True
-        else:
-            # Some lists of resources do not have all properties, for example
-            # Hipersocket adapters do not have a "card-location" property.
-            # If a filter property does not exist on a resource, the resource
-            # does not match.
-            try:
-                prop_value = obj.get_property(prop_name)
-            except KeyError:
-                return False
-            if isinstance(prop_value, six.string_types):
-                # HMC resource property is Enum String or (non-enum) String,
-                # and is both matched by regexp matching. Ideally, regexp
-                # matching should only be done for non-enum strings, but
-                # distinguishing them is not possible given that the client
-                # has no knowledge about the properties.
-
-                # The regexp matching implemented in the HMC requires begin and
-                # end of the string value to match, even if the '^' for begin
-                # and '$' for end are not specified in the pattern. The code
-                # here is consistent with that: We add end matching to the
-                # pattern, and begin matching is done by re.match()
-                # automatically.
-                re_match = prop_match + '$'
-                m = re.match(re_match, prop_value)
-                if m:
-                    return True
-            else:
-                if prop_value == prop_match:
-                    return True
-        return False
+        return compile_filter({prop_name: prop_match}).matches(obj.properties)
+
+    def _pull_full_properties(self, resource_obj_list):
+        """
+        Retrieve the full set of resource properties for a list of resource
+        objects, concurrently (see :meth:`_pull_concurrently`).
+
+        Parameters:
+
+          resource_obj_list (list of resource objects): The resource objects.
+        """
+        self._pull_concurrently(
+            resource_obj_list, lambda obj: obj.pull_full_properties())
+
+    def _pull_properties(self, resource_obj_list, properties):
+        """
+        Retrieve a subset of resource properties for a list of resource
+        objects, concurrently (see :meth:`_pull_concurrently`).
+
+        Only the resource properties that are not yet cached in a resource
+        object are retrieved for it, so resource objects that already have
+        all of the specified resource properties (e.g. from the list
+        operation) cause no retrieval.
+
+        Parameters:
+
+          resource_obj_list (list of resource objects): The resource objects.
+
+          properties (:term:`iterable` of :term:`string`): Names of the
+            resource properties to be retrieved.
+        """
+        properties = list(properties)
+
+        def missing(obj):
+            return [p for p in properties if p not in obj.properties]
+
+        pull_obj_list = [obj for obj in resource_obj_list
+                         if not obj.full_properties and missing(obj)]
+        self._pull_concurrently(
+            pull_obj_list, lambda obj: obj.pull_properties(missing(obj)))
+
+    def _pull_concurrently(self, resource_obj_list, pull):
+        """
+        Call a function that retrieves resource properties for each resource
+        object in a list, concurrently.
+
+        The number of concurrent retrievals is limited by the
+        `list_concurrency` attribute of the retry/timeout configuration of the
+        session. Any deadline that is active (see
+        :class:`~zhmcclient.Deadline`) also applies to the retrievals.
+
+        If retrievals fail, no further retrievals are started, and the
+        exception of the first failed resource object in the list is raised
+        (as if the properties had been retrieved one after the other).
+
+        Parameters:
+
+          resource_obj_list (list of resource objects): The resource objects.
+
+          pull (:term:`callable`): Function that retrieves the resource
+            properties for the resource object passed as its only argument.
+        """
+        max_workers = self.session.retry_timeout_config.list_concurrency
+        num_workers = min(max_workers or 1, len(resource_obj_list))
+        if num_workers <= 1:
+            for resource_obj in resource_obj_list:
+                pull(resource_obj)
+            return
+
+        deadline = Deadline.current()
+        lock = threading.Lock()
+        indexes = iter(range(len(resource_obj_list)))
+        errors = {}  # Key: index in list, value: exception
+
+        def worker():
+            with _activated(deadline):
+                while True:
+                    with lock:
+                        if errors:
+                            return
+                        index = next(indexes, None)
+                    if index is None:
+                        return
+                    try:
+                        pull(resource_obj_list[index])
+                    except Exception as exc:  # pylint: disable=broad-except
+                        with lock:
+                            errors[index] = exc
+
+        threads = [threading.Thread(target=worker)
+                   for _ in range(num_workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[min(errors)]
 
     @property
     def resource_class(self):
@@ -561,6 +983,63 @@ class BaseManager(object):
         """
         return self._parent
 
+    @property
+    def _identity_map(self):
+        """
+        The identity map of the client of this manager (see
+        :attr:`zhmcclient.Client.identity_map`), or `None` if the client has
+        no identity map.
+        """
+        manager = self
+        while True:
+            # The top-level managers know their client
+            client = getattr(manager, '_client', None)
+            if client is not None:
+                return client.identity_map
+            parent = manager.parent
+            if parent is None:
+                return None
+            manager = parent.manager
+
+    def _get_resource_obj(self, uri, name=None, properties=None):
+        """
+        Return a Python resource object for this resource class, that is
+        scoped to this manager.
+
+        If the client has an identity map and it already has a resource
+        object for the URI, that resource object is returned, with the
+        specified properties merged into its properties. Otherwise, a new
+        resource object is created and added to the identity map (if any).
+
+        Parameters:
+
+          uri (string): Canonical URI path of the resource.
+
+          name (string): Name of the resource, or `None`.
+
+          properties (dict): Properties for the resource object, or `None`.
+
+        Returns:
+
+          Subclass of :class:`~zhmcclient.BaseResource`: The resource object.
+        """
+        identity_map = self._identity_map
+        if identity_map is None:
+            return self.resource_class(
+                manager=self,
+                uri=uri,
+                name=name,
+                properties=properties)
+        # pylint: disable=protected-access
+        return identity_map._get_or_add(
+            uri,
+            lambda: self.resource_class(
+                manager=self,
+                uri=uri,
+                name=name,
+                properties=properties),
+            properties)
+
     def resource_object(self, uri_or_oid, props=None):
         """
         Return a minimalistic Python resource object for this resource class,
@@ -612,10 +1091,10 @@ class BaseManager(object):
                 name = props[self._name_prop]
             except KeyError:
                 pass
-        return self.resource_class(self, uri, name, res_props)
+        return self._get_resource_obj(uri, name, res_props)
 
     @logged_api_call
-    def findall(self, **filter_args):
+    def findall(self, properties=None, **filter_args):
         """
         Find zero or more resources in scope of this manager, by matching
         resource properties against the specified filter arguments, and return
@@ -642,6 +1121,13 @@ class BaseManager(object):
 
         Parameters:
 
+          properties (:term:`iterable` of :term:`string`):
+            Names of resource properties that should be retrieved for the
+            returned resource objects, in addition to the minimal set of
+            properties they have (see
+            :meth:`~zhmcclient.BaseResource.pull_properties`). `None` causes
+            no additional resource properties to be retrieved.
+
           \\**filter_args:
             All keyword arguments are used as filter arguments. Specifying no
             keyword arguments causes no filtering to happen. See the examples
@@ -651,7 +1137,7 @@ class BaseManager(object):
 
           List of resource objects in scope of this manager object that match
           the filter arguments. These resource objects have a minimal set of
-          properties.
+          properties, plus the properties specified in `properties`.
 
         Raises:
 
@@ -688,13 +1174,19 @@ class BaseManager(object):
                 obj = self.find_by_name(filter_args[self._name_prop])
             except NotFound:
                 return []
+            if properties:
+                self._pull_properties([obj], properties)
             return [obj]
+        elif properties:
+            obj_list = self.list(filter_args=filter_args,
+                                 properties=properties)
+            return obj_list
         else:
             obj_list = self.list(filter_args=filter_args)
             return obj_list
 
     @logged_api_call
-    def find(self, **filter_args):
+    def find(self, properties=None, **filter_args):
         """
         Find exactly one resource in scope of this manager, by matching
         resource properties against the specified filter arguments, and return
@@ -721,6 +1213,13 @@ class BaseManager(object):
 
         Parameters:
 
+          properties (:term:`iterable` of :term:`string`):
+            Names of resource properties that should be retrieved for the
+            returned resource objects, in addition to the minimal set of
+            properties they have (see
+            :meth:`~zhmcclient.BaseResource.pull_properties`). `None` causes
+            no additional resource properties to be retrieved.
+
           \\**filter_args:
             All keyword arguments are used as filter arguments. Specifying no
             keyword arguments causes no filtering to happen. See the examples
@@ -730,7 +1229,7 @@ class BaseManager(object):
 
           Resource object in scope of this manager object that matches the
           filter arguments. This resource object has a minimal set of
-          properties.
+          properties, plus the properties specified in `properties`.
 
         Raises:
 
@@ -763,8 +1262,15 @@ class BaseManager(object):
 
               filter_args = {'object-id': '12345-abc...de-12345'}
               cpc = client.cpcs.find(**filter_args)
+
+        * The following example finds a partition by its name, and retrieves
+          only its 'status' and 'ifl-processors' properties instead of its
+          full set of properties::
+
+              partition = cpc.partitions.find(
+                  name='PART1', properties=['status', 'ifl-processors'])
         """
-        obj_list = self.findall(**filter_args)
+        obj_list = self.findall(properties=properties, **filter_args)
         num_objs = len(obj_list)
         if num_objs == 0:
             raise NotFound(filter_args, self)
@@ -773,7 +1279,8 @@ class BaseManager(object):
         else:
             return obj_list[0]
 
-    def list(self, full_properties=False, filter_args=None):
+    def list(self, full_properties=False, filter_args=None,
+             properties=None):
         """
         Find zero or more resources in scope of this manager, by matching
         resource properties against the specified filter arguments, and return
@@ -807,11 +1314,18 @@ class BaseManager(object):
             Filter arguments. `None` causes no filtering to happen. See the
             examples for usage details.
 
+          properties (:term:`iterable` of :term:`string`):
+            Names of resource properties that should be retrieved in addition
+            to the minimal set as returned by the list operation (see
+            :meth:`~zhmcclient.BaseResource.pull_properties`). Resource
+            properties that are already in the minimal set are not retrieved
+            again. Ignored if `full_properties` is `True`.
+
         Returns:
 
           List of resource objects in scope of this manager object that match
           the filter arguments. These resource objects have a set of properties
-          according to the `full_properties` parameter.
+          according to the `full_properties` and `properties` parameters.
 
         Raises:
 
@@ -835,6 +1349,266 @@ class BaseManager(object):
         """
         raise NotImplementedError
 
+    @logged_api_call
+    def iter_list(self, full_properties=False, filter_args=None,
+                  properties=None, prefetch=0):
+        """
+        Generator that lists the resources in scope of this manager, like
+        :meth:`~zhmcclient.BaseManager.list`, but yields their Python resource
+        objects one by one as they are built and filtered, so that the first
+        resource objects are available before all resources are listed.
+
+        For resources that are listed with an HMC list operation, the response
+        of the HMC list operation is parsed incrementally (see
+        :meth:`~zhmcclient.Session.iter_get`), so the memory needed does not
+        depend on the number of resources. This is useful for managers with
+        very many resources, such as the storage volumes of a storage group.
+        For resources that are listed using a property of their parent
+        resource (e.g. NICs), the short set of resource properties is listed
+        first, and the remaining work is done as the resource objects are
+        yielded.
+
+        The HMC list operation is performed when the first resource object is
+        requested from the returned generator. It is never served from the
+        response cache of the session.
+
+        If resource properties are to be retrieved for each resource (see the
+        `full_properties` and `properties` parameters), they are retrieved
+        just before the resource object is yielded. With `prefetch`, they are
+        retrieved concurrently for the next resources while the caller
+        processes the current resource object.
+
+        Authorization requirements:
+
+        * see the `list()` method in the derived classes.
+
+        Parameters:
+
+          full_properties (bool):
+            Controls whether the full set of resource properties should be
+            retrieved for each resource before it is yielded, vs. only the
+            short set as returned by the list operation.
+
+          filter_args (dict):
+            Filter arguments that narrow the list of returned resources to
+            those that match the specified filter arguments. For details, see
+            :ref:`Filtering`.
+
+            `None` causes no filtering to happen, i.e. all resources are
+            returned.
+
+          properties (:term:`iterable` of :term:`string`):
+            Names of resource properties that should be retrieved for each
+            resource before it is yielded, in addition to the short set as
+            returned by the list operation. Ignored if `full_properties` is
+            `True`.
+
+          prefetch (:term:`integer`):
+            Number of resources ahead of the yielded resource for which the
+            resource properties are retrieved concurrently. 0 means that the
+            resource properties are retrieved one resource after the other,
+            when the resource object is requested. Has no effect if no
+            resource properties are to be retrieved.
+
+            If the caller stops iterating, the retrievals that are in progress
+            still complete.
+
+        Returns:
+
+          :term:`iterable` of resource objects: A generator that yields the
+          resource objects in scope of this manager object that match the
+          filter arguments.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+
+        Example::
+
+            for volume in storage_group.storage_volumes.iter_list():
+                print(volume.name)
+        """
+        if full_properties:
+            def pull(resource_obj):
+                if not resource_obj.full_properties:
+                    resource_obj.pull_full_properties()
+        elif properties:
+            def pull(resource_obj):
+                self._pull_properties([resource_obj], properties)
+        else:
+            pull = None
+
+        resource_objs = self._iter_resource_objs(filter_args)
+        if pull is None:
+            for resource_obj in resource_objs:
+                yield resource_obj
+        elif prefetch:
+            for resource_obj in self._iter_prefetched(
+                    resource_objs, pull, prefetch):
+                yield resource_obj
+        else:
+            for resource_obj in resource_objs:
+                pull(resource_obj)
+                yield resource_obj
+
+    @logged_api_call
+    def iter_findall(self, properties=None, **filter_args):
+        """
+        Generator that finds zero or more resources in scope of this manager,
+        like :meth:`~zhmcclient.BaseManager.findall`, but yields their Python
+        resource objects one by one as they are found (see
+        :meth:`~zhmcclient.BaseManager.iter_list`).
+
+        Authorization requirements:
+
+        * see the `list()` method in the derived classes.
+
+        Parameters:
+
+          properties (:term:`iterable` of :term:`string`):
+            Names of resource properties that should be retrieved for each
+            resource before it is yielded, in addition to the short set.
+
+          \\**filter_args:
+            All keyword arguments are used as filter arguments that narrow the
+            list of resources to those that match. For details, see
+            :ref:`Filtering`.
+
+        Returns:
+
+          :term:`iterable` of resource objects: A generator that yields the
+          resource objects in scope of this manager object that match the
+          filter arguments.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+
+        Example::
+
+            # Stop at the first active partition
+            for partition in cpc.partitions.iter_findall(status='active'):
+                break
+        """
+        if len(filter_args) == 1 and self._name_prop in filter_args:
+            for resource_obj in self.findall(properties, **filter_args):
+                yield resource_obj
+        else:
+            for resource_obj in self.iter_list(filter_args=filter_args,
+                                               properties=properties):
+                yield resource_obj
+
+    def _iter_resource_objs(self, filter_args):
+        """
+        Generator that yields the resource objects in scope of this manager
+        that match the filter arguments, with the short set of resource
+        properties (or with the full set, if it was retrieved for an optimized
+        lookup). The Name-URI cache is updated with each resource object.
+        """
+        resource_objs = self._list_loaded(filter_args)
+        if resource_objs is not None:
+            for resource_obj in resource_objs:
+                yield resource_obj
+            return
+
+        try:
+            self._list_operation('')
+        except NotImplementedError:
+            # The resources are listed using a property of their parent
+            # resource (e.g. NICs), or are not listed from the HMC at all
+            # (e.g. metrics contexts).
+            list_args = {'full_properties': False}
+            if filter_args:
+                list_args['filter_args'] = filter_args
+            for resource_obj in self.list(**list_args):
+                yield resource_obj
+            return
+
+        resource_obj = self._try_optimized_lookup(filter_args)
+        if resource_obj:
+            # It already has full properties
+            self._name_uri_cache.update_from([resource_obj])
+            yield resource_obj
+            return
+
+        query_parms, client_filters = self._divide_filter_args(filter_args)
+
+        uri, resources_name = self._list_operation(query_parms)
+
+        for props in self.session.iter_get(uri, resources_name):
+
+            resource_obj = self._get_resource_obj(
+                uri=props[self._uri_prop],
+                name=props.get(self._name_prop, None),
+                properties=props)
+
+            if self._matches_filters(resource_obj, client_filters):
+                self._name_uri_cache.update_from([resource_obj])
+                yield resource_obj
+
+    def _iter_prefetched(self, resource_objs, pull, prefetch):
+        """
+        Generator that yields the resource objects of an iterable after
+        calling a function that retrieves resource properties for each of
+        them. The function is called concurrently for up to `prefetch`
+        resource objects ahead of the yielded one. Any deadline that is active
+        (see :class:`~zhmcclient.Deadline`) also applies to the retrievals.
+
+        If a retrieval fails, its exception is raised when its resource object
+        would have been yielded.
+
+        Parameters:
+
+          resource_objs (:term:`iterable` of resource objects): The resource
+            objects.
+
+          pull (:term:`callable`): Function that retrieves the resource
+            properties for the resource object passed as its only argument.
+
+          prefetch (:term:`integer`): Maximum number of resource objects ahead
+            of the yielded one, for which the function is called concurrently.
+        """
+        deadline = Deadline.current()
+        pending = deque()  # Items: tuple(resource_obj, done_event, errors)
+
+        def start(resource_obj):
+            done = threading.Event()
+            errors = []
+
+            def run():
+                with _activated(deadline):
+                    try:
+                        pull(resource_obj)
+                    except Exception as exc:  # pylint: disable=broad-except
+                        errors.append(exc)
+                    finally:
+                        done.set()
+
+            thread = threading.Thread(target=run)
+            thread.daemon = True
+            thread.start()
+            pending.append((resource_obj, done, errors))
+
+        def finish():
+            resource_obj, done, errors = pending.popleft()
+            done.wait()
+            if errors:
+                raise errors[0]
+            return resource_obj
+
+        for resource_obj in resource_objs:
+            start(resource_obj)
+            if len(pending) > prefetch:
+                yield finish()
+        while pending:
+            yield finish()
+
     @logged_api_call
     def find_by_name(self, name):
         """
@@ -879,9 +1653,14 @@ class BaseManager(object):
 
               cpc = client.cpcs.find_by_name('CPC001')
         """
+        resource_objs = self._name_uri_cache.get_resources()
+        if resource_objs is not None:
+            for obj in resource_objs:
+                if obj.name == name:
+                    return obj
+            raise NotFound({self._name_prop: name}, self)
         uri = self._name_uri_cache.get(name)
-        obj = self.resource_class(
-            manager=self,
+        obj = self._get_resource_obj(
             uri=uri,
             name=name,
             properties=None)
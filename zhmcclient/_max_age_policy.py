@@ -0,0 +1,240 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The :class:`~zhmcclient.MaxAgePolicy` class defines how long the resource
+properties cached in Python resource objects (see
+:class:`~zhmcclient.BaseResource`) are considered fresh.
+
+Resource objects remember for each cached resource property when it was
+retrieved from the HMC. Without a max age policy, a cached resource property
+is used regardless of its age. A max age policy is enabled for a session by
+passing it to the :class:`~zhmcclient.Session` object via its
+`max_age_policy` init parameter. Then,
+:meth:`~zhmcclient.BaseResource.get_property` and
+:meth:`~zhmcclient.BaseResource.prop` check the age of a cached resource
+property against its maximum age, and if it is stale, retrieve all stale
+resource properties of the resource object from the HMC (see
+:meth:`~zhmcclient.BaseResource.pull_properties`) before returning it.
+
+By default, volatile resource properties such as 'status' have a short
+maximum age, static resource properties such as 'object-id' never become
+stale, and all other resource properties have a longer maximum age.
+
+Example::
+
+    import zhmcclient
+
+    policy = zhmcclient.MaxAgePolicy(max_ages={'status': 5})
+    session = zhmcclient.Session(hmc, userid, password,
+                                 max_age_policy=policy)
+
+    . . .
+
+    print(policy.statistics())
+"""
+
+from __future__ import absolute_import
+
+import threading
+
+__all__ = ['MaxAgePolicy']
+
+#: Default maximum ages in seconds of specific resource properties, where
+#: `None` means that the resource property never becomes stale.
+_DEFAULT_MAX_AGES = {
+    # Volatile properties
+    'status': 10,
+    'state': 10,
+    # Properties that rarely change
+    'name': 3600,
+    'description': 3600,
+    # Properties that never change
+    'object-id': None,
+    'object-uri': None,
+    'element-id': None,
+    'element-uri': None,
+    'class': None,
+    'parent': None,
+}
+
+
+class MaxAgePolicy(object):
+    """
+    A policy that defines the maximum age of the resource properties cached
+    in Python resource objects, and that keeps statistics about their use.
+
+    The statistics count how often
+    :meth:`~zhmcclient.BaseResource.get_property` (and
+    :meth:`~zhmcclient.BaseResource.prop`) found a resource property:
+
+    * "hits": cached and fresh.
+    * "refreshes": cached, but stale, so that the stale resource properties
+      were retrieved from the HMC.
+    * "misses": not cached, so that the full set of resource properties was
+      retrieved from the HMC.
+
+    A max age policy object can be shared by multiple sessions. Its
+    statistics then cover all of these sessions.
+    """
+
+    def __init__(self, default_max_age=300, max_ages=None):
+        """
+        Parameters:
+
+          default_max_age (:term:`number`):
+            Maximum age in seconds of the cached resource properties that do
+            not have a specific maximum age. `None` means that these resource
+            properties never become stale.
+
+          max_ages (dict):
+            Maximum ages in seconds of specific resource properties, with the
+            property names as keys. A value of `None` means that the resource
+            property never becomes stale. These maximum ages are added to
+            (and override) the default maximum ages of specific resource
+            properties, which are 10 seconds for 'status' and 'state', 3600
+            seconds for 'name' and 'description', and `None` for 'object-id',
+            'object-uri', 'element-id', 'element-uri', 'class' and 'parent'.
+        """
+        self._default_max_age = default_max_age
+        self._max_ages = dict(_DEFAULT_MAX_AGES)
+        if max_ages:
+            self._max_ages.update(max_ages)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._refreshes = 0
+        self._misses = 0
+
+    def __repr__(self):
+        """
+        Return a string with the state of this max age policy, for debug
+        purposes.
+        """
+        ret = (
+            "{classname}(default_max_age={s._default_max_age!r}, "
+            "max_ages={s._max_ages!r}, hits={s._hits!r}, "
+            "refreshes={s._refreshes!r}, misses={s._misses!r})".
+            format(classname=self.__class__.__name__, s=self))
+        return ret
+
+    @property
+    def default_max_age(self):
+        """
+        :term:`number`: Maximum age in seconds of the cached resource
+        properties that do not have a specific maximum age, or `None` if they
+        never become stale.
+        """
+        return self._default_max_age
+
+    @property
+    def max_ages(self):
+        """
+        dict: Maximum ages in seconds of specific resource properties, with
+        the property names as keys, including the default maximum ages of
+        specific resource properties.
+        """
+        return dict(self._max_ages)
+
+    def max_age(self, name):
+        """
+        Return the maximum age of a resource property.
+
+        Parameters:
+
+          name (:term:`string`): Name of the resource property.
+
+        Returns:
+
+          :term:`number`: Maximum age in seconds, or `None` if the resource
+          property never becomes stale.
+        """
+        return self._max_ages.get(name, self._default_max_age)
+
+    def is_stale(self, name, timestamp, now):
+        """
+        Return a boolean indicating whether a cached resource property is
+        stale.
+
+        Parameters:
+
+          name (:term:`string`): Name of the resource property.
+
+          timestamp (:term:`number`): Point in time when the resource
+            property was retrieved, as Unix time.
+
+          now (:term:`number`): Current point in time, as Unix time.
+
+        Returns:
+
+          bool: Indicates whether the resource property is stale.
+        """
+        max_age = self.max_age(name)
+        return max_age is not None and now - timestamp > max_age
+
+    @property
+    def hits(self):
+        """
+        :term:`integer`: Number of times a cached resource property was fresh.
+        """
+        return self._hits
+
+    @property
+    def refreshes(self):
+        """
+        :term:`integer`: Number of times a cached resource property was stale
+        and the stale resource properties were retrieved.
+        """
+        return self._refreshes
+
+    @property
+    def misses(self):
+        """
+        :term:`integer`: Number of times a resource property was not cached
+        and the full set of resource properties was retrieved.
+        """
+        return self._misses
+
+    def statistics(self):
+        """
+        Return the statistics of this max age policy.
+
+        Returns:
+
+          dict: With items 'hits', 'refreshes' and 'misses' (see the
+          properties of the same names).
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'refreshes': self._refreshes,
+                'misses': self._misses,
+            }
+
+    def reset_statistics(self):
+        """
+        Reset the statistics of this max age policy to 0.
+        """
+        with self._lock:
+            self._hits = 0
+            self._refreshes = 0
+            self._misses = 0
+
+    def _count(self, kind):
+        """
+        Count a use of a resource property, where `kind` is 'hits',
+        'refreshes' or 'misses'.
+        """
+        with self._lock:
+            attr = '_' + kind
+            setattr(self, attr, getattr(self, attr) + 1)
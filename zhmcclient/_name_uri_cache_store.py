@@ -0,0 +1,245 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A Name-URI cache store holds the Name-URI caches of resource managers (see
+:meth:`~zhmcclient.BaseManager.invalidate_cache`) outside of the manager
+objects, so that they can be shared.
+
+Without a Name-URI cache store, each manager object has its own Name-URI
+cache, which is filled by listing the resources of the manager when a
+resource is first looked up by name (e.g. with
+:meth:`~zhmcclient.BaseManager.find_by_name`). A Name-URI cache store is
+enabled for a session by passing it to the :class:`~zhmcclient.Session`
+object via its `name_uri_cache_store` init parameter. The Name-URI caches
+are then kept in the store, keyed by HMC host, URI of the parent resource
+and resource class, so that they are shared by all manager objects for the
+same resources:
+
+* :class:`~zhmcclient.MemoryNameUriCacheStore` keeps the Name-URI caches in
+  memory, and shares them across the manager objects of all sessions that
+  use the same store object.
+
+* :class:`~zhmcclient.FileNameUriCacheStore` keeps the Name-URI caches in the
+  local file system, and shares them also across processes, so that a
+  process starts with the Name-URI caches of earlier processes.
+
+The rules for invalidating the Name-URI caches are unchanged: A Name-URI
+cache invalidates itself when its time to live has passed since it was last
+invalidated (see
+:attr:`~zhmcclient.RetryTimeoutConfig.name_uri_cache_timetolive`), and
+:meth:`~zhmcclient.BaseManager.invalidate_cache` invalidates it. Since the
+point in time of the last invalidation is kept in the store, a Name-URI
+cache loaded from the store is used only within its time to live.
+
+Example::
+
+    import zhmcclient
+
+    store = zhmcclient.FileNameUriCacheStore()
+    session = zhmcclient.Session(hmc, userid, password,
+                                 name_uri_cache_store=store)
+    client = zhmcclient.Client(session)
+
+    cpc = client.cpcs.find_by_name('CPC1')  # no list operation if cached
+"""
+
+from __future__ import absolute_import
+
+import os
+import json
+import errno
+import hashlib
+import threading
+from collections import OrderedDict
+
+from ._logging import get_logger
+
+__all__ = ['NameUriCacheStore', 'MemoryNameUriCacheStore',
+           'FileNameUriCacheStore']
+
+LOG = get_logger(__name__)
+
+
+class NameUriCacheStore(object):
+    """
+    Base class for Name-URI cache stores.
+
+    A Name-URI cache store holds Name-URI caches, with a key that is a tuple
+    (host, parent_uri, class_name) of the HMC host, the URI of the parent
+    resource (or `None` for top-level resources) and the resource class of
+    the resources. Each Name-URI cache consists of the mapping of resource
+    names to resource URIs, and the point in time of its last invalidation.
+
+    Derived classes must implement all methods of this class. The methods
+    may be called from multiple threads.
+    """
+
+    def get(self, key):
+        """
+        Return a Name-URI cache.
+
+        Parameters:
+
+          key (tuple): Key of the Name-URI cache.
+
+        Returns:
+
+          tuple(uris, invalidated): The Name-URI cache, where `uris` is a dict
+          with the resource names as keys and the resource URIs as values,
+          and `invalidated` is the point in time of its last invalidation as
+          Unix time, or `None` if the store has no Name-URI cache for the key.
+          The caller must not modify the returned dict.
+        """
+        raise NotImplementedError
+
+    def put(self, key, uris, invalidated):
+        """
+        Put a Name-URI cache into the store, replacing any Name-URI cache
+        with the same key.
+
+        Parameters:
+
+          key (tuple): Key of the Name-URI cache.
+
+          uris (dict): Mapping of resource names to resource URIs. The store
+            takes ownership of the dict; the caller must not modify it
+            afterwards.
+
+          invalidated (:term:`number`): Point in time of the last
+            invalidation of the Name-URI cache, as Unix time.
+        """
+        raise NotImplementedError
+
+
+class MemoryNameUriCacheStore(NameUriCacheStore):
+    """
+    A Name-URI cache store that keeps the Name-URI caches in memory.
+
+    The Name-URI caches are shared by the manager objects of all sessions that
+    use the same store object.
+    """
+
+    def __init__(self):
+        self._caches = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        """
+        Return a string with the state of this store, for debug purposes.
+        """
+        return "{}(keys={!r})". \
+            format(self.__class__.__name__, sorted(self._caches, key=str))
+
+    def get(self, key):
+        """
+        Return a Name-URI cache.
+
+        For details, see :meth:`zhmcclient.NameUriCacheStore.get`.
+        """
+        with self._lock:
+            return self._caches.get(key)
+
+    def put(self, key, uris, invalidated):
+        """
+        Put a Name-URI cache into the store.
+
+        For details, see :meth:`zhmcclient.NameUriCacheStore.put`.
+        """
+        with self._lock:
+            self._caches[key] = (uris, invalidated)
+
+
+class FileNameUriCacheStore(NameUriCacheStore):
+    """
+    A Name-URI cache store that is a directory in the local file system.
+
+    Each Name-URI cache is stored in a JSON file in that directory. The files
+    are replaced atomically, so that processes that share the directory
+    always see complete Name-URI caches.
+    """
+
+    def __init__(self, directory=None):
+        """
+        Parameters:
+
+          directory (:term:`string`):
+            Path name of the directory of the store. It is created if it
+            does not exist. `None` means ``.zhmcclient/name-uri-cache`` in the
+            home directory of the user.
+        """
+        if directory is None:
+            directory = os.path.join(os.path.expanduser('~'), '.zhmcclient',
+                                     'name-uri-cache')
+        self._directory = directory
+
+    def __repr__(self):
+        """
+        Return a string with the state of this store, for debug purposes.
+        """
+        return "{}(directory={!r})". \
+            format(self.__class__.__name__, self._directory)
+
+    @property
+    def directory(self):
+        """
+        :term:`string`: Path name of the directory of the store.
+        """
+        return self._directory
+
+    def _path(self, key):
+        """Return the path name of the file for a key."""
+        hash_key = u'\n'.join(u'{}'.format(k) for k in key).encode('utf-8')
+        name = hashlib.sha256(hash_key).hexdigest() + '.json'
+        return os.path.join(self._directory, name)
+
+    def get(self, key):
+        """
+        Return a Name-URI cache.
+
+        For details, see :meth:`zhmcclient.NameUriCacheStore.get`.
+        """
+        try:
+            with open(self._path(key)) as fp:
+                cache = json.load(fp, object_pairs_hook=OrderedDict)
+        except (IOError, OSError, ValueError):
+            return None
+        if cache.get('key') != list(key):
+            return None
+        return cache['uris'], cache['invalidated']
+
+    def put(self, key, uris, invalidated):
+        """
+        Put a Name-URI cache into the store.
+
+        For details, see :meth:`zhmcclient.NameUriCacheStore.put`.
+        """
+        try:
+            os.makedirs(self._directory)
+        except OSError as exc:
+            if exc.errno != errno.EEXIST:
+                raise
+        path = self._path(key)
+        tmp_path = '{}.{}.{}.tmp'.format(path, os.getpid(),
+                                         threading.current_thread().ident)
+        try:
+            with open(tmp_path, 'w') as fp:
+                json.dump({'key': list(key), 'uris': uris,
+                           'invalidated': invalidated}, fp)
+            if os.name == 'nt' and os.path.exists(path):
+                os.remove(path)
+            os.rename(tmp_path, path)
+        except (IOError, OSError) as exc:
+            # The store is a cache, so failing to write it is not an error
+            LOG.warning("Cannot write Name-URI cache file %s: %s", path, exc)
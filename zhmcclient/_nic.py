@@ -29,6 +29,7 @@ from __future__ import absolute_import
 import copy
 
 from ._manager import BaseManager
+from ._filter import compile_filter
 from ._resource import BaseResource
 from ._logging import get_logger, logged_api_call
 
@@ -79,7 +80,8 @@ class NicManager(BaseManager):
         return self._parent
 
     @logged_api_call
-    def list(self, full_properties=False, filter_args=None):
+    def list(self, full_properties=False, filter_args=None,
+             properties=None):
         """
         List the NICs in this Partition.
 
@@ -102,6 +104,15 @@ class NicManager(BaseManager):
             `None` causes no filtering to happen, i.e. all resources are
             returned.
 
+          properties (:term:`iterable` of :term:`string`):
+            Names of resource properties that should be retrieved in addition
+            to the short set as returned by the list operation (see
+            :meth:`~zhmcclient.BaseResource.pull_properties`). Resource
+            properties that are already in the short set are not retrieved
+            again. Ignored if `full_properties` is `True`.
+
+            `None` causes only the short set to be retrieved.
+
         Returns:
 
           : A list of :class:`~zhmcclient.Nic` objects.
@@ -113,21 +124,28 @@ class NicManager(BaseManager):
           :exc:`~zhmcclient.AuthError`
           :exc:`~zhmcclient.ConnectionError`
         """
+        resource_obj_list = self._list_loaded(filter_args)
+        if resource_obj_list is not None:
+            return resource_obj_list
+
         resource_obj_list = []
+        compiled_filter = compile_filter(filter_args)
         uris = self.partition.get_property('nic-uris')
         if uris:
             for uri in uris:
 
-                resource_obj = self.resource_class(
-                    manager=self,
+                resource_obj = self._get_resource_obj(
                     uri=uri,
                     name=None,
                     properties=None)
 
-                if self._matches_filters(resource_obj, filter_args):
+                if self._matches_filters(resource_obj, compiled_filter):
                     resource_obj_list.append(resource_obj)
-                    if full_properties:
-                        resource_obj.pull_full_properties()
+
+            if full_properties:
+                self._pull_full_properties(resource_obj_list)
+            elif properties:
+                self._pull_properties(resource_obj_list, properties)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
@@ -231,7 +249,7 @@ class NicManager(BaseManager):
         props.update(result)
         name = props.get(self._name_prop, None)
         uri = props[self._uri_prop]
-        nic = Nic(self, uri, name, props)
+        nic = self._get_resource_obj(uri, name, props)
         self._name_uri_cache.update(name, uri)
         return nic
 
@@ -322,9 +322,119 @@ class _NotificationListener(object):
 
             # Indicate to receiver that there is a new notification
             self._handover_dict['headers'] = headers
-            try:
-                msg_obj = json.loads(message)
-            except Exception:
-                raise  # TODO: Find better exception for this case
+            if not message:
+                # Some notification types (e.g. 'job-completion') have no
+                # message body.
+                msg_obj = None
+            else:
+                try:
+                    msg_obj = json.loads(message)
+                except Exception:
+                    raise  # TODO: Find better exception for this case
             self._handover_dict['message'] = msg_obj
             self._handover_cond.notifyAll()
+
+
+class _JobNotifier(object):
+    """
+    Receives the 'job-completion' notifications of the job notification topic
+    of a session, and wakes up the jobs that are waiting for their completion.
+
+    This is an internal class that is used by the
+    :class:`~zhmcclient.Session` class when job notifications are enabled.
+    """
+
+    def __init__(self, topic, host, userid, password):
+        """
+        Parameters:
+
+          topic (:term:`string`): Name of the job notification topic of the
+            session.
+
+          host (:term:`string`): HMC host.
+
+          userid (:term:`string`): Userid of the HMC user to be used.
+
+          password (:term:`string`): Password of the HMC user to be used.
+        """
+        self._topic = topic
+        # Events of the jobs waiting for completion, by job URI
+        self._waiters = {}
+        self._lock = threading.Lock()
+        self._running = True
+        self._receiver = NotificationReceiver(topic, host, userid, password)
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def topic(self):
+        """
+        :term:`string`: Name of the job notification topic.
+        """
+        return self._topic
+
+    @property
+    def running(self):
+        """
+        bool: Indicates whether job completion notifications are still
+        being received.
+        """
+        return self._running
+
+    def register(self, job_uri):
+        """
+        Register a job that waits for its completion, and return a
+        :class:`py:threading.Event` object that is set when a completion
+        notification for the job is received, or when no more notifications
+        will be received.
+
+        Parameters:
+
+          job_uri (:term:`string`): Canonical URI of the job.
+        """
+        event = threading.Event()
+        with self._lock:
+            if not self._running:
+                event.set()
+            self._waiters[job_uri] = event
+        return event
+
+    def unregister(self, job_uri):
+        """
+        Unregister a job that no longer waits for its completion.
+
+        Parameters:
+
+          job_uri (:term:`string`): Canonical URI of the job.
+        """
+        with self._lock:
+            self._waiters.pop(job_uri, None)
+
+    def close(self):
+        """
+        Close the notification receiver. The jobs that are waiting are woken
+        up.
+        """
+        self._receiver.close()
+
+    def _run(self):
+        """
+        Thread function that processes the notifications.
+        """
+        try:
+            for headers, _ in self._receiver.notifications():
+                if headers.get('notification-type') != 'job-completion':
+                    continue
+                job_uri = headers.get('job-uri')
+                LOG.debug("Received completion notification for job %s",
+                          job_uri)
+                with self._lock:
+                    event = self._waiters.get(job_uri)
+                if event is not None:
+                    event.set()
+        finally:
+            with self._lock:
+                self._running = False
+                for event in self._waiters.values():
+                    event.set()
@@ -38,6 +38,7 @@ from requests.utils import quote
 from ._manager import BaseManager
 from ._resource import BaseResource
 from ._exceptions import StatusTimeout
+from ._deadline import Deadline, _activated
 from ._nic import NicManager
 from ._hba import HbaManager
 from ._virtual_function import VirtualFunctionManager
@@ -97,8 +98,14 @@ class PartitionManager(BaseManager):
         """
         return self._parent
 
+    def _list_operation(self, query_parms):
+        resources_name = 'partitions'
+        uri = '{}/{}{}'.format(self.cpc.uri, resources_name, query_parms)
+        return uri, resources_name
+
     @logged_api_call
-    def list(self, full_properties=False, filter_args=None):
+    def list(self, full_properties=False, filter_args=None,
+             properties=None):
         """
         List the Partitions in this CPC.
 
@@ -123,6 +130,15 @@ class PartitionManager(BaseManager):
             `None` causes no filtering to happen, i.e. all resources are
             returned.
 
+          properties (:term:`iterable` of :term:`string`):
+            Names of resource properties that should be retrieved in addition
+            to the short set as returned by the list operation (see
+            :meth:`~zhmcclient.BaseResource.pull_properties`). Resource
+            properties that are already in the short set are not retrieved
+            again. Ignored if `full_properties` is `True`.
+
+            `None` causes only the short set to be retrieved.
+
         Returns:
 
           : A list of :class:`~zhmcclient.Partition` objects.
@@ -134,6 +150,9 @@ class PartitionManager(BaseManager):
           :exc:`~zhmcclient.AuthError`
           :exc:`~zhmcclient.ConnectionError`
         """
+        resource_obj_list = self._list_loaded(filter_args)
+        if resource_obj_list is not None:
+            return resource_obj_list
 
         resource_obj_list = []
 
@@ -144,24 +163,25 @@ class PartitionManager(BaseManager):
         else:
             query_parms, client_filters = self._divide_filter_args(filter_args)
 
-            resources_name = 'partitions'
-            uri = '{}/{}{}'.format(self.cpc.uri, resources_name, query_parms)
+            uri, resources_name = self._list_operation(query_parms)
 
             result = self.session.get(uri)
             if result:
                 props_list = result[resources_name]
                 for props in props_list:
 
-                    resource_obj = self.resource_class(
-                        manager=self,
+                    resource_obj = self._get_resource_obj(
                         uri=props[self._uri_prop],
                         name=props.get(self._name_prop, None),
                         properties=props)
 
                     if self._matches_filters(resource_obj, client_filters):
                         resource_obj_list.append(resource_obj)
-                        if full_properties:
-                            resource_obj.pull_full_properties()
+
+                if full_properties:
+                    self._pull_full_properties(resource_obj_list)
+                elif properties:
+                    self._pull_properties(resource_obj_list, properties)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
@@ -204,7 +224,7 @@ class PartitionManager(BaseManager):
         props.update(result)
         name = props.get(self._name_prop, None)
         uri = props[self._uri_prop]
-        part = Partition(self, uri, name, props)
+        part = self._get_resource_obj(uri, name, props)
         self._name_uri_cache.update(name, uri)
         return part
 
@@ -833,7 +853,7 @@ class Partition(BaseResource):
             self.uri + '/operations/send-os-cmd', body)
 
     @logged_api_call
-    def wait_for_status(self, status, status_timeout=None):
+    def wait_for_status(self, status, status_timeout=None, deadline=None):
         """
         Wait until the status of this partition has a desired value.
 
@@ -852,6 +872,13 @@ class Partition(BaseResource):
             If the timeout expires, a :exc:`~zhmcclient.StatusTimeout` is
             raised.
 
+          deadline (:class:`~zhmcclient.Deadline`):
+            Deadline for waiting, including the HTTP requests for retrieving
+            the status. `None` means that only the active deadline applies, if
+            any (see :class:`~zhmcclient.Deadline`).
+            If the deadline expires, a :exc:`~zhmcclient.DeadlineExceeded` is
+            raised.
+
         Raises:
 
           :exc:`~zhmcclient.HTTPError`
@@ -860,6 +887,8 @@ class Partition(BaseResource):
           :exc:`~zhmcclient.ConnectionError`
           :exc:`~zhmcclient.StatusTimeout`: The status timeout expired while
             waiting for the desired partition status.
+          :exc:`~zhmcclient.DeadlineExceeded`: The deadline expired while
+            waiting for the desired partition status.
         """
         if status_timeout is None:
             status_timeout = \
@@ -870,26 +899,35 @@ class Partition(BaseResource):
             statuses = status
         else:
             statuses = [status]
-        while True:
-
-            # Fastest way to get actual status value:
-            parts = self.manager.cpc.partitions.list(
-                filter_args={'name': self.name})
-            assert len(parts) == 1
-            this_part = parts[0]
-            actual_status = this_part.get_property('status')
-
-            if actual_status in statuses:
-                return
-
-            if status_timeout > 0 and time.time() > end_time:
-                raise StatusTimeout(
-                    "Waiting for partition {} to reach status(es) '{}' timed "
-                    "out after {} s - current status is '{}'".
-                    format(self.name, statuses, status_timeout, actual_status),
-                    actual_status, statuses, status_timeout)
-
-            time.sleep(1)  # Avoid hot spin loop
+        deadline = Deadline.effective(deadline)
+        with _activated(deadline):
+            while True:
+
+                # Fastest way to get actual status value:
+                parts = self.manager.cpc.partitions.list(
+                    filter_args={'name': self.name})
+                assert len(parts) == 1
+                this_part = parts[0]
+                actual_status = this_part.get_property('status')
+
+                if actual_status in statuses:
+                    return
+
+                if status_timeout > 0 and time.time() > end_time:
+                    raise StatusTimeout(
+                        "Waiting for partition {} to reach status(es) '{}' "
+                        "timed out after {} s - current status is '{}'".
+                        format(self.name, statuses, status_timeout,
+                               actual_status),
+                        actual_status, statuses, status_timeout)
+
+                interval = 1  # Avoid hot spin loop
+                if deadline is not None:
+                    deadline.check(
+                        "waiting for partition {} to reach status(es) '{}'".
+                        format(self.name, statuses))
+                    interval = min(interval, max(deadline.remaining(), 0))
+                time.sleep(interval)
 
     @logged_api_call
     def increase_crypto_config(self, crypto_adapters,
@@ -1167,6 +1205,6 @@ class Partition(BaseResource):
             for sg_uri in sg_uris:
                 sg = cpc.storage_groups.resource_object(sg_uri)
                 sg_list.append(sg)
-                if full_properties:
-                    sg.pull_full_properties()
+            if full_properties:
+                cpc.storage_groups._pull_full_properties(sg_list)
         return sg_list
@@ -25,6 +25,7 @@ from __future__ import absolute_import
 import copy
 
 from ._manager import BaseManager
+from ._filter import compile_filter
 from ._resource import BaseResource
 from ._logging import get_logger, logged_api_call
 
@@ -94,7 +95,8 @@ class PortManager(BaseManager):
         return self._port_type
 
     @logged_api_call
-    def list(self, full_properties=False, filter_args=None):
+    def list(self, full_properties=False, filter_args=None,
+             properties=None):
         """
         List the Ports of this Adapter.
 
@@ -119,6 +121,15 @@ class PortManager(BaseManager):
             `None` causes no filtering to happen, i.e. all resources are
             returned.
 
+          properties (:term:`iterable` of :term:`string`):
+            Names of resource properties that should be retrieved in addition
+            to the short set as returned by the list operation (see
+            :meth:`~zhmcclient.BaseResource.pull_properties`). Resource
+            properties that are already in the short set are not retrieved
+            again. Ignored if `full_properties` is `True`.
+
+            `None` causes only the short set to be retrieved.
+
         Returns:
 
           : A list of :class:`~zhmcclient.Port` objects.
@@ -130,6 +141,10 @@ class PortManager(BaseManager):
           :exc:`~zhmcclient.AuthError`
           :exc:`~zhmcclient.ConnectionError`
         """
+        resource_obj_list = self._list_loaded(filter_args)
+        if resource_obj_list is not None:
+            return resource_obj_list
+
         uris_prop = self.adapter.port_uris_prop
         if not uris_prop:
             # Adapter does not have any ports
@@ -144,18 +159,21 @@ class PortManager(BaseManager):
         uris = list(set(uris))
 
         resource_obj_list = []
+        compiled_filter = compile_filter(filter_args)
         for uri in uris:
 
-            resource_obj = self.resource_class(
-                manager=self,
+            resource_obj = self._get_resource_obj(
                 uri=uri,
                 name=None,
                 properties=None)
 
-            if self._matches_filters(resource_obj, filter_args):
+            if self._matches_filters(resource_obj, compiled_filter):
                 resource_obj_list.append(resource_obj)
-                if full_properties:
-                    resource_obj.pull_full_properties()
+
+        if full_properties:
+            self._pull_full_properties(resource_obj_list)
+        elif properties:
+            self._pull_properties(resource_obj_list, properties)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
@@ -0,0 +1,311 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The :class:`~zhmcclient.RateLimiter` class limits the rate and the
+concurrency of the HTTP requests that a :class:`~zhmcclient.Session` object
+sends to the HMC.
+
+A rate limiter is enabled for a session by passing it to the
+:class:`~zhmcclient.Session` object via its `rate_limiter` init parameter.
+Requests that exceed a limit are delayed (queued) until they are within the
+limit again; they never fail because of a limit.
+
+Each HTTP request is subject to one :class:`~zhmcclient.RateLimit`, which is
+selected by matching the HTTP method and URI of the request against patterns.
+This allows separate budgets for different classes of operations, for example
+for asynchronous operations that cause heavy work on the HMC, and for
+retrieving resource properties.
+
+A rate limiter object can be shared by multiple sessions (e.g. by multiple
+sessions with the same HMC), in which case its limits apply to the requests
+of all of these sessions together.
+
+Example::
+
+    import zhmcclient
+
+    limiter = zhmcclient.RateLimiter(
+        limits=[
+            # Asynchronous operations, e.g. 'Start Partition'
+            (r'POST /api/.*/operations/.*',
+             zhmcclient.RateLimit(rate=2, max_inflight=4, name='operations')),
+        ],
+        default_limit=zhmcclient.RateLimit(rate=20, burst=40,
+                                           max_inflight=10))
+    session = zhmcclient.Session(hmc, userid, password,
+                                 rate_limiter=limiter)
+    session.time_stats_keeper.enable()
+
+    . . .
+
+    print(session.time_stats_keeper)
+"""
+
+from __future__ import absolute_import
+
+import re
+import math
+import time
+import threading
+
+from ._logging import get_logger
+
+__all__ = ['RateLimiter', 'RateLimit']
+
+LOG = get_logger(__name__)
+
+
+class RateLimit(object):
+    """
+    A limit for the rate and the concurrency of HTTP requests, implemented as
+    a token bucket for the rate and a counter for the requests in flight.
+
+    A rate limit object is thread-safe.
+    """
+
+    def __init__(self, rate=None, burst=None, max_inflight=None, name=None):
+        """
+        Parameters:
+
+          rate (:term:`number`):
+            Maximum average number of requests per second. `None` means that
+            the rate is not limited.
+
+          burst (:term:`integer`):
+            Maximum number of requests that can be sent at once, i.e. the
+            capacity of the token bucket. `None` means the rate rounded up to
+            an integer, or 1 for rates below 1. Ignored if the rate is not
+            limited.
+
+          max_inflight (:term:`integer`):
+            Maximum number of requests in flight, i.e. that have been sent
+            and whose response has not yet been received. `None` means that
+            the number of requests in flight is not limited.
+
+          name (:term:`string`):
+            Name of the rate limit, used for the names of its time statistics
+            (see :class:`~zhmcclient.RateLimiter`). `None` means that the rate
+            limiter sets the name.
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("Invalid rate value: {!r}".format(rate))
+        if max_inflight is not None and max_inflight < 1:
+            raise ValueError("Invalid max_inflight value: {!r}".
+                             format(max_inflight))
+        if burst is None and rate is not None:
+            burst = max(1, int(math.ceil(rate)))
+        if burst is not None and burst < 1:
+            raise ValueError("Invalid burst value: {!r}".format(burst))
+        self._rate = rate
+        self._burst = burst
+        self._max_inflight = max_inflight
+        self._name = name
+
+        # Token bucket, starting full
+        self._tokens = burst
+        self._last_refill = time.time()
+        self._inflight = 0
+        self._cond = threading.Condition()
+
+    def __repr__(self):
+        """
+        Return a string with the state of this rate limit, for debug purposes.
+        """
+        ret = (
+            "{classname}(rate={s._rate!r}, burst={s._burst!r}, "
+            "max_inflight={s._max_inflight!r}, name={s._name!r})".
+            format(classname=self.__class__.__name__, s=self))
+        return ret
+
+    @property
+    def rate(self):
+        """
+        :term:`number`: Maximum average number of requests per second, or
+        `None` if the rate is not limited.
+        """
+        return self._rate
+
+    @property
+    def burst(self):
+        """
+        :term:`integer`: Maximum number of requests that can be sent at once,
+        or `None` if the rate is not limited.
+        """
+        return self._burst
+
+    @property
+    def max_inflight(self):
+        """
+        :term:`integer`: Maximum number of requests in flight, or `None` if
+        the number of requests in flight is not limited.
+        """
+        return self._max_inflight
+
+    @property
+    def name(self):
+        """
+        :term:`string`: Name of the rate limit.
+        """
+        return self._name
+
+    @property
+    def inflight(self):
+        """
+        :term:`integer`: Current number of requests in flight.
+        """
+        return self._inflight
+
+    def acquire(self):
+        """
+        Wait until a request is within this rate limit, and account for it
+        as being in flight.
+
+        Each call must be followed by a call to
+        :meth:`~zhmcclient.RateLimit.release` when the response of the request
+        has been received.
+
+        Returns:
+
+          :term:`number`: The time in seconds the request was delayed, or 0 if
+          it was not delayed.
+        """
+        start = time.time()
+        delayed = False
+        with self._cond:
+            while True:
+                wait_time = None
+                inflight_ok = self._max_inflight is None or \
+                    self._inflight < self._max_inflight
+                if self._rate is not None:
+                    now = time.time()
+                    self._tokens = min(
+                        self._burst,
+                        self._tokens + (now - self._last_refill) * self._rate)
+                    self._last_refill = now
+                    if self._tokens < 1:
+                        wait_time = (1 - self._tokens) / self._rate
+                if inflight_ok and wait_time is None:
+                    break
+                self._cond.wait(None if not inflight_ok else wait_time)
+                delayed = True
+            if self._rate is not None:
+                self._tokens -= 1
+            self._inflight += 1
+        return time.time() - start if delayed else 0
+
+    def release(self):
+        """
+        Account for the response of a request having been received.
+        """
+        with self._cond:
+            self._inflight -= 1
+            self._cond.notify_all()
+
+
+class RateLimiter(object):
+    """
+    A client-side limiter for the rate and the concurrency of the HTTP
+    requests of one or more sessions, with limits that are specified per
+    class of operations.
+
+    The limit for an HTTP request is selected by matching the string
+    ``"{method} {uri}"`` (e.g. ``"POST /api/partitions/{partition-id}"``)
+    against the patterns of the rate limiter. The first matching pattern
+    determines the limit. Requests that do not match any pattern are subject
+    to the default limit.
+
+    A request is in flight from when it is sent until its response has been
+    received (for the streaming methods
+    :meth:`~zhmcclient.Session.iter_get` and
+    :meth:`~zhmcclient.Session.iter_post`, until the response headers have
+    been received).
+
+    The session records the time each request was delayed by its limit (the
+    queueing delay) in the time statistics of its
+    :attr:`~zhmcclient.Session.time_stats_keeper` named
+    "rate limit {name}", where {name} is the name of the limit, and counts
+    the requests that were delayed in counters named
+    "rate limit {name} (delayed)". For limits without a name, the name is
+    their pattern, or "default" for the default limit.
+    """
+
+    def __init__(self, limits=None, default_limit=None):
+        """
+        Parameters:
+
+          limits (:term:`iterable` of tuple(pattern, :class:`~zhmcclient.RateLimit`)):
+            Limits for classes of operations, where pattern
+            (:term:`string`) is a regular expression that is matched against
+            the entire string ``"{method} {uri}"`` of the request, including
+            any query parameters in the URI. The HTTP method is in upper case.
+
+            `None` means that no classes of operations are specified.
+
+          default_limit (:class:`~zhmcclient.RateLimit`):
+            Limit for the requests that do not match any of the patterns.
+            `None` means that these requests are not limited.
+        """  # noqa: E501
+        # pylint: disable=protected-access
+        self._limits = []  # list of tuple(compiled pattern, RateLimit)
+        if limits:
+            for pattern, limit in limits:
+                if limit.name is None:
+                    limit._name = pattern
+                self._limits.append((re.compile(pattern + '$'), limit))
+        if default_limit is not None and default_limit.name is None:
+            default_limit._name = 'default'
+        self._default_limit = default_limit
+
+    def __repr__(self):
+        """
+        Return a string with the state of this rate limiter, for debug
+        purposes.
+        """
+        ret = (
+            "{classname} at 0x{id:08x} (\n"
+            "  _limits = {s._limits!r}\n"
+            "  _default_limit = {s._default_limit!r}\n"
+            ")".format(classname=self.__class__.__name__, id=id(self), s=self))
+        return ret
+
+    @property
+    def default_limit(self):
+        """
+        :class:`~zhmcclient.RateLimit`: Limit for the requests that do not
+        match any of the patterns, or `None`.
+        """
+        return self._default_limit
+
+    def limit(self, method, uri):
+        """
+        Return the limit for an HTTP request.
+
+        Parameters:
+
+          method (:term:`string`): HTTP method in upper case, e.g. 'GET'.
+
+          uri (:term:`string`): URI of the request, including any query
+            parameters.
+
+        Returns:
+
+          :class:`~zhmcclient.RateLimit`: The limit for the request, or `None`
+          if the request is not limited.
+        """
+        request = method + ' ' + uri
+        for pattern, limit in self._limits:
+            if pattern.match(request):
+                return limit
+        return self._default_limit
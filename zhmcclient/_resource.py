@@ -21,8 +21,10 @@ by the HMC.
 
 from __future__ import absolute_import
 import time
+from requests.utils import quote
 
 from ._logging import get_logger, logged_api_call
+from ._exceptions import HTTPError
 from ._utils import repr_dict, repr_timestamp
 
 __all__ = ['BaseResource']
@@ -91,7 +93,12 @@ class BaseResource(object):
         else:
             self._properties[uri_prop] = uri
 
-        self._properties_timestamp = int(time.time())
+        now = time.time()
+        self._properties_timestamp = int(now)
+        # Key: property name, value: point in time of its retrieval, as Unix
+        # time. Properties without an entry (e.g. properties that were
+        # modified locally) use self._properties_timestamp.
+        self._property_timestamps = dict.fromkeys(self._properties, now)
         self._full_properties = False
 
     @property
@@ -186,6 +193,26 @@ class BaseResource(object):
         """
         return self._properties_timestamp
 
+    def property_timestamp(self, name):
+        """
+        Return the point in time of the last retrieval of a resource property
+        cached in this object, as Unix time (a float that is the number of
+        seconds since the Unix epoch).
+
+        Parameters:
+
+          name (:term:`string`):
+            Name of the resource property.
+
+        Returns:
+
+          :term:`number`: The point in time, or `None` if the resource
+          property is not cached in this object.
+        """
+        if name not in self._properties:
+            return None
+        return self._property_timestamps.get(name, self._properties_timestamp)
+
     @logged_api_call
     def pull_full_properties(self):
         """
@@ -204,8 +231,84 @@ class BaseResource(object):
           :exc:`~zhmcclient.ConnectionError`
         """
         full_properties = self.manager.session.get(self._uri)
+        self._set_full_properties(full_properties)
+
+    @logged_api_call
+    def pull_properties(self, properties):
+        """
+        Retrieve the specified subset of resource properties and cache them in
+        this object, in addition to the resource properties that are already
+        cached.
+
+        This uses the 'properties' query parameter of the 'Get <resource>
+        Properties' operations, so that the HMC only needs to produce the
+        specified resource properties. If the HMC does not support that query
+        parameter for the resource, the full set of resource properties is
+        retrieved instead (and is cached in this object).
+
+        Resource properties that do not exist for the resource are not
+        returned by the HMC and are therefore not cached.
+
+        Authorization requirements:
+
+        * Object-access permission to this resource.
+
+        Parameters:
+
+          properties (:term:`iterable` of :term:`string`):
+            Names of the resource properties to be retrieved, using the names
+            defined in the respective 'Data model' sections in the
+            :term:`HMC API` book.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        session = self.manager.session
+        class_name = self.manager.class_name
+        # pylint: disable=protected-access
+        if class_name in session._properties_parm_unsupported:
+            self.pull_full_properties()
+            return
+        uri = '{}?properties={}'.format(
+            self._uri, quote(','.join(properties), safe=','))
+        try:
+            props = session.get(uri)
+        except HTTPError as exc:
+            if exc.http_status != 400:
+                raise
+            # The HMC does not support the 'properties' query parameter for
+            # this resource type.
+            LOG.debug("HMC rejected the 'properties' query parameter for "
+                      "%s resources, retrieving the full set of properties "
+                      "instead: %s", class_name, exc)
+            session._properties_parm_unsupported.add(class_name)
+            self.pull_full_properties()
+            return
+        self._merge_properties(props)
+
+    def _merge_properties(self, properties):
+        """
+        Merge the specified resource properties, as retrieved from the HMC,
+        into the properties cached in this object.
+        """
+        now = time.time()
+        self._properties.update(properties)
+        self._properties_timestamp = int(now)
+        self._property_timestamps.update(dict.fromkeys(properties, now))
+
+    def _set_full_properties(self, full_properties):
+        """
+        Replace the properties cached in this object with the specified full
+        set of resource properties, as retrieved from the HMC.
+        """
+        now = time.time()
         self._properties = dict(full_properties)
-        self._properties_timestamp = int(time.time())
+        self._properties_timestamp = int(now)
+        self._property_timestamps = dict.fromkeys(self._properties, now)
         self._full_properties = True
 
     @logged_api_call
@@ -217,6 +320,11 @@ class BaseResource(object):
         of resource properties is retrieved and cached in this object, and the
         resource property is again attempted to be returned.
 
+        If the session has a max age policy (see
+        :class:`~zhmcclient.MaxAgePolicy`) and the cached resource property is
+        stale, all stale resource properties cached in this object are
+        retrieved again before the resource property is returned.
+
         Authorization requirements:
 
         * Object-access permission to this resource.
@@ -240,13 +348,29 @@ class BaseResource(object):
           :exc:`~zhmcclient.AuthError`
           :exc:`~zhmcclient.ConnectionError`
         """
+        # Asynchronous sessions have no max age policy
+        policy = getattr(self.manager.session, 'max_age_policy', None)
         try:
-            return self._properties[name]
+            value = self._properties[name]
         except KeyError:
             if self._full_properties:
                 raise
+            if policy is not None:
+                policy._count('misses')  # pylint: disable=protected-access
             self.pull_full_properties()
             return self._properties[name]
+        if policy is None:
+            return value
+        # pylint: disable=protected-access
+        now = time.time()
+        if not policy.is_stale(name, self.property_timestamp(name), now):
+            policy._count('hits')
+            return value
+        policy._count('refreshes')
+        stale_names = [n for n in self._properties
+                       if policy.is_stale(n, self.property_timestamp(n), now)]
+        self.pull_properties(stale_names)
+        return self._properties[name]
 
     @logged_api_call
     def prop(self, name, default=None):
@@ -256,7 +380,9 @@ class BaseResource(object):
 
         If the resource property is not cached in this object yet, the full set
         of resource properties is retrieved and cached in this object, and the
-        resource property is again attempted to be returned.
+        resource property is again attempted to be returned. Stale resource
+        properties are handled as described for
+        :meth:`~zhmcclient.BaseResource.get_property`.
 
         Authorization requirements:
 
@@ -0,0 +1,298 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The :class:`~zhmcclient.ResponseCache` class is a read-through cache for the
+results of HTTP GET requests of a :class:`~zhmcclient.Session` object.
+
+A response cache is enabled for a session by passing it to the
+:class:`~zhmcclient.Session` object via its `response_cache` init parameter.
+It caches the results of :meth:`~zhmcclient.Session.get` for the URIs that
+have a time to live, and returns the cached results until their time to live
+expires, or until they are invalidated because the session performed a
+:meth:`~zhmcclient.Session.post` or :meth:`~zhmcclient.Session.delete` on a
+related URI.
+
+The response cache does not know about changes made by other sessions or
+other HMC users, so it should only be used for URIs whose results rarely
+change, or with times to live that are acceptable for the staleness of the
+results.
+
+Example::
+
+    import zhmcclient
+
+    cache = zhmcclient.ResponseCache(
+        ttls=[
+            (r'/api/version', 3600),
+            (r'/api/cpcs(\\?.*)?', 300),
+            (r'/api/cpcs/[^/]+', 60),
+        ])
+    session = zhmcclient.Session(hmc, userid, password,
+                                 response_cache=cache)
+    session.time_stats_keeper.enable()
+
+    client = zhmcclient.Client(session)
+    cpcs = client.cpcs.list()
+    cpcs = client.cpcs.list()  # served from the response cache
+
+    print(session.time_stats_keeper)
+"""
+
+from __future__ import absolute_import
+
+import re
+import time
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+
+from ._logging import get_logger, logged_api_call
+from ._constants import DEFAULT_RESPONSE_CACHE_MAXSIZE
+
+__all__ = ['ResponseCache']
+
+LOG = get_logger(__name__)
+
+# URIs whose results are never cached, because they are expected to change
+# between subsequent requests (job status, metrics) or are session-specific.
+_UNCACHEABLE_URIS = re.compile(
+    r'/api/(jobs|sessions|services/metrics)(/.*|\?.*)?$')
+
+
+class ResponseCache(object):
+    """
+    A read-through cache for the results of HTTP GET requests, with times to
+    live that are specified per URI pattern and a maximum number of entries
+    with least-recently-used (LRU) eviction.
+
+    A response cache object can be shared by multiple threads that use the
+    same session.
+
+    Cached results are invalidated when the session performs an HTTP POST or
+    DELETE request on:
+
+    * the URI of the cached result (e.g. "Create Partition" on
+      ``/api/cpcs/{cpc-id}/partitions`` invalidates the cached partition
+      list of that CPC),
+    * a URI below that URI (e.g. an operation on
+      ``/api/partitions/{partition-id}/operations/start`` invalidates the
+      cached properties of that partition),
+    * a URI above that URI (e.g. "Delete Partition" on
+      ``/api/partitions/{partition-id}`` invalidates the cached properties
+      of the NICs of that partition).
+
+    Any query parameters in the URIs are ignored for this purpose.
+
+    The results of the URIs for jobs, sessions and metrics are never cached,
+    regardless of the times to live.
+
+    The session counts the cache hits and misses in counters of its
+    :attr:`~zhmcclient.Session.time_stats_keeper` named
+    "get {uri} (cache hit)" and "get {uri} (cache miss)". Requests for URIs
+    that are not cached are not counted.
+    """
+
+    def __init__(self, ttls=None, default_ttl=0,
+                 maxsize=DEFAULT_RESPONSE_CACHE_MAXSIZE):
+        """
+        Parameters:
+
+          ttls (:term:`iterable` of tuple(pattern, ttl)):
+            Times to live for URI patterns, where:
+
+            - pattern (:term:`string`): Regular expression that is matched
+              against the entire URI of the request, including any query
+              parameters.
+            - ttl (:term:`number`): Time to live in seconds for the cached
+              results of matching URIs. The special value 0 means that
+              the results are not cached.
+
+            The first matching pattern determines the time to live of a URI.
+            `None` means that no patterns are specified.
+
+          default_ttl (:term:`number`):
+            Time to live in seconds for the cached results of URIs that do not
+            match any of the patterns. The special value 0 means that the
+            results are not cached.
+
+          maxsize (:term:`integer`):
+            Maximum number of cached results. When the maximum is reached,
+            the least recently used result is removed from the cache.
+        """
+        self._ttls = []  # list of tuple(compiled pattern, ttl)
+        if ttls:
+            for pattern, ttl in ttls:
+                self._ttls.append((re.compile(pattern + '$'), ttl))
+        self._default_ttl = default_ttl
+        self._maxsize = maxsize
+
+        # The cached results, in the order of their last use, with:
+        # Key (string): URI of the request
+        # Value: tuple(expiration time, result)
+        self._entries = OrderedDict()
+
+        # Number of invalidations, used for detecting results that were
+        # retrieved while the cache was invalidated.
+        self._generation = 0
+
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        """
+        Return a string with the state of this response cache, for debug
+        purposes.
+        """
+        ret = (
+            "{classname} at 0x{id:08x} (\n"
+            "  _ttls = {s._ttls!r}\n"
+            "  _default_ttl = {s._default_ttl!r}\n"
+            "  _maxsize = {s._maxsize!r}\n"
+            "  len(_entries) = {num}\n"
+            ")".format(classname=self.__class__.__name__, id=id(self), s=self,
+                       num=len(self._entries)))
+        return ret
+
+    @property
+    def maxsize(self):
+        """
+        :term:`integer`: Maximum number of cached results.
+        """
+        return self._maxsize
+
+    @property
+    def default_ttl(self):
+        """
+        :term:`number`: Time to live in seconds for the cached results of URIs
+        that do not match any of the URI patterns.
+        """
+        return self._default_ttl
+
+    def __len__(self):
+        """
+        Return the number of cached results, including expired results that
+        have not been removed yet.
+        """
+        return len(self._entries)
+
+    def ttl(self, uri):
+        """
+        Return the time to live in seconds for the results of a URI.
+
+        Parameters:
+
+          uri (:term:`string`): URI of the request, including any query
+            parameters.
+
+        Returns:
+
+          :term:`number`: Time to live in seconds. 0 means that the results
+          of the URI are not cached.
+        """
+        if _UNCACHEABLE_URIS.match(uri):
+            return 0
+        for pattern, ttl in self._ttls:
+            if pattern.match(uri):
+                return ttl
+        return self._default_ttl
+
+    def generation(self):
+        """
+        Return the current invalidation generation of the cache.
+
+        The value returned by this method before retrieving a result must be
+        passed to :meth:`~zhmcclient.ResponseCache.put` when storing that
+        result, so that results that were retrieved while the cache was
+        invalidated are not stored.
+        """
+        return self._generation
+
+    def get(self, uri):
+        """
+        Return a copy of the cached result for a URI, or `None` if there is
+        no (unexpired) cached result for the URI.
+
+        Parameters:
+
+          uri (:term:`string`): URI of the request, including any query
+            parameters.
+        """
+        with self._lock:
+            try:
+                expires, result = self._entries.pop(uri)
+            except KeyError:
+                return None
+            if time.time() >= expires:
+                return None
+            self._entries[uri] = (expires, result)  # Most recently used
+        return deepcopy(result)
+
+    def put(self, uri, result, generation):
+        """
+        Store a copy of the result for a URI in the cache, if the URI has a
+        time to live and the cache has not been invalidated since the
+        specified generation.
+
+        Parameters:
+
+          uri (:term:`string`): URI of the request, including any query
+            parameters.
+
+          result (:term:`json object`): Result of the request.
+
+          generation (:term:`integer`): Invalidation generation of the cache
+            before the result was retrieved, as returned by
+            :meth:`~zhmcclient.ResponseCache.generation`.
+        """
+        ttl = self.ttl(uri)
+        if ttl <= 0:
+            return
+        result = deepcopy(result)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries.pop(uri, None)
+            self._entries[uri] = (time.time() + ttl, result)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)  # Least recently used
+
+    def invalidate(self, uri):
+        """
+        Invalidate the cached results that are related to a URI on which an
+        HTTP POST or DELETE request is performed.
+
+        For the rules, see :class:`~zhmcclient.ResponseCache`.
+
+        Parameters:
+
+          uri (:term:`string`): URI of the POST or DELETE request.
+        """
+        path = uri.split('?', 1)[0].rstrip('/')
+        with self._lock:
+            self._generation += 1
+            for entry_uri in list(self._entries.keys()):
+                entry_path = entry_uri.split('?', 1)[0].rstrip('/')
+                if entry_path == path or \
+                        entry_path.startswith(path + '/') or \
+                        path.startswith(entry_path + '/'):
+                    del self._entries[entry_uri]
+
+    @logged_api_call
+    def clear(self):
+        """
+        Remove all cached results.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
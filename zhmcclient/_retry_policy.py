@@ -0,0 +1,275 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The :class:`~zhmcclient.RetryPolicy` class defines how a
+:class:`~zhmcclient.Session` object retries idempotent HTTP requests that
+failed with a transient error.
+
+The retry/timeout configuration of a session (see
+:class:`~zhmcclient.RetryTimeoutConfig`) controls the retries of the
+underlying HTTP connections and reads. These retries do not cover errors that
+are returned by the HMC, such as HTTP status 503 (Service Unavailable) while
+the HMC is busy, or errors that occur after the retries are exhausted, such
+as connection resets during a failover of the HMC. A retry policy is enabled
+for a session by passing it to the :class:`~zhmcclient.Session` object via
+its `retry_policy` init parameter, and causes such failed requests to be
+retried with exponential backoff.
+
+Example::
+
+    import zhmcclient
+
+    policy = zhmcclient.RetryPolicy(max_retries=5, deadline=120)
+    session = zhmcclient.Session(hmc, userid, password, retry_policy=policy)
+    session.time_stats_keeper.enable()
+
+    . . .
+
+    print(session.time_stats_keeper.counters())
+"""
+
+from __future__ import absolute_import
+
+import time
+import random
+import threading
+
+from ._exceptions import HTTPError, ConnectionError, ReadTimeout, \
+    CircuitBreakerOpen
+
+__all__ = ['RetryPolicy']
+
+#: Transient errors that are retried by default, as a list of tuple(HTTP
+#: status code, HMC reason code), where a reason code of `None` matches any
+#: reason code.
+_DEFAULT_TRANSIENT_ERRORS = [
+    (503, None),  # Service unavailable, e.g. HMC busy or restarting
+    (409, 1),  # Object busy performing some other operation
+]
+
+
+class RetryPolicy(object):
+    """
+    A policy for retrying idempotent HTTP requests that failed with a
+    transient error, with exponential backoff and jitter.
+
+    The following errors are considered transient:
+
+    * :exc:`~zhmcclient.HTTPError` exceptions with an HTTP status code and
+      HMC reason code that is in the `transient_errors` init parameter (by
+      default, HTTP status 503 with any reason code, and HTTP status 409 with
+      reason code 1 "object busy").
+    * :exc:`~zhmcclient.ConnectionError` exceptions, except for
+      :exc:`~zhmcclient.ReadTimeout` (because the HMC may still be
+      processing the request) and :exc:`~zhmcclient.CircuitBreakerOpen`
+      (because the HMC is considered unreachable).
+
+    The number of retries is limited in three ways:
+
+    * per request, by the maximum number of retries,
+    * per request, by a deadline for the request including all of its
+      retries,
+    * per session, by a retry budget, which is a maximum number of retries
+      within a period of time. The retry budget prevents a session from
+      multiplying the load on an HMC that is overloaded.
+
+    When a retry is not possible anymore, the last error is raised.
+
+    The session counts the retried requests and the requests that failed
+    with a transient error that was not retried anymore, in counters of its
+    :attr:`~zhmcclient.Session.time_stats_keeper` named
+    "{method} {uri} (retried)" and "{method} {uri} (retry failed)", where
+    {method} is the HTTP method in lower case.
+
+    A retry policy object can be shared by multiple sessions. Each session
+    has its own retry budget.
+    """
+
+    def __init__(self, max_retries=3, backoff_initial=0.5, backoff_factor=2,
+                 backoff_max=10, jitter=0.1, deadline=60, budget=10,
+                 budget_period=60, methods=('GET', 'DELETE'),
+                 transient_errors=None):
+        """
+        Parameters:
+
+          max_retries (:term:`integer`):
+            Maximum number of retries of a request.
+
+          backoff_initial (:term:`number`):
+            Time in seconds to wait before the first retry of a request.
+
+          backoff_factor (:term:`number`):
+            Factor by which the time to wait grows for each further retry of
+            the request.
+
+          backoff_max (:term:`number`):
+            Maximum time in seconds to wait before a retry of a request.
+
+          jitter (:term:`number`):
+            Jitter of the time to wait before a retry, as a fraction of that
+            time. For example, 0.1 randomizes the time by up to +/-10%.
+
+          deadline (:term:`number`):
+            Time in seconds from the start of a request after which no more
+            retries of the request are started. The special value 0 means that
+            there is no deadline.
+
+          budget (:term:`integer`):
+            Maximum number of retries of all requests of a session within the
+            budget period. The budget is refilled continuously.
+
+          budget_period (:term:`number`):
+            Period in seconds for the retry budget.
+
+          methods (:term:`iterable` of :term:`string`):
+            HTTP methods (in upper case) of the requests that are retried.
+            Only idempotent methods should be specified.
+
+          transient_errors (:term:`iterable` of tuple(http_status, reason)):
+            HTTP status codes and HMC reason codes of the
+            :exc:`~zhmcclient.HTTPError` exceptions that are considered
+            transient. A reason code of `None` matches any reason code.
+            `None` means HTTP status 503 with any reason code, and HTTP status
+            409 with reason code 1.
+        """
+        if transient_errors is None:
+            transient_errors = _DEFAULT_TRANSIENT_ERRORS
+        self._max_retries = max_retries
+        self._backoff_initial = backoff_initial
+        self._backoff_factor = backoff_factor
+        self._backoff_max = backoff_max
+        self._jitter = jitter
+        self._deadline = deadline
+        self._budget = budget
+        self._budget_period = budget_period
+        self._methods = tuple(methods)
+        self._transient_errors = list(transient_errors)
+
+    def __repr__(self):
+        """
+        Return a string with the state of this retry policy, for debug
+        purposes.
+        """
+        ret = (
+            "{classname}(max_retries={s._max_retries!r}, "
+            "backoff_initial={s._backoff_initial!r}, "
+            "backoff_factor={s._backoff_factor!r}, "
+            "backoff_max={s._backoff_max!r}, jitter={s._jitter!r}, "
+            "deadline={s._deadline!r}, budget={s._budget!r}, "
+            "budget_period={s._budget_period!r}, methods={s._methods!r}, "
+            "transient_errors={s._transient_errors!r})".
+            format(classname=self.__class__.__name__, s=self))
+        return ret
+
+    @property
+    def max_retries(self):
+        """
+        :term:`integer`: Maximum number of retries of a request.
+        """
+        return self._max_retries
+
+    @property
+    def deadline(self):
+        """
+        :term:`number`: Time in seconds from the start of a request after which
+        no more retries of the request are started, or 0 for no deadline.
+        """
+        return self._deadline
+
+    @property
+    def budget(self):
+        """
+        :term:`integer`: Maximum number of retries of all requests of a
+        session within the budget period.
+        """
+        return self._budget
+
+    @property
+    def budget_period(self):
+        """
+        :term:`number`: Period in seconds for the retry budget.
+        """
+        return self._budget_period
+
+    @property
+    def methods(self):
+        """
+        tuple of :term:`string`: HTTP methods of the requests that are
+        retried.
+        """
+        return self._methods
+
+    def is_transient(self, exc):
+        """
+        Return a boolean indicating whether an exception raised for a request
+        is a transient error.
+
+        Parameters:
+
+          exc (:exc:`~zhmcclient.Error`): The exception.
+        """
+        if isinstance(exc, HTTPError):
+            for http_status, reason in self._transient_errors:
+                if exc.http_status == http_status and \
+                        (reason is None or exc.reason == reason):
+                    return True
+            return False
+        return isinstance(exc, ConnectionError) and \
+            not isinstance(exc, (ReadTimeout, CircuitBreakerOpen))
+
+    def backoff_intervals(self):
+        """
+        Generator that yields the times in seconds to wait before the
+        retries of a request.
+        """
+        interval = self._backoff_initial
+        while True:
+            interval = min(interval, self._backoff_max)
+            yield interval * random.uniform(1 - self._jitter, 1 + self._jitter)
+            interval *= self._backoff_factor
+
+
+class _RetryBudget(object):
+    """
+    The retry budget of a session, as a token bucket that holds up to the
+    budget of a retry policy and is refilled with that budget per budget
+    period.
+    """
+
+    def __init__(self, budget, budget_period):
+        self._budget = budget
+        self._rate = float(budget) / budget_period
+        self._tokens = float(budget)
+        self._last_refill = time.time()
+        self._lock = threading.Lock()
+
+    def spend(self):
+        """
+        Spend one retry from the budget, if available.
+
+        Returns:
+
+          bool: Indicates whether a retry was available.
+        """
+        with self._lock:
+            now = time.time()
+            self._tokens = min(
+                self._budget,
+                self._tokens + (now - self._last_refill) * self._rate)
+            self._last_refill = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
@@ -21,27 +21,35 @@ from __future__ import absolute_import
 import json
 import time
 import re
+import random
 import collections
+import threading
 import six
-from copy import copy
-try:
-    from collections import OrderedDict
-except ImportError:
-    from ordereddict import OrderedDict
+from copy import copy, deepcopy
+from contextlib import contextmanager
 import requests
 from requests.packages import urllib3
 
-from ._exceptions import HTTPError, ServerAuthError, ClientAuthError, \
-    ConnectionError, ParseError, ConnectTimeout, ReadTimeout, \
-    RetriesExceeded, OperationTimeout
+from ._exceptions import Error, HTTPError, ServerAuthError, \
+    ClientAuthError, ConnectionError, ParseError, ConnectTimeout, \
+    ReadTimeout, RetriesExceeded, OperationTimeout
 from ._timestats import TimeStatsKeeper
+from ._json_codec import JsonCodec
+from ._job_group import JobGroup
+from ._notification import _JobNotifier
+from ._retry_policy import _RetryBudget
+from ._deadline import Deadline, _activated
 from ._logging import get_logger, logged_api_call
 from ._constants import DEFAULT_CONNECT_TIMEOUT, DEFAULT_CONNECT_RETRIES, \
     DEFAULT_READ_TIMEOUT, DEFAULT_READ_RETRIES, DEFAULT_MAX_REDIRECTS, \
     DEFAULT_OPERATION_TIMEOUT, DEFAULT_STATUS_TIMEOUT, \
-    DEFAULT_NAME_URI_CACHE_TIMETOLIVE, HMC_LOGGER_NAME, \
+    DEFAULT_NAME_URI_CACHE_TIMETOLIVE, DEFAULT_NAME_URI_CACHE_MAXSIZE, \
+    DEFAULT_NAME_URI_CACHE_NEGATIVE_TIMETOLIVE, HMC_LOGGER_NAME, \
     HTML_REASON_WEB_SERVICES_DISABLED, HTML_REASON_OTHER, \
-    DEFAULT_HMC_PORT
+    DEFAULT_HMC_PORT, DEFAULT_POOL_MAXSIZE, DEFAULT_POOL_BLOCK, \
+    DEFAULT_STREAM_CHUNK_SIZE, DEFAULT_JOB_POLL_INITIAL, \
+    DEFAULT_JOB_POLL_MAX, DEFAULT_JOB_POLL_FACTOR, DEFAULT_JOB_POLL_JITTER, \
+    DEFAULT_LIST_CONCURRENCY
 
 __all__ = ['Session', 'Job', 'RetryTimeoutConfig', 'get_password_interface']
 
@@ -55,12 +63,84 @@ _STD_HEADERS = {
     'Accept': '*/*'
 }
 
+# JSON codec used when none is specified: Python json module, OrderedDict
+_DEFAULT_JSON_CODEC = JsonCodec()
+
+# Initial intervals in seconds for polling the jobs of asynchronous HMC
+# operations that are known to take long, as a list of tuple(method,
+# compiled pattern for the operation URI, initial interval). The first
+# matching entry is used. The intervals are never shorter than the
+# job_poll_initial attribute of the retry/timeout configuration.
+_JOB_POLL_HINTS = [
+    ('POST', re.compile(
+        r'/api/cpcs/[^/]+/operations/(start|stop|activate|deactivate)$'),
+     10),
+    ('POST', re.compile(
+        r'/api/cpcs/[^/]+/operations/(set-cpc-power-save|'
+        r'set-cpc-power-capping|import-profiles|export-profiles)$'),
+     5),
+    ('POST', re.compile(
+        r'/api/logical-partitions/[^/]+/operations/(activate|deactivate|'
+        r'load|scsi-load|scsi-dump|psw-restart|reset-clear)$'),
+     5),
+    ('POST', re.compile(
+        r'/api/partitions/[^/]+/operations/(scsi-dump|psw-restart)$'),
+     5),
+    ('POST', re.compile(
+        r'/api/partitions/[^/]+/operations/(start|stop)$'),
+     2),
+]
+
+
+def _body_data(body, headers, json_codec=None):
+    """
+    Return the data for the HTTP body of a POST request, from the request body
+    specified by the caller. The content type in the specified HTTP headers is
+    adjusted as needed.
+
+    Parameters:
+      body: Request body, as described for :meth:`Session.post`.
+      headers (dict): HTTP headers for the request. Will be updated.
+      json_codec (JsonCodec): JSON codec for encoding a dict body, or `None`
+        for the default JSON codec.
+
+    Raises:
+      TypeError: Body has invalid type.
+    """
+    if body is None:
+        data = None
+    elif isinstance(body, dict):
+        if json_codec is None:
+            json_codec = _DEFAULT_JSON_CODEC
+        data = json_codec.dumps(body)
+        # Content-type is already set in standard headers.
+    elif isinstance(body, six.text_type):
+        data = body.encode('utf-8')
+        headers['Content-type'] = 'application/octet-stream'
+    elif isinstance(body, six.binary_type):
+        data = body
+        headers['Content-type'] = 'application/octet-stream'
+    elif isinstance(body, collections.Iterable):
+        # For example, open files: open(), io.open()
+        data = body
+        headers['Content-type'] = 'application/octet-stream'
+    else:
+        raise TypeError("Body has invalid type: {}".format(type(body)))
+    return data
+
 
-def _handle_request_exc(exc, retry_timeout_config):
+def _handle_request_exc(exc, retry_timeout_config, deadline=None):
     """
     Handle a :exc:`request.exceptions.RequestException` exception that was
     raised.
+
+    If the deadline of the request has expired, the exception is handled as
+    :exc:`~zhmcclient.DeadlineExceeded`, because the timeouts of the request
+    were limited by the deadline.
     """
+    if deadline is not None:
+        deadline.check("the HTTP request ({})".
+                       format(_request_exc_message(exc)))
     if isinstance(exc, requests.exceptions.ConnectTimeout):
         raise ConnectTimeout(_request_exc_message(exc), exc,
                              retry_timeout_config.connect_timeout,
@@ -122,7 +202,11 @@ class RetryTimeoutConfig(object):
     def __init__(self, connect_timeout=None, connect_retries=None,
                  read_timeout=None, read_retries=None, max_redirects=None,
                  operation_timeout=None, status_timeout=None,
-                 name_uri_cache_timetolive=None):
+                 name_uri_cache_timetolive=None, pool_maxsize=None,
+                 pool_block=None, job_poll_initial=None, job_poll_max=None,
+                 job_poll_factor=None, job_poll_jitter=None,
+                 list_concurrency=None, name_uri_cache_maxsize=None,
+                 name_uri_cache_negative_timetolive=None):
         """
         For all parameters, `None` means that this object does not specify a
         value for the parameter, and that a default value should be used
@@ -172,6 +256,55 @@ class RetryTimeoutConfig(object):
             seconds since the last invalidation. The special value 0 means
             that no Name-URI cache is maintained (i.e. the caching is
             disabled).
+
+          pool_maxsize (:term:`integer`): Maximum number of HTTP connections
+            that are kept in the connection pool of the session, for reuse by
+            subsequent requests. When a session is used concurrently by
+            multiple threads, this should be at least the number of threads,
+            in order to avoid new SSL/TLS handshakes.
+
+          pool_block (bool): Boolean controlling what happens when all HTTP
+            connections in the connection pool are in use. If `True`, a
+            request waits until a connection becomes available. If `False`,
+            a new connection is created for the request and is discarded
+            afterwards.
+
+          job_poll_initial (:term:`number`): Interval in seconds before the
+            first repeated status check when polling for completion of a job.
+            Asynchronous HMC operations that are known to take long (e.g.
+            starting a partition) use a longer initial interval.
+
+          job_poll_max (:term:`number`): Maximum interval in seconds between
+            status checks when polling for completion of a job.
+
+          job_poll_factor (:term:`number`): Factor by which the interval
+            between status checks grows after each status check when polling
+            for completion of a job. The value 1 means that the interval
+            stays the same.
+
+          job_poll_jitter (:term:`number`): Jitter of the interval between
+            status checks when polling for completion of a job, as a fraction
+            of the interval. For example, 0.1 randomizes each interval by up to
+            +/-10%, so that many jobs that were started at the same time do not
+            check their status at the same time. The value 0 means that the
+            intervals are not randomized.
+
+          list_concurrency (:term:`integer`): Maximum number of concurrent
+            retrievals of the full set of resource properties, when listing
+            resources with full properties (e.g.
+            ``partitions.list(full_properties=True)``). The value 1 means that
+            the properties are retrieved one resource after the other. This
+            should not be larger than `pool_maxsize`.
+
+          name_uri_cache_maxsize (:term:`integer`): Maximum number of entries
+            in the Name-URI cache of manager objects. The least recently used
+            entries are evicted when the maximum is exceeded.
+
+          name_uri_cache_negative_timetolive (:term:`number`): Time in seconds
+            for which the Name-URI cache of manager objects remembers resource
+            names that were not found, so that repeated lookups of these
+            names do not cause HMC requests. The special value 0 means that
+            such names are not remembered.
         """
         self.connect_timeout = connect_timeout
         self.connect_retries = connect_retries
@@ -181,6 +314,16 @@ class RetryTimeoutConfig(object):
         self.operation_timeout = operation_timeout
         self.status_timeout = status_timeout
         self.name_uri_cache_timetolive = name_uri_cache_timetolive
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.job_poll_initial = job_poll_initial
+        self.job_poll_max = job_poll_max
+        self.job_poll_factor = job_poll_factor
+        self.job_poll_jitter = job_poll_jitter
+        self.list_concurrency = list_concurrency
+        self.name_uri_cache_maxsize = name_uri_cache_maxsize
+        self.name_uri_cache_negative_timetolive = \
+            name_uri_cache_negative_timetolive
 
         # Read retries only for these HTTP methods:
         self.method_whitelist = {'GET'}
@@ -188,7 +331,10 @@ class RetryTimeoutConfig(object):
     _attrs = ('connect_timeout', 'connect_retries', 'read_timeout',
               'read_retries', 'max_redirects', 'operation_timeout',
               'status_timeout', 'name_uri_cache_timetolive',
-              'method_whitelist')
+              'pool_maxsize', 'pool_block', 'job_poll_initial',
+              'job_poll_max', 'job_poll_factor', 'job_poll_jitter',
+              'list_concurrency', 'name_uri_cache_maxsize',
+              'name_uri_cache_negative_timetolive', 'method_whitelist')
 
     def override_with(self, override_config):
         """
@@ -243,6 +389,13 @@ class Session(object):
     requests against the HMC API. Instance variable
     :attr:`~zhmcclient.Session.time_stats_keeper` is used to enable/disable the
     measurements, and to print the statistics.
+
+    A session object can be shared by multiple threads. Logon and re-logon are
+    serialized, so that an expired session-id that is detected by multiple
+    threads at the same time causes only a single re-logon. The size of the
+    HTTP connection pool that is shared by these threads can be configured via
+    the `pool_maxsize` and `pool_block` attributes of
+    :class:`~zhmcclient.RetryTimeoutConfig`.
     """
 
     default_rt_config = RetryTimeoutConfig(
@@ -254,11 +407,25 @@ class Session(object):
         operation_timeout=DEFAULT_OPERATION_TIMEOUT,
         status_timeout=DEFAULT_STATUS_TIMEOUT,
         name_uri_cache_timetolive=DEFAULT_NAME_URI_CACHE_TIMETOLIVE,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        pool_block=DEFAULT_POOL_BLOCK,
+        job_poll_initial=DEFAULT_JOB_POLL_INITIAL,
+        job_poll_max=DEFAULT_JOB_POLL_MAX,
+        job_poll_factor=DEFAULT_JOB_POLL_FACTOR,
+        job_poll_jitter=DEFAULT_JOB_POLL_JITTER,
+        list_concurrency=DEFAULT_LIST_CONCURRENCY,
+        name_uri_cache_maxsize=DEFAULT_NAME_URI_CACHE_MAXSIZE,
+        name_uri_cache_negative_timetolive=(
+            DEFAULT_NAME_URI_CACHE_NEGATIVE_TIMETOLIVE),
     )
 
     def __init__(self, host, userid=None, password=None, session_id=None,
                  get_password=None, retry_timeout_config=None,
-                 port=DEFAULT_HMC_PORT):
+                 port=DEFAULT_HMC_PORT, coalesce_gets=False,
+                 response_cache=None, json_codec=None,
+                 job_notifications=False, rate_limiter=None,
+                 retry_policy=None, circuit_breaker=None, token_store=None,
+                 max_age_policy=None, name_uri_cache_store=None):
         """
         Creating a session object will not immediately cause a logon to be
         attempted; the logon is deferred until needed.
@@ -336,6 +503,53 @@ class Session(object):
             HMC TCP port. Defaults to
             :attr:`~zhmcclient._constants.DEFAULT_HMC_PORT`.
             For details, see the :attr:`~zhmcclient.Session.port` property.
+
+          coalesce_gets (bool):
+            Enables the coalescing of identical concurrent HTTP GET requests.
+            For details, see the :attr:`~zhmcclient.Session.coalesce_gets`
+            property.
+
+          response_cache (:class:`~zhmcclient.ResponseCache`):
+            Response cache for the results of HTTP GET requests of this
+            session, or `None` for not caching them.
+
+          json_codec (:class:`~zhmcclient.JsonCodec`):
+            JSON codec for encoding the request bodies and decoding the
+            response bodies of this session. `None` means that the JSON codec
+            of the Python standard library is used, and that JSON objects are
+            returned as :class:`py:collections.OrderedDict` objects.
+
+          job_notifications (bool):
+            Enables waiting for job completion based on HMC notifications.
+            For details, see the :attr:`~zhmcclient.Session.job_notifications`
+            property.
+
+          rate_limiter (:class:`~zhmcclient.RateLimiter`):
+            Rate limiter for the HTTP requests of this session, or `None` for
+            not limiting them.
+
+          retry_policy (:class:`~zhmcclient.RetryPolicy`):
+            Policy for retrying idempotent HTTP requests of this session that
+            failed with a transient error, or `None` for not retrying them.
+
+          circuit_breaker (:class:`~zhmcclient.CircuitBreaker`):
+            Circuit breaker for the HTTP requests of this session, or `None`
+            for not using a circuit breaker.
+
+          token_store (:class:`~zhmcclient.SessionTokenStore`):
+            Session token store for sharing the session-id of this session
+            with other processes, or `None` for not sharing it. Requires that
+            `userid` is specified.
+
+          max_age_policy (:class:`~zhmcclient.MaxAgePolicy`):
+            Policy for the maximum age of the resource properties cached in
+            the resource objects of this session, or `None` for using cached
+            resource properties regardless of their age.
+
+          name_uri_cache_store (:class:`~zhmcclient.NameUriCacheStore`):
+            Name-URI cache store for sharing the Name-URI caches of the
+            resource managers of this session with other resource managers
+            and sessions, or `None` for not sharing them.
         """
         self._host = host
         self._port = port
@@ -349,6 +563,10 @@ class Session(object):
             host=self._host,
             port=self._port)
         self._headers = copy(_STD_HEADERS)  # dict with standard HTTP headers
+        # Lock for serializing logon, re-logon and logoff across threads. The
+        # dict in self._headers is never modified while it is in use; it is
+        # replaced with a modified copy instead.
+        self._logon_lock = threading.RLock()
         if session_id is not None:
             # Create a logged-on state (same state as in _do_logon())
             self._session_id = session_id
@@ -359,6 +577,35 @@ class Session(object):
             self._session_id = None
             self._session = None
         self._time_stats_keeper = TimeStatsKeeper()
+        self._coalesce_gets = coalesce_gets
+        self._response_cache = response_cache
+        self._json_codec = json_codec if json_codec is not None \
+            else _DEFAULT_JSON_CODEC
+        # HTTP GET requests in progress, for coalescing them:
+        # Key: tuple(uri, logon_required)
+        # Value: _InflightRequest object
+        self._inflight_gets = {}
+        self._inflight_lock = threading.Lock()
+        self._job_notifications = job_notifications
+        # Receiver of job completion notifications, if started:
+        self._job_notifier = None
+        self._job_notifier_session_id = None
+        self._job_notifier_failed = False
+        self._job_notifier_lock = threading.Lock()
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        if retry_policy is not None:
+            self._retry_budget = _RetryBudget(retry_policy.budget,
+                                              retry_policy.budget_period)
+        else:
+            self._retry_budget = None
+        self._circuit_breaker = circuit_breaker
+        self._token_store = token_store
+        self._max_age_policy = max_age_policy
+        self._name_uri_cache_store = name_uri_cache_store
+        # Resource class names for which the HMC rejected the 'properties'
+        # query parameter of the 'Get <resource> Properties' operations:
+        self._properties_parm_unsupported = set()
 
     def __repr__(self):
         """
@@ -375,6 +622,17 @@ class Session(object):
             "  _headers = {s._headers!r}\n"
             "  _session_id = {s._session_id!r}\n"
             "  _session = {s._session!r}\n"
+            "  _coalesce_gets = {s._coalesce_gets!r}\n"
+            "  _response_cache = {s._response_cache!r}\n"
+            "  _json_codec = {s._json_codec!r}\n"
+            "  _job_notifications = {s._job_notifications!r}\n"
+            "  _job_notifier = {s._job_notifier!r}\n"
+            "  _rate_limiter = {s._rate_limiter!r}\n"
+            "  _retry_policy = {s._retry_policy!r}\n"
+            "  _circuit_breaker = {s._circuit_breaker!r}\n"
+            "  _token_store = {s._token_store!r}\n"
+            "  _max_age_policy = {s._max_age_policy!r}\n"
+            "  _name_uri_cache_store = {s._name_uri_cache_store!r}\n"
             ")".format(classname=self.__class__.__name__, id=id(self), s=self))
         return ret
 
@@ -470,6 +728,142 @@ class Session(object):
         """
         return self._time_stats_keeper
 
+    @property
+    def coalesce_gets(self):
+        """
+        bool: Indicates whether identical concurrent HTTP GET requests are
+        coalesced.
+
+        If `True`, an HTTP GET request for a URI for which an identical HTTP
+        GET request of this session is already in progress (e.g. in another
+        thread) is not sent to the HMC. Instead, the caller waits for the
+        request in progress to complete and gets a copy of its result (or the
+        same exception). This reduces the load on the HMC when many threads
+        retrieve the same resource at the same time.
+
+        The number of HTTP GET requests that were saved this way is counted
+        in the :attr:`~zhmcclient.Session.time_stats_keeper` of this session,
+        in counters named "get {uri} (coalesced)".
+
+        This property can be set, in order to enable or disable the
+        coalescing.
+        """
+        return self._coalesce_gets
+
+    @coalesce_gets.setter
+    def coalesce_gets(self, value):
+        self._coalesce_gets = value
+
+    @property
+    def response_cache(self):
+        """
+        :class:`~zhmcclient.ResponseCache`: Response cache for the results of
+        HTTP GET requests of this session, or `None` if they are not cached.
+
+        For details, see :class:`~zhmcclient.ResponseCache`.
+        """
+        return self._response_cache
+
+    @property
+    def rate_limiter(self):
+        """
+        :class:`~zhmcclient.RateLimiter`: Rate limiter for the HTTP requests
+        of this session, or `None` if they are not limited.
+
+        For details, see :class:`~zhmcclient.RateLimiter`.
+        """
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self):
+        """
+        :class:`~zhmcclient.RetryPolicy`: Policy for retrying idempotent HTTP
+        requests of this session that failed with a transient error, or `None`
+        if they are not retried.
+
+        For details, see :class:`~zhmcclient.RetryPolicy`.
+        """
+        return self._retry_policy
+
+    @property
+    def circuit_breaker(self):
+        """
+        :class:`~zhmcclient.CircuitBreaker`: Circuit breaker for the HTTP
+        requests of this session, or `None` if there is none.
+
+        The state of the circuit breaker indicates whether the HMC is
+        considered reachable. For details, see
+        :class:`~zhmcclient.CircuitBreaker`.
+        """
+        return self._circuit_breaker
+
+    @property
+    def token_store(self):
+        """
+        :class:`~zhmcclient.SessionTokenStore`: Session token store for
+        sharing the session-id of this session with other processes, or `None`
+        if it is not shared.
+
+        For details, see :class:`~zhmcclient.SessionTokenStore`.
+        """
+        return self._token_store
+
+    @property
+    def max_age_policy(self):
+        """
+        :class:`~zhmcclient.MaxAgePolicy`: Policy for the maximum age of the
+        resource properties cached in the resource objects of this session,
+        or `None` if cached resource properties are used regardless of their
+        age.
+
+        For details, see :class:`~zhmcclient.MaxAgePolicy`.
+        """
+        return self._max_age_policy
+
+    @property
+    def name_uri_cache_store(self):
+        """
+        :class:`~zhmcclient.NameUriCacheStore`: Name-URI cache store for
+        sharing the Name-URI caches of the resource managers of this session,
+        or `None` if they are not shared.
+
+        For details, see :class:`~zhmcclient.NameUriCacheStore`.
+        """
+        return self._name_uri_cache_store
+
+    @property
+    def json_codec(self):
+        """
+        :class:`~zhmcclient.JsonCodec`: JSON codec for encoding the request
+        bodies and decoding the response bodies of this session.
+        """
+        return self._json_codec
+
+    @property
+    def job_notifications(self):
+        """
+        bool: Indicates whether waiting for job completion is based on HMC
+        notifications.
+
+        If `True`, the first :meth:`~zhmcclient.Job.wait_for_completion` of
+        this session starts a :class:`~zhmcclient.NotificationReceiver` for the
+        job notification topic of this session (see
+        :meth:`~zhmcclient.Session.get_notification_topics`), which is then
+        shared by all jobs of this session. A job that waits for its
+        completion is woken up when the 'job-completion' notification for the
+        job is received, and the job status is polled only with the maximum
+        poll interval of the retry/timeout configuration, as a safety net in
+        case a notification is missed.
+
+        If the notification receiver cannot be started (e.g. because no
+        password is known for the session) or stops receiving notifications,
+        waiting for job completion falls back to polling with the regular
+        poll intervals.
+
+        If `False`, waiting for job completion is based on polling only.
+        """
+        return self._job_notifications
+
     @property
     def session_id(self):
         """
@@ -515,7 +909,11 @@ class Session(object):
           :exc:`~zhmcclient.ConnectionError`
         """
         if not self.is_logon(verify):
-            self._do_logon()
+            session_id = self._session_id
+            with self._logon_lock:
+                # Another thread may have logged on while we were waiting
+                if self._session_id == session_id:
+                    self._do_logon(session_id)
 
     @logged_api_call
     def logoff(self, verify=False):
@@ -537,7 +935,9 @@ class Session(object):
           :exc:`~zhmcclient.ConnectionError`
         """
         if self.is_logon(verify):
-            self._do_logoff()
+            with self._logon_lock:
+                if self._session_id is not None:
+                    self._do_logoff()
 
     @logged_api_call
     def is_logon(self, verify=False):
@@ -564,11 +964,19 @@ class Session(object):
                 return False
         return True
 
-    def _do_logon(self):
+    def _do_logon(self, expired_session_id=None):
         """
         Log on, unconditionally. This can be used to re-logon.
         This requires credentials to be provided.
 
+        If this session has a token store, the session-id in the token store
+        is reused instead, unless it is the expired session-id.
+
+        Parameters:
+
+          expired_session_id (:term:`string`): The session-id that was
+            rejected by the HMC as expired, or `None`.
+
         Raises:
 
           :exc:`~zhmcclient.ClientAuthError`
@@ -579,9 +987,42 @@ class Session(object):
         """
         if self._userid is None:
             raise ClientAuthError("Userid is not provided.")
+        with self._logon_lock:
+            store = self._token_store
+            if store is None:
+                self._do_logon_post()
+                return
+            with store.lock(self._host, self._userid):
+                session_id = store.get(self._host, self._userid)
+                if session_id is not None and \
+                        session_id != expired_session_id:
+                    LOG.debug("Reusing session-id from token store for "
+                              "userid %s on HMC %s", self._userid, self._host)
+                    self._set_session_id(session_id)
+                    return
+                self._do_logon_post()
+                store.put(self._host, self._userid, self._session_id)
+
+    def _set_session_id(self, session_id):
+        """
+        Set a session-id that was obtained without logging on, for a logged-on
+        state (same state as in _do_logon_post()). Must be called with the
+        logon lock held.
+        """
+        if self._session is None:
+            self._session = self._new_session(self.retry_timeout_config)
+        self._session_id = session_id
+        self._set_session_header(session_id)
+
+    def _do_logon_post(self):
+        """
+        Log on to the HMC with the 'Logon' operation, unconditionally. Must
+        be called with the logon lock held.
+        """
         if self._password is None:
             if self._get_password:
-                self._password = self._get_password(self._host, self._userid)
+                self._password = self._get_password(self._host,
+                                                    self._userid)
             else:
                 raise ClientAuthError("Password is not provided.")
         logon_uri = '/api/sessions'
@@ -589,11 +1030,225 @@ class Session(object):
             'userid': self._userid,
             'password': self._password
         }
-        self._headers.pop('X-API-Session', None)  # Just in case
-        self._session = self._new_session(self.retry_timeout_config)
+        self._set_session_header(None)  # Just in case
+        if self._session is None:
+            # On re-logon, the existing session and thus its connection
+            # pool is reused.
+            self._session = self._new_session(self.retry_timeout_config)
         logon_res = self.post(logon_uri, logon_body, logon_required=False)
         self._session_id = logon_res['api-session']
-        self._headers['X-API-Session'] = self._session_id
+        self._set_session_header(self._session_id)
+
+    def _do_relogon(self, expired_session_id):
+        """
+        Log on again, because the HMC has rejected the specified session-id
+        as expired.
+
+        If multiple threads detect the expiration of the same session-id, only
+        the first one performs the logon, and the others reuse the new
+        session-id.
+
+        Parameters:
+
+          expired_session_id (:term:`string`): The session-id that was used
+            in the rejected request, or `None`.
+
+        Raises:
+
+          :exc:`~zhmcclient.ClientAuthError`
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.HTTPError`
+        """
+        with self._logon_lock:
+            if self._session_id is None or \
+                    self._session_id == expired_session_id:
+                self._do_logon(expired_session_id)
+
+    def _request_timeout(self, method, uri, deadline):
+        """
+        Return the connect and read timeouts for an HTTP request, limited to
+        the remaining time of a deadline.
+
+        Raises:
+
+          :exc:`~zhmcclient.DeadlineExceeded`: The deadline has expired.
+        """
+        connect_timeout = self.retry_timeout_config.connect_timeout
+        read_timeout = self.retry_timeout_config.read_timeout
+        if deadline is not None:
+            deadline.check("HTTP request {} {}".format(method, uri))
+            remaining = deadline.remaining()
+            if connect_timeout is None or connect_timeout > remaining:
+                connect_timeout = remaining
+            if read_timeout is None or read_timeout > remaining:
+                read_timeout = remaining
+        return connect_timeout, read_timeout
+
+    def _retried(self, method, uri, func, *args):
+        """
+        Call a function that performs an HTTP request, and retry it according
+        to the retry policy of this session if it fails with a transient
+        error.
+
+        Parameters:
+
+          method (:term:`string`): HTTP method in upper case, e.g. 'GET'.
+
+          uri (:term:`string`): URI of the request.
+
+          func (callable): Function that performs the request.
+
+          args: Positional arguments for the function.
+
+        Returns:
+
+          The return value of the function.
+        """
+        policy = self._retry_policy
+        if policy is None or method not in policy.methods:
+            return func(*args)
+        if policy.deadline > 0:
+            deadline = time.time() + policy.deadline
+        else:
+            deadline = None
+        call_deadline = Deadline.current()
+        if call_deadline is not None and \
+                (deadline is None or call_deadline.expires_at < deadline):
+            deadline = call_deadline.expires_at
+        intervals = policy.backoff_intervals()
+        name = method.lower() + ' ' + uri
+        retries = 0
+        while True:
+            try:
+                return func(*args)
+            except Error as exc:
+                if not policy.is_transient(exc):
+                    raise
+                interval = next(intervals)
+                if retries >= policy.max_retries:
+                    reason = "retries exhausted"
+                elif deadline is not None and \
+                        time.time() + interval > deadline:
+                    reason = "deadline exceeded"
+                elif not self._retry_budget.spend():
+                    reason = "retry budget exhausted"
+                else:
+                    reason = None
+                if reason:
+                    LOG.debug("Not retrying %s %s (%s): %s",
+                              method, uri, reason, exc)
+                    self.time_stats_keeper.count(name + ' (retry failed)')
+                    raise
+                retries += 1
+                LOG.debug("Retrying %s %s in %.1f s (retry %s): %s",
+                          method, uri, interval, retries, exc)
+                self.time_stats_keeper.count(name + ' (retried)')
+                time.sleep(interval)
+
+    @contextmanager
+    def _rate_limited(self, method, uri):
+        """
+        Context manager that delays an HTTP request until it is within the
+        limits of the rate limiter of this session, and accounts for it as
+        being in flight while the context is active.
+
+        The delay is recorded in the time statistics keeper of this session.
+        """
+        limit = None
+        if self._rate_limiter is not None:
+            limit = self._rate_limiter.limit(method, uri)
+        if limit is None:
+            yield
+            return
+        delay = limit.acquire()
+        stats_name = 'rate limit ' + limit.name
+        # pylint: disable=protected-access
+        self.time_stats_keeper.get_stats(stats_name)._add_time(delay)
+        if delay > 0:
+            self.time_stats_keeper.count(stats_name + ' (delayed)')
+        try:
+            yield
+        finally:
+            limit.release()
+
+    @contextmanager
+    def _circuit_guarded(self, method, uri):
+        """
+        Context manager that lets an HTTP request fail fast if the circuit
+        breaker of this session is open, probes the HMC if the circuit breaker
+        allows a probe, and reports the outcome of the HTTP request that is
+        sent while the context is active to the circuit breaker.
+
+        Raises:
+
+          :exc:`~zhmcclient.CircuitBreakerOpen`: The circuit breaker is open.
+          :exc:`~zhmcclient.ConnectionError`: The probe failed.
+        """
+        breaker = self._circuit_breaker
+        if breaker is None:
+            yield
+            return
+        probe = breaker.before_request()
+        if probe and (method, uri) != ('GET', '/api/version'):
+            # The 'Query API Version' request itself is used as the probe
+            self._probe()
+            probe = False
+        try:
+            yield
+        except ConnectionError as exc:
+            breaker.failure(exc)
+            raise
+        except BaseException:
+            if probe:
+                breaker.abort_probe()
+            raise
+        else:
+            breaker.success()
+
+    def _probe(self):
+        """
+        Probe the HMC with the 'Query API Version' operation, and report the
+        outcome to the circuit breaker of this session.
+
+        Raises:
+
+          :exc:`~zhmcclient.ConnectionError`: The probe failed.
+        """
+        breaker = self._circuit_breaker
+        url = self.base_url + '/api/version'
+        req = self._session or requests
+        req_timeout = (self.retry_timeout_config.connect_timeout,
+                       self.retry_timeout_config.read_timeout)
+        LOG.debug("Probing HMC %s for circuit breaker", self.host)
+        try:
+            try:
+                req.get(url, headers=_STD_HEADERS, verify=False,
+                        timeout=req_timeout)
+            except requests.exceptions.RequestException as exc:
+                _handle_request_exc(exc, self.retry_timeout_config)
+        except ConnectionError as exc:
+            breaker.failure(exc)
+            raise
+        except BaseException:
+            breaker.abort_probe()
+            raise
+        breaker.success()
+
+    def _set_session_header(self, session_id):
+        """
+        Set or remove the session-id in the standard HTTP headers.
+
+        The headers dict is replaced instead of being modified in place, so
+        that requests of other threads that are in progress are not affected.
+        """
+        headers = copy(self._headers)
+        if session_id is None:
+            headers.pop('X-API-Session', None)
+        else:
+            headers['X-API-Session'] = session_id
+        self._headers = headers
 
     @staticmethod
     def _new_session(retry_timeout_config):
@@ -608,9 +1263,15 @@ class Session(object):
             redirect=retry_timeout_config.max_redirects)
         session = requests.Session()
         session.mount('https://',
-                      requests.adapters.HTTPAdapter(max_retries=retry))
+                      requests.adapters.HTTPAdapter(
+                          max_retries=retry,
+                          pool_maxsize=retry_timeout_config.pool_maxsize,
+                          pool_block=retry_timeout_config.pool_block))
         session.mount('http://',
-                      requests.adapters.HTTPAdapter(max_retries=retry))
+                      requests.adapters.HTTPAdapter(
+                          max_retries=retry,
+                          pool_maxsize=retry_timeout_config.pool_maxsize,
+                          pool_block=retry_timeout_config.pool_block))
         return session
 
     def _do_logoff(self):
@@ -625,10 +1286,16 @@ class Session(object):
           :exc:`~zhmcclient.HTTPError`
         """
         session_uri = '/api/sessions/this-session'
-        self.delete(session_uri, logon_required=False)
-        self._session_id = None
-        self._session = None
-        self._headers.pop('X-API-Session', None)
+        with self._logon_lock:
+            self._close_job_notifier()
+            if self._token_store is not None and self._userid is not None:
+                with self._token_store.lock(self._host, self._userid):
+                    self._token_store.remove(self._host, self._userid,
+                                             self._session_id)
+            self.delete(session_uri, logon_required=False)
+            self._session_id = None
+            self._session = None
+            self._set_session_header(None)
 
     @staticmethod
     def _log_http_request(method, url, headers=None, content=None):
@@ -686,6 +1353,14 @@ class Session(object):
         If the HMC session token is expired, this method re-logs on and retries
         the operation.
 
+        If the session has a response cache (see
+        :attr:`~zhmcclient.Session.response_cache`), an unexpired cached
+        result for the URI is returned without performing the request.
+
+        If the session has a retry policy (see
+        :attr:`~zhmcclient.Session.retry_policy`), the request is retried if it
+        fails with a transient error.
+
         Parameters:
 
           uri (:term:`string`):
@@ -711,42 +1386,105 @@ class Session(object):
           :exc:`~zhmcclient.ServerAuthError`
           :exc:`~zhmcclient.ConnectionError`
         """
+        cache = self._response_cache
+        if cache is None or cache.ttl(uri) <= 0:
+            return self._coalesce_get(uri, logon_required)
+
+        result = cache.get(uri)
+        if result is not None:
+            self.time_stats_keeper.count('get ' + uri + ' (cache hit)')
+            return result
+        self.time_stats_keeper.count('get ' + uri + ' (cache miss)')
+        generation = cache.generation()
+        result = self._coalesce_get(uri, logon_required)
+        cache.put(uri, result, generation)
+        return result
+
+    def _coalesce_get(self, uri, logon_required):
+        """
+        Perform the HTTP GET method, coalescing it with an identical request
+        in progress if enabled (see
+        :attr:`~zhmcclient.Session.coalesce_gets`).
+        """
+        if not self._coalesce_gets:
+            return self._retried('GET', uri, self._do_get, uri,
+                                 logon_required)
+
+        key = (uri, logon_required)
+        with self._inflight_lock:
+            inflight = self._inflight_gets.get(key, None)
+            if inflight is None:
+                inflight = _InflightRequest()
+                self._inflight_gets[key] = inflight
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            # An identical request is in progress; use its outcome
+            self.time_stats_keeper.count('get ' + uri + ' (coalesced)')
+            return inflight.wait()
+
+        try:
+            result = self._retried('GET', uri, self._do_get, uri,
+                                   logon_required)
+        except Exception as exc:
+            with self._inflight_lock:
+                del self._inflight_gets[key]
+            inflight.set_exception(exc)
+            raise
+        with self._inflight_lock:
+            del self._inflight_gets[key]
+        inflight.set_result(result)
+        return result
+
+    def _do_get(self, uri, logon_required):
+        """
+        Perform the HTTP GET method, unconditionally (i.e. without coalescing
+        it with identical requests in progress).
+
+        For details, see :meth:`~zhmcclient.Session.get`.
+        """
         if logon_required:
             self.logon()
         url = self.base_url + uri
-        self._log_http_request('GET', url, headers=self.headers)
+        headers = self.headers  # Standard headers, never modified in place
+        self._log_http_request('GET', url, headers=headers)
         stats = self.time_stats_keeper.get_stats('get ' + uri)
-        stats.begin()
         req = self._session or requests
-        req_timeout = (self.retry_timeout_config.connect_timeout,
-                       self.retry_timeout_config.read_timeout)
-        try:
-            result = req.get(url, headers=self.headers, verify=False,
-                             timeout=req_timeout)
-        except requests.exceptions.RequestException as exc:
-            _handle_request_exc(exc, self.retry_timeout_config)
-        finally:
-            stats.end()
+        deadline = Deadline.current()
+        req_timeout = self._request_timeout('GET', uri, deadline)
+        with self._circuit_guarded('GET', uri), \
+                self._rate_limited('GET', uri):
+            stats.begin()
+            try:
+                result = req.get(url, headers=headers, verify=False,
+                                 timeout=req_timeout)
+            except requests.exceptions.RequestException as exc:
+                _handle_request_exc(exc, self.retry_timeout_config,
+                                    deadline)
+            finally:
+                stats.end()
         self._log_http_response('GET', url,
                                 status=result.status_code,
                                 headers=result.headers,
                                 content=result.content)
 
         if result.status_code == 200:
-            return _result_object(result)
+            return _result_object(result, self._json_codec)
         elif result.status_code == 403:
-            result_object = _result_object(result)
+            result_object = _result_object(result, self._json_codec)
             reason = result_object.get('reason', None)
             if reason == 5:
                 # API session token expired: re-logon and retry
-                self._do_logon()
-                return self.get(uri, logon_required)
+                self._do_relogon(headers.get('X-API-Session', None))
+                return self._do_get(uri, logon_required)
             else:
                 msg = result_object.get('message', None)
                 raise ServerAuthError("HTTP authentication failed: {}".
                                       format(msg), HTTPError(result_object))
         else:
-            result_object = _result_object(result)
+            result_object = _result_object(result, self._json_codec)
             raise HTTPError(result_object)
 
     @logged_api_call
@@ -863,58 +1601,58 @@ class Session(object):
             waiting for completion of the asynchronous operation.
           :exc:`TypeError`: Body has invalid type.
         """
+        try:
+            return self._do_post(uri, body, logon_required,
+                                 wait_for_completion, operation_timeout)
+        finally:
+            if self._response_cache is not None:
+                self._response_cache.invalidate(uri)
+
+    def _do_post(self, uri, body, logon_required, wait_for_completion,
+                 operation_timeout):
+        """
+        Perform the HTTP POST method, without invalidating the response cache.
+
+        For details, see :meth:`~zhmcclient.Session.post`.
+        """
         if logon_required:
             self.logon()
         url = self.base_url + uri
         headers = self.headers.copy()  # Standard headers
-
-        if body is None:
-            data = None
-        elif isinstance(body, dict):
-            data = json.dumps(body)
-            # Content-type is already set in standard headers.
-        elif isinstance(body, six.text_type):
-            data = body.encode('utf-8')
-            headers['Content-type'] = 'application/octet-stream'
-        elif isinstance(body, six.binary_type):
-            data = body
-            headers['Content-type'] = 'application/octet-stream'
-        elif isinstance(body, collections.Iterable):
-            # For example, open files: open(), io.open()
-            data = body
-            headers['Content-type'] = 'application/octet-stream'
-        else:
-            raise TypeError("Body has invalid type: {}".format(type(body)))
+        data = _body_data(body, headers, self._json_codec)
 
         self._log_http_request('POST', url, headers=headers, content=data)
         req = self._session or requests
-        req_timeout = (self.retry_timeout_config.connect_timeout,
-                       self.retry_timeout_config.read_timeout)
+        deadline = Deadline.current()
+        req_timeout = self._request_timeout('POST', uri, deadline)
         if wait_for_completion:
             stats_total = self.time_stats_keeper.get_stats(
                 'post ' + uri + '+completion')
             stats_total.begin()
         try:
             stats = self.time_stats_keeper.get_stats('post ' + uri)
-            stats.begin()
-            try:
-                if data is None:
-                    result = req.post(url, headers=headers,
-                                      verify=False, timeout=req_timeout)
-                else:
-                    result = req.post(url, data=data, headers=headers,
-                                      verify=False, timeout=req_timeout)
-            except requests.exceptions.RequestException as exc:
-                _handle_request_exc(exc, self.retry_timeout_config)
-            finally:
-                stats.end()
+            with self._circuit_guarded('POST', uri), \
+                    self._rate_limited('POST', uri):
+                stats.begin()
+                try:
+                    if data is None:
+                        result = req.post(url, headers=headers,
+                                          verify=False, timeout=req_timeout)
+                    else:
+                        result = req.post(url, data=data, headers=headers,
+                                          verify=False, timeout=req_timeout)
+                except requests.exceptions.RequestException as exc:
+                    _handle_request_exc(exc, self.retry_timeout_config,
+                                        deadline)
+                finally:
+                    stats.end()
             self._log_http_response('POST', url,
                                     status=result.status_code,
                                     headers=result.headers,
                                     content=result.content)
 
             if result.status_code in (200, 201):
-                return _result_object(result)
+                return _result_object(result, self._json_codec)
             elif result.status_code == 204:
                 # No content
                 return None
@@ -927,7 +1665,7 @@ class Session(object):
                 else:
                     # This is the most common case to return 202: An
                     # asynchronous job has been started.
-                    result_object = _result_object(result)
+                    result_object = _result_object(result, self._json_codec)
                     job_uri = result_object['job-uri']
                     job = Job(self, job_uri, 'POST', uri)
                     if wait_for_completion:
@@ -935,19 +1673,20 @@ class Session(object):
                     else:
                         return job
             elif result.status_code == 403:
-                result_object = _result_object(result)
+                result_object = _result_object(result, self._json_codec)
                 reason = result_object.get('reason', None)
                 if reason == 5:
                     # API session token expired: re-logon and retry
-                    self._do_logon()
-                    return self.post(uri, body, logon_required)
+                    self._do_relogon(headers.get('X-API-Session', None))
+                    return self._do_post(uri, body, logon_required,
+                                         False, None)
                 else:
                     msg = result_object.get('message', None)
                     raise ServerAuthError("HTTP authentication failed: {}".
                                           format(msg),
                                           HTTPError(result_object))
             else:
-                result_object = _result_object(result)
+                result_object = _result_object(result, self._json_codec)
                 raise HTTPError(result_object)
         finally:
             if wait_for_completion:
@@ -964,6 +1703,10 @@ class Session(object):
         If the HMC session token is expired, this method re-logs on and retries
         the operation.
 
+        If the session has a retry policy (see
+        :attr:`~zhmcclient.Session.retry_policy`), the request is retried if it
+        fails with a transient error.
+
         Parameters:
 
           uri (:term:`string`):
@@ -986,22 +1729,39 @@ class Session(object):
           :exc:`~zhmcclient.ServerAuthError`
           :exc:`~zhmcclient.ConnectionError`
         """
+        try:
+            self._retried('DELETE', uri, self._do_delete, uri, logon_required)
+        finally:
+            if self._response_cache is not None:
+                self._response_cache.invalidate(uri)
+
+    def _do_delete(self, uri, logon_required):
+        """
+        Perform the HTTP DELETE method, without invalidating the response
+        cache.
+
+        For details, see :meth:`~zhmcclient.Session.delete`.
+        """
         if logon_required:
             self.logon()
         url = self.base_url + uri
-        self._log_http_request('DELETE', url, headers=self.headers)
+        headers = self.headers  # Standard headers, never modified in place
+        self._log_http_request('DELETE', url, headers=headers)
         stats = self.time_stats_keeper.get_stats('delete ' + uri)
-        stats.begin()
         req = self._session or requests
-        req_timeout = (self.retry_timeout_config.connect_timeout,
-                       self.retry_timeout_config.read_timeout)
-        try:
-            result = req.delete(url, headers=self.headers, verify=False,
-                                timeout=req_timeout)
-        except requests.exceptions.RequestException as exc:
-            _handle_request_exc(exc, self.retry_timeout_config)
-        finally:
-            stats.end()
+        deadline = Deadline.current()
+        req_timeout = self._request_timeout('DELETE', uri, deadline)
+        with self._circuit_guarded('DELETE', uri), \
+                self._rate_limited('DELETE', uri):
+            stats.begin()
+            try:
+                result = req.delete(url, headers=headers, verify=False,
+                                    timeout=req_timeout)
+            except requests.exceptions.RequestException as exc:
+                _handle_request_exc(exc, self.retry_timeout_config,
+                                    deadline)
+            finally:
+                stats.end()
         self._log_http_response('DELETE', url,
                                 status=result.status_code,
                                 headers=result.headers,
@@ -1010,21 +1770,221 @@ class Session(object):
         if result.status_code in (200, 204):
             return
         elif result.status_code == 403:
-            result_object = _result_object(result)
+            result_object = _result_object(result, self._json_codec)
             reason = result_object.get('reason', None)
             if reason == 5:
                 # API session token expired: re-logon and retry
-                self._do_logon()
-                self.delete(uri, logon_required)
+                self._do_relogon(headers.get('X-API-Session', None))
+                self._do_delete(uri, logon_required)
                 return
             else:
                 msg = result_object.get('message', None)
                 raise ServerAuthError("HTTP authentication failed: {}".
                                       format(msg), HTTPError(result_object))
         else:
-            result_object = _result_object(result)
+            result_object = _result_object(result, self._json_codec)
             raise HTTPError(result_object)
 
+    @logged_api_call
+    def iter_get(self, uri, member=None, logon_required=True):
+        """
+        Perform the HTTP GET method against the resource identified by a URI,
+        and yield the items of a JSON array in the response incrementally,
+        while the response body is being received.
+
+        This method is intended for operations with very large responses,
+        such as listing the storage volumes of a storage group. The memory
+        needed for processing the response does not depend on the number of
+        items in the JSON array. Apart from that, this method behaves like
+        :meth:`~zhmcclient.Session.get`, except that the request is never
+        served from the response cache or coalesced with other requests.
+
+        The request is performed when the first item is requested from the
+        returned generator. Exceptions for HTTP errors are raised at that
+        point; parse errors in the response body may be raised later.
+
+        The time statistics for the request cover the time until the response
+        headers have been received.
+
+        Parameters:
+
+          uri (:term:`string`):
+            Relative URI path of the resource, e.g. "/api/cpcs".
+            This URI is relative to the base URL of the session (see
+            the :attr:`~zhmcclient.Session.base_url` property).
+            Must not be `None`.
+
+          member (:term:`string`):
+            Name of the member of the JSON object in the response that has the
+            JSON array, e.g. "cpcs". `None` means that the response is the
+            JSON array.
+
+          logon_required (bool):
+            Boolean indicating whether the operation requires that the session
+            is logged on to the HMC.
+
+        Returns:
+
+          :term:`iterable` of :term:`json object`: A generator that yields the
+          items of the JSON array.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.ClientAuthError`
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        return self._iter_request('GET', uri, member, None, logon_required)
+
+    @logged_api_call
+    def iter_post(self, uri, member=None, body=None, logon_required=True):
+        """
+        Perform the HTTP POST method against the resource identified by a URI,
+        using a provided request body, and yield the items of a JSON array in
+        the response incrementally, while the response body is being received.
+
+        This method is intended for synchronous operations with very large
+        responses, such as 'Get Inventory'. For details, see
+        :meth:`~zhmcclient.Session.iter_get`. If the operation has no result
+        or starts an asynchronous job, the generator yields no items.
+
+        Parameters:
+
+          uri (:term:`string`):
+            Relative URI path of the resource, e.g. "/api/services/inventory".
+            This URI is relative to the base URL of the session (see the
+            :attr:`~zhmcclient.Session.base_url` property).
+            Must not be `None`.
+
+          member (:term:`string`):
+            Name of the member of the JSON object in the response that has the
+            JSON array. `None` means that the response is the JSON array.
+
+          body (:term:`json object`):
+            JSON object to be used as the HTTP request body (payload).
+            `None` means that no HTTP body is included in the request.
+
+          logon_required (bool):
+            Boolean indicating whether the operation requires that the session
+            is logged on to the HMC.
+
+        Returns:
+
+          :term:`iterable` of :term:`json object`: A generator that yields the
+          items of the JSON array.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.ClientAuthError`
+          :exc:`~zhmcclient.ServerAuthError`
+          :exc:`~zhmcclient.ConnectionError`
+          :exc:`TypeError`: Body has invalid type.
+        """
+        try:
+            for item in self._iter_request('POST', uri, member, body,
+                                           logon_required):
+                yield item
+        finally:
+            if self._response_cache is not None:
+                self._response_cache.invalidate(uri)
+
+    def _iter_request(self, method, uri, member, body, logon_required):
+        """
+        Perform an HTTP method with a streamed response body, and yield the
+        items of a JSON array in the response.
+
+        For details, see :meth:`~zhmcclient.Session.iter_get`.
+        """
+        if logon_required:
+            self.logon()
+        url = self.base_url + uri
+        headers = self.headers.copy()  # Standard headers
+        data = _body_data(body, headers, self._json_codec)
+
+        self._log_http_request(method, url, headers=headers, content=data)
+        # The generator may be interleaved with other requests in the same
+        # thread, so the elapsed time is measured here.
+        stats = self.time_stats_keeper.get_stats(method.lower() + ' ' + uri)
+        req = self._session or requests
+        deadline = Deadline.current()
+        req_timeout = self._request_timeout(method, uri, deadline)
+        with self._circuit_guarded(method, uri), \
+                self._rate_limited(method, uri):
+            begin = time.time()
+            try:
+                result = req.request(method, url, data=data, headers=headers,
+                                     verify=False, timeout=req_timeout,
+                                     stream=True)
+            except requests.exceptions.RequestException as exc:
+                _handle_request_exc(exc, self.retry_timeout_config,
+                                    deadline)
+            finally:
+                stats._add_time(time.time() - begin)
+
+        try:
+            if result.status_code in (200, 201):
+                self._log_http_response(method, url,
+                                        status=result.status_code,
+                                        headers=result.headers,
+                                        content='(streamed)')
+                for item in self._iter_result_items(result, member):
+                    yield item
+                return
+
+            self._log_http_response(method, url,
+                                    status=result.status_code,
+                                    headers=result.headers,
+                                    content=result.content)
+            if result.status_code in (202, 204):
+                return
+            result_object = _result_object(result, self._json_codec)
+            if result.status_code != 403:
+                raise HTTPError(result_object)
+            reason = result_object.get('reason', None)
+            if reason != 5:
+                msg = result_object.get('message', None)
+                raise ServerAuthError("HTTP authentication failed: {}".
+                                      format(msg), HTTPError(result_object))
+        finally:
+            result.close()
+
+        # API session token expired: re-logon and retry
+        self._do_relogon(headers.get('X-API-Session', None))
+        for item in self._iter_request(method, uri, member, body,
+                                       logon_required):
+            yield item
+
+    def _iter_result_items(self, result, member):
+        """
+        Yield the items of a JSON array in a streamed HTTP response with
+        status 200 or 201.
+        """
+        content_type = result.headers.get('content-type', None)
+        if content_type is not None and \
+                not content_type.startswith('application/json'):
+            # Raises ParseError for unexpected content types
+            result_object = _result_object(result, self._json_codec)
+            raise HTTPError(result_object)
+        chunks = result.iter_content(DEFAULT_STREAM_CHUNK_SIZE)
+        try:
+            for item in self._json_codec.iter_items(chunks, member):
+                yield item
+        except requests.exceptions.RequestException as exc:
+            _handle_request_exc(exc, self.retry_timeout_config)
+        except ValueError as exc:
+            raise ParseError(
+                "JSON parse error in streamed HTTP response: {}. "
+                "HTTP request: {} {}. "
+                "Response status {}. "
+                "Response content-type: {!r}.".
+                format(exc.args[0],
+                       result.request.method, result.request.url,
+                       result.status_code, content_type))
+
     @logged_api_call
     def get_notification_topics(self):
         """
@@ -1052,6 +2012,135 @@ class Session(object):
         response = self.get(topics_uri)
         return response['topics']
 
+    def _get_job_notifier(self):
+        """
+        Return the receiver of job completion notifications of this session,
+        starting it if needed, or `None` if job notifications are not enabled
+        or not available.
+
+        The receiver is restarted when the session-id has changed (e.g. due
+        to a re-logon), because the notification topics of the HMC belong to
+        a session-id.
+        """
+        if not self._job_notifications:
+            return None
+        with self._job_notifier_lock:
+            notifier = self._job_notifier
+            if notifier is not None and notifier.running and \
+                    self._job_notifier_session_id == self._session_id:
+                return notifier
+            if self._job_notifier_failed:
+                return None
+            if notifier is not None:
+                notifier.close()
+                self._job_notifier = None
+            try:
+                topics = self.get_notification_topics()
+                job_topics = [t['topic-name'] for t in topics
+                              if t['topic-type'] == 'job-notification']
+                if not job_topics:
+                    raise ValueError("The HMC has no job notification topic "
+                                     "for the session")
+                if self._password is None:
+                    raise ValueError("No password is known for the session")
+                notifier = _JobNotifier(job_topics[0], self._host,
+                                        self._userid, self._password)
+            except Exception as exc:  # pylint: disable=broad-except
+                LOG.warning("Waiting for job completion falls back to "
+                            "polling, because job notifications cannot be "
+                            "received: %s", exc)
+                self._job_notifier_failed = True
+                return None
+            self._job_notifier = notifier
+            self._job_notifier_session_id = self._session_id
+            return notifier
+
+    def _close_job_notifier(self):
+        """
+        Close the receiver of job completion notifications of this session,
+        if it was started.
+        """
+        with self._job_notifier_lock:
+            if self._job_notifier is not None:
+                self._job_notifier.close()
+                self._job_notifier = None
+
+    @logged_api_call
+    def wait_for_jobs(self, jobs, operation_timeout=None,
+                      max_concurrent=None):
+        """
+        Generator that waits for completion of multiple jobs concurrently and
+        yields the result of each job as the job completes.
+
+        This is a shortcut for waiting for a :class:`~zhmcclient.JobGroup`;
+        for details, see :meth:`zhmcclient.JobGroup.wait`.
+
+        Parameters:
+
+          jobs (:term:`iterable` of :class:`~zhmcclient.Job`):
+            The jobs to wait for.
+            Must not be `None`.
+
+          operation_timeout (:term:`number`):
+            Timeout in seconds, when waiting for completion of all jobs. The
+            special value 0 means that no timeout is set. `None` means that the
+            default async operation timeout of this session is used.
+
+          max_concurrent (:term:`integer`):
+            Maximum number of concurrent job status checks. `None` means
+            :data:`~zhmcclient._constants.DEFAULT_JOB_GROUP_CONCURRENCY`.
+
+        Returns:
+
+          :term:`iterable` of tuple(:class:`~zhmcclient.Job`, :term:`json object`, :exc:`~zhmcclient.Error`):
+            A generator that yields a tuple (job, result, error) for each job,
+            in the order in which the jobs complete.
+
+        Raises:
+
+          :exc:`~zhmcclient.OperationTimeout`: The timeout expired while
+            waiting for job completion.
+        """  # noqa: E501
+        if operation_timeout is None:
+            operation_timeout = self.retry_timeout_config.operation_timeout
+        job_group = JobGroup(jobs, max_concurrent=max_concurrent)
+        return job_group.wait(operation_timeout=operation_timeout)
+
+
+class _InflightRequest(object):
+    """
+    An HTTP request in progress, whose outcome is shared with the callers
+    that issue an identical request while it is in progress.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._result = None
+        self._exception = None
+
+    def set_result(self, result):
+        """Complete the request with a result."""
+        self._result = result
+        self._event.set()
+
+    def set_exception(self, exception):
+        """Complete the request with an exception."""
+        self._exception = exception
+        self._event.set()
+
+    def wait(self):
+        """
+        Wait for completion of the request and return a copy of its result,
+        or raise its exception.
+
+        Each caller gets its own copy of the result, so that callers can
+        modify their result without affecting each other.
+        """
+        self._event.wait()
+        if self._exception is not None:
+            raise self._exception
+        return deepcopy(self._result)
+
 
 class Job(object):
     """
@@ -1130,6 +2219,29 @@ class Job(object):
         """
         return self._op_uri
 
+    def _poll_intervals(self):
+        """
+        Generator that yields the intervals in seconds between status checks
+        when polling for completion of this job.
+
+        The first interval is the initial poll interval of the retry/timeout
+        configuration of the session, or the interval for the operation in
+        `_JOB_POLL_HINTS` if that is longer. Each further interval grows by the
+        poll factor up to the maximum poll interval, and each interval is
+        randomized by the poll jitter.
+        """
+        rt_config = self.session.retry_timeout_config
+        interval = rt_config.job_poll_initial
+        for method, uri_pattern, hint in _JOB_POLL_HINTS:
+            if self.op_method == method and uri_pattern.search(self.op_uri):
+                interval = max(interval, hint)
+                break
+        jitter = rt_config.job_poll_jitter
+        while True:
+            interval = min(interval, rt_config.job_poll_max)
+            yield interval * random.uniform(1 - jitter, 1 + jitter)
+            interval *= rt_config.job_poll_factor
+
     @logged_api_call
     def check_for_completion(self):
         """
@@ -1171,36 +2283,48 @@ class Job(object):
         job_status = job_result_obj['status']
         if job_status == 'complete':
             self.session.delete(self.uri)
-            op_status_code = job_result_obj['job-status-code']
-            if op_status_code in (200, 201):
-                op_result_obj = job_result_obj.get('job-results', None)
-            elif op_status_code == 204:
-                # No content
-                op_result_obj = None
-            else:
-                error_result_obj = job_result_obj.get('job-results', None)
-                if not error_result_obj:
-                    message = None
-                elif 'message' in error_result_obj:
-                    message = error_result_obj['message']
-                elif 'error' in error_result_obj:
-                    message = error_result_obj['error']
-                else:
-                    message = None
-                error_obj = {
-                    'http-status': op_status_code,
-                    'reason': job_result_obj['job-reason-code'],
-                    'message': message,
-                    'request-method': self.op_method,
-                    'request-uri': self.op_uri,
-                }
-                raise HTTPError(error_obj)
+            op_result_obj = self._op_result(job_result_obj)
         else:
             op_result_obj = None
         return job_status, op_result_obj
 
+    def _op_result(self, job_result_obj):
+        """
+        Return the result of the original asynchronous operation from the
+        response body of a "Query Job Status" operation for a completed job.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`: The job completed in error.
+        """
+        op_status_code = job_result_obj['job-status-code']
+        if op_status_code in (200, 201):
+            op_result_obj = job_result_obj.get('job-results', None)
+        elif op_status_code == 204:
+            # No content
+            op_result_obj = None
+        else:
+            error_result_obj = job_result_obj.get('job-results', None)
+            if not error_result_obj:
+                message = None
+            elif 'message' in error_result_obj:
+                message = error_result_obj['message']
+            elif 'error' in error_result_obj:
+                message = error_result_obj['error']
+            else:
+                message = None
+            error_obj = {
+                'http-status': op_status_code,
+                'reason': job_result_obj['job-reason-code'],
+                'message': message,
+                'request-method': self.op_method,
+                'request-uri': self.op_uri,
+            }
+            raise HTTPError(error_obj)
+        return op_result_obj
+
     @logged_api_call
-    def wait_for_completion(self, operation_timeout=None):
+    def wait_for_completion(self, operation_timeout=None, deadline=None):
         """
         Wait for completion of the job, then delete the job on the HMC and
         return the result of the original asynchronous HMC operation, if it
@@ -1223,6 +2347,27 @@ class Job(object):
             achieving the timeout. This may cause a slightly longer duration of
             the method than prescribed by the timeout.
 
+          deadline (:class:`~zhmcclient.Deadline`):
+            Deadline for waiting, including the HTTP requests for checking the
+            job status. `None` means that only the active deadline applies, if
+            any (see :class:`~zhmcclient.Deadline`).
+
+            If the deadline expires, a :exc:`~zhmcclient.DeadlineExceeded` is
+            raised. Unlike the operation timeout, the deadline is strictly
+            achieved.
+
+        The job status is checked right away, and then repeatedly with
+        intervals that grow from the initial to the maximum poll interval, as
+        defined by the `job_poll_*` attributes of the
+        :class:`~zhmcclient.RetryTimeoutConfig` of the session. HMC operations
+        that are known to take long (e.g. starting a partition or activating a
+        CPC) start with a longer interval.
+
+        If the session has job notifications enabled (see
+        :attr:`~zhmcclient.Session.job_notifications`), the job status is
+        checked when the completion notification for the job is received, and
+        otherwise only with the maximum poll interval.
+
         Returns:
 
           :term:`json object` or `None`:
@@ -1242,33 +2387,72 @@ class Job(object):
           :exc:`~zhmcclient.ConnectionError`
           :exc:`~zhmcclient.OperationTimeout`: The timeout expired while
             waiting for job completion.
+          :exc:`~zhmcclient.DeadlineExceeded`: The deadline expired while
+            waiting for job completion.
         """
+        deadline = Deadline.effective(deadline)
+        with _activated(deadline):
+            return self._wait_for_completion(operation_timeout, deadline)
 
+    def _wait_for_completion(self, operation_timeout, deadline):
+        """
+        Wait for completion of the job, with an effective deadline or `None`.
+
+        For details, see :meth:`~zhmcclient.Job.wait_for_completion`.
+        """
         if operation_timeout is None:
             operation_timeout = \
                 self.session.retry_timeout_config.operation_timeout
         if operation_timeout > 0:
             start_time = time.time()
+        poll_intervals = self._poll_intervals()
 
-        while True:
-            job_status, op_result_obj = self.check_for_completion()
-
-            # We give completion of status priority over strictly achieving
-            # the timeout, so we check status first. This may cause a longer
-            # duration of the method than prescribed by the timeout.
-            if job_status == 'complete':
-                return op_result_obj
-
-            if operation_timeout > 0:
-                current_time = time.time()
-                if current_time > start_time + operation_timeout:
-                    raise OperationTimeout(
-                        "Waiting for completion of job {} timed out "
-                        "(operation timeout: {} s)".
-                        format(self.uri, operation_timeout),
-                        operation_timeout)
-
-            time.sleep(1)  # Avoid hot spin loop
+        # pylint: disable=protected-access
+        notifier = self.session._get_job_notifier()
+        if notifier is not None:
+            completion_event = notifier.register(self.uri)
+        try:
+            while True:
+                job_status, op_result_obj = self.check_for_completion()
+
+                # We give completion of status priority over strictly
+                # achieving the timeout, so we check status first. This may
+                # cause a longer duration of the method than prescribed by
+                # the timeout.
+                if job_status == 'complete':
+                    return op_result_obj
+
+                if operation_timeout > 0:
+                    current_time = time.time()
+                    if current_time > start_time + operation_timeout:
+                        raise OperationTimeout(
+                            "Waiting for completion of job {} timed out "
+                            "(operation timeout: {} s)".
+                            format(self.uri, operation_timeout),
+                            operation_timeout)
+
+                if notifier is not None and notifier.running:
+                    # Polling is only a safety net for missed notifications
+                    interval = \
+                        self.session.retry_timeout_config.job_poll_max
+                else:
+                    interval = next(poll_intervals)
+                if operation_timeout > 0:
+                    # Check once more when the timeout expires
+                    remaining = start_time + operation_timeout - current_time
+                    interval = min(interval, max(remaining, 0))
+                if deadline is not None:
+                    deadline.check("waiting for completion of job {}".
+                                   format(self.uri))
+                    interval = min(interval, max(deadline.remaining(), 0))
+                if notifier is not None and notifier.running:
+                    completion_event.wait(interval)
+                    completion_event.clear()
+                else:
+                    time.sleep(interval)
+        finally:
+            if notifier is not None:
+                notifier.unregister(self.uri)
 
 
 def _text_repr(text, max_len=1000):
@@ -1285,12 +2469,14 @@ def _text_repr(text, max_len=1000):
     return text_repr
 
 
-def _result_object(result):
+def _result_object(result, json_codec=None):
     """
     Return the JSON payload in the HTTP response as a Python dict.
 
     Parameters:
         result (requests.Response): HTTP response object.
+        json_codec (JsonCodec): JSON codec for decoding the payload, or `None`
+          for the default JSON codec.
 
     Raises:
         zhmcclient.ParseError: Error parsing the returned JSON.
@@ -1298,10 +2484,12 @@ def _result_object(result):
     content_type = result.headers.get('content-type', None)
 
     if content_type is None or content_type.startswith('application/json'):
+        if json_codec is None:
+            json_codec = _DEFAULT_JSON_CODEC
         # This function is only called when there is content expected.
         # Therefore, a response without content will result in a ParseError.
         try:
-            return result.json(object_pairs_hook=OrderedDict)
+            return json_codec.loads(result.content)
         except ValueError as exc:
             raise ParseError(
                 "JSON parse error in HTTP response: {}. "
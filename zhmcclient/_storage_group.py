@@ -145,8 +145,14 @@ class StorageGroupManager(BaseManager):
         """
         return self._console
 
+    def _list_operation(self, query_parms):
+        resources_name = 'storage-groups'
+        uri = '{}{}'.format(self._base_uri, query_parms)
+        return uri, resources_name
+
     @logged_api_call
-    def list(self, full_properties=False, filter_args=None):
+    def list(self, full_properties=False, filter_args=None,
+             properties=None):
         """
         List the storage groups defined in the HMC.
 
@@ -173,6 +179,15 @@ class StorageGroupManager(BaseManager):
 
             `None` causes no filtering to happen.
 
+          properties (:term:`iterable` of :term:`string`):
+            Names of resource properties that should be retrieved in addition
+            to the short set as returned by the list operation (see
+            :meth:`~zhmcclient.BaseResource.pull_properties`). Resource
+            properties that are already in the short set are not retrieved
+            again. Ignored if `full_properties` is `True`.
+
+            `None` causes only the short set to be retrieved.
+
         Returns:
 
           : A list of :class:`~zhmcclient.StorageGroup` objects.
@@ -184,6 +199,9 @@ class StorageGroupManager(BaseManager):
           :exc:`~zhmcclient.AuthError`
           :exc:`~zhmcclient.ConnectionError`
         """
+        resource_obj_list = self._list_loaded(filter_args)
+        if resource_obj_list is not None:
+            return resource_obj_list
 
         resource_obj_list = []
 
@@ -196,23 +214,25 @@ class StorageGroupManager(BaseManager):
             # It already has full properties
         else:
             query_parms, client_filters = self._divide_filter_args(filter_args)
-            uri = '{}{}'.format(self._base_uri, query_parms)
+            uri, resources_name = self._list_operation(query_parms)
 
             result = self.session.get(uri)
             if result:
-                props_list = result['storage-groups']
+                props_list = result[resources_name]
                 for props in props_list:
 
-                    resource_obj = self.resource_class(
-                        manager=self,
+                    resource_obj = self._get_resource_obj(
                         uri=props[self._uri_prop],
                         name=props.get(self._name_prop, None),
                         properties=props)
 
                     if self._matches_filters(resource_obj, client_filters):
                         resource_obj_list.append(resource_obj)
-                        if full_properties:
-                            resource_obj.pull_full_properties()
+
+                if full_properties:
+                    self._pull_full_properties(resource_obj_list)
+                elif properties:
+                    self._pull_properties(resource_obj_list, properties)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
@@ -265,7 +285,7 @@ class StorageGroupManager(BaseManager):
         props.update(result)
         name = props.get(self._name_prop, None)
         uri = props[self._uri_prop]
-        storage_group = StorageGroup(self, uri, name, props)
+        storage_group = self._get_resource_obj(uri, name, props)
         self._name_uri_cache.update(name, uri)
         return storage_group
 
@@ -651,7 +671,8 @@ class StorageGroup(BaseResource):
                 port_mgr = adapter.ports
                 port = port_mgr.resource_object(port_uri)
                 port_list.append(port)
-                if full_properties:
-                    port.pull_full_properties()
+
+            if full_properties:
+                adapter_mgr._pull_full_properties(port_list)
 
         return port_list
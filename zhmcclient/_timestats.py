@@ -42,6 +42,7 @@ from __future__ import absolute_import
 
 import time
 import copy
+import threading
 
 from ._logging import get_logger, logged_api_call
 
@@ -62,6 +63,9 @@ class TimeStats(object):
     created by the user. Instead, the
     :meth:`zhmcclient.TimeStatsKeeper.get_stats` method should be used to
     create objects of this class.
+
+    Invocations of the operation may be measured concurrently by multiple
+    threads; the begin time is kept separately for each thread.
     """
 
     def __init__(self, keeper, name):
@@ -80,7 +84,24 @@ class TimeStats(object):
         self._sum = float(0)
         self._min = float('inf')
         self._max = float(0)
-        self._begin_time = None
+        # Begin times of the measurements in progress, by thread ID
+        self._begin_times = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        """
+        Return the state of this object for copying, without the lock.
+        """
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restore the state of this object when copying, with a new lock.
+        """
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
     @property
     def name(self):
@@ -137,10 +158,11 @@ class TimeStats(object):
         """
         Reset the time statistics data for the operation.
         """
-        self._count = 0
-        self._sum = float(0)
-        self._min = float('inf')
-        self._max = float(0)
+        with self._lock:
+            self._count = 0
+            self._sum = float(0)
+            self._min = float('inf')
+            self._max = float(0)
 
     @logged_api_call
     def begin(self):
@@ -158,7 +180,7 @@ class TimeStats(object):
         this method does nothing, in order to save resources.
         """
         if self.keeper.enabled:
-            self._begin_time = time.time()
+            self._begin_times[threading.current_thread().ident] = time.time()
 
     @logged_api_call
     def end(self):
@@ -183,16 +205,29 @@ class TimeStats(object):
           RuntimeError
         """
         if self.keeper.enabled:
-            if self._begin_time is None:
+            begin_time = self._begin_times.pop(
+                threading.current_thread().ident, None)
+            if begin_time is None:
                 raise RuntimeError("end() called without preceding begin()")
-            dt = time.time() - self._begin_time
-            self._begin_time = None
-            self._count += 1
-            self._sum += dt
-            if dt > self._max:
-                self._max = dt
-            if dt < self._min:
-                self._min = dt
+            self._add_time(time.time() - begin_time)
+
+    def _add_time(self, dt):
+        """
+        Update the time statistics to reflect a new invocation of the
+        operation with the specified duration in seconds.
+
+        This is used instead of :meth:`~zhmcclient.TimeStats.begin` and
+        :meth:`~zhmcclient.TimeStats.end` by callers that measure concurrent
+        invocations within the same thread (e.g. asyncio coroutines).
+        """
+        if self.keeper.enabled:
+            with self._lock:
+                self._count += 1
+                self._sum += dt
+                if dt > self._max:
+                    self._max = dt
+                if dt < self._min:
+                    self._min = dt
 
     def __str__(self):
         """
@@ -224,6 +259,11 @@ class TimeStatsKeeper(object):
     methods of class :class:`~zhmcclient.TimeStats`.
     If disabled, calls to these methods do not accumulate any time.
 
+    In addition, the statistics keeper can hold named counters, that count
+    events that have no elapsed time (for example, HTTP requests that were
+    saved by an optimization). Counters are only incremented while the
+    statistics keeper is enabled.
+
     Initially, the statistics keeper is disabled.
     """
 
@@ -231,6 +271,23 @@ class TimeStatsKeeper(object):
         self._enabled = False
         self._time_stats = {}  # TimeStats objects
         self._disabled_stats = TimeStats(self, "disabled")
+        self._counters = {}  # Counter values by name
+        self._counters_lock = threading.Lock()
+
+    def __getstate__(self):
+        """
+        Return the state of this object for copying, without the lock.
+        """
+        state = self.__dict__.copy()
+        del state['_counters_lock']
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restore the state of this object when copying, with a new lock.
+        """
+        self.__dict__.update(state)
+        self._counters_lock = threading.Lock()
 
     @property
     def enabled(self):
@@ -272,9 +329,12 @@ class TimeStatsKeeper(object):
         """
         if not self.enabled:
             return self._disabled_stats
-        if name not in self._time_stats:
-            self._time_stats[name] = TimeStats(self, name)
-        return self._time_stats[name]
+        try:
+            return self._time_stats[name]
+        except KeyError:
+            # setdefault() is atomic, so concurrent threads end up using the
+            # same time statistics object.
+            return self._time_stats.setdefault(name, TimeStats(self, name))
 
     @logged_api_call
     def snapshot(self):
@@ -293,12 +353,56 @@ class TimeStatsKeeper(object):
           - value (:class:`~zhmcclient.TimeStats`): Time statistics for the
             operation
         """
-        return copy.deepcopy(self._time_stats)
+        return copy.deepcopy(self._time_stats.copy())
+
+    def count(self, name, increment=1):
+        """
+        Increment the counter for a name.
+        If a counter for that name does not exist yet, create one.
+
+        If the statistics keeper is disabled, this method does nothing, in
+        order to save resources.
+
+        Parameters:
+
+          name (string):
+            Name of the counter.
+
+          increment (:term:`integer`):
+            Value by which the counter is incremented.
+        """
+        if self.enabled:
+            with self._counters_lock:
+                self._counters[name] = self._counters.get(name, 0) + increment
+
+    @logged_api_call
+    def counters(self):
+        """
+        Return a snapshot of the counters of this keeper.
+
+        Returns:
+
+         dict: A dictionary of the counters, where:
+
+          - key (:term:`string`): Name of the counter
+          - value (:term:`integer`): Value of the counter
+        """
+        with self._counters_lock:
+            return self._counters.copy()
+
+    @logged_api_call
+    def reset_counters(self):
+        """
+        Remove all counters of this keeper.
+        """
+        with self._counters_lock:
+            self._counters = {}
 
     def __str__(self):
         """
         Return a human readable string with the time statistics for this
         keeper. The operations are sorted by decreasing average time.
+        Counters, if any, follow the time statistics, sorted by name.
 
         Example result, if keeper is enabled:
 
@@ -320,6 +424,12 @@ class TimeStatsKeeper(object):
                 ret += "{:5d}  {:7.3f}  {:7.3f}  {:7.3f}  {}\n".format(
                     stats.count, stats.avg_time, stats.min_time,
                     stats.max_time, name)
+            counters = self.counters()
+            if counters:
+                ret += "Counters:\n"
+                ret += "  Value  Counter name\n"
+                for name in sorted(counters):
+                    ret += "{:7d}  {}\n".format(counters[name], name)
         else:
             ret += "Disabled.\n"
         return ret.strip()
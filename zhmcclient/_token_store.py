@@ -0,0 +1,281 @@
+# Copyright 2018 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A session token store shares the HMC session-ids (the ``X-API-Session``
+tokens) of :class:`~zhmcclient.Session` objects across processes, so that
+short-lived processes that use the same HMC host and userid do not each
+have to log on to the HMC.
+
+Logging on is one of the slower HMC operations, and the HMC limits the number
+of concurrent sessions. A session token store is enabled for a session by
+passing it to the :class:`~zhmcclient.Session` object via its `token_store`
+init parameter. A session with a token store logs on as follows:
+
+* While holding the lock of the token store for its HMC host and userid, the
+  session reuses the session-id in the token store, if there is one.
+  Otherwise, it logs on to the HMC and puts the new session-id into the
+  token store. Because of the lock, only one process at a time logs on for
+  the same HMC host and userid.
+
+* When the HMC rejects the session-id as expired (HTTP status 403 with reason
+  code 5), the session logs on again, unless another process has already put
+  a different session-id into the token store, which is then reused.
+
+* :meth:`zhmcclient.Session.logoff` deletes the session on the HMC, and
+  removes its session-id from the token store. The processes that still use
+  the session-id then log on again. Processes that share session-ids should
+  therefore normally not log off, and leave the expiration of the session to
+  the HMC.
+
+The session-ids are credentials for the HMC and must be protected like
+passwords.
+
+Example::
+
+    import zhmcclient
+
+    store = zhmcclient.FileTokenStore()
+    session = zhmcclient.Session(hmc, userid, password, token_store=store)
+    client = zhmcclient.Client(session)
+
+    . . .  # no logoff
+"""
+
+from __future__ import absolute_import
+
+import os
+import json
+import errno
+import hashlib
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt  # pylint: disable=import-error
+
+from ._logging import get_logger
+
+__all__ = ['SessionTokenStore', 'FileTokenStore']
+
+LOG = get_logger(__name__)
+
+
+class SessionTokenStore(object):
+    """
+    Base class for session token stores.
+
+    A session token store holds at most one session-id per HMC host and
+    userid, and provides a lock per HMC host and userid that serializes the
+    logons across the processes that use the token store.
+
+    Derived classes must implement all methods of this class.
+    """
+
+    def get(self, host, userid):
+        """
+        Return the session-id for an HMC host and userid.
+
+        Parameters:
+
+          host (:term:`string`): HMC host.
+
+          userid (:term:`string`): HMC userid.
+
+        Returns:
+
+          :term:`string`: The session-id, or `None` if there is none.
+        """
+        raise NotImplementedError
+
+    def put(self, host, userid, session_id):
+        """
+        Put the session-id for an HMC host and userid into the token store,
+        replacing any session-id that is already there.
+
+        Parameters:
+
+          host (:term:`string`): HMC host.
+
+          userid (:term:`string`): HMC userid.
+
+          session_id (:term:`string`): The session-id.
+        """
+        raise NotImplementedError
+
+    def remove(self, host, userid, session_id):
+        """
+        Remove the session-id for an HMC host and userid from the token store,
+        if it is the specified session-id.
+
+        Parameters:
+
+          host (:term:`string`): HMC host.
+
+          userid (:term:`string`): HMC userid.
+
+          session_id (:term:`string`): The session-id to be removed.
+        """
+        raise NotImplementedError
+
+    def lock(self, host, userid):
+        """
+        Return a context manager that holds the lock of the token store for
+        an HMC host and userid while its context is active.
+
+        The lock must exclude other processes and other threads.
+
+        Parameters:
+
+          host (:term:`string`): HMC host.
+
+          userid (:term:`string`): HMC userid.
+        """
+        raise NotImplementedError
+
+
+class FileTokenStore(SessionTokenStore):
+    """
+    A session token store that is a directory in the local file system.
+
+    The session-id for an HMC host and userid is stored in a file in that
+    directory, which can be read and written only by its owner. The lock for
+    an HMC host and userid is an exclusive lock on a separate lock file
+    (using :func:`py:fcntl.flock` on UNIX-like systems, and
+    :func:`py:msvcrt.locking` on Windows).
+    """
+
+    def __init__(self, directory=None):
+        """
+        Parameters:
+
+          directory (:term:`string`):
+            Path name of the directory of the token store. It is created if it
+            does not exist. `None` means ``.zhmcclient/tokens`` in the home
+            directory of the user.
+        """
+        if directory is None:
+            directory = os.path.join(os.path.expanduser('~'), '.zhmcclient',
+                                     'tokens')
+        self._directory = directory
+
+    def __repr__(self):
+        """
+        Return a string with the state of this token store, for debug
+        purposes.
+        """
+        return "{}(directory={!r})". \
+            format(self.__class__.__name__, self._directory)
+
+    @property
+    def directory(self):
+        """
+        :term:`string`: Path name of the directory of the token store.
+        """
+        return self._directory
+
+    def _path(self, host, userid, suffix):
+        """Return the path name of a file for an HMC host and userid."""
+        key = u'{}\n{}'.format(host, userid).encode('utf-8')
+        name = hashlib.sha256(key).hexdigest() + suffix
+        return os.path.join(self._directory, name)
+
+    def _makedirs(self):
+        """Create the directory of the token store, if needed."""
+        try:
+            os.makedirs(self._directory, 0o700)
+        except OSError as exc:
+            if exc.errno != errno.EEXIST:
+                raise
+
+    def get(self, host, userid):
+        """
+        Return the session-id for an HMC host and userid.
+
+        For details, see :meth:`zhmcclient.SessionTokenStore.get`.
+        """
+        try:
+            with open(self._path(host, userid, '.json')) as fp:
+                token = json.load(fp)
+        except (IOError, OSError, ValueError):
+            return None
+        if token.get('host') != host or token.get('userid') != userid:
+            return None
+        return token.get('session-id')
+
+    def put(self, host, userid, session_id):
+        """
+        Put the session-id for an HMC host and userid into the token store.
+
+        For details, see :meth:`zhmcclient.SessionTokenStore.put`.
+        """
+        self._makedirs()
+        path = self._path(host, userid, '.json')
+        tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as fp:
+            json.dump({'host': host, 'userid': userid,
+                       'session-id': session_id}, fp)
+        if os.name == 'nt' and os.path.exists(path):
+            os.remove(path)
+        os.rename(tmp_path, path)
+
+    def remove(self, host, userid, session_id):
+        """
+        Remove the session-id for an HMC host and userid from the token store,
+        if it is the specified session-id.
+
+        For details, see :meth:`zhmcclient.SessionTokenStore.remove`.
+        """
+        if self.get(host, userid) == session_id:
+            try:
+                os.remove(self._path(host, userid, '.json'))
+            except OSError as exc:
+                if exc.errno != errno.ENOENT:
+                    raise
+
+    @contextmanager
+    def lock(self, host, userid):
+        """
+        Return a context manager that holds the lock of the token store for
+        an HMC host and userid.
+
+        For details, see :meth:`zhmcclient.SessionTokenStore.lock`.
+        """
+        self._makedirs()
+        path = self._path(host, userid, '.lock')
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                # LK_LOCK retries for 10 s, so retry until locked
+                while True:
+                    try:
+                        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except (IOError, OSError):
+                        pass
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                else:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
@@ -83,8 +83,15 @@ class UnmanagedCpcManager(BaseManager):
         """
         return self._parent
 
+    def _list_operation(self, query_parms):
+        resources_name = 'cpcs'
+        uri = '{}/operations/list-unmanaged-cpcs{}'.format(
+            self.parent.uri, query_parms)
+        return uri, resources_name
+
     @logged_api_call
-    def list(self, full_properties=False, filter_args=None):
+    def list(self, full_properties=False, filter_args=None,
+             properties=None):
         """
         List the unmanaged CPCs exposed by the HMC this client is connected to.
 
@@ -112,6 +119,9 @@ class UnmanagedCpcManager(BaseManager):
             `None` causes no filtering to happen, i.e. all resources are
             returned.
 
+          properties (:term:`iterable` of :term:`string`):
+            Ignored (exists for consistency with other list() methods).
+
         Returns:
 
           : A list of :class:`~zhmcclient.UnmanagedCpc` objects.
@@ -123,6 +133,10 @@ class UnmanagedCpcManager(BaseManager):
           :exc:`~zhmcclient.AuthError`
           :exc:`~zhmcclient.ConnectionError`
         """
+        resource_obj_list = self._list_loaded(filter_args)
+        if resource_obj_list is not None:
+            return resource_obj_list
+
         resource_obj_list = []
         resource_obj = self._try_optimized_lookup(filter_args)
         if resource_obj:
@@ -130,16 +144,14 @@ class UnmanagedCpcManager(BaseManager):
         else:
             query_parms, client_filters = self._divide_filter_args(filter_args)
 
-            uri = self.parent.uri + '/operations/list-unmanaged-cpcs' + \
-                query_parms
+            uri, resources_name = self._list_operation(query_parms)
 
             result = self.session.get(uri)
             if result:
-                props_list = result['cpcs']
+                props_list = result[resources_name]
                 for props in props_list:
 
-                    resource_obj = self.resource_class(
-                        manager=self,
+                    resource_obj = self._get_resource_obj(
                         uri=props[self._uri_prop],
                         name=props.get(self._name_prop, None),
                         properties=props)
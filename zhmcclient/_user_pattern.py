@@ -91,8 +91,14 @@ class UserPatternManager(BaseManager):
         """
         return self._parent
 
+    def _list_operation(self, query_parms):
+        resources_name = 'user-patterns'
+        uri = '{}/{}{}'.format(self.console.uri, resources_name, query_parms)
+        return uri, resources_name
+
     @logged_api_call
-    def list(self, full_properties=True, filter_args=None):
+    def list(self, full_properties=True, filter_args=None,
+             properties=None):
         """
         List the :term:`User Pattern` resources representing the user patterns
         defined in this HMC.
@@ -117,6 +123,15 @@ class UserPatternManager(BaseManager):
             `None` causes no filtering to happen, i.e. all resources are
             returned.
 
+          properties (:term:`iterable` of :term:`string`):
+            Names of resource properties that should be retrieved in addition
+            to the short set as returned by the list operation (see
+            :meth:`~zhmcclient.BaseResource.pull_properties`). Resource
+            properties that are already in the short set are not retrieved
+            again. Ignored if `full_properties` is `True`.
+
+            `None` causes only the short set to be retrieved.
+
         Returns:
 
           : A list of :class:`~zhmcclient.UserPattern` objects.
@@ -128,26 +143,31 @@ class UserPatternManager(BaseManager):
           :exc:`~zhmcclient.AuthError`
           :exc:`~zhmcclient.ConnectionError`
         """
+        resource_obj_list = self._list_loaded(filter_args)
+        if resource_obj_list is not None:
+            return resource_obj_list
+
         resource_obj_list = []
         query_parms, client_filters = self._divide_filter_args(filter_args)
-        resources_name = 'user-patterns'
-        uri = '{}/{}{}'.format(self.console.uri, resources_name, query_parms)
+        uri, resources_name = self._list_operation(query_parms)
 
         result = self.session.get(uri)
         if result:
             props_list = result[resources_name]
             for props in props_list:
 
-                resource_obj = self.resource_class(
-                    manager=self,
+                resource_obj = self._get_resource_obj(
                     uri=props[self._uri_prop],
                     name=props.get(self._name_prop, None),
                     properties=props)
 
                 if self._matches_filters(resource_obj, client_filters):
                     resource_obj_list.append(resource_obj)
-                    if full_properties:
-                        resource_obj.pull_full_properties()
+
+            if full_properties:
+                self._pull_full_properties(resource_obj_list)
+            elif properties:
+                self._pull_properties(resource_obj_list, properties)
 
         self._name_uri_cache.update_from(resource_obj_list)
         return resource_obj_list
@@ -189,7 +209,7 @@ class UserPatternManager(BaseManager):
         props.update(result)
         name = props.get(self._name_prop, None)
         uri = props[self._uri_prop]
-        user_pattern = UserPattern(self, uri, name, props)
+        user_pattern = self._get_resource_obj(uri, name, props)
         self._name_uri_cache.update(name, uri)
         return user_pattern
 
@@ -25,12 +25,12 @@ try:
 except ImportError:
     from ordereddict import OrderedDict
 import six
-import re
 import copy
 
 from ._idpool import IdPool
 from zhmcclient._utils import repr_dict, repr_manager, repr_list, \
     timestamp_from_datetime
+from zhmcclient._filter import compile_filter
 
 __all__ = ['InputError', 'FakedBaseResource', 'FakedBaseManager', 'FakedHmc',
            'FakedConsoleManager', 'FakedConsole',
@@ -376,7 +376,7 @@ class FakedBaseManager(object):
           obj (FakedBaseResource):
             Resource object.
 
-          filter_args (dict):
+          filter_args (dict or CompiledFilter):
             Filter arguments. For details, see :ref:`Filtering`.
             `None` causes the resource to always match.
 
@@ -385,12 +385,7 @@ class FakedBaseManager(object):
           bool: Boolean indicating whether the resource object matches the
             filter arguments.
         """
-        if filter_args is not None:
-            for prop_name in filter_args:
-                prop_match = filter_args[prop_name]
-                if not self._matches_prop(obj, prop_name, prop_match):
-                    return False
-        return True
+        return compile_filter(filter_args).matches(obj.properties)
 
     def _matches_prop(self, obj, prop_name, prop_match):
         """
@@ -422,40 +417,7 @@ class FakedBaseManager(object):
           bool: Boolean indicating whether the resource object matches w.r.t.
             the specified property and the match value.
         """
-        if isinstance(prop_match, (list, tuple)):
-            # List items are logically ORed, so one matching item suffices.
-            for pm in prop_match:
-                if self._matches_prop(obj, prop_name, pm):
-                    return True
-        else:
-            # Some lists of resources do not have all properties, for example
-            # Hipersocket adapters do not have a "card-location" property.
-            # If a filter property does not exist on a resource, the resource
-            # does not match.
-            if prop_name not in obj.properties:
-                return False
-            prop_value = obj.properties[prop_name]
-            if isinstance(prop_value, six.string_types):
-                # HMC resource property is Enum String or (non-enum) String,
-                # and is both matched by regexp matching. Ideally, regexp
-                # matching should only be done for non-enum strings, but
-                # distinguishing them is not possible given that the client
-                # has no knowledge about the properties.
-
-                # The regexp matching implemented in the HMC requires begin and
-                # end of the string value to match, even if the '^' for begin
-                # and '$' for end are not specified in the pattern. The code
-                # here is consistent with that: We add end matching to the
-                # pattern, and begin matching is done by re.match()
-                # automatically.
-                re_match = prop_match + '$'
-                m = re.match(re_match, prop_value)
-                if m:
-                    return True
-            else:
-                if prop_value == prop_match:
-                    return True
-        return False
+        return compile_filter({prop_name: prop_match}).matches(obj.properties)
 
     @property
     def hmc(self):
@@ -568,9 +530,10 @@ class FakedBaseManager(object):
             manager.
         """
         res = list()
+        compiled_filter = compile_filter(filter_args)
         for oid in self._resources:
             resource = self._resources[oid]
-            if self._matches_filters(resource, filter_args):
+            if self._matches_filters(resource, compiled_filter):
                 res.append(resource)
         return res
 
@@ -266,6 +266,42 @@ class FakedSession(zhmcclient.Session):
         except ConnectionError as exc:
             raise zhmcclient.ConnectionError(exc.message, None)
 
+    def iter_get(self, uri, member=None, logon_required=True):
+        """
+        Perform the HTTP GET method against the resource identified by a URI,
+        on the faked HMC, and yield the items of a JSON array in the response.
+
+        The faked HMC does not stream its responses, so this method is
+        implemented using :meth:`~zhmcclient_mock.FakedSession.get`.
+
+        For the parameters and exceptions, see
+        :meth:`zhmcclient.Session.iter_get`.
+        """
+        result = self.get(uri, logon_required)
+        if result:
+            items = result if member is None else result[member]
+            for item in items:
+                yield item
+
+    def iter_post(self, uri, member=None, body=None, logon_required=True):
+        """
+        Perform the HTTP POST method against the resource identified by a URI,
+        using a provided request body, on the faked HMC, and yield the items
+        of a JSON array in the response.
+
+        The faked HMC does not stream its responses, so this method is
+        implemented using :meth:`~zhmcclient_mock.FakedSession.post`.
+
+        For the parameters and exceptions, see
+        :meth:`zhmcclient.Session.iter_post`.
+        """
+        result = self.post(uri, body, logon_required,
+                           wait_for_completion=False)
+        if result and 'job-uri' not in result:
+            items = result if member is None else result[member]
+            for item in items:
+                yield item
+
     def delete(self, uri, logon_required=True):
         """
         Perform the HTTP DELETE method against the resource identified by a
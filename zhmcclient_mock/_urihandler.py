@@ -355,10 +355,16 @@ class GenericGetPropertiesHandler(object):
     @staticmethod
     def get(method, hmc, uri, uri_parms, logon_required):
         """Operation: Get <resource> Properties."""
+        resource_uri, _, query_str = uri.partition('?')
         try:
-            resource = hmc.lookup_by_uri(uri)
+            resource = hmc.lookup_by_uri(resource_uri)
         except KeyError:
             raise InvalidResourceError(method, uri)
+        query_parms = parse_query_parms(method, uri, query_str)
+        if query_parms and 'properties' in query_parms:
+            names = query_parms['properties'].split(',')
+            return {name: value for name, value in resource.properties.items()
+                    if name in names}
         return resource.properties
 
 
@@ -2605,7 +2611,7 @@ URIS = (
 
     (r'/api/version', VersionHandler),
 
-    (r'/api/console', ConsoleHandler),
+    (r'/api/console(?:\?(.*))?', ConsoleHandler),
     (r'/api/console/operations/restart', ConsoleRestartHandler),
     (r'/api/console/operations/shutdown', ConsoleShutdownHandler),
     (r'/api/console/operations/make-primary', ConsoleMakePrimaryHandler),